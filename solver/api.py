@@ -4,6 +4,7 @@
 """
 from typing import Dict, List, Optional, Union, Tuple, Any
 from datetime import datetime, time, timedelta
+import dataclasses
 import logging
 import pandas as pd
 
@@ -14,6 +15,11 @@ from .types import (
 )
 from .multi_date_scheduler import MultiDateScheduler
 from .single_date_scheduler import SingleDateScheduler
+from .ui_config_cache import UIConfigCache
+from .result_frame import ScheduleColumns, pivot_activities
+
+# UI 설정 변환 결과 캐시 (같은 내용의 표로 다시 실행하거나 2/3단계 흐름의 단계별 실행시 변환 생략)
+_UI_CONFIG_CACHE = UIConfigCache()
 
 
 def schedule_interviews(
@@ -190,38 +196,14 @@ def convert_to_wide_format(schedule_df: pd.DataFrame) -> pd.DataFrame:
     if schedule_df.empty:
         return pd.DataFrame()
     
-    # 피벗 테이블 생성
-    wide_df = schedule_df.pivot_table(
+    # 활동별 열로 펼치기 (pivot_table 대신 코드 배열로 한 번에, 시간은 'HH:MM')
+    wide_df = pivot_activities(
+        schedule_df,
         index=['id', 'interview_date'],
-        columns='activity',
-        values=['start_time', 'end_time', 'room'],
-        aggfunc='first'
-    ).reset_index()
-    
-    # 컬럼명 평탄화
-    wide_df.columns = ['_'.join(col).strip() if isinstance(col, tuple) and col[1] else col[0] 
-                       for col in wide_df.columns]
-    wide_df = wide_df.rename(columns={'id_': 'id', 'interview_date_': 'interview_date'})
-    
-    # 시간 형식 변환
-    time_cols = [col for col in wide_df.columns if col.startswith(('start_time_', 'end_time_'))]
-    for col in time_cols:
-        wide_df[col] = pd.to_datetime(wide_df[col]).dt.strftime('%H:%M')
-    
-    # 컬럼명 변경 (기존 형식에 맞게)
-    rename_map = {}
-    for col in wide_df.columns:
-        if col.startswith('start_time_'):
-            activity = col[len('start_time_'):]
-            rename_map[col] = f'start_{activity}'
-        elif col.startswith('end_time_'):
-            activity = col[len('end_time_'):]
-            rename_map[col] = f'end_{activity}'
-        elif col.startswith('room_'):
-            activity = col[len('room_'):]
-            rename_map[col] = f'loc_{activity}'
-    
-    wide_df = wide_df.rename(columns=rename_map)
+        activity='activity',
+        time_columns={'start_time': 'start_', 'end_time': 'end_'},
+        value_columns={'room': 'loc_'}
+    )
     
     # 직무 코드 추가
     wide_df['code'] = wide_df['id'].str.split('_').str[0]
@@ -280,6 +262,25 @@ def solve_for_days_v2(
     Returns:
         (status, final_wide_df, logs, daily_limit)
     """
+    return _solve_for_days_v2_result(cfg_ui, params, debug, progress_callback)[:4]
+
+
+def _solve_for_days_v2_result(
+    cfg_ui: dict,
+    params: dict = None,
+    debug: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    warm_start: Optional[MultiDateResult] = None
+) -> Tuple[str, pd.DataFrame, str, int, Optional[MultiDateResult]]:
+    """
+    solve_for_days_v2 + 멀티 날짜 결과 (2/3단계 스케줄링에서 다음 단계 웜 스타트로 전달)
+    warm_start: 체류시간 제한만 다른 이전 단계 결과
+    
+    Returns:
+        (status, final_wide_df, logs, daily_limit, multi_date_result)
+    """
+    params = params or {}
+    result = None
     try:
         # 로깅 설정
         log_level = logging.DEBUG if debug else logging.WARNING
@@ -288,26 +289,35 @@ def solve_for_days_v2(
         
         logs_buffer = []
         
-        # 🚀 스마트 통합 로직 적용
-        cfg_ui_optimized = _apply_smart_integration(cfg_ui, logs_buffer)
-        
         # 스케줄링 컨텍스트 생성
         context = SchedulingContext(
             progress_callback=progress_callback,
             debug=debug,
-            time_limit_sec=params.get('time_limit_sec', 120.0)
+            time_limit_sec=params.get('time_limit_sec', 120.0),
+            date_workers=params.get('date_workers'),
+            backtrack_workers=params.get('backtrack_workers'),
+            level3_portfolio_workers=params.get('level3_portfolio_workers')
         )
         
-        # UI 데이터 변환
-        date_plans, global_config, rooms, activities = _convert_ui_data(cfg_ui_optimized, logs_buffer)
+        # 🚀 스마트 통합 로직 적용 + UI 데이터 변환 (같은 내용이면 캐시 사용)
+        conversion = _UI_CONFIG_CACHE.get_or_convert(cfg_ui, _integrate_and_convert, logs_buffer)
+        date_plans, global_config = conversion.date_plans, conversion.global_config
+        rooms, activities = conversion.rooms, conversion.activities
         
-        # params의 max_stay_hours가 있으면 global_config에 적용
-        if params and 'max_stay_hours' in params:
+        # params의 max_stay_hours가 있으면 global_config와 (날짜별 오버라이드가 없는) 날짜 설정에 적용
+        date_configs = conversion.date_configs
+        if 'max_stay_hours' in params:
             global_config.max_stay_hours = params['max_stay_hours']
+            date_configs = date_configs and {
+                date: config if 'max_stay_hours' in (date_plans[date].overrides or {})
+                else dataclasses.replace(config, max_stay_hours=params['max_stay_hours'])
+                for date, config in date_configs.items()
+            }
             logs_buffer.append(f"제약 적용: max_stay_hours = {params['max_stay_hours']}시간")
         
         if not date_plans:
-            return "FAILED", pd.DataFrame(), "날짜별 계획이 없습니다.", 0
+            return "FAILED", pd.DataFrame(), "날짜별 계획이 없습니다.", 0, None
+        _log_daily_capacity(date_plans, global_config, rooms, activities, logs_buffer)
         
         # 멀티 날짜 스케줄링 실행
         scheduler = MultiDateScheduler()
@@ -316,7 +326,9 @@ def solve_for_days_v2(
             global_config=global_config,
             rooms=rooms,
             activities=activities,
-            context=context  # 컨텍스트 전달
+            context=context,  # 컨텍스트 전달
+            date_configs=date_configs,
+            warm_start=warm_start
         )
         
         # 결과 분석
@@ -331,7 +343,7 @@ def solve_for_days_v2(
             final_df = _convert_result_to_ui_format(result, logs_buffer)
             daily_limit = _calculate_daily_limit(result)
             
-            return "SUCCESS", final_df, "\n".join(logs_buffer), daily_limit
+            return "SUCCESS", final_df, "\n".join(logs_buffer), daily_limit, result
             
         elif result.status == "PARTIAL":
             # 부분 성공
@@ -343,7 +355,7 @@ def solve_for_days_v2(
             final_df = _convert_result_to_ui_format(result, logs_buffer)
             daily_limit = _calculate_daily_limit(result)
             
-            return "PARTIAL", final_df, "\n".join(logs_buffer), daily_limit
+            return "PARTIAL", final_df, "\n".join(logs_buffer), daily_limit, result
             
         else:
             # 완전 실패
@@ -352,11 +364,11 @@ def solve_for_days_v2(
                 date_result = result.results[failed_date]
                 logs_buffer.append(f"  - {failed_date.date()}: {date_result.error_message}")
             
-            return "FAILED", pd.DataFrame(), "\n".join(logs_buffer), 0
+            return "FAILED", pd.DataFrame(), "\n".join(logs_buffer), 0, result
     
     except Exception as e:
         logger.exception("스케줄링 중 예외 발생")
-        return "ERROR", pd.DataFrame(), f"예외 발생: {str(e)}", 0
+        return "ERROR", pd.DataFrame(), f"예외 발생: {str(e)}", 0, result
 
 
 def _apply_smart_integration(cfg_ui: dict, logs_buffer: List[str]) -> dict:
@@ -378,13 +390,11 @@ def _apply_smart_integration(cfg_ui: dict, logs_buffer: List[str]) -> dict:
         return cfg_optimized
     
     # 인접 제약 찾기 (gap_min=0, adjacent=True)
-    adjacent_pairs = []
-    for _, rule in precedence_df.iterrows():
-        if rule.get("adjacent", False) and rule.get("gap_min", 0) == 0:
-            pred = rule["predecessor"]
-            succ = rule["successor"]
-            adjacent_pairs.append((pred, succ))
-            logs_buffer.append(f"🔍 인접 제약 발견: {pred} → {succ} (gap_min=0)")
+    is_adjacent = _column(precedence_df, "adjacent", False).astype(bool) & (_column(precedence_df, "gap_min", 0) == 0)
+    adjacent_rules = precedence_df[is_adjacent]
+    adjacent_pairs = list(zip(adjacent_rules["predecessor"], adjacent_rules["successor"]))
+    for pred, succ in adjacent_pairs:
+        logs_buffer.append(f"🔍 인접 제약 발견: {pred} → {succ} (gap_min=0)")
     
     if not adjacent_pairs:
         logs_buffer.append("gap_min=0 인접 제약 없음 - 통합 불필요")
@@ -481,18 +491,24 @@ def _convert_ui_data(
     if activities_df.empty:
         raise ValueError("활동 정보가 없습니다")
     
-    activities = {}
-    for _, row in activities_df.iterrows():
-        if not row.get("use", False):
-            continue
-            
-        activities[row["activity"]] = {
-            "mode": row["mode"],
-            "duration_min": int(row["duration_min"]),
-            "room_type": row["room_type"],
-            "min_capacity": int(row.get("min_cap", 1)),
-            "max_capacity": int(row.get("max_cap", 1))
+    used = activities_df[_column(activities_df, "use", False).astype(bool)]
+    activities = {
+        name: {
+            "mode": mode,
+            "duration_min": duration,
+            "room_type": room_type,
+            "min_capacity": min_cap,
+            "max_capacity": max_cap
         }
+        for name, mode, duration, room_type, min_cap, max_cap in zip(
+            used["activity"].tolist(),
+            used["mode"].tolist(),
+            used["duration_min"].astype(int).tolist(),
+            used["room_type"].tolist(),
+            _column(used, "min_cap", 1).astype(int).tolist(),
+            _column(used, "max_cap", 1).astype(int).tolist()
+        )
+    }
     
     logs_buffer.append(f"활동 {len(activities)}개 로드: {list(activities.keys())}")
     
@@ -556,7 +572,8 @@ def _convert_ui_data(
             date_plans[plan_date] = DatePlan(
                 date=plan_date,
                 jobs=jobs,
-                selected_activities=selected_activities
+                selected_activities=selected_activities,
+                overrides=plan.get("overrides")
             )
             
             logs_buffer.append(f"날짜 계획 생성: {plan_date.date()}, 직무: {jobs}, 활동: {selected_activities}")
@@ -571,47 +588,57 @@ def _convert_ui_data(
             # 기본값: 내일 날짜
             selected_dates = [(datetime.now() + timedelta(days=1)).date()]
         
-        # 각 날짜별로 DatePlan 생성
-        for _, row in job_acts_df.iterrows():
-            # 직무별 인원수
-            jobs = {row["code"]: int(row["count"])}
+        # 첫 번째 직무 행만 처리 (모든 날짜에 동일 적용)
+        row = job_acts_df.iloc[0]
+        
+        # 직무별 인원수
+        jobs = {row["code"]: int(row["count"])}
+        
+        # 해당 직무가 수행할 활동들
+        selected_activities = [name for name in activities if row.get(name, False)]
+        
+        # 각 선택된 날짜별로 DatePlan 생성
+        for selected_date in selected_dates:
+            if isinstance(selected_date, str):
+                plan_date = datetime.strptime(selected_date, "%Y-%m-%d")
+            elif hasattr(selected_date, 'date'):
+                plan_date = datetime.combine(selected_date, datetime.min.time())
+            else:
+                plan_date = datetime.combine(selected_date, datetime.min.time())
             
-            # 해당 직무가 수행할 활동들
-            selected_activities = []
-            for activity_name in activities.keys():
-                if row.get(activity_name, False):
-                    selected_activities.append(activity_name)
+            date_plans[plan_date] = DatePlan(
+                date=plan_date,
+                jobs=jobs,
+                selected_activities=selected_activities
+            )
             
-            # 각 선택된 날짜별로 DatePlan 생성
-            for selected_date in selected_dates:
-                if isinstance(selected_date, str):
-                    plan_date = datetime.strptime(selected_date, "%Y-%m-%d")
-                elif hasattr(selected_date, 'date'):
-                    plan_date = datetime.combine(selected_date, datetime.min.time())
-                else:
-                    plan_date = datetime.combine(selected_date, datetime.min.time())
-                
-                date_plans[plan_date] = DatePlan(
-                    date=plan_date,
-                    jobs=jobs,
-                    selected_activities=selected_activities
-                )
-                
-                logs_buffer.append(f"날짜 계획 생성: {plan_date.date()}, 직무: {jobs}, 활동: {selected_activities}")
-            break  # 첫 번째 직무 행만 처리 (모든 날짜에 동일 적용)
+            logs_buffer.append(f"날짜 계획 생성: {plan_date.date()}, 직무: {jobs}, 활동: {selected_activities}")
+    
+    # 날짜별 오버라이드 (예: 2단계 스케줄링의 날짜별 체류시간 하드 제약)
+    for date_key, overrides in (cfg_ui.get("date_overrides") or {}).items():
+        plan_date = pd.to_datetime(date_key).to_pydatetime().replace(hour=0, minute=0, second=0, microsecond=0)
+        if plan_date in date_plans:
+            plan = date_plans[plan_date]
+            plan.overrides = {**(plan.overrides or {}), **overrides}
+            logs_buffer.append(f"날짜 오버라이드 적용: {plan_date.date()} {overrides}")
     
     # 5. 선후행 제약 추출
     precedence_df = cfg_ui.get("precedence", pd.DataFrame())
     precedence_rules = []
     
     if not precedence_df.empty:
-        for _, row in precedence_df.iterrows():
-            if row["predecessor"] != "__START__" and row["successor"] != "__END__":
-                precedence_rules.append(PrecedenceRule(
-                    predecessor=row["predecessor"],
-                    successor=row["successor"],
-                    gap_min=int(row.get("gap_min", 5))
-                ))
+        # __START__/__END__ 앵커 규칙 제외
+        rules = precedence_df[
+            (precedence_df["predecessor"] != "__START__") & (precedence_df["successor"] != "__END__")
+        ]
+        precedence_rules = [
+            PrecedenceRule(predecessor=pred, successor=succ, gap_min=gap)
+            for pred, succ, gap in zip(
+                rules["predecessor"].tolist(),
+                rules["successor"].tolist(),
+                _column(rules, "gap_min", 5).astype(int).tolist()
+            )
+        ]
     
     # 6. 글로벌 설정
     operating_hours = {"default": (time(9, 0), time(18, 0))}
@@ -647,44 +674,38 @@ def _convert_ui_data(
         room_settings={},
         time_settings={},
         global_gap_min=cfg_ui.get('global_gap_min', 5),
-        max_stay_hours=cfg_ui.get('max_stay_hours', 5)  # 기본값을 5시간으로 변경
+        max_stay_hours=cfg_ui.get('max_stay_hours', 8)  # GlobalConfig 기본값과 동일
     )
     
     return date_plans, global_config, rooms, activities
 
 
+def _column(df: pd.DataFrame, name: str, default) -> pd.Series:
+    """열이 없으면 기본값으로 채운 Series (row.get(name, default)의 열 단위 버전)"""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+def _integrate_and_convert(
+    cfg_ui: dict,
+    logs_buffer: List[str]
+) -> Tuple[Dict[datetime, DatePlan], GlobalConfig, Dict[str, dict], Dict[str, dict]]:
+    """스마트 통합 후 변환 (solve_for_days_v2 경로)"""
+    return _convert_ui_data(_apply_smart_integration(cfg_ui, logs_buffer), logs_buffer)
+
+
 def _convert_result_to_ui_format(result, logs_buffer: List[str]) -> pd.DataFrame:
-    """스케줄링 결과를 UI 표시용 DataFrame으로 변환"""
-    
-    schedule_data = []
-    
+    """스케줄링 결과를 UI 표시용 DataFrame으로 변환 (열 단위 빌더, 더미 지원자 제외, 시간 순 정렬)"""
+    columns = ScheduleColumns()
     for date, date_result in result.results.items():
-        if date_result.status != "SUCCESS":
-            continue
-            
-        for item in date_result.schedule:
-            # 더미 지원자는 제외
-            if item.applicant_id.startswith("DUMMY_"):
-                continue
-                
-            schedule_data.append({
-                "interview_date": date,
-                "applicant_id": item.applicant_id,
-                "job_code": item.job_code,
-                "activity_name": item.activity_name,
-                "room_name": item.room_name,
-                "start_time": item.start_time,
-                "end_time": item.end_time,
-                "duration_min": int(round((item.end_time - item.start_time).total_seconds() / 60 / 5) * 5)
-            })
+        if date_result.status == "SUCCESS":
+            columns.add(date, date_result.schedule, skip_dummy=True)
     
-    if not schedule_data:
+    if not len(columns):
         return pd.DataFrame()
     
-    df = pd.DataFrame(schedule_data)
-    
-    # 시간 순으로 정렬
-    df = df.sort_values(["interview_date", "start_time", "applicant_id"])
+    df = columns.to_ui_frame()
     
     logs_buffer.append(f"UI 형식 변환 완료: {len(df)}개 스케줄 항목")
     
@@ -692,20 +713,47 @@ def _convert_result_to_ui_format(result, logs_buffer: List[str]) -> pd.DataFrame
 
 
 def _calculate_daily_limit(result) -> int:
-    """일일 처리 가능 인원 계산"""
+    """일일 처리 인원 계산 (성공한 날짜 중 최대, 더미 제외 지원자 수)"""
     max_daily = 0
     
     for date, date_result in result.results.items():
         if date_result.status == "SUCCESS":
-            daily_count = len([
-                item for item in date_result.schedule 
+            daily_count = len({
+                item.applicant_id for item in date_result.schedule 
                 if not item.applicant_id.startswith("DUMMY_")
-            ])
+            })
             max_daily = max(max_daily, daily_count)
     
     return max_daily
 
 
+def _log_daily_capacity(
+    date_plans: Dict[datetime, DatePlan],
+    global_config: GlobalConfig,
+    rooms: Dict[str, dict],
+    activities: Dict[str, dict],
+    logs_buffer: List[str]
+):
+    """날짜별 처리량 상한 추정을 로그에 기록 (계획 인원이 상한을 넘으면 병목 자원 안내)"""
+    from .capacity import DailyCapacityEstimator
+    
+    builder = MultiDateScheduler()
+    estimator = DailyCapacityEstimator()
+    for plan_date, plan in sorted(date_plans.items()):
+        try:
+            config = builder._build_date_config(plan, global_config, rooms, activities)
+            estimate = estimator.estimate(config)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"일일 처리량 추정 실패 ({plan_date.date()}): {e}")
+            continue
+        planned = plan.get_total_applicants()
+        logs_buffer.append(
+            f"{plan_date.date()}: 계획 {planned}명, 처리량 상한 {estimate.bound}명 (권장 {estimate.recommended}명)"
+        )
+        if planned > estimate.bound:
+            logs_buffer.append(f"  ⚠️ 계획 인원이 처리량 상한 초과 - 병목: {estimate.bottleneck}")
+
+
 def get_scheduler_comparison() -> Dict[str, Any]:
     """두 스케줄러 시스템의 비교 정보 제공"""
     return {
@@ -791,15 +839,17 @@ def solve_for_days_optimized(
         # 스케줄링 컨텍스트 생성
         context = SchedulingContext(
             progress_callback=progress_callback,
-            enable_detailed_logging=debug,
-            real_time_updates=True
+            debug=debug
         )
         
-        # UI 데이터 변환
-        date_plans, global_config, rooms, activities = _convert_ui_data(cfg_ui, logs_buffer)
+        # UI 데이터 변환 (같은 내용이면 캐시 사용)
+        conversion = _UI_CONFIG_CACHE.get_or_convert(cfg_ui, _convert_ui_data, logs_buffer)
+        date_plans, global_config = conversion.date_plans, conversion.global_config
+        rooms, activities = conversion.rooms, conversion.activities
         
         if not date_plans:
             return "FAILED", pd.DataFrame(), "날짜별 계획이 없습니다.", 0
+        _log_daily_capacity(date_plans, global_config, rooms, activities, logs_buffer)
         
         # 멀티 날짜 스케줄링 실행 (최적화된 스케줄러 사용)
         from .optimized_multi_date_scheduler import OptimizedMultiDateScheduler
@@ -810,7 +860,8 @@ def solve_for_days_optimized(
             global_config=global_config,
             rooms=rooms,
             activities=activities,
-            context=context
+            context=context,
+            date_configs=conversion.date_configs
         )
         
         # 결과 분석
@@ -955,7 +1006,8 @@ def solve_for_days_three_phase(
     progress_callback: Optional[ProgressCallback] = None,
     initial_percentile: float = 90.0,
     final_percentile: float = 95.0,
-    max_iterations: int = 3
+    max_iterations: int = 3,
+    sweep: bool = False
 ) -> Tuple[str, pd.DataFrame, str, int, Dict[str, pd.DataFrame]]:
     """
     3단계 하드 제약 스케줄링 (점진적 분위수 조정)
@@ -968,10 +1020,15 @@ def solve_for_days_three_phase(
         initial_percentile: 초기 하드 제약 계산용 분위수 (기본값: 90.0)
         final_percentile: 최종 하드 제약 계산용 분위수 (기본값: 95.0)
         max_iterations: 최대 반복 횟수 (기본값: 3)
+        sweep: True면 같은 분위수 후보를 순서대로 대신 동시에 평가 (solve_for_days_sweep)
     
     Returns:
         (status, final_wide_df, logs, daily_limit, reports)
     """
+    if sweep:
+        step = (final_percentile - initial_percentile) / (max_iterations - 1) if max_iterations > 1 else 0.0
+        percentiles = [min(final_percentile, initial_percentile + step * i) for i in range(max_iterations)]
+        return solve_for_days_sweep(cfg_ui, params, debug, progress_callback, percentiles=percentiles)
     try:
         # 로깅 설정
         log_level = logging.DEBUG if debug else logging.WARNING
@@ -986,11 +1043,11 @@ def solve_for_days_three_phase(
         # 1단계: 초기 스케줄링 (소프트 제약만 적용)
         logs_buffer.append("\n1단계: 초기 스케줄링 (소프트 제약)")
         
-        from .api import solve_for_days_v2
         phase1_params = params.copy() if params else {}
         phase1_params['max_stay_hours'] = 12  # 충분히 큰 값으로 설정
         
-        status1, df1, logs1, limit1 = solve_for_days_v2(
+        # 각 단계 결과는 다음 단계의 웜 스타트 (체류시간 제한만 바뀌므로 이전 배치 재사용)
+        status1, df1, logs1, limit1, previous_result = _solve_for_days_v2_result(
             cfg_ui, 
             phase1_params, 
             debug, 
@@ -1032,13 +1089,16 @@ def solve_for_days_three_phase(
             scheduler = HardConstraintScheduler(percentile=current_percentile)
             
             phase_result = scheduler._apply_hard_constraints(
-                cfg_ui, hard_constraints, params, debug, progress_callback
+                cfg_ui, hard_constraints, params, debug, progress_callback,
+                warm_start=previous_result
             )
             
             if phase_result['status'] != "SUCCESS":
                 logs_buffer.append(f"{iteration + 1}단계 스케줄링 실패: {phase_result.get('error', 'Unknown error')}")
                 break
             
+            previous_result = phase_result['result']
+            
             # 결과 저장
             iteration_results.append({
                 'iteration': iteration + 1,
@@ -1097,6 +1157,95 @@ def solve_for_days_three_phase(
         return "ERROR", pd.DataFrame(), f"예외 발생: {str(e)}", 0, {}
 
 
+def solve_for_days_sweep(
+    cfg_ui: dict,
+    params: dict = None,
+    debug: bool = False,
+    progress_callback: Optional[ProgressCallback] = None,
+    percentiles: Optional[List[float]] = None,
+    hour_caps: Optional[List[float]] = None,
+    policy: str = "tightest",
+    max_violation_rate: float = 5.0,
+    workers: Optional[int] = None
+) -> Tuple[str, pd.DataFrame, str, int, Dict[str, pd.DataFrame]]:
+    """
+    하드 제약 후보 동시 평가 스케줄링 (1단계 결과 하나에서 후보 제한을 한 번에 평가)
+    
+    Args:
+        cfg_ui: UI 설정 딕셔너리
+        params: 추가 파라미터
+        debug: 디버그 모드
+        progress_callback: 실시간 진행 상황 콜백 함수 (후보 평가 완료마다)
+        percentiles: 날짜별 제한을 정할 분위수 후보 (기본값: 90, 92.5, 95)
+        hour_caps: 모든 날짜에 같은 절대 제한(시간) 후보
+        policy: 선택 정책 - tightest | fewest_violations | fastest
+        max_violation_rate: 허용 위반률 (%, tightest/fastest 기준)
+        workers: 동시 평가 프로세스 수 (기본값: CPU 수)
+    
+    Returns:
+        (status, final_wide_df, logs, daily_limit, reports)
+        reports['sweep_tradeoff']: 후보별 제한 / 위반 수 / 실행시간 (pareto, selected 열 포함)
+    """
+    try:
+        log_level = logging.DEBUG if debug else logging.WARNING
+        logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
+        logger = logging.getLogger(__name__)
+        
+        from .constraint_sweep import ConstraintSweep, DEFAULT_PERCENTILES
+        sweeper = ConstraintSweep(
+            percentiles=DEFAULT_PERCENTILES if percentiles is None else percentiles,
+            hour_caps=hour_caps or (),
+            policy=policy,
+            max_violation_rate=max_violation_rate,
+            workers=workers,
+            logger=logger
+        )
+        
+        logs_buffer = [f"=== 하드 제약 후보 동시 평가 시작 (정책: {policy}) ==="]
+        
+        # 1단계: 초기 스케줄링 (소프트 제약만 적용) - 모든 후보가 공유하는 웜 스타트
+        phase1_params = params.copy() if params else {}
+        phase1_params['max_stay_hours'] = 12  # 충분히 큰 값으로 설정
+        status1, df1, logs1, limit1, phase1_result = _solve_for_days_v2_result(
+            cfg_ui, phase1_params, debug, progress_callback
+        )
+        if status1 != "SUCCESS":
+            logs_buffer.append(f"1단계 스케줄링 실패: {status1}")
+            return "FAILED", pd.DataFrame(), "\n".join(logs_buffer), 0, {}
+        logs_buffer.append(f"1단계 완료: {len(df1)}개 스케줄 생성")
+        
+        sweep_result = sweeper.run(cfg_ui, df1, phase1_result, params, debug, progress_callback)
+        for point in sweep_result.points:
+            logs_buffer.append(
+                f"  {point.label}: {point.status}, 제한 {point.cap_hours:.2f}시간, "
+                f"위반 {point.total_violations}명 ({point.violation_rate:.1f}%), {point.runtime_sec:.1f}초"
+            )
+        reports = {'sweep_tradeoff': sweep_result.to_dataframe()} if sweep_result.points else {}
+        
+        selected = sweep_result.selected
+        if selected is None:
+            logs_buffer.append("모든 후보 실패")
+            return "FAILED", pd.DataFrame(), "\n".join(logs_buffer), 0, reports
+        
+        logs_buffer.append(
+            f"\n최종 결과: {selected.label} (Pareto {len(sweep_result.pareto)}개 중 {policy} 기준)"
+        )
+        final_df = selected.schedule
+        daily_limit = final_df.groupby('interview_date')['applicant_id'].nunique().max() if not final_df.empty else 0
+        final_result = {
+            'iteration': 2,
+            'percentile': selected.percentile,
+            'exceed_analysis': selected.exceed_analysis
+        }
+        reports.update(_generate_three_phase_report([final_result], final_result))
+        
+        return "SUCCESS", final_df, "\n".join(logs_buffer), daily_limit, reports
+    
+    except Exception as e:
+        logger.exception("하드 제약 후보 동시 평가 중 예외 발생")
+        return "ERROR", pd.DataFrame(), f"예외 발생: {str(e)}", 0, {}
+
+
 def _generate_three_phase_report(iteration_results: List[Dict], final_result: Dict) -> Dict[str, pd.DataFrame]:
     """3단계 스케줄링 종합 리포트 생성"""
     reports = {}
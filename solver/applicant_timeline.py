@@ -0,0 +1,141 @@
+"""
+지원자별 하루 일정 비트맵
+
+운영시간을 5분 그리드로 나누고 지원자당 1행의 bool 배열(2-D NumPy)로 바쁜 시간을 표시한다.
+- 배정이 추가되면 해당 행만 갱신 (증분)
+- 그룹 공통 가용 시간은 여러 행의 OR 후 반전으로 한 번에 계산
+- 최대 체류시간(max_stay)이 있으면 가용 시간을 [마지막 바쁜 슬롯 끝 - 제한, 첫 바쁜 슬롯 시작 + 제한]
+  으로 좁힌다 (배정이 늘수록 창이 좁아짐)
+- UndoLog를 넘기면 sync로 바뀐 행과 반영 개수를 기록해, 백트래킹 rollback 때 함께 되돌린다
+  (되돌린 뒤 같은 길이로 다시 append해도 새 배정이 반영됨)
+"""
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .undo_log import UndoLog
+
+
+class ApplicantTimelines:
+    """지원자별 바쁜 시간 비트맵 (행: 지원자, 열: 5분 슬롯)"""
+
+    def __init__(
+        self,
+        applicant_ids: Iterable[str],
+        start_time: timedelta,
+        end_time: timedelta,
+        slot_minutes: int = 5,
+        max_stay: Optional[timedelta] = None,
+        log: Optional[UndoLog] = None
+    ):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.slot = timedelta(minutes=slot_minutes)
+        self.n_slots = max(0, -(-(end_time - start_time) // self.slot))
+        # 체류시간 제한 (슬롯 수, 내림)
+        self.max_stay_slots = max_stay // self.slot if max_stay else None
+
+        self._rows: Dict[str, int] = {}
+        for applicant_id in applicant_ids:
+            self._rows.setdefault(applicant_id, len(self._rows))
+
+        self._busy = np.zeros((len(self._rows), self.n_slots), dtype=bool)
+        self._base = self._busy
+        # 지원자별로 이미 반영한 TimeSlot 개수 (schedule_by_applicant 증분 동기화용)
+        self._synced = np.zeros(len(self._rows), dtype=np.int64)
+        self._log = log
+
+    def _slot_range(self, start: timedelta, end: timedelta) -> Tuple[int, int]:
+        """[start, end)를 덮는 슬롯 범위 (바깥쪽으로 반올림)"""
+        lo = (start - self.start_time) // self.slot
+        hi = -(-(end - self.start_time) // self.slot)
+        return max(0, lo), min(self.n_slots, hi)
+
+    def mark_busy(self, applicant_id: str, start: timedelta, end: timedelta) -> None:
+        """지원자의 [start, end)를 바쁜 시간으로 표시"""
+        row = self._rows.get(applicant_id)
+        if row is None:
+            return
+        lo, hi = self._slot_range(start, end)
+        if lo < hi:
+            self._busy[row, lo:hi] = True
+
+    def freeze_base(self) -> None:
+        """현재 상태(Batched 블록)를 기준선으로 저장"""
+        self._base = self._busy.copy()
+
+    def sync(self, applicant_id: str, slots: Sequence) -> None:
+        """schedule_by_applicant의 새 TimeSlot만 반영 (목록이 줄었으면 기준선부터 재구성)"""
+        row = self._rows.get(applicant_id)
+        if row is None:
+            return
+        synced = int(self._synced[row])
+        if len(slots) == synced:
+            return
+        if self._log is not None:
+            self._log.push(self._restore_row(row, self._busy[row].copy(), synced))
+        if len(slots) < synced:
+            self._busy[row] = self._base[row]
+            synced = 0
+        for slot in slots[synced:]:
+            self.mark_busy(applicant_id, slot.start_time, slot.end_time)
+        self._synced[row] = len(slots)
+
+    def _restore_row(self, row: int, busy: np.ndarray, synced: int):
+        def restore() -> None:
+            self._busy[row] = busy
+            self._synced[row] = synced
+        return restore
+
+    def free_intervals(self, applicant_id: str) -> List[Tuple[timedelta, timedelta]]:
+        """지원자의 가용 시간대 (체류시간 창 안)"""
+        row = self._rows.get(applicant_id)
+        if row is None:
+            return [(self.start_time, self.end_time)]
+        return self._runs(self._within_stay(~self._busy[row], [row]))
+
+    def common_free_intervals(self, applicant_ids: Sequence[str]) -> List[Tuple[timedelta, timedelta]]:
+        """여러 지원자의 공통 가용 시간대 (모두의 체류시간 창 안)"""
+        rows = [self._rows[a] for a in applicant_ids if a in self._rows]
+        if not rows:
+            return [(self.start_time, self.end_time)]
+        return self._runs(self._within_stay(~self._busy[rows].any(axis=0), rows))
+
+    def stay_window(self, applicant_ids: Sequence[str]) -> Tuple[timedelta, timedelta]:
+        """체류시간 제한상 지원자들의 활동이 모두 들어가야 하는 시간대 (제한이 없으면 운영시간)"""
+        rows = [self._rows[a] for a in applicant_ids if a in self._rows]
+        lo, hi = self._stay_bounds(rows)
+        return self.start_time + lo * self.slot, min(self.end_time, self.start_time + hi * self.slot)
+
+    def _stay_bounds(self, rows: Sequence[int]) -> Tuple[int, int]:
+        """행들의 체류시간 창 [lo, hi) (슬롯 인덱스)"""
+        if self.max_stay_slots is None or not len(rows):
+            return 0, self.n_slots
+        busy = self._busy[rows]
+        has_busy = busy.any(axis=1)
+        if not has_busy.any():
+            return 0, self.n_slots
+        busy = busy[has_busy]
+        first = busy.argmax(axis=1)
+        last = self.n_slots - busy[:, ::-1].argmax(axis=1)
+        return max(0, int(last.max()) - self.max_stay_slots), min(self.n_slots, int(first.min()) + self.max_stay_slots)
+
+    def _within_stay(self, free: np.ndarray, rows: Sequence[int]) -> np.ndarray:
+        lo, hi = self._stay_bounds(rows)
+        if lo == 0 and hi == self.n_slots:
+            return free
+        free = free.copy()
+        free[:lo] = False
+        free[hi:] = False
+        return free
+
+    def _runs(self, free: np.ndarray) -> List[Tuple[timedelta, timedelta]]:
+        """연속된 True 구간을 시간대 목록으로 변환"""
+        edges = np.diff(np.concatenate(([0], free.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return [
+            (self.start_time + int(s) * self.slot, min(self.end_time, self.start_time + int(e) * self.slot))
+            for s, e in zip(starts, ends)
+        ]
@@ -5,16 +5,21 @@ Level 2: Batched 활동 스케줄링
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import reduce
 import logging
+import math
 import time as time_module
 import random
 from dataclasses import dataclass
+from ortools.sat.python import cp_model
 
 from .types import (
     Group, DateConfig, Level2Result, ScheduleItem, TimeSlot,
     Room, Activity, ActivityMode, PrecedenceRule,
     GroupScheduleResult, GroupAssignment
 )
+from .compiled_config import CompiledDateConfig, compile_date_config
+from .room_calendar import RoomCalendar
 
 
 @dataclass
@@ -29,16 +34,20 @@ class BatchedScheduler:
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
+        self.greedy_placements: Dict[Tuple[str, str], Tuple[str, timedelta]] = {}
+        self.last_cpsat_status: Optional[str] = None
         
     def schedule(
         self,
         groups: Dict[str, List[Group]],
         config: DateConfig,
-        time_limit: float = 60.0
+        time_limit: float = 60.0,
+        compiled: Optional[CompiledDateConfig] = None
     ) -> Optional[Level2Result]:
         """Level 2: Batched 활동 스케줄링"""
         self.logger.info("Batched 활동 스케줄링 시작")
         start_time = time_module.time()
+        compiled = compiled or compile_date_config(config)
         
         # Batched 활동만 필터링
         batched_activities = [
@@ -61,13 +70,18 @@ class BatchedScheduler:
         
         # 스케줄링 시도
         results = []
-        room_assignments = {}
         group_activity_times = {}  # 모든 활동에서 공유
+        room_next_free = {}  # 방별 다음 사용 가능 시각 (같은 방을 쓰는 활동끼리 공유)
+        applicant_spans = {}  # 지원자별 (첫 시작, 마지막 종료) - 최대 체류시간 확인용
+        self.greedy_placements = {}  # (그룹 id, 활동) → (방, 시작) - CP-SAT hint용
         
         for activity in ordered_activities:
+            # 최대 체류시간이 있으면 마지막 Batched 활동에서 후속 개별 활동 처리량에 맞춰 그룹 시작을 늦춤
+            pacing = {} if config.max_stay and activity is ordered_activities[-1] else None
             result = self._schedule_activity_with_precedence(
                 activity, groups, config, group_activity_times,
-                time_limit - (time_module.time() - start_time)
+                time_limit - (time_module.time() - start_time),
+                compiled, room_next_free, applicant_spans, pacing
             )
             
             if not result:
@@ -75,10 +89,19 @@ class BatchedScheduler:
                 return None
                 
             results.append(result)
-            
+        
+        elapsed = time_module.time() - start_time
+        self.logger.info(f"Batched 스케줄링 완료: {elapsed:.1f}초")
+        
+        return self._assemble_level2_result(results)
+    
+    def _assemble_level2_result(self, results: List[GroupScheduleResult]) -> Level2Result:
+        """활동별 GroupScheduleResult를 Level2Result로 통합"""
+        room_assignments = {}
+        for result in results:
             # 방 배정 정보 통합 (GroupAssignment에서 추출)
             for assignment in result.assignments:
-                room_assignments[f"{activity.name}_{assignment.group.id}"] = assignment.room
+                room_assignments[f"{result.activity_name}_{assignment.group.id}"] = assignment.room
         
         # 전체 스케줄 통합 (GroupAssignment에서 ScheduleItem 생성)
         all_schedule = []
@@ -118,15 +141,277 @@ class BatchedScheduler:
         
         self.logger.info(f"🔍 총 생성된 ScheduleItem 수: {len(all_schedule)}")
         
-        elapsed = time_module.time() - start_time
-        self.logger.info(f"Batched 스케줄링 완료: {elapsed:.1f}초")
-        
         return Level2Result(
             schedule=all_schedule,
             room_assignments=room_assignments,
             group_results=results
         )
     
+    def schedule_cpsat(
+        self,
+        groups: Dict[str, List[Group]],
+        config: DateConfig,
+        time_limit: float = 60.0,
+        compiled: Optional[CompiledDateConfig] = None,
+        hint: Optional[Dict[Tuple[str, str], Tuple[str, timedelta]]] = None
+    ) -> Optional[Level2Result]:
+        """
+        Level 2: CP-SAT 기반 Batched 활동 스케줄링
+        
+        시간 단위는 5분과 소요시간/간격의 최대공약수 (올림 없이 정확한 간격).
+        그룹 × 방 optional interval, 방별 NoOverlap, 지원자별 NoOverlap과 최대 체류시간,
+        Batched 활동 간 precedence, 운영시간을 모델링하고
+        makespan → 직무 접미사 외 방 사용 → 시작 시각 합 순으로 최소화한다.
+        hint: (그룹 id, 활동) → (방, 시작) - greedy 배치 결과 (부분 배치도 가능)
+        """
+        self.logger.info("CP-SAT Batched 활동 스케줄링 시작")
+        start_clock = time_module.time()
+        compiled = compiled or compile_date_config(config)
+        day_start, day_end = config.operating_hours
+        
+        batched_activities = [
+            a for a in config.activities
+            if a.mode == ActivityMode.BATCHED
+        ]
+        if not batched_activities:
+            return Level2Result(schedule=[], room_assignments={}, group_results=[])
+        slot = self._cpsat_slot(batched_activities, compiled)
+        horizon = int((day_end - day_start).total_seconds() // 60) // slot
+        
+        model = cp_model.CpModel()
+        starts = {}        # (그룹 id, 활동) → 시작 슬롯 변수
+        durations = {}     # 활동 → 슬롯 수
+        presences = {}     # (그룹 id, 활동) → [(방, presence 변수)]
+        intervals = {}     # (그룹 id, 활동) → interval
+        room_intervals = defaultdict(list)
+        applicant_intervals = defaultdict(dict)  # 지원자 → {(그룹 id, 활동): interval}
+        ends = []
+        penalties = []
+        
+        for activity in batched_activities:
+            activity_groups = groups.get(activity.name, [])
+            if not activity_groups:
+                self.logger.warning(f"활동 {activity.name}에 대한 그룹이 없습니다")
+                return None
+            
+            duration = int(activity.duration.total_seconds() // 60) // slot
+            durations[activity.name] = duration
+            available_rooms = [
+                room for room in compiled.rooms_for(activity.name)
+                if room.capacity >= activity.min_capacity
+            ]
+            if not available_rooms or duration > horizon:
+                self.logger.error(f"활동 {activity.name}에 사용 가능한 방/시간이 없습니다")
+                self.last_cpsat_status = "INFEASIBLE"
+                return None
+            
+            activity_intervals = []
+            room_suffix_map = self._assign_room_suffixes(
+                sorted({g.job_code for g in activity_groups}), available_rooms
+            )
+            
+            for group in activity_groups:
+                key = (group.id, activity.name)
+                start = model.NewIntVar(0, horizon - duration, f"s_{group.id}_{activity.name}")
+                end = model.NewIntVar(duration, horizon, f"e_{group.id}_{activity.name}")
+                interval = model.NewIntervalVar(start, duration, end, f"i_{group.id}_{activity.name}")
+                starts[key], intervals[key] = start, interval
+                activity_intervals.append(interval)
+                ends.append(end)
+                
+                # 방 선택 (정확히 1개)
+                preferred = [
+                    r for r in available_rooms
+                    if r.get_suffix() == room_suffix_map.get(group.job_code)
+                ] or available_rooms
+                options = []
+                for room in available_rooms:
+                    present = model.NewBoolVar(f"p_{group.id}_{activity.name}_{room.name}")
+                    room_intervals[room.name].append(model.NewOptionalIntervalVar(
+                        start, duration, end, present,
+                        f"o_{group.id}_{activity.name}_{room.name}"
+                    ))
+                    options.append((room, present))
+                    if room not in preferred:
+                        penalties.append(present)
+                model.AddExactlyOne(p for _, p in options)
+                presences[key] = options
+                
+                member_ids = [a.id for a in group.applicants] + list(getattr(group, 'dummy_ids', []))
+                for member_id in member_ids:
+                    applicant_intervals[member_id][key] = interval
+            
+            # 중복 제약: 동시에 진행되는 그룹 수 ≤ 방 수 (makespan 하한 강화)
+            model.AddCumulative(activity_intervals, [1] * len(activity_intervals), len(available_rooms))
+        
+        # 방별 NoOverlap (같은 방을 쓰는 Batched 활동끼리 공유)
+        for room_name, room_ivs in room_intervals.items():
+            model.AddNoOverlap(room_ivs)
+        
+        # 지원자별 NoOverlap + 최대 체류시간 (같은 그룹 조합은 한 번만)
+        max_stay_slots = int(config.max_stay.total_seconds() // 60) // slot if config.max_stay else None
+        seen = set()
+        for member_intervals in applicant_intervals.values():
+            signature = tuple(sorted(member_intervals))
+            if len(signature) > 1 and signature not in seen:
+                seen.add(signature)
+                model.AddNoOverlap(list(member_intervals.values()))
+                if max_stay_slots is not None:
+                    first = model.NewIntVar(0, horizon, f"first_{len(seen)}")
+                    last = model.NewIntVar(0, horizon, f"last_{len(seen)}")
+                    model.AddMinEquality(first, [starts[key] for key in signature])
+                    model.AddMaxEquality(last, [starts[key] + durations[key[1]] for key in signature])
+                    model.Add(last - first <= max_stay_slots)
+        
+        # Batched 활동 간 precedence (지원자가 속한 그룹 쌍마다)
+        linked = set()
+        for member_intervals in applicant_intervals.values():
+            by_activity = {activity_name: group_id for group_id, activity_name in member_intervals}
+            for activity in batched_activities:
+                succ_group = by_activity.get(activity.name)
+                if succ_group is None:
+                    continue
+                for predecessor, gap, is_adjacent in compiled.predecessors_of(activity.name):
+                    pred_group = by_activity.get(predecessor)
+                    link = (pred_group, predecessor, succ_group, activity.name)
+                    if pred_group is None or link in linked:
+                        continue
+                    linked.add(link)
+                    gap_slots = gap // slot
+                    pred_end = starts[(pred_group, predecessor)] + durations[predecessor]
+                    succ_start = starts[(succ_group, activity.name)]
+                    if is_adjacent:
+                        model.Add(succ_start == pred_end + gap_slots)
+                    else:
+                        model.Add(succ_start >= pred_end + gap_slots)
+        
+        # 목적함수: makespan → 접미사 외 방 사용 → 시작 시각 합
+        makespan = model.NewIntVar(0, horizon, "makespan")
+        model.AddMaxEquality(makespan, ends)
+        start_weight = 1
+        penalty_weight = len(starts) * horizon + 1
+        makespan_weight = penalty_weight * (len(penalties) + 1)
+        model.Minimize(
+            makespan * makespan_weight
+            + sum(penalties) * penalty_weight
+            + sum(starts.values()) * start_weight
+        )
+        
+        # greedy 배치를 hint로 사용
+        for key, (room_name, start_time) in (hint or {}).items():
+            if key not in starts:
+                continue
+            model.AddHint(starts[key], int((start_time - day_start).total_seconds() // 60) // slot)
+            for room, present in presences[key]:
+                model.AddHint(present, room.name == room_name)
+        
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = max(1.0, float(time_limit))
+        solver.parameters.relative_gap_limit = 0.01
+        status = solver.Solve(model)
+        self.last_cpsat_status = solver.StatusName(status)
+        
+        elapsed = time_module.time() - start_clock
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            if status == cp_model.INFEASIBLE:
+                self.logger.error(f"❌ CP-SAT Level 2 불가능 증명 ({elapsed:.1f}초)")
+            else:
+                self.logger.error(f"❌ CP-SAT Level 2 해 없음: {self.last_cpsat_status} ({elapsed:.1f}초)")
+            return None
+        
+        self.logger.info(
+            f"✅ CP-SAT Level 2 {self.last_cpsat_status}: makespan "
+            f"{day_start + timedelta(minutes=solver.Value(makespan) * slot)} ({elapsed:.1f}초)"
+        )
+        
+        # 결과 추출 (활동별 GroupScheduleResult)
+        placements = {}
+        for activity in batched_activities:
+            for group in groups[activity.name]:
+                key = (group.id, activity.name)
+                room = next(room for room, present in presences[key] if solver.Value(present))
+                placements[key] = (room, day_start + timedelta(minutes=solver.Value(starts[key]) * slot))
+        return self._assemble_level2_result(self._group_results(batched_activities, groups, placements))
+    
+    @staticmethod
+    def _cpsat_slot(batched_activities: List[Activity], compiled: CompiledDateConfig, base: int = 5) -> int:
+        """
+        CP-SAT 시간 단위(분): 5분과 Batched 활동 소요시간, 활동 간 간격의 최대공약수
+        소요시간/간격이 5의 배수가 아니어도 올림 없이 정확한 연속배치/간격을 표현한다.
+        """
+        names = {a.name for a in batched_activities}
+        minutes = [int(a.duration.total_seconds() // 60) for a in batched_activities]
+        minutes += [
+            gap for a in batched_activities
+            for predecessor, gap, _ in compiled.predecessors_of(a.name) if predecessor in names
+        ]
+        return reduce(math.gcd, minutes, base) or base
+    
+    def rebuild(
+        self,
+        groups: Dict[str, List[Group]],
+        config: DateConfig,
+        schedule: List[ScheduleItem],
+        compiled: Optional[CompiledDateConfig] = None
+    ) -> Optional[Level2Result]:
+        """
+        이미 있는 스케줄(이전 단계 결과, Level 4 조정 포함)의 Batched 배치로 Level2Result 재구성
+        그룹 하나라도 배치를 찾지 못하면 None
+        """
+        compiled = compiled or compile_date_config(config)
+        batched_activities = [a for a in config.activities if a.mode == ActivityMode.BATCHED]
+        found = {
+            (item.group_id, item.activity_name): (item.room_name, item.start_time)
+            for item in schedule if item.group_id and compiled.is_batched(item.activity_name)
+        }
+        placements = {}
+        for activity in batched_activities:
+            for group in groups.get(activity.name, []):
+                key = (group.id, activity.name)
+                room = compiled.room(found[key][0]) if key in found else None
+                if room is None:
+                    return None
+                placements[key] = (room, found[key][1])
+        return self._assemble_level2_result(self._group_results(batched_activities, groups, placements))
+    
+    def _group_results(
+        self,
+        batched_activities: List[Activity],
+        groups: Dict[str, List[Group]],
+        placements: Dict[Tuple[str, str], Tuple[Room, timedelta]]
+    ) -> List[GroupScheduleResult]:
+        """(그룹 id, 활동) → (방, 시작) 배치를 활동별 GroupScheduleResult로 변환"""
+        results = []
+        for activity in batched_activities:
+            result = GroupScheduleResult(activity_name=activity.name)
+            schedule_by_applicant = defaultdict(list)
+            schedule_by_room = defaultdict(list)
+            for group in groups.get(activity.name, []):
+                room, start_time = placements[(group.id, activity.name)]
+                end_time = start_time + activity.duration
+                
+                member_ids = [a.id for a in group.applicants] + list(getattr(group, 'dummy_ids', []))
+                time_slot = TimeSlot(
+                    activity_name=activity.name,
+                    start_time=start_time,
+                    end_time=end_time,
+                    room_name=room.name,
+                    applicant_id=member_ids[0] if member_ids else None,
+                    group_id=group.id
+                )
+                result.assignments.append(GroupAssignment(
+                    group=group, room=room, start_time=start_time, end_time=end_time
+                ))
+                for member_id in member_ids:
+                    schedule_by_applicant[member_id].append(time_slot)
+                schedule_by_room[room.name].append(time_slot)
+            
+            result.assignments.sort(key=lambda a: (a.start_time, a.room.name))
+            result.schedule_by_applicant = dict(schedule_by_applicant)
+            result.schedule_by_room = dict(schedule_by_room)
+            results.append(result)
+        return results
+    
     def _order_activities_by_precedence(
         self,
         activities: List[Activity],
@@ -176,11 +461,24 @@ class BatchedScheduler:
         groups: Dict[str, List[Group]],
         config: DateConfig,
         group_activity_times: Dict[Tuple[str, str], timedelta],
-        time_limit: float
+        time_limit: float,
+        compiled: Optional[CompiledDateConfig] = None,
+        room_next_free: Optional[Dict[str, timedelta]] = None,
+        applicant_spans: Optional[Dict[str, Tuple[timedelta, timedelta]]] = None,
+        pacing: Optional[Dict[str, timedelta]] = None
     ) -> Optional[GroupScheduleResult]:
-        """Precedence를 고려한 특정 Batched 활동 스케줄링"""
+        """
+        Precedence를 고려한 특정 Batched 활동 스케줄링
+        applicant_spans: 지원자별 (첫 시작, 마지막 종료) - 활동 사이에 공유, 최대 체류시간 창 계산용
+        pacing: 후속 비-Batched 활동별 예상 처리 완료 시각 (있으면 최대 체류시간 안에
+                그룹원이 후속 활동을 마칠 수 있도록 그룹 시작을 늦춤)
+        """
         # 기존 _schedule_activity의 내용을 여기로 이동하고
         # group_activity_times를 파라미터로 받아서 사용
+        compiled = compiled or compile_date_config(config)
+        
+        applicant_spans = {} if applicant_spans is None else applicant_spans
+        max_stay = config.max_stay
         
         # 해당 활동의 그룹들만 추출
         activity_groups = groups.get(activity.name, [])
@@ -195,9 +493,8 @@ class BatchedScheduler:
         
         # 사용 가능한 방 찾기
         available_rooms = [
-            room for room in config.rooms
-            if any(rt in room.room_type for rt in activity.required_rooms)
-            and room.capacity >= activity.min_capacity
+            room for room in compiled.rooms_for(activity.name)
+            if room.capacity >= activity.min_capacity
         ]
         
         if not available_rooms:
@@ -231,12 +528,15 @@ class BatchedScheduler:
                 assigned_rooms = available_rooms
             
             # 각 그룹에 대해 정보 준비
+            preferred_rooms = frozenset(room.name for room in assigned_rooms)
             for group in job_groups:
-                all_groups.append((group, job_code, assigned_rooms))
+                all_groups.append((group, job_code, preferred_rooms))
         
-        # 시간대별로 그룹 스케줄링 (병렬 처리)
-        current_slot_groups = []
-        next_start_time = config.operating_hours[0]
+        # 방별 다음 사용 가능 시각 (이벤트 기반 배치)
+        calendar = RoomCalendar(
+            available_rooms, config.operating_hours[0], config.operating_hours[1],
+            next_free=room_next_free
+        )
         
         # ========================
         # BALANCED 분산 배치 적용 여부 판단
@@ -252,113 +552,68 @@ class BatchedScheduler:
         group_index = 0
         
         for group_info in all_groups:
-            group, job_code, rooms = group_info
+            group, job_code, preferred_rooms = group_info
             
             # Precedence 제약에 따른 최소 시작 시간 계산
             earliest_start = config.operating_hours[0]
             
-            # 이 활동의 precedence 제약 확인
-            for rule in config.precedence_rules:
-                if rule.successor == activity.name:
-                    # 이 그룹이 선행 활동을 완료했는지 확인
-                    pred_key = (group.id, rule.predecessor)
-                    if pred_key in group_activity_times:
-                        pred_end_time = group_activity_times[pred_key]
-                        
-                        # is_adjacent 플래그에 따른 간격 처리
-                        if rule.is_adjacent:
-                            # 연속 배치: 정확히 지정된 간격 사용
-                            required_start = pred_end_time + timedelta(minutes=rule.gap_min)
-                        else:
-                            # 일반 선후행: max(rule.gap_min, global_gap_min) 사용
-                            global_gap = getattr(config, 'global_gap_min', 5)
-                            effective_gap = max(rule.gap_min, global_gap)
-                            required_start = pred_end_time + timedelta(minutes=effective_gap)
-                        
-                        earliest_start = max(earliest_start, required_start)
-                        
-                        gap_type = "연속배치" if rule.is_adjacent else "일반"
-                        actual_gap = (required_start - pred_end_time).total_seconds() / 60
-                        self.logger.info(
-                            f"Precedence 적용: {group.id}의 {rule.predecessor} "
-                            f"→ {actual_gap:.0f}분 → {activity.name} ({gap_type})"
-                        )
+            # 이 활동의 precedence 제약 확인 (유효 간격은 컴파일 단계에서 계산됨)
+            for predecessor, effective_gap, is_adjacent in compiled.predecessors_of(activity.name):
+                # 이 그룹이 선행 활동을 완료했는지 확인
+                pred_key = (group.id, predecessor)
+                if pred_key in group_activity_times:
+                    pred_end_time = group_activity_times[pred_key]
+                    required_start = pred_end_time + timedelta(minutes=effective_gap)
+                    earliest_start = max(earliest_start, required_start)
+                    
+                    gap_type = "연속배치" if is_adjacent else "일반"
+                    self.logger.info(
+                        f"Precedence 적용: {group.id}의 {predecessor} "
+                        f"→ {effective_gap}분 → {activity.name} ({gap_type})"
+                    )
             
             # ========================
             # 시작 시간 결정: BALANCED vs 기존 로직
             # ========================
             if apply_balanced_distribution and balanced_start_times and group_index < len(balanced_start_times):
-                # BALANCED 알고리즘: 미리 계산된 시간 사용
-                balanced_start = balanced_start_times[group_index]
-                start_time = max(earliest_start, balanced_start)
-                self.logger.debug(f"그룹 {group.id}: BALANCED 시간 {balanced_start} → 실제 {start_time}")
-            else:
-                # 기존 로직: 순차적 배치
-                start_time = max(earliest_start, next_start_time)
-            
-            end_time = start_time + activity.duration
+                # BALANCED 알고리즘: 미리 계산된 시간 이후로 배치
+                earliest_start = max(earliest_start, balanced_start_times[group_index])
             group_index += 1
             
-            # 운영 시간 내인지 확인
-            if end_time > config.operating_hours[1]:
-                # 다음 시간대로 이동
-                if current_slot_groups:
-                    # 현재 시간대 마무리
-                    next_start_time = start_time + activity.duration + timedelta(minutes=10)
-                    current_slot_groups = []
-                    
-                    # 새로운 시작 시간으로 재계산
-                    start_time = max(earliest_start, next_start_time)
-                    end_time = start_time + activity.duration
-                    
-                    if end_time > config.operating_hours[1]:
-                        self.logger.warning(f"그룹 {group.id}가 운영 시간을 초과합니다")
-                        return None
-                else:
-                    self.logger.warning(f"그룹 {group.id}가 운영 시간을 초과합니다")
-                    return None
-            
-            # 사용 가능한 방 찾기
-            assigned_room = None
-            for room in rooms:
-                # 해당 시간대에 비어있는 방 확인
-                is_available = True
-                for existing_slot in schedule_by_room.get(room.name, []):
-                    if not (end_time <= existing_slot.start_time or start_time >= existing_slot.end_time):
-                        is_available = False
-                        break
-                
-                if is_available:
-                    assigned_room = room
-                    break
-            
-            if not assigned_room:
-                # 사용 가능한 방이 없으면 다음 시간대로
-                if len(current_slot_groups) < len(available_rooms):
-                    # 다른 방 시도
-                    for room in available_rooms:
-                        if room not in rooms:
-                            is_available = True
-                            for existing_slot in schedule_by_room.get(room.name, []):
-                                if not (end_time <= existing_slot.start_time or start_time >= existing_slot.end_time):
-                                    is_available = False
-                                    break
-                            
-                            if is_available:
-                                assigned_room = room
-                                break
-                
-                if not assigned_room:
-                    # 모든 방이 사용중이면 다음 시간대로
-                    next_start_time = start_time + activity.duration + timedelta(minutes=10)
-                    current_slot_groups = []
-                    continue
-            
             # 그룹의 지원자 ID 리스트 생성
             applicant_ids = [app.id for app in group.applicants]
             if hasattr(group, 'dummy_ids'):
                 applicant_ids.extend(group.dummy_ids)
             
+            # 최대 체류시간: 그룹원 모두의 [마지막 종료 - 제한, 첫 시작 + 제한] 안에 배치
+            stay_deadline = None
+            spans = [applicant_spans[a] for a in applicant_ids if a in applicant_spans]
+            if max_stay and spans:
+                earliest_start = max(earliest_start, max(end for _, end in spans) - max_stay)
+                stay_deadline = min(start for start, _ in spans) + max_stay
+            
+            # 후속 활동 대기열을 고려한 시작 시각 (운영시간 안에 못 들어가면 대기열 무시)
+            loads = self._downstream_loads(activity, group, config, compiled) if pacing is not None else {}
+            paced_start = earliest_start
+            for name, (gap, load) in loads.items():
+                paced_start = max(paced_start, pacing.get(name, earliest_start) + load - max_stay)
+            
+            # 가장 이른 배치 가능 시각과 방 (직무 접미사 방 우선)
+            placement = calendar.find(activity.duration, paced_start, preferred_rooms)
+            if placement is None and paced_start > earliest_start:
+                placement = calendar.find(activity.duration, earliest_start, preferred_rooms)
+            if placement is None:
+                self.logger.warning(f"그룹 {group.id}가 운영 시간을 초과합니다")
+                return None
+            
+            assigned_room, start_time = placement
+            end_time = start_time + activity.duration
+            if stay_deadline is not None and end_time > stay_deadline:
+                self.logger.warning(f"그룹 {group.id}의 {activity.name}이 최대 체류시간을 초과합니다 ({end_time} > {stay_deadline})")
+                return None
+            calendar.book(assigned_room.name, start_time, end_time)
+            self.greedy_placements[(group.id, activity.name)] = (assigned_room.name, start_time)
+            
             # TimeSlot 생성 (단일 지원자ID만 지원하므로 대표 ID 사용)
             representative_id = applicant_ids[0] if applicant_ids else None
             time_slot = TimeSlot(
@@ -386,15 +641,16 @@ class BatchedScheduler:
                 key = f"{member_id}_{activity.name}"
                 applicant_assignments[key] = assignment
                 schedule_by_applicant[member_id].append(time_slot)
+                span = applicant_spans.get(member_id, (start_time, end_time))
+                applicant_spans[member_id] = (min(span[0], start_time), max(span[1], end_time))
             
             schedule_by_room[assigned_room.name].append(time_slot)
             room_assignments[group.id] = assigned_room.name
             
             # 그룹 활동 완료 시간 저장
             group_activity_times[(group.id, activity.name)] = end_time
-            
-            # 현재 시간대 그룹에 추가
-            current_slot_groups.append(group)
+            for name, (gap, load) in loads.items():
+                pacing[name] = max(pacing.get(name, end_time + gap), end_time + gap) + load
         
         # 🔧 수정: assignments 리스트 직접 사용
         return GroupScheduleResult(
@@ -405,6 +661,32 @@ class BatchedScheduler:
             schedule_by_room=dict(schedule_by_room)
         )
     
+    def _downstream_loads(
+        self,
+        activity: Activity,
+        group: Group,
+        config: DateConfig,
+        compiled: CompiledDateConfig
+    ) -> Dict[str, Tuple[timedelta, timedelta]]:
+        """
+        그룹원이 이 활동 뒤에 치를 비-Batched 활동별 (간격, 그룹 전체 처리 시간)
+        처리 시간 = 동시에 받을 수 있는 인원(방 수 × 정원) 기준 라운드 수 × 활동 시간
+        """
+        gaps = {name: timedelta(minutes=gap) for name, gap, _ in compiled.successors_of(activity.name)}
+        loads = {}
+        for other in config.activities:
+            if other.mode == ActivityMode.BATCHED or not config.job_activity_matrix.get((group.job_code, other.name), False):
+                continue
+            rooms = compiled.rooms_for(other.name)
+            if other.mode == ActivityMode.PARALLEL:
+                seats = sum(min(room.capacity, other.max_capacity) for room in rooms)
+            else:
+                seats = len(rooms)
+            if seats:
+                rounds = -(-group.size // seats)
+                loads[other.name] = (gaps.get(other.name, timedelta(minutes=compiled.global_gap_min)), rounds * other.duration)
+        return loads
+    
     def _assign_room_suffixes(
         self, 
         job_codes: List[str],
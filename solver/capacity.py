@@ -0,0 +1,154 @@
+"""
+일일 처리 가능 인원 추정 (처리량 상한)
+
+직무 구성비를 유지한 채 하루 인원 N을 늘려 가며, FeasibilityChecker의 하한
+(방 묶음별 최소 방 사용시간, batched 그룹 슬롯, 선후행 최장 경로)을 모두 만족하는
+최대 N을 이분 탐색으로 찾는다. 방 유형별 병목 모델이므로 방 유형/그룹 수용인원/
+선후행을 반영하고, 첫 위반 자원이 병목이 된다. 하한은 필요조건이라 실제 배치에는
+여유가 필요하므로 권장 인원은 상한 × margin.
+"""
+import logging
+from datetime import datetime, time, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+
+from .feasibility import FeasibilityChecker
+from .types import (
+    Activity, ActivityMode, DailyCapacityEstimate, DateConfig, PrecedenceRule, Room
+)
+
+
+class DailyCapacityEstimator:
+    """직무 구성비별 하루 처리량 상한"""
+
+    def __init__(self, margin: float = 0.9, max_applicants: int = 5000, logger: Optional[logging.Logger] = None):
+        self.margin = margin
+        self.max_applicants = max_applicants
+        self.checker = FeasibilityChecker()
+        self.logger = logger or logging.getLogger(__name__)
+
+    def estimate(self, config: DateConfig, job_mix: Optional[Dict[str, float]] = None) -> DailyCapacityEstimate:
+        """config의 방/활동/운영시간으로 하루 최대 인원 (job_mix 없으면 config.jobs 비율)"""
+        mix = {job: float(weight) for job, weight in (job_mix or config.jobs).items() if weight > 0}
+        if not mix:
+            mix = {job: 1.0 for job in config.jobs}
+        estimate = DailyCapacityEstimate(job_mix=mix)
+        if not mix:
+            return estimate
+
+        def violations(total: int):
+            jobs = self._apportion(total, mix)
+            return self.checker.check(DateConfig(
+                date=config.date,
+                jobs=jobs,
+                activities=config.activities,
+                rooms=config.rooms,
+                operating_hours=config.operating_hours,
+                precedence_rules=config.precedence_rules,
+                job_activity_matrix=config.job_activity_matrix,
+                global_gap_min=config.global_gap_min,
+                max_stay_hours=config.max_stay_hours
+            )).violations
+
+        # 상한 구간 찾기 (배수 증가) → 이분 탐색
+        low, high = 0, 1
+        while high <= self.max_applicants and not violations(high):
+            low, high = high, high * 2
+        high = min(high, self.max_applicants + 1)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if violations(middle):
+                high = middle
+            else:
+                low = middle
+
+        estimate.bound = low
+        estimate.recommended = int(low * self.margin)
+        estimate.per_job = self._apportion(estimate.recommended, mix)
+        if high <= self.max_applicants:
+            estimate.bottleneck = violations(high)[0]
+        self.logger.info(
+            f"일일 처리량 상한 {estimate.bound}명 (권장 {estimate.recommended}명), 병목: {estimate.bottleneck}"
+        )
+        return estimate
+
+    @staticmethod
+    def _apportion(total: int, mix: Dict[str, float]) -> Dict[str, int]:
+        """total명을 구성비대로 나눔 (최대 잉여 방식, 합 = total)"""
+        weight_sum = sum(mix.values())
+        quotas = {job: total * weight / weight_sum for job, weight in mix.items()}
+        counts = {job: int(quota) for job, quota in quotas.items()}
+        remainder = total - sum(counts.values())
+        for job in sorted(quotas, key=lambda j: quotas[j] - counts[j], reverse=True)[:remainder]:
+            counts[job] += 1
+        return counts
+
+
+def date_config_from_frames(
+    activities_df: pd.DataFrame,
+    room_plan_df: pd.DataFrame,
+    oper_window_df: pd.DataFrame,
+    job_acts_map: pd.DataFrame,
+    precedence_df: Optional[pd.DataFrame] = None
+) -> DateConfig:
+    """UI 표(활동/방/운영시간/직무별 활동/선후행)로 DateConfig 구성 (레거시 solve_for_days 용)"""
+    mode_map = {mode.value: mode for mode in ActivityMode}
+    activities = []
+    for _, row in activities_df.iterrows():
+        if not row.get("use", True):
+            continue
+        activities.append(Activity(
+            name=row["activity"],
+            mode=mode_map.get(row.get("mode", "individual"), ActivityMode.INDIVIDUAL),
+            duration_min=int(row["duration_min"]),
+            room_type=row["room_type"],
+            required_rooms=[row["room_type"]],
+            min_capacity=int(row.get("min_cap", 1)),
+            max_capacity=int(row.get("max_cap", 1))
+        ))
+
+    rooms = []
+    for room_type in dict.fromkeys(a.room_type for a in activities):
+        count_col, cap_col = f"{room_type}_count", f"{room_type}_cap"
+        if count_col not in room_plan_df.columns:
+            continue
+        count = int(pd.to_numeric(room_plan_df[count_col].iloc[0], errors="coerce") or 0)
+        capacity = int(room_plan_df[cap_col].iloc[0]) if cap_col in room_plan_df.columns else 1
+        # 방이 여러 개면 A, B, C... 접미사 (MultiDateScheduler와 같은 규칙)
+        names = [f"{room_type}{chr(ord('A') + i)}" for i in range(count)] if count > 1 else [room_type] * count
+        rooms.extend(Room(name=name, room_type=room_type, capacity=capacity) for name in names)
+
+    jobs, matrix = {}, {}
+    for _, row in job_acts_map.iterrows():
+        jobs[row["code"]] = int(row["count"])
+        for activity in activities:
+            matrix[(row["code"], activity.name)] = bool(row.get(activity.name, False))
+
+    precedence_rules = []
+    if precedence_df is not None and not precedence_df.empty:
+        for _, row in precedence_df.iterrows():
+            if row["predecessor"] != "__START__" and row["successor"] != "__END__":
+                precedence_rules.append(PrecedenceRule(
+                    predecessor=row["predecessor"],
+                    successor=row["successor"],
+                    gap_min=int(row.get("gap_min", 5)),
+                    is_adjacent=bool(row.get("adjacent", False))
+                ))
+
+    def to_timedelta(value) -> timedelta:
+        value = value if isinstance(value, time) else pd.to_datetime(str(value)).time()
+        return timedelta(hours=value.hour, minutes=value.minute)
+
+    return DateConfig(
+        date=datetime.combine(datetime.now().date(), time()),
+        jobs=jobs,
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(
+            to_timedelta(oper_window_df["start_time"].iloc[0]),
+            to_timedelta(oper_window_df["end_time"].iloc[0])
+        ),
+        precedence_rules=precedence_rules,
+        job_activity_matrix=matrix
+    )
@@ -0,0 +1,271 @@
+"""
+컴파일된 날짜 설정
+
+DateConfig (+ Level1Result)를 정수 인덱스 기반의 불변 구조로 한 번 변환해
+Level 2~4가 공유한다. 활동/방/지원자/그룹 조회, 활동×방 배정 가능 여부,
+선후행 관계(유효 간격 포함)를 매번 선형 탐색하지 않도록 미리 계산해 둔다.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .types import (
+    Activity, ActivityMode, Applicant, DateConfig, Group, Level1Result,
+    PrecedenceRule, Room
+)
+
+
+# (상대 활동 id, 유효 간격(분), 연속배치 여부)
+PrecedenceLink = Tuple[int, int, bool]
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledDateConfig:
+    """정수 id 기반 불변 스케줄링 설정"""
+    activities: Tuple[Activity, ...]
+    rooms: Tuple[Room, ...]
+    applicants: Tuple[Applicant, ...]
+    groups: Tuple[Group, ...]
+
+    activity_ids: Mapping[str, int]
+    room_ids: Mapping[str, int]
+    applicant_ids: Mapping[str, int]
+    group_ids: Mapping[str, int]
+
+    applicant_jobs: Tuple[str, ...]                    # 지원자 id → 직무 코드
+    eligibility: np.ndarray                            # (활동 수, 방 수) bool
+    eligible_rooms: Tuple[Tuple[int, ...], ...]        # 활동 id → 배정 가능한 방 id
+    predecessors: Tuple[Tuple[PrecedenceLink, ...], ...]  # 활동 id → 선행 활동
+    successors: Tuple[Tuple[PrecedenceLink, ...], ...]    # 활동 id → 후행 활동
+    global_gap_min: int = 5
+
+    # ---- 이름 기반 조회 ----
+    def activity(self, name: str) -> Optional[Activity]:
+        idx = self.activity_ids.get(name)
+        return self.activities[idx] if idx is not None else None
+
+    def room(self, name: str) -> Optional[Room]:
+        idx = self.room_ids.get(name)
+        return self.rooms[idx] if idx is not None else None
+
+    def applicant(self, applicant_id: str) -> Optional[Applicant]:
+        idx = self.applicant_ids.get(applicant_id)
+        return self.applicants[idx] if idx is not None else None
+
+    def job_of(self, applicant_id: str) -> Optional[str]:
+        idx = self.applicant_ids.get(applicant_id)
+        return self.applicant_jobs[idx] if idx is not None else None
+
+    def is_batched(self, activity_name: str) -> bool:
+        activity = self.activity(activity_name)
+        return activity is not None and activity.mode == ActivityMode.BATCHED
+
+    def rooms_for(self, activity_name: str) -> List[Room]:
+        """활동에 배정 가능한 방 (설정 순서 유지)"""
+        idx = self.activity_ids.get(activity_name)
+        if idx is None:
+            return []
+        return [self.rooms[r] for r in self.eligible_rooms[idx]]
+
+    def can_use_room(self, activity_name: str, room_name: str) -> bool:
+        a = self.activity_ids.get(activity_name)
+        r = self.room_ids.get(room_name)
+        return a is not None and r is not None and bool(self.eligibility[a, r])
+
+    def predecessors_of(self, activity_name: str) -> List[Tuple[str, int, bool]]:
+        """선행 활동 목록: (선행 활동명, 유효 간격(분), 연속배치 여부)"""
+        idx = self.activity_ids.get(activity_name)
+        if idx is None:
+            return []
+        return [(self.activities[p].name, gap, adj) for p, gap, adj in self.predecessors[idx]]
+
+    def successors_of(self, activity_name: str) -> List[Tuple[str, int, bool]]:
+        """후행 활동 목록: (후행 활동명, 유효 간격(분), 연속배치 여부)"""
+        idx = self.activity_ids.get(activity_name)
+        if idx is None:
+            return []
+        return [(self.activities[s].name, gap, adj) for s, gap, adj in self.successors[idx]]
+
+    def adjacent_successor(self, activity_name: str) -> Optional[Tuple[Activity, int]]:
+        """연속배치 후행 활동과 간격 (첫 번째 규칙)"""
+        idx = self.activity_ids.get(activity_name)
+        if idx is None:
+            return None
+        for s, gap, adj in self.successors[idx]:
+            if adj:
+                return self.activities[s], gap
+        return None
+
+    # ---- 용량 상한 (Level 1 / 사전 점검 공용) ----
+    def chain_minutes(
+        self,
+        activity_name: str,
+        required: Sequence[str],
+        forward: bool,
+        slot: int = 1,
+        visiting: frozenset = frozenset()
+    ) -> int:
+        """
+        활동 앞(forward=False) 또는 뒤(forward=True)에 반드시 들어가야 하는
+        선후행 활동 소요시간(slot 단위 올림) + 간격의 최장 합 (required에 있는 활동만)
+        """
+        if activity_name in visiting:
+            return 0
+        visiting = visiting | {activity_name}
+        links = self.successors_of(activity_name) if forward else self.predecessors_of(activity_name)
+        longest = 0
+        for other_name, gap, _ in links:
+            other = self.activity(other_name)
+            if other is None or other_name not in required:
+                continue
+            duration = -(-other.duration_min // slot) * slot
+            longest = max(longest, gap + duration + self.chain_minutes(other_name, required, forward, slot, visiting))
+        return longest
+
+    def slots_per_room(
+        self,
+        activity: Activity,
+        required_by_job: Mapping[str, Sequence[str]],
+        window: int,
+        slot: int = 1
+    ) -> Tuple[int, Dict[str, int]]:
+        """
+        batched 활동의 방당 슬롯 수 상한: (전체, 직무별)
+
+        직무마다 앞뒤 선후행 시간을 뺀 구간에서만 시작할 수 있다. 전체 상한은 그 구간들의
+        합집합(가장 이른 시작 ~ 가장 늦은 끝) 기준이고, 각 직무 그룹은 자기 구간에 들어가야 한다.
+        """
+        duration = -(-activity.duration_min // slot) * slot
+        spans = {
+            job: (self.chain_minutes(activity.name, required, False, slot),
+                  window - self.chain_minutes(activity.name, required, True, slot))
+            for job, required in required_by_job.items()
+        }
+        if not spans:
+            return 0, {}
+        per_job = {job: max(0, end - start) // duration for job, (start, end) in spans.items()}
+        earliest = min(start for start, _ in spans.values())
+        latest = max(end for _, end in spans.values())
+        return max(0, latest - earliest) // duration, per_job
+
+    # ---- 생성 ----
+    @classmethod
+    def build(
+        cls,
+        activities: Sequence[Activity],
+        rooms: Sequence[Room],
+        precedence_rules: Sequence[PrecedenceRule] = (),
+        global_gap_min: int = 5,
+        applicants: Sequence[Applicant] = (),
+        groups: Sequence[Group] = ()
+    ) -> 'CompiledDateConfig':
+        activities = tuple(activities)
+        rooms = tuple(rooms)
+        applicants = tuple(applicants)
+
+        activity_ids = {a.name: i for i, a in enumerate(activities)}
+        room_ids = {r.name: i for i, r in enumerate(rooms)}
+        applicant_ids = {a.id: i for i, a in enumerate(applicants)}
+
+        # 같은 그룹이 여러 batched 활동에 등장하므로 id 기준으로 중복 제거
+        unique_groups: Dict[str, Group] = {}
+        for group in groups:
+            unique_groups.setdefault(group.id, group)
+        group_ids = {gid: i for i, gid in enumerate(unique_groups)}
+
+        # 활동×방 배정 가능 여부 (방 타입 부분 문자열 일치)
+        eligibility = np.zeros((len(activities), len(rooms)), dtype=bool)
+        for a_idx, activity in enumerate(activities):
+            for r_idx, room in enumerate(rooms):
+                eligibility[a_idx, r_idx] = any(rt in room.room_type for rt in activity.required_rooms)
+        eligibility.setflags(write=False)
+        eligible_rooms = tuple(tuple(np.flatnonzero(row).tolist()) for row in eligibility)
+
+        # 선후행 인접 리스트 (유효 간격: 연속배치는 gap_min, 그 외 max(gap_min, global_gap_min))
+        predecessors = [[] for _ in activities]
+        successors = [[] for _ in activities]
+        for rule in precedence_rules:
+            pred = activity_ids.get(rule.predecessor)
+            succ = activity_ids.get(rule.successor)
+            if pred is None or succ is None:
+                continue
+            gap = rule.gap_min if rule.is_adjacent else max(rule.gap_min, global_gap_min)
+            predecessors[succ].append((pred, gap, rule.is_adjacent))
+            successors[pred].append((succ, gap, rule.is_adjacent))
+
+        return cls(
+            activities=activities,
+            rooms=rooms,
+            applicants=applicants,
+            groups=tuple(unique_groups.values()),
+            activity_ids=MappingProxyType(activity_ids),
+            room_ids=MappingProxyType(room_ids),
+            applicant_ids=MappingProxyType(applicant_ids),
+            group_ids=MappingProxyType(group_ids),
+            applicant_jobs=tuple(a.job_code for a in applicants),
+            eligibility=eligibility,
+            eligible_rooms=eligible_rooms,
+            predecessors=tuple(tuple(p) for p in predecessors),
+            successors=tuple(tuple(s) for s in successors),
+            global_gap_min=global_gap_min
+        )
+
+
+def compile_date_config(
+    config: DateConfig,
+    level1_result: Optional[Level1Result] = None
+) -> CompiledDateConfig:
+    """DateConfig (+ Level 1 결과)를 컴파일"""
+    applicants: Sequence[Applicant] = ()
+    groups: List[Group] = []
+    if level1_result is not None:
+        applicants = level1_result.applicants
+        for activity_groups in level1_result.groups.values():
+            groups.extend(activity_groups)
+
+    return CompiledDateConfig.build(
+        activities=config.activities,
+        rooms=config.rooms,
+        precedence_rules=config.precedence_rules,
+        global_gap_min=getattr(config, 'global_gap_min', 5),
+        applicants=applicants,
+        groups=groups
+    )
+
+
+def config_fingerprint(config: DateConfig) -> str:
+    """
+    스케줄 결과에 영향을 주는 설정의 지문 (날짜 제외)
+    직무별 인원, 활동, 직무-활동 매트릭스, 방, 운영시간, 선후행, 전역 간격, 최대 체류시간
+    """
+    fingerprint = {
+        "jobs": sorted(config.jobs.items()),
+        "activities": [
+            (a.name, a.mode.value, a.duration_min, a.room_type, list(a.required_rooms),
+             a.min_capacity, a.max_capacity)
+            for a in config.activities
+        ],
+        "job_activity_matrix": sorted(
+            key for key, enabled in config.job_activity_matrix.items() if enabled
+        ),
+        "rooms": [(r.name, r.room_type, r.capacity) for r in config.rooms],
+        "operating_hours": [int(t.total_seconds()) for t in config.operating_hours],
+        "precedence_rules": [
+            (r.predecessor, r.successor, r.gap_min, r.is_adjacent)
+            for r in config.precedence_rules
+        ],
+        "global_gap_min": config.global_gap_min,
+        "max_stay_hours": config.max_stay_hours
+    }
+    return hashlib.sha256(
+        json.dumps(fingerprint, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def warm_start_fingerprint(config: DateConfig) -> str:
+    """체류시간 제한을 뺀 설정 지문 - 제한만 바뀐 재스케줄링에서 이전 결과를 재사용할 수 있는지 판단"""
+    return config_fingerprint(replace(config, max_stay_hours=None))
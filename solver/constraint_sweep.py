@@ -0,0 +1,235 @@
+"""
+체류시간 하드 제약 후보 동시 평가 (sweep)
+
+3단계 스케줄링은 분위수(90 → 92.5 → 95)를 하나씩 올려 가며 전체 스케줄링과
+DataFrame 분석을 반복하고, 처음 허용 위반률을 만족하는 단계에서 멈춘다.
+sweep은 1단계 결과 하나에서 후보 제한(분위수 또는 절대 시간)을 한 번에 만들고,
+프로세스 풀에서 동시에 평가한 뒤 제한 / 위반 수 / 실행시간의 Pareto 집합에서
+선택 정책에 따라 하나를 고른다. 각 후보는 1단계 MultiDateResult를 웜 스타트로 쓴다.
+"""
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .hard_constraint_analyzer import HardConstraintAnalyzer
+from .hard_constraint_scheduler import HardConstraintScheduler
+from .types import MultiDateResult, ProgressCallback, ProgressInfo, SweepPoint, SweepResult
+
+DEFAULT_PERCENTILES = (90.0, 92.5, 95.0)
+# tightest: 허용 위반률 이내에서 가장 짧은 제한 (기존 3단계 순차 방식과 같은 기준)
+# fewest_violations: 위반 수 최소 / fastest: 허용 위반률 이내에서 가장 빠른 후보
+SWEEP_POLICIES = ("tightest", "fewest_violations", "fastest")
+# 후보 하나의 평가 제한: 날짜별 솔버 제한시간(time_limit_sec) × 날짜 수 + 여유
+SWEEP_TIMEOUT_MARGIN_SEC = 30.0
+
+
+def _run_sweep_candidate(args) -> Dict[str, Any]:
+    """프로세스 풀 작업: 후보 제한 하나로 하드 제약 스케줄링 (1단계 결과 웜 스타트)"""
+    cfg_ui, hard_constraints, params, debug, warm_start = args
+    started = time.perf_counter()
+    outcome = HardConstraintScheduler()._apply_hard_constraints(
+        cfg_ui, hard_constraints, params, debug, warm_start=warm_start
+    )
+    return {
+        'status': outcome['status'],
+        'schedule': outcome.get('schedule'),
+        'exceed_analysis': outcome.get('exceed_analysis', {}),
+        'error': outcome.get('error'),
+        'runtime_sec': time.perf_counter() - started
+    }
+
+
+class ConstraintSweep:
+    """체류시간 제한 후보를 동시에 평가해 Pareto 집합과 선택 결과 반환"""
+
+    def __init__(
+        self,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        hour_caps: Sequence[float] = (),
+        policy: str = "tightest",
+        max_violation_rate: float = 5.0,
+        workers: Optional[int] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        if policy not in SWEEP_POLICIES:
+            raise ValueError(f"알 수 없는 선택 정책: {policy} (가능: {', '.join(SWEEP_POLICIES)})")
+        self.percentiles = list(percentiles)
+        self.hour_caps = list(hour_caps)
+        self.policy = policy
+        self.max_violation_rate = max_violation_rate
+        self.workers = workers
+        self.logger = logger or logging.getLogger(__name__)
+
+    def run(
+        self,
+        cfg_ui: dict,
+        phase1_df: pd.DataFrame,
+        phase1_result: Optional[MultiDateResult] = None,
+        params: Optional[dict] = None,
+        debug: bool = False,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> SweepResult:
+        """1단계 스케줄(phase1_df)에서 후보를 만들어 평가하고 정책에 따라 선택"""
+        points = self.candidates(phase1_df)
+        self._evaluate(points, cfg_ui, phase1_result, params, debug, progress_callback)
+        pareto = self.pareto(points)
+        selected = self.select(pareto)
+        if selected:
+            self.logger.info(
+                f"🎯 sweep 선택 ({self.policy}): {selected.label} - 제한 {selected.cap_hours:.2f}시간, "
+                f"위반 {selected.total_violations}명, {selected.runtime_sec:.1f}초"
+            )
+        return SweepResult(points=points, pareto=pareto, selected=selected, policy=self.policy)
+
+    def candidates(self, phase1_df: pd.DataFrame) -> List[SweepPoint]:
+        """
+        분위수 / 절대 시간 후보별 날짜별 제한 (체류시간 분석은 한 번만)
+        제한이 같아지는 후보(체류시간 값이 몇 개 안 되는 경우)는 처음 것만 평가한다.
+        """
+        stay_times = HardConstraintAnalyzer()._calculate_stay_times(phase1_df) if not phase1_df.empty else pd.DataFrame()
+        if stay_times.empty:
+            return []
+        stays_by_date = {
+            str(interview_date): group['stay_hours'].values
+            for interview_date, group in stay_times.groupby('interview_date')
+        }
+        candidates = [
+            (f"p{percentile:g}", percentile,
+             {date: float(np.percentile(stays, percentile)) for date, stays in stays_by_date.items()})
+            for percentile in self.percentiles
+        ] + [
+            (f"{hours:g}h", None, {date: float(hours) for date in stays_by_date})
+            for hours in self.hour_caps
+        ]
+        points = []
+        seen = {}
+        for label, percentile, hard_constraints in candidates:
+            key = tuple(sorted((date, round(hours, 4)) for date, hours in hard_constraints.items()))
+            if key in seen:
+                self.logger.info(f"sweep 후보 {label}: {seen[key]}와 제한이 같아 생략")
+                continue
+            seen[key] = label
+            points.append(SweepPoint(label=label, hard_constraints=hard_constraints, percentile=percentile))
+        return points
+
+    @staticmethod
+    def pareto(points: List[SweepPoint]) -> List[SweepPoint]:
+        """성공한 후보 중 다른 후보에 지배되지 않는 것 (제한 오름차순)"""
+        solved = [point for point in points if point.status == "SUCCESS"]
+        front = [point for point in solved if not any(other.dominates(point) for other in solved)]
+        return sorted(front, key=lambda point: (point.cap_hours, point.total_violations))
+
+    def select(self, pareto: List[SweepPoint]) -> Optional[SweepPoint]:
+        """선택 정책에 따라 Pareto 집합에서 하나 (허용 위반률을 만족하는 후보가 없으면 위반 수 최소)"""
+        if not pareto:
+            return None
+        acceptable = [point for point in pareto if point.violation_rate <= self.max_violation_rate]
+        if self.policy == "fewest_violations" or not acceptable:
+            return min(pareto, key=lambda point: (point.total_violations, point.cap_hours, point.runtime_sec))
+        if self.policy == "fastest":
+            return min(acceptable, key=lambda point: (point.runtime_sec, point.cap_hours))
+        return min(acceptable, key=lambda point: (point.cap_hours, point.total_violations, point.runtime_sec))
+
+    def _evaluate(
+        self,
+        points: List[SweepPoint],
+        cfg_ui: dict,
+        phase1_result: Optional[MultiDateResult],
+        params: Optional[dict],
+        debug: bool,
+        progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        """후보를 프로세스 풀에서 동시에 평가 (워커 1개면 순서대로)"""
+        workers = min(len(points), self._workers())
+        done_count = 0
+
+        def finish(point: SweepPoint, outcome: Dict[str, Any]) -> None:
+            nonlocal done_count
+            self._fill(point, outcome)
+            done_count += 1
+            self.logger.info(
+                f"sweep {point.label}: {point.status}, 위반 {point.total_violations}명 "
+                f"({point.violation_rate:.1f}%), {point.runtime_sec:.1f}초"
+            )
+            if progress_callback:
+                progress_callback(ProgressInfo(
+                    stage="Sweep",
+                    progress=done_count / len(points),
+                    message=f"제한 후보 {point.label} 평가 완료 ({done_count}/{len(points)})",
+                    details={'label': point.label, 'status': point.status}
+                ))
+
+        if workers <= 1:
+            for point in points:
+                try:
+                    outcome = _run_sweep_candidate((cfg_ui, point.hard_constraints, params, debug, phase1_result))
+                except Exception as e:
+                    outcome = {'status': "ERROR", 'error': str(e)}
+                finish(point, outcome)
+            return
+
+        # 후보끼리 CPU를 나눠 쓰므로 후보 안의 날짜/백트래킹/Level 3 포트폴리오 병렬화는 끔
+        worker_params = dict(params or {}, date_workers=1, backtrack_workers=1, level3_portfolio_workers=1)
+        # 워커 수만큼씩 차례로 실행되므로 전체 제한 = 실행 차수 × 후보당 제한
+        timeout = math.ceil(len(points) / workers) * self._candidate_timeout(params, phase1_result)
+        deadline = time.monotonic() + timeout
+        self.logger.info(f"🔀 체류시간 제한 후보 {len(points)}개 동시 평가 (워커 {workers}개, 제한 {timeout:.0f}초)")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(
+                    _run_sweep_candidate, (cfg_ui, point.hard_constraints, worker_params, debug, phase1_result)
+                ): point
+                for point in points
+            }
+            pending = set(futures)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"sweep 워커 오류: {e}")
+                        outcome = {'status': "ERROR", 'error': str(e)}
+                    finish(futures[future], outcome)
+            if pending:
+                self.logger.warning(f"⏰ sweep 제한시간 {timeout:.0f}초 초과 - 미완료 후보 {len(pending)}개 실패 처리")
+                for future in pending:
+                    finish(futures[future], {'status': "FAILED", 'error': f"제한시간 {timeout:.0f}초 초과"})
+                # 멈추지 않는 워커가 인터프리터 종료(풀 join)까지 막지 않도록 강제 종료
+                for process in list((getattr(executor, "_processes", None) or {}).values()):
+                    process.terminate()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _candidate_timeout(params: Optional[dict], phase1_result: Optional[MultiDateResult]) -> float:
+        """후보 하나의 평가 제한 (날짜는 후보 안에서 순서대로 풀리므로 날짜 수를 곱함)"""
+        time_limit = float((params or {}).get('time_limit_sec', 120.0))
+        dates = len(phase1_result.results) if phase1_result is not None and phase1_result.results else 1
+        return time_limit * dates + SWEEP_TIMEOUT_MARGIN_SEC
+
+    @staticmethod
+    def _fill(point: SweepPoint, outcome: Dict[str, Any]) -> None:
+        point.status = outcome['status'] if outcome['status'] in ("SUCCESS", "ERROR") else "FAILED"
+        point.schedule = outcome.get('schedule')
+        point.exceed_analysis = outcome.get('exceed_analysis') or {}
+        point.error = outcome.get('error')
+        point.runtime_sec = outcome.get('runtime_sec', 0.0)
+        point.total_violations = point.exceed_analysis.get('total_violations', 0)
+        point.violation_rate = point.exceed_analysis.get('overall_violation_rate', 0.0)
+
+    def _workers(self) -> int:
+        """동시 평가 프로세스 수 (지정값, 없으면 CPU 수)"""
+        if self.workers:
+            return max(1, int(self.workers))
+        return os.cpu_count() or 1
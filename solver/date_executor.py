@@ -0,0 +1,203 @@
+"""
+날짜별 프로세스 병렬 실행
+
+날짜마다 SingleDateScheduler.schedule(date_config)은 서로 독립이고 순수 파이썬 CPU 작업이라
+스레드로는 GIL 때문에 동시에 돌지 않는다. 날짜마다 프로세스 하나를 띄워 동시에 실행한다.
+- 동시 실행 프로세스 수: 날짜 수와 CPU 코어 수 중 작은 값 (지정 가능)
+- 결과는 완료 순서와 관계없이 날짜 순서로 정렬
+- 날짜별 제한시간: 시작 후 date_timeout_sec이 지나면 작업자 프로세스 그룹을 종료하고 FAILED 결과로 처리
+- 작업자 진행 상황은 작업자별 파이프로 부모 프로세스에 전달해 부모의 ProgressCallback으로 보고
+  (전송 중에 종료된 작업자가 다른 날짜의 통신을 망가뜨리지 않도록 공유 큐를 쓰지 않음)
+- 작업자는 데몬이 아니므로 안에서 Level 3 포트폴리오/백트래킹 프로세스 풀을 그대로 쓸 수 있다.
+  POSIX에서는 작업자가 자기 프로세스 그룹을 만들어, 종료할 때 그 하위 프로세스 풀까지 함께 정리한다
+"""
+import dataclasses
+import logging
+import multiprocessing as mp
+import os
+import signal
+import time as time_module
+import traceback
+from datetime import datetime
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Optional
+
+from .types import DateConfig, SingleDateResult, SchedulingContext, ProgressInfo
+from .single_date_scheduler import SingleDateScheduler
+
+
+def _schedule_date_process(date, config, context, scheduler_factory, conn, warm_start=None):
+    """작업자 프로세스: 날짜 하나 스케줄링, 진행 상황과 결과를 전용 파이프로 전달"""
+    if hasattr(os, "setsid"):
+        # 자기 프로세스 그룹 - 제한시간 초과시 부모가 하위 프로세스 풀까지 한 번에 종료
+        os.setsid()
+    context = dataclasses.replace(
+        context, progress_callback=lambda info: conn.send(("progress", info))
+    )
+    try:
+        scheduler = scheduler_factory()
+        if warm_start is None:
+            result = scheduler.schedule(config, context)
+        else:
+            result = scheduler.schedule(config, context, warm_start=warm_start)
+    except Exception as e:
+        result = SingleDateResult(
+            date=date,
+            status="FAILED",
+            error_message=f"예외 발생: {str(e)}\n{traceback.format_exc()}"
+        )
+    conn.send(("result", result))
+    conn.close()
+
+
+class DateProcessExecutor:
+    """날짜별 스케줄링을 날짜마다 별도 프로세스에서 동시에 실행"""
+
+    # 결과 대기 중 제한시간/프로세스 상태 확인 간격
+    POLL_INTERVAL_SEC = 0.05
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        date_timeout_sec: Optional[float] = None,
+        scheduler_factory: Callable[[], object] = SingleDateScheduler,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.max_workers = max_workers
+        self.date_timeout_sec = date_timeout_sec
+        # 인자 없이 호출해 schedule(config, context)를 가진 객체를 만드는 pickle 가능한 호출 객체
+        self.scheduler_factory = scheduler_factory
+        self.logger = logger or logging.getLogger(__name__)
+
+    def workers_for(self, date_count: int) -> int:
+        """동시 실행 프로세스 수 = min(날짜 수, 지정값 또는 CPU 코어 수)"""
+        return max(1, min(date_count, self.max_workers or os.cpu_count() or 1))
+
+    def run(
+        self,
+        date_configs: Dict[datetime, DateConfig],
+        context: Optional[SchedulingContext] = None,
+        warm_starts: Optional[Dict[datetime, SingleDateResult]] = None
+    ) -> Dict[datetime, SingleDateResult]:
+        """날짜별 결과 (날짜 순서), warm_starts: 날짜별 이전 단계 결과 (SingleDateScheduler 웜 스타트)"""
+        context = context or SchedulingContext()
+        callback = context.progress_callback
+        # 콜백은 부모 프로세스에만 있으므로 작업자에는 빼고 보냄
+        worker_context = dataclasses.replace(context, progress_callback=None)
+        timeout = self.date_timeout_sec
+        if timeout is None:
+            timeout = context.time_limit_sec + 30.0
+
+        dates = sorted(date_configs)
+        workers = self.workers_for(len(dates))
+        self.logger.info(f"🔀 날짜 {len(dates)}개 프로세스 병렬 실행 (동시 {workers}개)")
+
+        waiting = list(dates)
+        running: Dict[datetime, tuple] = {}  # date -> (process, 시작 시각, 수신 파이프)
+        results: Dict[datetime, SingleDateResult] = {}
+        try:
+            while waiting or running:
+                while waiting and len(running) < workers:
+                    date = waiting.pop(0)
+                    reader, writer = mp.Pipe(duplex=False)
+                    process = mp.Process(
+                        target=_schedule_date_process,
+                        args=(
+                            date, date_configs[date], worker_context, self.scheduler_factory, writer,
+                            (warm_starts or {}).get(date)
+                        ),
+                        name=f"schedule-{self._label(date)}"
+                    )
+                    process.start()
+                    writer.close()
+                    running[date] = (process, time_module.monotonic(), reader)
+
+                readers = {reader: date for date, (_, _, reader) in running.items()}
+                for reader in wait(list(readers), timeout=self.POLL_INTERVAL_SEC):
+                    date = readers[reader]
+                    try:
+                        while reader.poll():
+                            kind, payload = reader.recv()
+                            if kind == "progress":
+                                self._forward_progress(callback, date, payload, len(results), len(dates))
+                            else:
+                                self._finish(running, results, date, payload, callback, len(dates))
+                                break
+                    except EOFError:
+                        # 결과를 보내지 못하고 종료
+                        self._finish(running, results, date, self._crashed(date, running[date][0]),
+                                     callback, len(dates), kill=True)
+
+                now = time_module.monotonic()
+                for date, (process, started, reader) in list(running.items()):
+                    if now - started > timeout:
+                        self.logger.error(f"{self._label(date)}: 제한시간 {timeout:.0f}초 초과")
+                        failed = SingleDateResult(
+                            date=date, status="FAILED", error_message=f"제한시간 초과 ({timeout:.0f}초)"
+                        )
+                        self._finish(running, results, date, failed, callback, len(dates), kill=True)
+                    elif not process.is_alive() and not reader.poll():
+                        # 결과 없이 종료 (하위 프로세스가 파이프를 물고 있어 EOF가 오지 않는 경우)
+                        self._finish(running, results, date, self._crashed(date, process),
+                                     callback, len(dates), kill=True)
+        finally:
+            for process, _, reader in running.values():
+                self._kill(process)
+                reader.close()
+
+        return {date: results[date] for date in dates}
+
+    def _finish(
+        self, running, results, date, result: SingleDateResult, callback, total_dates: int, kill: bool = False
+    ):
+        process, _, reader = running.pop(date)
+        if kill:
+            self._kill(process)
+        else:
+            process.join()
+        reader.close()
+        results[date] = result
+        if callback:
+            callback(ProgressInfo(
+                stage="MultiDate",
+                progress=len(results) / total_dates,
+                message=f"날짜별 처리 완료: {len(results)}/{total_dates}",
+                details={"completed_dates": len(results), "total_dates": total_dates, "date": date}
+            ))
+
+    def _forward_progress(self, callback, date, info: ProgressInfo, completed: int, total_dates: int):
+        """작업자 진행 상황을 부모 콜백으로 전달 (진행률은 완료된 날짜 비율, 단계 진행률은 details에)"""
+        if not callback:
+            return
+        callback(ProgressInfo(
+            stage=info.stage,
+            progress=completed / total_dates,
+            message=f"[{self._label(date)}] {info.message}",
+            details={**info.details, "date": date, "stage_progress": info.progress},
+            timestamp=info.timestamp
+        ))
+
+    @staticmethod
+    def _crashed(date, process) -> SingleDateResult:
+        process.join(timeout=1.0)
+        return SingleDateResult(
+            date=date, status="FAILED",
+            error_message=f"병렬 처리 예외: 작업자 비정상 종료 (exitcode {process.exitcode})"
+        )
+
+    @staticmethod
+    def _kill(process) -> None:
+        """작업자와 그 하위 프로세스(같은 프로세스 그룹) 종료"""
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                # 아직 setsid 전이거나 이미 정리된 그룹
+                process.kill()
+        else:
+            process.terminate()
+        process.join()
+
+    @staticmethod
+    def _label(date) -> str:
+        return str(date.date() if isinstance(date, datetime) else date)
@@ -0,0 +1,58 @@
+"""
+스케줄링 제한시간 관리
+
+전체 마감 시각 하나를 모든 레벨과 백트래킹 루프가 공유한다.
+레벨별 예산은 남은 시간을 '현재 레벨 + 이후 레벨' 가중치 비율로 나눠 정하므로
+(적응형 분배) 앞 레벨이 빨리 끝나면 남은 시간이 뒤 레벨로 넘어간다.
+레벨별 고정 상한(cap)이 있으면 그 값을 넘지 않는다.
+stop_event(multiprocessing.Event 등)가 설정되면 남은 시간과 관계없이 즉시 만료된다
+(프로세스 풀 작업을 부모가 중단시킬 때 사용).
+"""
+import time
+from typing import Any, Callable, Dict, Optional
+
+# 레벨 실행 순서와 예산 가중치
+LEVEL_WEIGHTS: Dict[str, float] = {
+    "level1": 1.0,
+    "level2": 3.0,
+    "level3": 4.0,
+    "level4": 2.0,
+}
+
+
+class Deadline:
+    """전체 마감 시각과 레벨별 예산 분배"""
+
+    def __init__(
+        self,
+        total_sec: float,
+        weights: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        stop_event: Optional[Any] = None
+    ):
+        self.total_sec = float(total_sec)
+        self.weights = dict(weights or LEVEL_WEIGHTS)
+        self._clock = clock
+        self._started = clock()
+        self._stop_event = stop_event
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def remaining(self) -> float:
+        if self._stop_event is not None and self._stop_event.is_set():
+            return 0.0
+        return max(0.0, self.total_sec - self.elapsed())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def budget(self, level: str, cap: Optional[float] = None) -> float:
+        """level에 줄 시간 = 남은 시간 × (level 가중치 / level 이후 가중치 합), cap 이하"""
+        remaining = self.remaining()
+        levels = list(self.weights)
+        later = sum(self.weights[name] for name in levels[levels.index(level):])
+        share = remaining * self.weights[level] / later if later > 0 else remaining
+        if cap is not None:
+            share = min(share, float(cap))
+        return share
@@ -0,0 +1,128 @@
+"""
+면접 날짜별 지원자 배분 (부하 균형)
+
+날짜별 직무 인원을 스케줄링 전에 다시 나눠 방 유형별 부하를 고르게 한다.
+- 직무별 총 인원을 코호트(batched 그룹 크기 단위, 없으면 1명) 단위로 쪼개
+  큰 직무부터 날짜에 하나씩 배정한다 (bin packing, worst-fit)
+- 코호트를 넣었을 때 그 날짜의 자원 사용률(FeasibilityChecker 하한 기준)이
+  가장 낮은 날짜(최대 사용률부터 차례로 비교)를 고르고, 사전 검사를 통과하는 날짜를 우선한다
+- 고정 배정(fixed)은 그대로 두고 나머지 인원만 나눈다
+- 직무의 활동을 수행할 수 없는 날짜(활동이 없거나 방이 없음)에는 배정하지 않는다
+"""
+import logging
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .feasibility import FeasibilityChecker
+from .types import ActivityMode, DateConfig
+
+
+class DateLoadBalancer:
+    """직무별 인원을 날짜별 용량에 맞춰 균형 있게 배분"""
+
+    def __init__(self, checker: Optional[FeasibilityChecker] = None, logger: Optional[logging.Logger] = None):
+        self.checker = checker or FeasibilityChecker()
+        self.logger = logger or logging.getLogger(__name__)
+
+    def balance(
+        self,
+        date_configs: Dict[datetime, DateConfig],
+        fixed: Optional[Dict[datetime, Dict[str, int]]] = None
+    ) -> Dict[datetime, DateConfig]:
+        """
+        date_configs의 직무별 총 인원을 날짜별로 다시 나눈 설정
+        fixed: 날짜별로 고정할 직무 인원 (총 인원에서 먼저 빼고 해당 날짜에 그대로 배정)
+        """
+        fixed = fixed or {}
+        dates = sorted(date_configs)
+        totals: Dict[str, int] = defaultdict(int)
+        activities_of: Dict[str, Dict[str, bool]] = defaultdict(dict)  # 직무 -> 활동 수행 여부
+        for date in dates:
+            config = date_configs[date]
+            for job, count in config.jobs.items():
+                totals[job] += count
+            for (job, activity), enabled in config.job_activity_matrix.items():
+                activities_of[job][activity] = activities_of[job].get(activity, False) or enabled
+
+        assigned: Dict[datetime, Dict[str, int]] = {date: defaultdict(int) for date in dates}
+        for date, jobs in fixed.items():
+            for job, count in jobs.items():
+                assigned[date][job] += count
+                totals[job] -= count
+        if any(count < 0 for count in totals.values()):
+            raise ValueError("고정 배정 인원이 직무별 총 인원보다 많습니다")
+
+        hosts = {job: [d for d in dates if self._can_host(date_configs[d], activities_of[job])] for job in totals}
+        cohorts = self._cohorts(totals, date_configs, activities_of)
+        for job, size in cohorts:
+            if not hosts[job]:
+                raise ValueError(f"{job}: 활동을 모두 수행할 수 있는 날짜가 없습니다")
+            best = min(
+                hosts[job],
+                key=lambda d: self._load_after(date_configs[d], assigned[d], activities_of, job, size)
+            )
+            assigned[best][job] += size
+
+        balanced = {
+            date: self._with_jobs(date_configs[date], assigned[date], activities_of)
+            for date in dates
+        }
+        for date, config in balanced.items():
+            report = self.checker.check(config)
+            self.logger.info(
+                f"{date.date()}: {dict(config.jobs)} 최대 사용률 "
+                f"{max(report.utilization.values(), default=0):.0%}"
+                + ("" if report.feasible else f" ⚠️ {report.violations[0]}")
+            )
+        return balanced
+
+    # ---- 보조 ----
+    @staticmethod
+    def _can_host(config: DateConfig, job_activities: Dict[str, bool]) -> bool:
+        """직무의 활동이 모두 이 날짜 설정에 있고 방이 있는지"""
+        rooms_by_type = {room.room_type for room in config.rooms}
+        available = {a.name for a in config.activities if a.room_type in rooms_by_type}
+        return all(name in available for name, enabled in job_activities.items() if enabled)
+
+    @staticmethod
+    def _cohorts(totals, date_configs, activities_of) -> List[Tuple[str, int]]:
+        """
+        배정 단위: 직무별 batched 그룹 크기(최소 max_capacity) 묶음, batched 활동이 없으면 1명씩
+        큰 직무부터, 직무 사이에는 번갈아 가며 배정해 날짜마다 구성비가 비슷해지게 한다
+        """
+        per_job: Dict[str, List[int]] = {}
+        for job, total in sorted(totals.items(), key=lambda item: -item[1]):
+            sizes = [
+                a.max_capacity
+                for config in date_configs.values() for a in config.activities
+                if a.mode == ActivityMode.BATCHED and activities_of[job].get(a.name)
+            ]
+            size = max(1, min(sizes, default=1))
+            per_job[job] = [size] * (total // size) + ([total % size] if total % size else [])
+        cohorts = []
+        for position in range(max((len(c) for c in per_job.values()), default=0)):
+            cohorts.extend((job, c[position]) for job, c in per_job.items() if position < len(c))
+        return cohorts
+
+    def _load_after(self, config, jobs, activities_of, job, size) -> Tuple[bool, Tuple[float, ...]]:
+        """
+        코호트를 넣은 뒤 (사전 검사 위반 여부, 자원 사용률 내림차순) - 작을수록 좋음
+        최대 사용률이 같으면 (인원과 무관한 지원자 동선 등) 다음 자원 사용률로 비교
+        """
+        trial = dict(jobs)
+        trial[job] = trial.get(job, 0) + size
+        report = self.checker.check(self._with_jobs(config, trial, activities_of))
+        return (not report.feasible, tuple(sorted(report.utilization.values(), reverse=True)))
+
+    @staticmethod
+    def _with_jobs(config: DateConfig, jobs: Dict[str, int], activities_of) -> DateConfig:
+        """직무 인원과 직무-활동 매트릭스를 바꾼 날짜 설정"""
+        jobs = {job: count for job, count in jobs.items() if count > 0}
+        names = {a.name for a in config.activities}
+        matrix = {
+            (job, activity): enabled
+            for job in jobs for activity, enabled in activities_of[job].items() if activity in names
+        }
+        return replace(config, jobs=jobs, job_activity_matrix=matrix)
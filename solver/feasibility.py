@@ -0,0 +1,207 @@
+"""
+실행 전 실현 가능성 사전 검사
+
+Level 1~4를 돌리기 전에 DateConfig만으로 계산할 수 있는 하한(lower bound)을 확인한다.
+모든 하한은 실제 스케줄이 반드시 만족해야 하는 값이므로 위반하면 어떤 해도 없다.
+- 활동별 배정 가능한 방 / batched 방 수용인원 vs min_capacity
+- 직무별 활동 소요시간 합, 선후행 최장 경로(간격 포함) vs 운영시간 / 최대 체류시간
+- batched 활동: 최소 그룹 수 vs 방 수 × 방당 슬롯 수
+- 같은 방을 쓰는 활동들의 최소 방 사용시간(분) vs 방 수 × 운영시간
+자원별 사용률(utilization)을 남기고, 위반이 없어도 사용률이 높은 자원은
+병목 후보(bottlenecks)로 알려 준다.
+"""
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from .compiled_config import CompiledDateConfig, compile_date_config
+from .types import Activity, ActivityMode, DateConfig, FeasibilityReport
+
+
+class FeasibilityChecker:
+    """DateConfig 하한 분석 (Level 1 이전, 수 ms)"""
+
+    def __init__(self, tight_threshold: float = 0.9, logger: Optional[logging.Logger] = None):
+        # 사용률이 이 값 이상인 자원을 병목 후보로 보고
+        self.tight_threshold = tight_threshold
+        self.logger = logger or logging.getLogger(__name__)
+
+    def check(self, config: DateConfig) -> FeasibilityReport:
+        started = time.perf_counter()
+        report = FeasibilityReport()
+        compiled = compile_date_config(config)
+        window = int((config.operating_hours[1] - config.operating_hours[0]).total_seconds() // 60)
+
+        # 직무별 수행 활동과 활동별 인원
+        required_by_job: Dict[str, Set[str]] = {}
+        demand: Dict[str, int] = defaultdict(int)
+        for job_code, count in config.jobs.items():
+            if count <= 0:
+                continue
+            required = {
+                a.name for a in config.activities
+                if config.job_activity_matrix.get((job_code, a.name), False)
+            }
+            required_by_job[job_code] = required
+            for name in required:
+                demand[name] += count
+
+        self._check_rooms(config, compiled, demand, report)
+        self._check_applicant_window(config, compiled, required_by_job, window, report)
+        self._check_batched_slots(config, compiled, required_by_job, window, report)
+        self._check_room_minutes(config, compiled, demand, window, report)
+
+        report.bottlenecks.sort(key=lambda b: b["utilization"], reverse=True)
+        report.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return report
+
+    # ---- 개별 하한 ----
+    def _check_rooms(self, config, compiled, demand, report):
+        """활동별 배정 가능한 방, batched 방 수용인원 vs 최소 그룹 크기"""
+        for activity in config.activities:
+            if not demand.get(activity.name):
+                continue
+            rooms = compiled.rooms_for(activity.name)
+            if not rooms:
+                report.violations.append(f"{activity.name}: 배정 가능한 방 없음 (방 유형 {activity.room_type})")
+            elif activity.mode == ActivityMode.BATCHED and not self._batched_rooms(activity, compiled):
+                report.violations.append(
+                    f"{activity.name}: 방 수용인원(최대 {max(r.capacity for r in rooms)}명)이 "
+                    f"최소 그룹 크기({activity.min_capacity}명)보다 작음"
+                )
+
+    def _check_applicant_window(self, config, compiled, required_by_job, window, report):
+        """지원자 한 명의 활동 소요시간 합과 선후행 최장 경로(간격 포함) vs 운영시간(최대 체류시간이 더 짧으면 체류시간)"""
+        limit, label = window, "운영시간"
+        if config.max_stay_hours and config.max_stay_hours * 60 < window:
+            limit, label = int(config.max_stay_hours * 60), "최대 체류시간"
+        for job_code, required in required_by_job.items():
+            total = sum(compiled.activity(name).duration_min for name in required)
+            if total > limit:
+                report.violations.append(
+                    f"{job_code}: 활동 소요시간 합 {total}분 > {label} {limit}분"
+                )
+                continue
+            chain, cycle = self._longest_chain(compiled, required)
+            if cycle:
+                report.violations.append(f"{job_code}: 선후행 순환 ({' → '.join(cycle)})")
+            elif chain[0] > limit:
+                report.violations.append(
+                    f"{job_code}: 선후행 최장 경로 {' → '.join(chain[1])} {chain[0]}분 > {label} {limit}분"
+                )
+            else:
+                self._note(report, f"{job_code} 지원자 동선", max(total, chain[0]), limit, "분")
+
+    def _check_batched_slots(self, config, compiled, required_by_job, window, report):
+        """batched 활동: 직무별 최소 그룹 수 합 vs 방 수 × 방당 슬롯 수"""
+        for activity in config.activities:
+            if activity.mode != ActivityMode.BATCHED:
+                continue
+            rooms = self._batched_rooms(activity, compiled)
+            jobs = [job for job, required in required_by_job.items() if activity.name in required]
+            if not rooms or not jobs:
+                continue
+            group_size = min(activity.max_capacity, max(r.capacity for r in rooms))
+            needed = sum(math.ceil(config.jobs[job] / group_size) for job in jobs)
+            # 직무별로 앞뒤 선후행 시간을 뺀 구간에만 들어갈 수 있음
+            slots_per_room, job_slots = compiled.slots_per_room(
+                activity, {job: required_by_job[job] for job in jobs}, window
+            )
+            capacity = len(rooms) * slots_per_room
+            if needed > capacity:
+                report.violations.append(
+                    f"{activity.name}: 필요 그룹 최소 {needed}개 > 배치 가능 {capacity}개 "
+                    f"(방 {len(rooms)}개 × {slots_per_room}슬롯)"
+                )
+            for job in jobs:
+                job_needed = math.ceil(config.jobs[job] / group_size)
+                if job_needed > len(rooms) * job_slots[job]:
+                    report.violations.append(
+                        f"{activity.name}: {job} 필요 그룹 최소 {job_needed}개 > 배치 가능 "
+                        f"{len(rooms) * job_slots[job]}개 (방 {len(rooms)}개 × {job_slots[job]}슬롯)"
+                    )
+            self._note(report, f"{activity.name} 그룹 슬롯", needed, capacity, "개")
+
+    def _check_room_minutes(self, config, compiled, demand, window, report):
+        """같은 방 묶음을 쓰는 활동들의 최소 방 사용시간 합 vs 방 수 × 운영시간"""
+        pools: Dict[Tuple[str, ...], List[Tuple[Activity, float]]] = defaultdict(list)
+        for activity in config.activities:
+            count = demand.get(activity.name, 0)
+            if activity.mode == ActivityMode.BATCHED:
+                rooms = self._batched_rooms(activity, compiled)
+            else:
+                rooms = compiled.rooms_for(activity.name)
+            if not count or not rooms:
+                continue
+            if activity.mode == ActivityMode.INDIVIDUAL:
+                minutes = count * activity.duration_min
+            elif activity.mode == ActivityMode.PARALLEL:
+                per_session = max(min(r.capacity, activity.max_capacity) for r in rooms)
+                minutes = count * activity.duration_min / max(1, per_session)
+            else:
+                group_size = min(activity.max_capacity, max(r.capacity for r in rooms))
+                minutes = math.ceil(count / group_size) * activity.duration_min
+            pools[tuple(sorted(r.name for r in rooms))].append((activity, minutes))
+
+        for room_names, pool in pools.items():
+            used = sum(minutes for _, minutes in pool)
+            available = len(room_names) * window
+            label = "/".join(activity.name for activity, _ in pool)
+            if used > available:
+                report.violations.append(
+                    f"{label}: 필요 방 사용시간 최소 {used:.0f}분 > "
+                    f"방 {len(room_names)}개 × 운영시간 {window}분 = {available}분"
+                )
+            self._note(report, f"{label} 방 사용시간", used, available, "분")
+
+    # ---- 보조 ----
+    @staticmethod
+    def _batched_rooms(activity: Activity, compiled: CompiledDateConfig) -> List:
+        """min_capacity 이상을 수용하는 방 (Level 1/2와 같은 기준)"""
+        return [room for room in compiled.rooms_for(activity.name) if room.capacity >= activity.min_capacity]
+
+    def _longest_chain(self, compiled, required) -> Tuple[Tuple[int, List[str]], Optional[List[str]]]:
+        """수행 활동 사이 선후행 최장 경로 ((분, 경로), 순환이 있으면 순환 경로)"""
+        best: Dict[str, Tuple[int, List[str]]] = {}
+        state: Dict[str, int] = {}  # 1: 방문 중, 2: 완료
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == 1:
+                return path[path.index(name):] + [name]
+            if state.get(name) == 2:
+                return None
+            state[name] = 1
+            duration = compiled.activity(name).duration_min
+            best[name] = (duration, [name])
+            for successor, gap, _ in compiled.successors_of(name):
+                if successor not in required:
+                    continue
+                cycle = visit(successor, path + [name])
+                if cycle:
+                    return cycle
+                tail_minutes, tail_path = best[successor]
+                if duration + gap + tail_minutes > best[name][0]:
+                    best[name] = (duration + gap + tail_minutes, [name] + tail_path)
+            state[name] = 2
+            return None
+
+        for name in sorted(required):
+            cycle = visit(name, [])
+            if cycle:
+                return (0, []), cycle
+        return max(best.values(), default=(0, []), key=lambda item: item[0]), None
+
+    def _note(self, report: FeasibilityReport, resource: str, used: float, capacity: float, unit: str):
+        """자원 사용률 기록, 사용률이 높은 자원은 병목 후보로"""
+        utilization = used / capacity if capacity else float("inf")
+        report.utilization[resource] = utilization
+        if utilization >= self.tight_threshold:
+            report.bottlenecks.append({
+                "resource": resource,
+                "demand": round(used, 1),
+                "capacity": capacity,
+                "unit": unit,
+                "utilization": round(utilization, 3)
+            })
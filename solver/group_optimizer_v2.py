@@ -4,12 +4,14 @@
 import logging
 import time as time_module
 from collections import defaultdict
+from datetime import timedelta
 from typing import List, Dict, Optional, Tuple
 
 from .types import (
     Applicant, Activity, Group, ActivityMode, Level1Result,
     calculate_group_count
 )
+from .compiled_config import CompiledDateConfig
 
 
 class GroupOptimizerV2:
@@ -22,13 +24,16 @@ class GroupOptimizerV2:
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.dummy_counter = 0
+        self.last_infeasibility: Optional[str] = None
     
     def optimize(
         self,
         applicants: List[Applicant],
         activities: List[Activity],
         time_limit: float = 30.0,
-        dummy_hint: int = 0
+        dummy_hint: int = 0,
+        compiled: Optional[CompiledDateConfig] = None,
+        operating_hours: Optional[Tuple[timedelta, timedelta]] = None
     ) -> Optional[Level1Result]:
         """
         Level 1: 그룹 구성 최적화 (개선된 버전)
@@ -37,9 +42,14 @@ class GroupOptimizerV2:
         1. 직무별로 분리
         2. 각 직무 내에서 공통 그룹을 구성 (모든 batched 활동 공유)
         3. 그룹 수 최소화 우선, 동일 그룹 수면 더 큰 균등 크기 선호
+        
+        compiled/operating_hours가 주어지면 방 수용인원으로 그룹 크기 상한을 정하고,
+        활동별 배치 가능한 그룹 수(방 수 × 방당 슬롯 수)를 넘으면 Level 2를 실행하지
+        않고 바로 실패(None)를 반환한다. 실패 사유는 last_infeasibility에 남긴다.
         """
         self.logger.info(f"그룹 최적화 시작 (V2): {len(applicants)}명 지원자")
         start_time = time_module.time()
+        self.last_infeasibility = None
         
         # Batched 활동만 필터링
         batched_activities = [
@@ -78,6 +88,19 @@ class GroupOptimizerV2:
             min_capacity = max(act.min_capacity for act in job_batched_activities)
             max_capacity = min(act.max_capacity for act in job_batched_activities)
             
+            # 방 수용인원보다 큰 그룹은 배치할 수 없음
+            if compiled is not None:
+                max_capacity = min(
+                    [max_capacity] + [
+                        max((room.capacity for room in self._batched_rooms(act, compiled)), default=0)
+                        for act in job_batched_activities
+                    ]
+                )
+                if max_capacity < min_capacity:
+                    return self._infeasible(
+                        f"{job_code}: 방 수용인원({max_capacity}명)이 최소 그룹 크기({min_capacity}명)보다 작음"
+                    )
+            
             self.logger.info(
                 f"{job_code}: {len(job_applicants)}명, "
                 f"그룹 크기 {min_capacity}~{max_capacity} "
@@ -96,6 +119,14 @@ class GroupOptimizerV2:
             job_groups[job_code] = groups
             total_dummy_count += dummy_count
         
+        # 활동별 그룹 수가 방 × 슬롯 수 안에 들어가는지 확인
+        if compiled is not None and operating_hours is not None:
+            reason = self._check_slot_capacity(
+                batched_activities, job_groups, applicants_by_job, compiled, operating_hours
+            )
+            if reason:
+                return self._infeasible(reason)
+        
         # 활동별로 그룹 할당 (같은 그룹이 모든 활동 수행)
         all_groups = {}
         for activity in batched_activities:
@@ -256,4 +287,99 @@ class GroupOptimizerV2:
             group.dummy_ids = [mid for mid in group_member_ids if mid.startswith("DUMMY_")]
             groups.append(group)
         
-        return groups, dummy_count 
\ No newline at end of file
+        return groups, dummy_count
+    
+    def _infeasible(self, reason: str) -> None:
+        """배치 불가능 - 사유 기록 후 None 반환"""
+        self.last_infeasibility = reason
+        self.logger.warning(f"❌ Level 1: 배치 가능한 그룹 구성 없음 - {reason}")
+        return None
+    
+    @staticmethod
+    def _batched_rooms(activity: Activity, compiled: CompiledDateConfig) -> List:
+        """Level 2에서 이 활동에 쓸 수 있는 방 (BatchedScheduler와 같은 기준)"""
+        return [
+            room for room in compiled.rooms_for(activity.name)
+            if room.capacity >= activity.min_capacity
+        ]
+    
+    @staticmethod
+    def _slot_minutes(activity: Activity, slot: int = 5) -> int:
+        """5분 단위로 올림한 소요시간 (Level 2 격자 기준)"""
+        return -(-activity.duration_min // slot) * slot
+    
+    def _check_slot_capacity(
+        self,
+        batched_activities: List[Activity],
+        job_groups: Dict[str, List[Group]],
+        applicants_by_job: Dict[str, List[Applicant]],
+        compiled: CompiledDateConfig,
+        operating_hours: Tuple[timedelta, timedelta]
+    ) -> Optional[str]:
+        """
+        활동별 배치 가능한 그룹 수 상한 확인
+        
+        방당 슬롯 수 = 직무별 시작 가능 구간(운영시간 - 앞뒤 선후행 시간)의 합집합 // 활동 소요시간,
+        직무별로도 자기 구간 안의 슬롯 수를 넘지 않아야 한다.
+        같은 방을 쓰는 활동들은 소요시간 합이 방 운영시간 합을 넘지 않아야 한다.
+        Returns: 배치 불가능 사유 (가능하면 None)
+        """
+        window = int((operating_hours[1] - operating_hours[0]).total_seconds() // 60)
+        required_by_job = {
+            job_code: set(job_applicants[0].required_activities)
+            for job_code, job_applicants in applicants_by_job.items() if job_applicants
+        }
+        
+        demand: Dict[str, int] = {}
+        for activity in batched_activities:
+            jobs = [
+                job_code for job_code in job_groups
+                if activity.name in required_by_job.get(job_code, ())
+            ]
+            needed = sum(len(job_groups[job_code]) for job_code in jobs)
+            if not needed:
+                continue
+            demand[activity.name] = needed
+            
+            # 직무별로 앞뒤 선후행 시간을 뺀 구간에만 들어갈 수 있음
+            rooms = self._batched_rooms(activity, compiled)
+            slots_per_room, job_slots = compiled.slots_per_room(
+                activity, {job_code: required_by_job[job_code] for job_code in jobs}, window, 5
+            )
+            capacity = len(rooms) * slots_per_room
+            
+            self.logger.info(
+                f"{activity.name}: 그룹 {needed}개 (가능 범위 {needed}~{capacity}개 = "
+                f"방 {len(rooms)}개 × {slots_per_room}슬롯)"
+            )
+            if needed > capacity:
+                return (
+                    f"{activity.name}: 필요 그룹 {needed}개 > 배치 가능 {capacity}개 "
+                    f"(방 {len(rooms)}개 × {slots_per_room}슬롯)"
+                )
+            for job_code in jobs:
+                job_capacity = len(rooms) * job_slots[job_code]
+                if len(job_groups[job_code]) > job_capacity:
+                    return (
+                        f"{activity.name}: {job_code} 필요 그룹 {len(job_groups[job_code])}개 > "
+                        f"배치 가능 {job_capacity}개 (방 {len(rooms)}개 × {job_slots[job_code]}슬롯)"
+                    )
+        
+        # 같은 방을 공유하는 활동들의 총 사용시간
+        shared: Dict[Tuple[str, ...], List[Activity]] = defaultdict(list)
+        for activity in batched_activities:
+            if activity.name in demand:
+                key = tuple(sorted(room.name for room in self._batched_rooms(activity, compiled)))
+                shared[key].append(activity)
+        for room_names, pool in shared.items():
+            if len(pool) < 2:
+                continue
+            used = sum(demand[a.name] * self._slot_minutes(a) for a in pool)
+            available = len(room_names) * window
+            if used > available:
+                return (
+                    f"{'/'.join(a.name for a in pool)}: 같은 방 사용시간 {used}분 > "
+                    f"운영시간 합 {available}분"
+                )
+        
+        return None
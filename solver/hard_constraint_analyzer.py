@@ -91,7 +91,7 @@ class HardConstraintAnalyzer:
     
     def _calculate_stay_times(self, schedule_df: pd.DataFrame) -> pd.DataFrame:
         """
-        지원자별 체류시간 계산
+        지원자별 체류시간 계산 (날짜 + 지원자 단위, 열 단위 연산)
         
         Args:
             schedule_df: 스케줄 DataFrame
@@ -99,78 +99,44 @@ class HardConstraintAnalyzer:
         Returns:
             지원자별 체류시간 DataFrame
         """
-        stay_data = []
+        # 더미 지원자 제외
+        schedule_df = schedule_df[~schedule_df['applicant_id'].astype(str).str.startswith('dummy')]
+        if schedule_df.empty:
+            return pd.DataFrame()
         
-        # 지원자별로 그룹화
-        for applicant_id in schedule_df['applicant_id'].unique():
-            applicant_data = schedule_df[schedule_df['applicant_id'] == applicant_id]
-            
-            if applicant_data.empty:
-                continue
-            
-            # 더미 지원자 제외
-            if str(applicant_id).startswith('dummy'):
-                continue
-            
-            # 시간 정보 수집
-            all_start_times = []
-            all_end_times = []
-            
-            for _, row in applicant_data.iterrows():
-                try:
-                    start_time = row['start_time']
-                    end_time = row['end_time']
-                    
-                    # 시간 형식 변환
-                    if isinstance(start_time, str):
-                        start_time = pd.to_datetime(start_time, format='%H:%M:%S').time()
-                    if isinstance(end_time, str):
-                        end_time = pd.to_datetime(end_time, format='%H:%M:%S').time()
-                    
-                    # timedelta로 변환
-                    from datetime import timedelta
-                    if hasattr(start_time, 'hour'):
-                        start_td = timedelta(hours=start_time.hour, minutes=start_time.minute, seconds=start_time.second)
-                    else:
-                        # 이미 timedelta인 경우
-                        start_td = start_time
-                        
-                    if hasattr(end_time, 'hour'):
-                        end_td = timedelta(hours=end_time.hour, minutes=end_time.minute, seconds=end_time.second)
-                    else:
-                        # 이미 timedelta인 경우
-                        end_td = end_time
-                    
-                    all_start_times.append(start_td)
-                    all_end_times.append(end_td)
-                    
-                except Exception as e:
-                    self.logger.debug(f"시간 파싱 오류 (applicant_id: {applicant_id}): {e}")
-                    continue
-            
-            if all_start_times and all_end_times:
-                # 전체 체류시간 = 첫 번째 활동 시작 ~ 마지막 활동 종료
-                total_start = min(all_start_times)
-                total_end = max(all_end_times)
-                # 5분 단위로 라운딩
-                stay_duration_minutes = (total_end - total_start).total_seconds() / 60
-                stay_duration_hours = round(stay_duration_minutes / 5) * 5 / 60
-                
-                # 메타 정보
-                interview_date = applicant_data['interview_date'].iloc[0]
-                job_code = applicant_data['job_code'].iloc[0]
-                
-                stay_data.append({
-                    'applicant_id': applicant_id,
-                    'interview_date': interview_date,
-                    'job_code': job_code,
-                    'stay_hours': stay_duration_hours,
-                    'start_time': total_start,
-                    'end_time': total_end,
-                    'activity_count': len(applicant_data)
-                })
+        # 시간 형식 변환 ('HH:MM:SS' 문자열 / time / timedelta → timedelta, 파싱 실패는 제외)
+        rows = pd.DataFrame({
+            'interview_date': schedule_df['interview_date'],
+            'applicant_id': schedule_df['applicant_id'],
+            'job_code': schedule_df['job_code'],
+            'start_time': self._to_timedelta(schedule_df['start_time']),
+            'end_time': self._to_timedelta(schedule_df['end_time'])
+        })
+        
+        # 같은 지원자 ID가 여러 날짜에 있을 수 있으므로 날짜별로 따로 집계
+        stays = rows.groupby(['interview_date', 'applicant_id'], sort=False).agg(
+            job_code=('job_code', 'first'),
+            start_time=('start_time', 'min'),
+            end_time=('end_time', 'max'),
+            activity_count=('job_code', 'size')
+        ).reset_index().dropna(subset=['start_time', 'end_time'])
+        if stays.empty:
+            return pd.DataFrame()
         
-        return pd.DataFrame(stay_data)
+        # 전체 체류시간 = 첫 번째 활동 시작 ~ 마지막 활동 종료 (5분 단위로 라운딩)
+        stay_minutes = (stays['end_time'] - stays['start_time']).dt.total_seconds() / 60
+        stays['stay_hours'] = (stay_minutes / 5).round() * 5 / 60
+        return stays[[
+            'applicant_id', 'interview_date', 'job_code', 'stay_hours',
+            'start_time', 'end_time', 'activity_count'
+        ]].reset_index(drop=True)
+    
+    @staticmethod
+    def _to_timedelta(times: pd.Series) -> pd.Series:
+        """시간 열을 timedelta로 ('HH:MM:SS' 문자열 / time / timedelta)"""
+        if pd.api.types.is_timedelta64_dtype(times):
+            return times
+        return pd.to_timedelta(times.astype(str), errors='coerce')
     
     def generate_constraint_report(self, date_analysis: Dict) -> pd.DataFrame:
         """
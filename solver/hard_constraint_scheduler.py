@@ -48,11 +48,11 @@ class HardConstraintScheduler:
         self.logger.info("1단계: 초기 스케줄링 (소프트 제약)")
         
         # 소프트 제약으로 1차 스케줄링 (순환 import 방지를 위해 동적 import)
-        from .api import solve_for_days_v2
+        from .api import _solve_for_days_v2_result
         phase1_params = params.copy() if params else {}
         phase1_params['max_stay_hours'] = 12  # 충분히 큰 값으로 설정
         
-        status1, df1, logs1, limit1 = solve_for_days_v2(
+        status1, df1, logs1, limit1, phase1_multi_result = _solve_for_days_v2_result(
             cfg_ui, 
             phase1_params, 
             debug, 
@@ -96,9 +96,10 @@ class HardConstraintScheduler:
         # 3단계: 하드 제약 적용 2차 스케줄링
         self.logger.info("3단계: 하드 제약 적용 2차 스케줄링")
         
-        # 하드 제약을 적용한 2차 스케줄링
+        # 하드 제약을 적용한 2차 스케줄링 (1차 결과를 웜 스타트로 사용)
         phase2_result = self._apply_hard_constraints(
-            cfg_ui, hard_constraints, params, debug, progress_callback
+            cfg_ui, hard_constraints, params, debug, progress_callback,
+            warm_start=phase1_multi_result
         )
         
         # 결과 정리
@@ -121,7 +122,8 @@ class HardConstraintScheduler:
                                hard_constraints: Dict[str, float],
                                params: dict = None,
                                debug: bool = False,
-                               progress_callback = None) -> Dict[str, Any]:
+                               progress_callback = None,
+                               warm_start = None) -> Dict[str, Any]:
         """
         하드 제약을 적용한 스케줄링
         
@@ -131,36 +133,29 @@ class HardConstraintScheduler:
             params: 추가 파라미터
             debug: 디버그 모드
             progress_callback: 진행상황 콜백
+            warm_start: 이전 단계의 MultiDateResult (Level 1 그룹과 배치를 재사용)
             
         Returns:
-            하드 제약 적용 결과
+            하드 제약 적용 결과 ('result': 다음 단계 웜 스타트용 MultiDateResult)
         """
         # 하드 제약을 적용한 파라미터 생성
         phase2_params = params.copy() if params else {}
         
-        # 각 날짜별로 하드 제약 적용
-        date_overrides = {}
-        for date_str, constraint_hours in hard_constraints.items():
-            date_overrides[date_str] = {
-                'max_stay_hours': constraint_hours
-            }
-        
-        # UI 설정에 날짜별 오버라이드 추가
+        # 날짜별 체류시간 하드 제약을 오버라이드로 전달 (솔버가 배치 단계에서 직접 지킴)
         cfg_with_constraints = cfg_ui.copy()
-        if 'multidate_plans' in cfg_with_constraints:
-            for date_str, plan in cfg_with_constraints['multidate_plans'].items():
-                if date_str in date_overrides:
-                    if 'overrides' not in plan:
-                        plan['overrides'] = {}
-                    plan['overrides'].update(date_overrides[date_str])
+        cfg_with_constraints['date_overrides'] = {
+            date_str: {'max_stay_hours': constraint_hours}
+            for date_str, constraint_hours in hard_constraints.items()
+        }
         
         # 2차 스케줄링 실행 (순환 import 방지를 위해 동적 import)
-        from .api import solve_for_days_v2
-        status2, df2, logs2, limit2 = solve_for_days_v2(
+        from .api import _solve_for_days_v2_result
+        status2, df2, logs2, limit2, multi_result = _solve_for_days_v2_result(
             cfg_with_constraints,
             phase2_params,
             debug,
-            progress_callback
+            progress_callback,
+            warm_start
         )
         
         if status2 != "SUCCESS":
@@ -169,21 +164,24 @@ class HardConstraintScheduler:
                 'error': f"2차 스케줄링 실패: {status2}",
                 'logs': logs2,
                 'schedule': None,
-                'exceed_analysis': {}
+                'exceed_analysis': {},
+                'result': multi_result
             }
         
-        # 🔧 하드 제약 강제 적용 후처리
-        self.logger.info("🔧 하드 제약 강제 적용 후처리 시작")
-        adjusted_df = self._force_apply_hard_constraints(df2, hard_constraints)
-        
-        # 초과자 분석
+        # 초과자 분석 (남은 초과자가 있을 때만 강제 적용 후처리)
+        adjusted_df = df2
         exceed_analysis = self._analyze_constraint_violations(adjusted_df, hard_constraints)
+        if exceed_analysis.get('total_violations', 0) > 0:
+            self.logger.warning(f"🔧 체류시간 초과 {exceed_analysis['total_violations']}명 - 강제 적용 후처리 시작")
+            adjusted_df = self._force_apply_hard_constraints(df2, hard_constraints)
+            exceed_analysis = self._analyze_constraint_violations(adjusted_df, hard_constraints)
         
         return {
             'status': 'SUCCESS',
             'schedule': adjusted_df,
             'logs': logs2,
-            'exceed_analysis': exceed_analysis
+            'exceed_analysis': exceed_analysis,
+            'result': multi_result
         }
     
     def _force_apply_hard_constraints(self, 
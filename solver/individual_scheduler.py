@@ -4,10 +4,18 @@ Level 3: Individual & Parallel 활동 스케줄링
 Individual: 1명씩 개별 면접
 Parallel: 여러명이 같은 공간에서 각자 다른 일
 """
+import functools
 import logging
-from typing import Dict, List, Optional, Tuple, Set
+import multiprocessing
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Set
 from datetime import timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
 from ortools.sat.python import cp_model
 
 from .types import (
@@ -16,15 +24,93 @@ from .types import (
     TimeSlot, GroupAssignment, RoomAssignment,
     PrecedenceRule
 )
+from .room_availability import RoomAvailability
+from .applicant_timeline import ApplicantTimelines
+from .compiled_config import CompiledDateConfig
+from .undo_log import JournaledAvailability, JournaledDict, JournaledListDict, UndoLog
 
 logger = logging.getLogger(__name__)
 
 
+class _CpsatStallCallback(cp_model.CpSolverSolutionCallback):
+    """CP-SAT 해 개선 시각 기록 (개선 정체시 조기 종료용)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.solution_count = 0
+        self.last_improvement = time.time()
+        
+    def on_solution_callback(self):
+        self.solution_count += 1
+        self.last_improvement = time.time()
+
+
+@dataclass(frozen=True)
+class HeuristicVariant:
+    """Level 3 휴리스틱 변형 (포트폴리오 실행용)"""
+    seed: int = 0
+    applicant_order: str = "default"  # default | constrained | job | random
+    room_offset: int = 0              # 방 라운드 로빈 시작 위치
+    shuffle_activities: bool = False  # 체인/활동 처리 순서 섞기
+
+
+APPLICANT_ORDERS = ("constrained", "job", "random")
+
+
+# 포트폴리오 프로세스 풀 워커의 중단 신호 (부모가 결과를 정하거나 제한시간이 지나면 설정)
+_portfolio_stop = None
+
+
+def _init_portfolio_worker(stop_event) -> None:
+    global _portfolio_stop
+    _portfolio_stop = stop_event
+
+
+def _run_heuristic_variant(variant: HeuristicVariant, args: tuple):
+    """포트폴리오 워커: 변형 하나로 휴리스틱 실행 (프로세스 풀에서 pickle 가능한 최상위 함수)"""
+    (applicants, activities, rooms, batched_results, start_time, end_time,
+     date_str, precedence_rules, global_gap_min, search_budget, max_stay) = args
+    scheduler = IndividualScheduler(variant, *search_budget)
+    scheduler.max_stay = max_stay
+    scheduler.stop_event = _portfolio_stop
+    scheduler._ensure_compiled(activities, rooms, precedence_rules, global_gap_min, applicants)
+    individual_activities = [
+        a for a in activities
+        if a.mode in [ActivityMode.INDIVIDUAL, ActivityMode.PARALLEL]
+    ]
+    result = scheduler._schedule_heuristic(
+        applicants, individual_activities, rooms, batched_results,
+        start_time, end_time, date_str, precedence_rules, global_gap_min
+    )
+    if result.success and scheduler._find_precedence_violations(result):
+        result.success = False
+    return variant, result, scheduler.search_stats
+
+
 class IndividualScheduler:
     """Level 3: Individual & Parallel 활동 스케줄러"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        variant: Optional[HeuristicVariant] = None,
+        search_node_limit: int = 5000,
+        search_time_limit_sec: float = 5.0,
+        backtrack_window: int = 4
+    ):
         self.time_slot_minutes = 5  # 5분 단위
+        self.variant = variant or HeuristicVariant()
+        # 백트래킹 예산: 배정 노드 수 / 시간 / 최대 도달 단위에서 되돌아갈 수 있는 단위 수
+        self.search_node_limit = search_node_limit
+        self.search_time_limit_sec = search_time_limit_sec
+        self.backtrack_window = backtrack_window
+        self.search_stats = self._new_search_stats()
+        self._undo_log = UndoLog()
+        self._timelines: Optional[ApplicantTimelines] = None  # 휴리스틱 실행 중 지원자 비트맵
+        self._compiled: Optional[CompiledDateConfig] = None    # 활동/방/선후행 조회 테이블
+        self._batched_times: Dict[Tuple[str, str], Tuple[timedelta, timedelta]] = {}
+        self.max_stay: Optional[timedelta] = None  # 지원자 최대 체류시간 (Batched 활동 포함)
+        self.reserved_rooms: Dict[str, List[Tuple[timedelta, timedelta]]] = {}  # 방별 이미 배정된 시간대
+        self.stop_event = None  # 설정되면 휴리스틱 탐색 중단 (포트폴리오 워커)
         
     def schedule_individuals(
         self,
@@ -36,9 +122,24 @@ class IndividualScheduler:
         end_time: timedelta,
         date_str: str,
         precedence_rules: List[PrecedenceRule] = None,
-        global_gap_min: int = 5
+        global_gap_min: int = 5,
+        time_limit_sec: float = 30.0,
+        compiled: Optional[CompiledDateConfig] = None,
+        max_stay_hours: Optional[float] = None,
+        reserved_rooms: Optional[Dict[str, List[Tuple[timedelta, timedelta]]]] = None
     ) -> Optional[IndividualScheduleResult]:
-        """Individual & Parallel 활동 스케줄링"""
+        """
+        Individual & Parallel 활동 스케줄링 (max_stay_hours: 지원자 최대 체류시간, Batched 블록 포함)
+        reserved_rooms: 방별로 이미 배정된 시간대 - 일부 지원자만 다시 배치할 때 나머지 배정을 고정
+        """
+        self.max_stay = timedelta(hours=max_stay_hours) if max_stay_hours else None
+        self.reserved_rooms = reserved_rooms or {}
+        
+        # 컴파일된 설정 (SingleDateScheduler에서 전달되지 않으면 직접 생성)
+        if compiled is not None:
+            self._compiled = compiled
+        else:
+            self._ensure_compiled(activities, rooms, precedence_rules or [], global_gap_min, applicants)
         
         # 디버깅: applicants 타입 확인
         logger.debug(f"Applicants 수: {len(applicants)}")
@@ -63,21 +164,28 @@ class IndividualScheduler:
             
         # 1. 휴리스틱 방식 시도
         logger.info("휴리스틱 방식으로 Individual 스케줄링 시도...")
-        result = self._schedule_heuristic(
+        heuristic_result = self._schedule_heuristic(
             applicants, individual_activities, rooms, 
             batched_results, start_time, end_time, date_str,
             precedence_rules or [], global_gap_min
         )
         
-        if result and result.success:
-            logger.info("✅ 휴리스틱 방식 성공")
-            return result
+        if heuristic_result and heuristic_result.success:
+            violations = self._find_precedence_violations(heuristic_result)
+            if not violations:
+                logger.info("✅ 휴리스틱 방식 성공")
+                return heuristic_result
+            logger.warning(f"휴리스틱 결과 선후행 위반 {len(violations)}건: {violations[:3]}")
+            heuristic_result.success = False
             
-        # 2. 실패시 CP-SAT 방식 시도
+        # 2. 실패시 CP-SAT 방식 시도 (휴리스틱 부분 배정을 hint로 사용)
         logger.warning("휴리스틱 실패, CP-SAT 방식 시도...")
         result = self._schedule_cpsat(
             applicants, individual_activities, rooms,
-            batched_results, start_time, end_time, date_str
+            batched_results, start_time, end_time, date_str,
+            precedence_rules or [], global_gap_min,
+            hint=heuristic_result,
+            time_limit_sec=time_limit_sec
         )
         
         if result and result.success:
@@ -87,6 +195,169 @@ class IndividualScheduler:
         logger.error("❌ Individual 스케줄링 실패")
         return None
         
+    def schedule_portfolio(
+        self,
+        applicants: List[Applicant],
+        activities: List[Activity],
+        rooms: List[Room],
+        batched_results: List[GroupScheduleResult],
+        start_time: timedelta,
+        end_time: timedelta,
+        date_str: str,
+        precedence_rules: List[PrecedenceRule] = None,
+        global_gap_min: int = 5,
+        time_limit_sec: float = 30.0,
+        n_variants: int = 8,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        first_feasible: bool = True,
+        compiled: Optional[CompiledDateConfig] = None,
+        max_stay_hours: Optional[float] = None
+    ) -> Optional[IndividualScheduleResult]:
+        """
+        포트폴리오 방식 Individual & Parallel 활동 스케줄링
+        
+        활동 순서/지원자 순서/방 시작 위치가 다른 휴리스틱 변형 N개를 프로세스 풀에서
+        동시에 실행한다. 제한시간 안에 첫 번째 성공 결과(first_feasible=False면
+        총 체류시간이 가장 짧은 결과)를 채택하고, 모두 실패하면 가장 많이 배정된
+        부분 결과를 hint로 CP-SAT을 남은 시간 동안 실행한다.
+        """
+        precedence_rules = precedence_rules or []
+        deadline = time.time() + time_limit_sec
+        
+        individual_activities = [
+            a for a in activities
+            if a.mode in [ActivityMode.INDIVIDUAL, ActivityMode.PARALLEL]
+        ]
+        if not individual_activities or n_variants <= 1:
+            return self.schedule_individuals(
+                applicants, activities, rooms, batched_results, start_time, end_time,
+                date_str, precedence_rules, global_gap_min, time_limit_sec, compiled, max_stay_hours
+            )
+        self.max_stay = timedelta(hours=max_stay_hours) if max_stay_hours else None
+        
+        if compiled is not None:
+            self._compiled = compiled
+        else:
+            self._ensure_compiled(activities, rooms, precedence_rules, global_gap_min, applicants)
+        self._batched_times = self._extract_batched_times(batched_results)
+        
+        variants = self.build_portfolio(n_variants, seed)
+        args = (
+            applicants, activities, rooms, batched_results,
+            start_time, end_time, date_str, precedence_rules, global_gap_min,
+            (self.search_node_limit, self.search_time_limit_sec, self.backtrack_window),
+            self.max_stay
+        )
+        self.search_stats = self._new_search_stats()
+        workers = min(len(variants), max_workers or os.cpu_count() or 1)
+        logger.info(f"🎲 Level 3 포트폴리오 실행: 변형 {len(variants)}개, 워커 {workers}개")
+        
+        best: Optional[IndividualScheduleResult] = None
+        best_stay = float('inf')
+        best_partial: Optional[IndividualScheduleResult] = None
+        
+        def consider(
+            variant: HeuristicVariant,
+            result: Optional[IndividualScheduleResult],
+            stats: Dict[str, int]
+        ) -> bool:
+            """결과/탐색 통계 반영, 탐색 종료 여부 반환"""
+            nonlocal best, best_stay, best_partial
+            for key in ("nodes", "backtracks", "undone_changes"):
+                self.search_stats[key] += stats[key]
+            self.search_stats["max_depth"] = max(self.search_stats["max_depth"], stats["max_depth"])
+            self.search_stats["budget_exhausted"] |= stats["budget_exhausted"]
+            if result is None:
+                return False
+            if not result.success:
+                if best_partial is None or len(result.assignments) > len(best_partial.assignments):
+                    best_partial = result
+                return False
+            stay = self._total_stay_minutes(result)
+            logger.debug(f"포트폴리오 변형 {variant} 성공: 총 체류 {stay:.0f}분")
+            if stay < best_stay:
+                best, best_stay = result, stay
+            return first_feasible
+        
+        if workers <= 1:
+            for variant in variants:
+                if time.time() >= deadline:
+                    break
+                if consider(*_run_heuristic_variant(variant, args)):
+                    break
+        else:
+            stop = multiprocessing.Event()
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_portfolio_worker, initargs=(stop,)
+            )
+            try:
+                pending = {executor.submit(_run_heuristic_variant, v, args) for v in variants}
+                done_early = False
+                while pending and not done_early:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        logger.warning(f"⏰ 포트폴리오 제한시간 도달 (미완료 변형 {len(pending)}개)")
+                        break
+                    done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            outcome = future.result()
+                        except Exception as e:
+                            logger.warning(f"포트폴리오 워커 오류: {e}")
+                            continue
+                        done_early = consider(*outcome) or done_early
+            finally:
+                # 실행 중인 변형은 중단 신호로 다음 탐색 단계에서 멈춤
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        if best is not None:
+            logger.info(f"✅ 포트폴리오 성공 (총 체류 {best_stay:.0f}분)")
+            return best
+        
+        # 모든 변형 실패 → 가장 많이 배정된 부분 결과를 hint로 CP-SAT
+        remaining = max(1.0, deadline - time.time())
+        logger.warning(f"포트폴리오 전 변형 실패, CP-SAT 방식 시도 ({remaining:.1f}초)...")
+        result = self._schedule_cpsat(
+            applicants, individual_activities, rooms,
+            batched_results, start_time, end_time, date_str,
+            precedence_rules, global_gap_min,
+            hint=best_partial,
+            time_limit_sec=remaining
+        )
+        if result and result.success:
+            logger.info("✅ CP-SAT 방식 성공")
+            return result
+        
+        logger.error("❌ Individual 스케줄링 실패 (포트폴리오)")
+        return None
+        
+    @staticmethod
+    def build_portfolio(n_variants: int, seed: int = 0) -> List[HeuristicVariant]:
+        """휴리스틱 변형 목록 (첫 번째는 기본 휴리스틱)"""
+        variants = [HeuristicVariant(seed=seed)]
+        for i in range(1, n_variants):
+            variants.append(HeuristicVariant(
+                seed=seed + i,
+                applicant_order=APPLICANT_ORDERS[(i - 1) % len(APPLICANT_ORDERS)],
+                room_offset=i,
+                shuffle_activities=i > len(APPLICANT_ORDERS)
+            ))
+        return variants
+        
+    def _total_stay_minutes(self, result: IndividualScheduleResult) -> float:
+        """총 체류시간 (분, Batched 활동 포함)"""
+        spans: Dict[str, List[timedelta]] = {}
+        for (applicant_id, _), (start, end) in self._batched_times.items():
+            span = spans.setdefault(applicant_id, [start, end])
+            span[0], span[1] = min(span[0], start), max(span[1], end)
+        for applicant_id, slots in result.schedule_by_applicant.items():
+            for slot in slots:
+                span = spans.setdefault(applicant_id, [slot.start_time, slot.end_time])
+                span[0], span[1] = min(span[0], slot.start_time), max(span[1], slot.end_time)
+        return sum((end - start).total_seconds() for start, end in spans.values()) / 60
+        
     def _schedule_heuristic(
         self,
         applicants: List[Applicant],
@@ -103,16 +374,32 @@ class IndividualScheduler:
         
         # Batched 활동의 시간대 추출
         batched_blocks = self._extract_batched_blocks(batched_results)
+        self._batched_times = self._extract_batched_times(batched_results)
+        
+        # 지원자별 스케줄 저장 (백트래킹을 위해 모든 변경을 undo log에 기록)
+        self._undo_log = UndoLog()
+        self.search_stats = self._new_search_stats()
+        
+        # 지원자별 비트맵 (Batched 블록을 기준선으로, 증분 반영도 undo log에 기록)
+        self._timelines = self._build_timelines(
+            applicants, batched_blocks, start_time, end_time, self._undo_log
+        )
         
         # 방별 사용 가능 시간대 계산
         room_availability = self._calculate_room_availability(
             rooms, batched_blocks, start_time, end_time
         )
         
-        # 지원자별 스케줄 저장
-        assignments = {}
-        schedule_by_applicant = defaultdict(list)
-        schedule_by_room = defaultdict(list)
+        # 변형별 지원자 처리 순서
+        applicants = self._order_applicants(applicants)
+        
+        room_availability = {
+            name: JournaledAvailability(self._undo_log, availability)
+            for name, availability in room_availability.items()
+        }
+        assignments = JournaledDict(self._undo_log)
+        schedule_by_applicant = JournaledListDict(self._undo_log)
+        schedule_by_room = JournaledListDict(self._undo_log)
         
         # ✨ 개선된 스케줄링 순서 결정
         ordered_activities = self._optimize_activity_order(
@@ -129,18 +416,14 @@ class IndividualScheduler:
         
         if not success:
             logger.warning("백트래킹 스케줄링 실패, 기본 방식으로 재시도")
-            # 기본 방식으로 재시도
-            assignments.clear()
-            schedule_by_applicant.clear()
-            schedule_by_room.clear()
-            
-            # 방 가용성 재계산
-            room_availability = self._calculate_room_availability(
-                rooms, batched_blocks, start_time, end_time
-            )
+            # 기본 방식으로 재시도 (배정/방 가용성을 처음 상태로 되돌림)
+            self.search_stats["undone_changes"] += self._undo_log.rollback(0)
             
             # 활동별로 처리 (기본 방식)
             for activity in ordered_activities:
+                if self._stopped():
+                    success = False
+                    break
                 if activity.mode == ActivityMode.INDIVIDUAL:
                     success = self._schedule_individual_activity(
                         activity, applicants, rooms, room_availability,
@@ -158,21 +441,36 @@ class IndividualScheduler:
                     
                 if not success:
                     logger.warning(f"활동 {activity.name} 스케줄링 실패")
-                    return None
+                    break
                 
+        # 실패시에도 부분 배정을 반환 (CP-SAT hint로 사용)
         return IndividualScheduleResult(
-            assignments=assignments,
-            schedule_by_applicant=dict(schedule_by_applicant),
-            schedule_by_room=dict(schedule_by_room),
-            success=True
+            assignments=dict(assignments),
+            schedule_by_applicant={k: list(v) for k, v in schedule_by_applicant.items()},
+            schedule_by_room={k: list(v) for k, v in schedule_by_room.items()},
+            success=success
         )
         
+    def _stopped(self) -> bool:
+        return self.stop_event is not None and self.stop_event.is_set()
+        
+    @staticmethod
+    def _new_search_stats() -> Dict[str, int]:
+        """백트래킹 탐색 통계"""
+        return {
+            "nodes": 0,            # 적용한 배정 후보 수
+            "backtracks": 0,       # 되돌아간 횟수
+            "undone_changes": 0,   # undo log로 되돌린 변경 수
+            "max_depth": 0,        # 도달한 최대 배정 단위
+            "budget_exhausted": False
+        }
+        
     def _schedule_with_backtracking(
         self,
         activities: List[Activity],
         applicants: List[Applicant],
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -183,7 +481,11 @@ class IndividualScheduler:
         end_time: timedelta,
         global_gap_min: int
     ) -> bool:
-        """🧠 개선된 백트래킹 기반 스케줄링"""
+        """🧠 undo log 기반 백트래킹 스케줄링
+        
+        배치 단위(연속배치 쌍의 그룹 → 나머지 활동)를 순서대로 배정하다가 막히면
+        undo log로 직전 단위들의 변경만 되돌리고 다음 후보 시간을 시도한다.
+        """
         
         # precedence 체인이 있는 활동들을 우선 처리
         precedence_pairs = []
@@ -191,76 +493,121 @@ class IndividualScheduler:
             if rule.is_adjacent:  # 연속배치가 필요한 경우만
                 precedence_pairs.append((rule.predecessor, rule.successor))
         
-        if not precedence_pairs:
-            # precedence가 없으면 기본 방식 사용
-            return self._schedule_activities_basic(
-                activities, applicants, rooms, room_availability,
-                batched_blocks, assignments, schedule_by_applicant,
-                schedule_by_room, date_str, precedence_rules,
-                start_time, end_time, global_gap_min
-            )
+        units = []
         
-        logger.info("🚀 백트래킹 기반 precedence 쌍 스케줄링 시작")
+        if precedence_pairs:
+            logger.info("🚀 백트래킹 기반 precedence 쌍 스케줄링 시작")
         
-        # 🧠 핵심 개선: precedence 쌍을 하나의 단위로 처리
+        # 🧠 핵심 개선: precedence 쌍을 하나의 단위로 처리 (그룹마다 후보 시간 여러 개)
         for pred_name, succ_name in precedence_pairs:
-            pred_activity = next((a for a in activities if a.name == pred_name), None)
-            succ_activity = next((a for a in activities if a.name == succ_name), None)
+            pred_activity = self._compiled.activity(pred_name)
+            succ_activity = self._compiled.activity(succ_name)
             
             if not pred_activity or not succ_activity:
                 logger.error(f"precedence 쌍의 활동을 찾을 수 없음: {pred_name} → {succ_name}")
                 return False
             
             # 🎯 통합 스케줄링: 발표준비+발표면접을 함께 처리
-            success = self._schedule_precedence_pair_integrated(
-                pred_activity, succ_activity, applicants, rooms,
-                room_availability, batched_blocks, assignments,
-                schedule_by_applicant, schedule_by_room, date_str,
-                precedence_rules, start_time, end_time, global_gap_min
+            plan = self._plan_precedence_pair(
+                pred_activity, succ_activity, applicants, rooms, room_availability
             )
-            
-            if not success:
+            if plan is None:
                 logger.error(f"precedence 쌍 스케줄링 실패: {pred_name} → {succ_name}")
                 return False
-        
-        # 나머지 활동들 처리
+            
+            groups, pred_room, succ_rooms, gap_duration = plan
+            for group in groups:
+                units.append(functools.partial(
+                    self._iter_group_with_successor,
+                    group, pred_activity, succ_activity, pred_room, succ_rooms,
+                    gap_duration, room_availability, batched_blocks,
+                    assignments, schedule_by_applicant, schedule_by_room,
+                    date_str, start_time, end_time
+                ))
+        
+        # 나머지 활동들 처리 (활동 단위, 후보 1개)
         remaining_activities = [
             a for a in activities 
             if not any(a.name in [pair[0], pair[1]] for pair in precedence_pairs)
         ]
         
         for activity in remaining_activities:
-            success = self._schedule_single_activity(
-                activity, applicants, rooms, room_availability,
-                batched_blocks, assignments, schedule_by_applicant,
-                schedule_by_room, date_str, precedence_rules,
-                start_time, end_time, global_gap_min
-            )
+            units.append(functools.partial(
+                self._iter_once,
+                functools.partial(
+                    self._schedule_single_activity,
+                    activity, applicants, rooms, room_availability,
+                    batched_blocks, assignments, schedule_by_applicant,
+                    schedule_by_room, date_str, precedence_rules,
+                    start_time, end_time, global_gap_min
+                ),
+                f"단일 활동 스케줄링 실패: {activity.name}"
+            ))
+        
+        return self._search_placements(units)
+    
+    def _search_placements(self, units: List[Callable[[], Iterator[bool]]]) -> bool:
+        """
+        제한 깊이 우선 탐색
+        
+        units[i]()는 배정 후보를 하나씩 적용하며 yield 하는 iterator.
+        막히면 undo log를 해당 단위 시작 시점까지 되돌리고 다음 후보로 진행한다.
+        가장 깊이 도달한 단위에서 backtrack_window 이상 되돌아가거나
+        노드/시간 예산을 넘거나 중단 신호(stop_event)가 오면 실패 처리.
+        """
+        log = self._undo_log
+        stats = self.search_stats
+        deadline = time.time() + self.search_time_limit_sec
+        
+        stack: List[Tuple[Iterator[bool], int]] = []  # (후보 iterator, 단위 시작 mark)
+        depth = 0
+        frontier = 0
+        while depth < len(units):
+            if self._stopped():
+                logger.info("포트폴리오 중단 신호 - 탐색 종료")
+                return False
+            if depth == len(stack):
+                stack.append((units[depth](), log.mark()))
+            alternatives, mark = stack[-1]
+            stats["undone_changes"] += log.rollback(mark)
             
-            if not success:
-                logger.error(f"단일 활동 스케줄링 실패: {activity.name}")
+            if next(alternatives, False):
+                stats["nodes"] += 1
+                depth += 1
+                stats["max_depth"] = max(stats["max_depth"], depth)
+                continue
+            
+            # 후보 소진 → 직전 단위의 다음 후보로
+            stack.pop()
+            frontier = max(frontier, depth)
+            depth -= 1
+            if depth < 0 or frontier - depth > self.backtrack_window:
+                return False
+            if stats["nodes"] >= self.search_node_limit or time.time() > deadline:
+                stats["budget_exhausted"] = True
+                logger.warning(f"⏰ 백트래킹 예산 소진: {stats}")
                 return False
+            stats["backtracks"] += 1
+            logger.debug(f"↩️ 백트래킹: 단위 {depth + 1}/{len(units)} 다음 후보 시도")
         
         return True
     
-    def _schedule_precedence_pair_integrated(
+    def _iter_once(self, schedule_fn: Callable[[], bool], failure_message: str) -> Iterator[bool]:
+        """후보가 하나뿐인 배정 단위"""
+        if schedule_fn():
+            yield True
+        else:
+            logger.error(failure_message)
+    
+    def _plan_precedence_pair(
         self,
         pred_activity: Activity,  # 발표준비
         succ_activity: Activity,  # 발표면접
         applicants: List[Applicant],
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
-        batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
-        assignments: Dict[str, TimeSlot],
-        schedule_by_applicant: Dict[str, List[TimeSlot]],
-        schedule_by_room: Dict[str, List[TimeSlot]],
-        date_str: str,
-        precedence_rules: List[PrecedenceRule],
-        start_time: timedelta,
-        end_time: timedelta,
-        global_gap_min: int
-    ) -> bool:
-        """🎯 통합 precedence 쌍 스케줄링"""
+        room_availability: Dict[str, RoomAvailability]
+    ) -> Optional[Tuple[List[List[Applicant]], Room, List[Room], timedelta]]:
+        """🎯 통합 precedence 쌍 그룹 구성: (그룹 목록, 선행 방, 후속 방 목록, 간격)"""
         
         logger.info(f"🎯 통합 스케줄링: {pred_activity.name} → {succ_activity.name}")
         
@@ -271,7 +618,7 @@ class IndividualScheduler:
         ]
         
         if not target_applicants:
-            return True
+            return [], None, [], timedelta(0)
         
         # 방 찾기
         pred_rooms = self._find_available_rooms(pred_activity, rooms, room_availability)
@@ -279,13 +626,13 @@ class IndividualScheduler:
         
         if not pred_rooms or not succ_rooms:
             logger.error("사용 가능한 방이 없음")
-            return False
+            return None
         
         # gap 시간 계산
         gap_duration = timedelta(minutes=5)  # adjacent=True이므로 정확히 5분
-        for rule in precedence_rules:
-            if rule.predecessor == pred_activity.name and rule.successor == succ_activity.name:
-                gap_duration = timedelta(minutes=rule.gap_min)
+        for successor, gap_min, _ in self._compiled.successors_of(pred_activity.name):
+            if successor == succ_activity.name:
+                gap_duration = timedelta(minutes=gap_min)
                 break
         
         # 🧠 핵심: 후속 방 수에 맞춘 그룹 크기
@@ -301,22 +648,9 @@ class IndividualScheduler:
             group = target_applicants[i:i + optimal_group_size]
             groups.append(group)
         
-        # 각 그룹별로 시간 찾기 및 스케줄링
-        for group_idx, group in enumerate(groups):
-            success = self._schedule_group_with_successor(
-                group, pred_activity, succ_activity, pred_room, succ_rooms,
-                gap_duration, room_availability, batched_blocks,
-                assignments, schedule_by_applicant, schedule_by_room,
-                date_str, start_time, end_time
-            )
-            
-            if not success:
-                logger.error(f"그룹 {group_idx + 1} 스케줄링 실패")
-                return False
-        
-        return True
+        return groups, pred_room, succ_rooms, gap_duration
     
-    def _schedule_group_with_successor(
+    def _iter_group_with_successor(
         self,
         group: List[Applicant],
         pred_activity: Activity,
@@ -324,7 +658,7 @@ class IndividualScheduler:
         pred_room: Room,
         succ_rooms: List[Room],
         gap_duration: timedelta,
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -332,58 +666,55 @@ class IndividualScheduler:
         date_str: str,
         start_time: timedelta,
         end_time: timedelta
-    ) -> bool:
-        """그룹과 후속 활동을 함께 스케줄링"""
+    ) -> Iterator[bool]:
+        """그룹과 후속 활동을 함께 스케줄링 - 가능한 시간대마다 배정 후 yield (이른 순)"""
         
         # 그룹 공통 가용 시간 찾기
         common_times = self._get_group_common_free_times(
             group, batched_blocks, schedule_by_applicant, start_time, end_time
         )
         
+        # 선행 활동(Batched 포함) 종료 후 시작 가능한 시각
+        earliest = max(
+            self._earliest_start(a.id, pred_activity.name, schedule_by_applicant, start_time)
+            for a in group
+        )
+        
         # 가능한 시간대 찾기
         for common_start, common_end in common_times:
-            for room_start, room_end in room_availability[pred_room.name]:
-                # 교집합 계산
-                slot_start = max(common_start, room_start)
-                slot_end = min(common_end, room_end)
+            for slot_start in self._iter_fits(
+                room_availability[pred_room.name], pred_activity.duration,
+                max(common_start, earliest), common_end
+            ):
+                pred_end = slot_start + pred_activity.duration
+                succ_start = pred_end + gap_duration
+                successor_end = succ_start + succ_activity.duration
                 
-                if slot_end - slot_start >= pred_activity.duration:
-                    pred_end = slot_start + pred_activity.duration
-                    succ_start = pred_end + gap_duration
-                    # 후속 활동의 duration을 동적으로 찾기
-                    successor_duration = None
-                    for act in activities:
-                        if act.name == succ_activity.name:
-                            successor_duration = act.duration
-                            break
-                    
-                    if not successor_duration:
-                        logger.error(f"후속 활동 {succ_activity.name}의 duration을 찾을 수 없음")
-                        continue
-                        
-                    successor_end = succ_start + successor_duration
-                    
-                    # 후속 활동 방 확인
-                    available_succ_rooms = []
-                    for succ_room in succ_rooms[:len(group)]:  # 그룹 크기만큼만
-                        for succ_room_start, succ_room_end in room_availability[succ_room.name]:
-                            if succ_room_start <= succ_start and succ_room_end >= successor_end:
-                                available_succ_rooms.append(succ_room)
-                                break
-                    
-                    if len(available_succ_rooms) >= len(group):
-                        # 스케줄링 실행
-                        self._execute_group_schedule(
-                            group, pred_activity, succ_activity, pred_room,
-                            available_succ_rooms, slot_start, pred_end,
-                            succ_start, successor_end, assignments,
-                            schedule_by_applicant, schedule_by_room,
-                            room_availability, date_str
-                        )
-                        return True
+                # 후속 활동까지 체류시간 제한 안에 끝나야 함
+                deadline = self._stay_deadline(
+                    [a.id for a in group], slot_start, batched_blocks, schedule_by_applicant
+                )
+                if deadline is not None and successor_end > deadline:
+                    continue
+                
+                # 후속 활동 방 확인
+                available_succ_rooms = []
+                for succ_room in succ_rooms[:len(group)]:  # 그룹 크기만큼만
+                    if room_availability[succ_room.name].is_free(succ_start, successor_end):
+                        available_succ_rooms.append(succ_room)
+                
+                if len(available_succ_rooms) >= len(group):
+                    # 스케줄링 실행
+                    self._execute_group_schedule(
+                        group, pred_activity, succ_activity, pred_room,
+                        available_succ_rooms, slot_start, pred_end,
+                        succ_start, successor_end, assignments,
+                        schedule_by_applicant, schedule_by_room,
+                        room_availability, date_str
+                    )
+                    yield True
         
         logger.warning(f"그룹 스케줄링 실패: {[a.id for a in group]}")
-        return False
     
     def _execute_group_schedule(
         self,
@@ -399,7 +730,7 @@ class IndividualScheduler:
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
         schedule_by_room: Dict[str, List[TimeSlot]],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         date_str: str
     ):
         """그룹 스케줄 실행"""
@@ -427,9 +758,7 @@ class IndividualScheduler:
         schedule_by_room[pred_room.name].append(pred_slot)
         
         # 방 가용성 업데이트
-        self._update_availability(
-            room_availability[pred_room.name], pred_start_rounded, pred_end_rounded
-        )
+        room_availability[pred_room.name].reserve(pred_start_rounded, pred_end_rounded)
         
         # 5분 단위로 라운딩
         succ_start_rounded = self._round_to_5min(succ_start)
@@ -454,9 +783,7 @@ class IndividualScheduler:
                 schedule_by_room[succ_room.name].append(succ_slot)
                 
                 # 방 가용성 업데이트
-                self._update_availability(
-                    room_availability[succ_room.name], succ_start_rounded, succ_end_rounded
-                )
+                room_availability[succ_room.name].reserve(succ_start_rounded, succ_end_rounded)
                 
                 logger.info(f"✅ {applicant.id}: {pred_activity.name} {pred_start_rounded}~{pred_end_rounded} → {succ_activity.name} {succ_start_rounded}~{succ_end_rounded}")
         
@@ -467,7 +794,7 @@ class IndividualScheduler:
         activity: Activity,
         applicants: List[Applicant],
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -480,10 +807,11 @@ class IndividualScheduler:
     ) -> bool:
         """Individual 활동 스케줄링 (1명씩) - 후속 활동 예약 시스템 포함"""
         
-        # 활동 수행 지원자 필터
+        # 활동 수행 지원자 필터 (연속배치 예약으로 이미 배정된 지원자 제외)
         target_applicants = [
             a for a in applicants 
             if activity.name in a.required_activities
+            and f"{a.id}_{activity.name}" not in assignments
         ]
         
         # 직무별로 그룹화
@@ -512,58 +840,23 @@ class IndividualScheduler:
                     start_time, end_time
                 )
                 
-                # Precedence 제약에 따른 최소 시작 시간 계산
-                earliest_start = timedelta(hours=0)
-                
-                # 이미 스케줄된 활동에서 precedence 체크
-                if applicant.id in schedule_by_applicant:
-                    for prev_slot in schedule_by_applicant[applicant.id]:
-                        # precedence 규칙 확인
-                        for rule in precedence_rules:
-                            if (rule.predecessor == prev_slot.activity_name and 
-                                rule.successor == activity.name):
-                                
-                                # is_adjacent 플래그에 따른 간격 처리
-                                if rule.is_adjacent:
-                                    # 연속 배치: 정확히 지정된 간격 사용
-                                    required_gap = timedelta(minutes=rule.gap_min)
-                                else:
-                                    # 일반 선후행: max(rule.gap_min, global_gap_min) 사용
-                                    effective_gap = max(rule.gap_min, global_gap_min)
-                                    required_gap = timedelta(minutes=effective_gap)
-                                
-                                required_start = prev_slot.end_time + required_gap
-                                earliest_start = max(earliest_start, required_start)
-                                
-                                gap_type = "연속배치" if rule.is_adjacent else "일반"
-                                actual_gap = required_gap.total_seconds() / 60
-                                logger.info(
-                                    f"Precedence: {applicant.id}의 {rule.predecessor} "
-                                    f"→ {actual_gap:.0f}분 → {activity.name} ({gap_type})"
-                                )
+                # Precedence 제약에 따른 최소 시작 시간 계산 (Batched 선행 활동 포함)
+                earliest_start = self._earliest_start(
+                    applicant.id, activity.name, schedule_by_applicant, timedelta(hours=0)
+                )
                 
                 # 후속 활동 예약 시스템: precedence가 있는 경우 후속 활동 시간도 함께 고려
                 successor_reservation = None
-                for rule in precedence_rules:
-                    if rule.predecessor == activity.name and rule.is_adjacent:
-                        # 연속배치가 필요한 후속 활동이 있는 경우
-                        successor_activity = rule.successor
-                        successor_gap = timedelta(minutes=rule.gap_min)
-                        successor_duration = None
-                        
-                        # 후속 활동의 duration 찾기
-                        for act in activities:
-                            if act.name == successor_activity:
-                                successor_duration = act.duration
-                                break
-                        
-                        if successor_duration:
-                            successor_reservation = {
-                                'activity': successor_activity,
-                                'gap': successor_gap,
-                                'duration': successor_duration
-                            }
-                            logger.info(f"후속 활동 예약: {applicant.id}의 {activity.name} → {successor_activity}")
+                adjacent = self._compiled.adjacent_successor(activity.name)
+                if adjacent and adjacent[0].name in applicant.required_activities:
+                    # 연속배치가 필요한 후속 활동이 있는 경우
+                    successor_activity, successor_gap_min = adjacent
+                    successor_reservation = {
+                        'activity': successor_activity.name,
+                        'gap': timedelta(minutes=successor_gap_min),
+                        'duration': successor_activity.duration
+                    }
+                    logger.info(f"후속 활동 예약: {applicant.id}의 {activity.name} → {successor_activity.name}")
                 
                 # 방 순회하며 가능한 시간 찾기 (후속 활동 고려)
                 scheduled = False
@@ -571,111 +864,90 @@ class IndividualScheduler:
                     room = available_rooms[room_idx % len(available_rooms)]
                     room_idx += 1
                     
-                    # 방의 가용 시간과 지원자 가용 시간 교집합
-                    for room_slot in room_availability[room.name]:
-                        for app_slot in applicant_free_times:
-                            # Precedence 고려
-                            overlap_start = max(room_slot[0], app_slot[0], earliest_start)
-                            overlap_end = min(room_slot[1], app_slot[1])
+                    # 지원자 가용 시간 안에서 방의 가장 이른 빈 시간 탐색 (Precedence 고려)
+                    for app_slot in applicant_free_times:
+                        for overlap_start in self._iter_fits(
+                            room_availability[room.name], activity.duration,
+                            max(app_slot[0], earliest_start), app_slot[1]
+                        ):
+                            current_end = overlap_start + activity.duration
                             
-                            if overlap_end - overlap_start >= activity.duration:
-                                current_end = overlap_start + activity.duration
-                                
-                                # 후속 활동 예약이 있는 경우 가능한지 확인
-                                if successor_reservation:
-                                    successor_start = current_end + successor_reservation['gap']
-                                    successor_end = successor_start + successor_reservation['duration']
-                                    
-                                    # 🎯 수정: 후속 활동을 위한 방 찾기 (일반화)
-                                    successor_room_available = False
-                                    successor_room_name = None
-                                    
-                                    # 후속 활동의 room_type 찾기
-                                    successor_room_type = None
-                                    for act in activities:
-                                        if act.name == successor_reservation['activity']:
-                                            successor_room_type = act.room_type
-                                            break
-                                    
-                                    if successor_room_type:
-                                        # 모든 방에서 후속 활동 방 타입 찾기
-                                        for room in rooms:
-                                            if room.room_type == successor_room_type:
-                                                # 해당 방의 가용성 확인
-                                                if room.name in room_availability:
-                                                    for succ_room_slot in room_availability[room.name]:
-                                                        if (succ_room_slot[0] <= successor_start and 
-                                                            succ_room_slot[1] >= successor_end):
-                                                            successor_room_available = True
-                                                            successor_room_name = room.name
-                                                            break
-                                                if successor_room_available:
-                                                    break
-                                    
-                                    if not successor_room_available:
-                                        logger.debug(f"후속 활동 {successor_reservation['activity']} 시간 확보 불가: {successor_start} ~ {successor_end}")
-                                        continue  # 다른 시간대 시도
-                                    else:
-                                        # 🎯 후속 활동 즉시 예약
-                                        logger.info(f"🎉 연속배치 성공: {applicant.id} {activity.name} → {successor_reservation['activity']}")
-                                        
-                                        # 후속 활동 시간 조정
-                                        adjusted_succ_start, adjusted_succ_end = self._apply_min_gap_constraint(
-                                            successor_start, successor_end, global_gap_min
-                                        )
-                                        
-                                        # 후속 활동 스케줄 생성
-                                        successor_slot = TimeSlot(
-                                            activity_name=successor_reservation['activity'],
-                                            start_time=adjusted_succ_start,
-                                            end_time=adjusted_succ_end,
-                                            room_name=successor_room_name,
-                                            applicant_id=applicant.id
-                                        )
-                                        
-                                        # 후속 활동 저장
-                                        succ_key = f"{applicant.id}_{successor_reservation['activity']}"
-                                        assignments[succ_key] = successor_slot
-                                        schedule_by_applicant[applicant.id].append(successor_slot)
-                                        schedule_by_room[successor_room_name].append(successor_slot)
-                                        
-                                        # 후속 활동 방 가용성 업데이트
-                                        self._update_availability(
-                                            room_availability[successor_room_name],
-                                            successor_start,
-                                            successor_end
-                                        )
+                            # 후속 활동 예약이 있는 경우 가능한지 확인
+                            if successor_reservation:
+                                successor_start = current_end + successor_reservation['gap']
+                                successor_end = successor_start + successor_reservation['duration']
                                 
-                                # min_gap_min 제약 적용하여 시간 조정
-                                adjusted_start, adjusted_end = self._apply_min_gap_constraint(
-                                    overlap_start, current_end, global_gap_min
+                                # 후속 활동까지 체류시간 제한 안에 끝나야 함
+                                deadline = self._stay_deadline(
+                                    [applicant.id], overlap_start, batched_blocks, schedule_by_applicant
                                 )
+                                if deadline is not None and successor_end > deadline:
+                                    continue
                                 
-                                # 스케줄 생성
-                                time_slot = TimeSlot(
-                                    activity_name=activity.name,
-                                    start_time=adjusted_start,
-                                    end_time=adjusted_end,
-                                    room_name=room.name,
-                                    applicant_id=applicant.id
-                                )
+                                # 🎯 수정: 후속 활동을 위한 방 찾기 (일반화)
+                                successor_room_name = None
+                                for succ_room in self._rooms_for(successor_reservation['activity']):
+                                    if (succ_room.name in room_availability and
+                                            room_availability[succ_room.name].is_free(successor_start, successor_end)):
+                                        successor_room_name = succ_room.name
+                                        break
+                                
+                                if not successor_room_name:
+                                    logger.debug(f"후속 활동 {successor_reservation['activity']} 시간 확보 불가: {successor_start} ~ {successor_end}")
+                                    continue  # 다른 시간대 시도
                                 
-                                # 저장
-                                key = f"{applicant.id}_{activity.name}"
-                                assignments[key] = time_slot
-                                schedule_by_applicant[applicant.id].append(time_slot)
-                                schedule_by_room[room.name].append(time_slot)
+                                # 🎯 후속 활동 즉시 예약
+                                logger.info(f"🎉 연속배치 성공: {applicant.id} {activity.name} → {successor_reservation['activity']}")
                                 
-                                # 방 가용성 업데이트
-                                self._update_availability(
-                                    room_availability[room.name],
-                                    overlap_start, 
-                                    current_end
+                                # 후속 활동 시간 조정
+                                adjusted_succ_start, adjusted_succ_end = self._apply_min_gap_constraint(
+                                    successor_start, successor_end, global_gap_min
+                                )
+                                
+                                # 후속 활동 스케줄 생성
+                                successor_slot = TimeSlot(
+                                    activity_name=successor_reservation['activity'],
+                                    start_time=adjusted_succ_start,
+                                    end_time=adjusted_succ_end,
+                                    room_name=successor_room_name,
+                                    applicant_id=applicant.id
                                 )
                                 
-                                scheduled = True
-                                break
+                                # 후속 활동 저장
+                                succ_key = f"{applicant.id}_{successor_reservation['activity']}"
+                                assignments[succ_key] = successor_slot
+                                schedule_by_applicant[applicant.id].append(successor_slot)
+                                schedule_by_room[successor_room_name].append(successor_slot)
                                 
+                                # 후속 활동 방 가용성 업데이트
+                                room_availability[successor_room_name].reserve(successor_start, successor_end)
+                            
+                            # min_gap_min 제약 적용하여 시간 조정
+                            adjusted_start, adjusted_end = self._apply_min_gap_constraint(
+                                overlap_start, current_end, global_gap_min
+                            )
+                            
+                            # 스케줄 생성
+                            time_slot = TimeSlot(
+                                activity_name=activity.name,
+                                start_time=adjusted_start,
+                                end_time=adjusted_end,
+                                room_name=room.name,
+                                applicant_id=applicant.id
+                            )
+                            
+                            # 저장
+                            key = f"{applicant.id}_{activity.name}"
+                            assignments[key] = time_slot
+                            schedule_by_applicant[applicant.id].append(time_slot)
+                            schedule_by_room[room.name].append(time_slot)
+                            
+                            # 방 가용성 업데이트
+                            room_availability[room.name].reserve(overlap_start, current_end)
+                            
+                            scheduled = True
+                            break
+                            
                         if scheduled:
                             break
                     
@@ -693,7 +965,7 @@ class IndividualScheduler:
         activity: Activity,
         applicants: List[Applicant],
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -706,10 +978,11 @@ class IndividualScheduler:
     ) -> bool:
         """Parallel 활동 스케줄링 - 🧠 스마트 그룹핑"""
         
-        # 활동 수행 지원자 필터
+        # 활동 수행 지원자 필터 (연속배치 예약으로 이미 배정된 지원자 제외)
         target_applicants = [
             a for a in applicants 
             if activity.name in a.required_activities
+            and f"{a.id}_{activity.name}" not in assignments
         ]
         
         if not target_applicants:
@@ -729,7 +1002,7 @@ class IndividualScheduler:
         
         # 🧠 스마트 그룹핑: 후속 활동 방 수를 고려한 그룹 크기 결정
         if precedence_rules and self._has_adjacent_successor(activity.name, precedence_rules):
-            successor_room_count = self._get_successor_room_count(activity.name, precedence_rules, rooms, activities)
+            successor_room_count = self._get_successor_room_count(activity.name, precedence_rules, rooms)
             optimal_group_size = min(room.capacity, activity.max_capacity, successor_room_count)
             logger.info(f"🧠 스마트 그룹핑: 후속 방 {successor_room_count}개에 맞춰 그룹 크기 {optimal_group_size}로 조정")
         else:
@@ -762,17 +1035,14 @@ class IndividualScheduler:
     
     def _has_adjacent_successor(self, activity_name: str, precedence_rules: List[PrecedenceRule]) -> bool:
         """해당 활동에 연속배치가 필요한 후속 활동이 있는지 확인"""
-        for rule in precedence_rules:
-            if rule.predecessor == activity_name and rule.is_adjacent:
-                return True
-        return False
+        return self._compiled.adjacent_successor(activity_name) is not None
     
     def _schedule_parallel_with_successor_optimization(
         self,
         activity: Activity,
         applicant_groups: List[List[Applicant]],
         room: Room,
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -787,13 +1057,13 @@ class IndividualScheduler:
         
         # 후속 활동 정보 찾기
         successor_info = None
-        for rule in precedence_rules:
-            if rule.predecessor == activity.name and rule.is_adjacent:
-                successor_info = {
-                    'name': rule.successor,
-                    'gap': timedelta(minutes=rule.gap_min)
-                }
-                break
+        adjacent = self._compiled.adjacent_successor(activity.name)
+        if adjacent:
+            successor_info = {
+                'name': adjacent[0].name,
+                'gap': timedelta(minutes=adjacent[1]),
+                'duration': adjacent[0].duration
+            }
         
         if not successor_info:
             logger.warning("연속배치 정보를 찾을 수 없음")
@@ -812,42 +1082,36 @@ class IndividualScheduler:
                 logger.warning(f"그룹 {group_idx + 1}: 공통 가용 시간 없음")
                 return False
             
+            # 선행 활동(Batched 포함) 종료 후 시작 가능한 시각
+            earliest = max(
+                self._earliest_start(a.id, activity.name, schedule_by_applicant, start_time)
+                for a in group
+            )
+            
             # 연속 시간 확보 시도
             scheduled = False
-            for room_slot in room_availability[room.name]:
-                for common_slot in group_free_times:
+            for common_slot in group_free_times:
+                for current_start in self._iter_fits(
+                    room_availability[room.name], activity.duration,
+                    max(common_slot[0], earliest), common_slot[1]
+                ):
                     # 현재 활동 시간 계산
-                    current_start = max(room_slot[0], common_slot[0])
                     current_end = current_start + activity.duration
                     
-                    if current_end > min(room_slot[1], common_slot[1]):
-                        continue  # 시간 부족
-                    
                     # 후속 활동 시간 계산
                     successor_start = current_end + successor_info['gap']
-                    # 후속 활동의 duration을 동적으로 찾기
-                    successor_duration = None
-                    for act in activities:
-                        if act.name == successor_info['name']:
-                            successor_duration = act.duration
-                            break
+                    successor_end = successor_start + successor_info['duration']
                     
-                    if not successor_duration:
-                        logger.error(f"후속 활동 {successor_info['name']}의 duration을 찾을 수 없음")
+                    # 후속 활동까지 체류시간 제한 안에 끝나야 함
+                    deadline = self._stay_deadline(
+                        [a.id for a in group], current_start, batched_blocks, schedule_by_applicant
+                    )
+                    if deadline is not None and successor_end > deadline:
                         continue
-                        
-                    successor_end = successor_start + successor_duration
                     
                     # 후속 활동을 위한 방 확보 가능한지 확인
-                    # 후속 활동의 room_type 찾기
-                    successor_room_type = None
-                    for act in activities:
-                        if act.name == successor_info['name']:
-                            successor_room_type = act.room_type
-                            break
-                    
                     successor_rooms_available = self._check_successor_rooms_availability(
-                        group, successor_start, successor_end, room_availability, successor_room_type
+                        group, successor_start, successor_end, room_availability, successor_info['name']
                     )
                     
                     if len(successor_rooms_available) >= len(group):
@@ -868,9 +1132,9 @@ class IndividualScheduler:
                         )
                         
                         # 방 가용성 업데이트
-                        self._update_availability(room_availability[room.name], current_start, current_end)
-                        for i, succ_room_name in enumerate(successor_rooms_available[:len(group)]):
-                            self._update_availability(room_availability[succ_room_name], successor_start, successor_end)
+                        room_availability[room.name].reserve(current_start, current_end)
+                        for succ_room_name in successor_rooms_available[:len(group)]:
+                            room_availability[succ_room_name].reserve(successor_start, successor_end)
                         
                         scheduled = True
                         break
@@ -890,21 +1154,19 @@ class IndividualScheduler:
         group: List[Applicant],
         start_time: timedelta,
         end_time: timedelta,
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
-        successor_room_type: str = None
+        room_availability: Dict[str, RoomAvailability],
+        successor_name: str = None
     ) -> List[str]:
         """후속 활동을 위한 방 가용성 확인"""
         available_rooms = []
         
-        for room_name, slots in room_availability.items():
-            # 후속 활동 방 타입이 지정된 경우 해당 타입만 확인
-            if successor_room_type and successor_room_type not in room_name:
+        for room_name, availability in room_availability.items():
+            # 후속 활동이 지정된 경우 배정 가능한 방만 확인
+            if successor_name and not self._compiled.can_use_room(successor_name, room_name):
                 continue
                 
-            for slot in slots:
-                if slot[0] <= start_time and slot[1] >= end_time:
-                    available_rooms.append(room_name)
-                    break
+            if availability.is_free(start_time, end_time):
+                available_rooms.append(room_name)
         
         return available_rooms
     
@@ -1004,7 +1266,7 @@ class IndividualScheduler:
         activity: Activity,
         applicant_groups: List[List[Applicant]],
         room: Room,
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -1028,37 +1290,35 @@ class IndividualScheduler:
                 logger.warning(f"그룹 {group_idx + 1}: 공통 가용 시간 없음")
                 return False
             
+            # 선행 활동(Batched 포함) 종료 후 시작 가능한 시각
+            precedence_earliest = max(
+                self._earliest_start(a.id, activity.name, schedule_by_applicant, start_time)
+                for a in group
+            )
+            
             # 방과 시간 교집합 찾기
             scheduled = False
-            for room_slot in room_availability[room.name]:
-                for common_slot in group_free_times:
-                    slot_start = max(room_slot[0], common_slot[0])
-                    slot_end = min(room_slot[1], common_slot[1])
+            for common_slot in group_free_times:
+                # 연속 배치를 위해 이전 그룹 종료 시간 고려
+                earliest = max(common_slot[0], precedence_earliest)
+                if current_time_cursor:
+                    earliest = max(earliest, current_time_cursor)
+                
+                slot_start = room_availability[room.name].earliest_fit(
+                    activity.duration, earliest, common_slot[1]
+                )
+                if slot_start is not None:
+                    # 스케줄 생성
+                    self._create_parallel_schedule(
+                        activity, group, room, slot_start, slot_start + activity.duration,
+                        assignments, schedule_by_applicant, schedule_by_room, date_str, 5
+                    )
                     
-                    if slot_end - slot_start >= activity.duration:
-                        # 연속 배치를 위해 이전 그룹 종료 시간 고려
-                        if current_time_cursor:
-                            slot_start = max(slot_start, current_time_cursor)
-                        
-                        if slot_start + activity.duration <= slot_end:
-                            # 스케줄 생성
-                            self._create_parallel_schedule(
-                                activity, group, room, slot_start, slot_start + activity.duration,
-                                assignments, schedule_by_applicant, schedule_by_room, date_str, 5
-                            )
-                            
-                            # 방 가용성 업데이트
-                            self._update_availability(
-                                room_availability[room.name], 
-                                slot_start, 
-                                slot_start + activity.duration
-                            )
-                            
-                            current_time_cursor = slot_start + activity.duration
-                            scheduled = True
-                            break
-                            
-                if scheduled:
+                    # 방 가용성 업데이트
+                    room_availability[room.name].reserve(slot_start, slot_start + activity.duration)
+                    
+                    current_time_cursor = slot_start + activity.duration
+                    scheduled = True
                     break
             
             if not scheduled:
@@ -1075,65 +1335,359 @@ class IndividualScheduler:
         batched_results: List[GroupScheduleResult],
         start_time: timedelta,
         end_time: timedelta,
-        date_str: str
+        date_str: str,
+        precedence_rules: List[PrecedenceRule] = None,
+        global_gap_min: int = 5,
+        hint: Optional[IndividualScheduleResult] = None,
+        time_limit_sec: float = 30.0
     ) -> Optional[IndividualScheduleResult]:
-        """CP-SAT 방식 Individual 스케줄링"""
-        
+        """
+        CP-SAT 방식 Individual 스케줄링 (휴리스틱 실패시 fallback)
+        
+        - 시간 단위: 운영 시작 기준 분(minute), 시작 시각은 5분 그리드
+        - 방별 Cumulative: individual/batched는 방 독점, parallel은 지원자당 수요 1로
+          min(방 용량, max_capacity)까지 동시 사용
+        - 지원자별 NoOverlap: Level 2 batched 블록은 상수 interval로 고정
+        - Precedence: is_adjacent면 정확히 gap_min, 아니면 max(gap_min, global_gap_min) 이상
+        - hint: 휴리스틱의 부분 배정을 solution hint로 사용
+        - 목적함수: 지원자별 체류시간(첫 활동 시작 ~ 마지막 활동 종료) 합 최소화
+        - 최대 체류시간(self.max_stay)이 있으면 지원자별 체류시간 ≤ 제한
+        - 이미 배정된 방 시간대(self.reserved_rooms)는 Level 2 점유와 같이 상수로 고정
+        """
+        precedence_rules = precedence_rules or []
+        compiled = self._ensure_compiled(activities, rooms, precedence_rules, global_gap_min, applicants)
         model = cp_model.CpModel()
         
-        # 시간 범위를 분 단위로 변환 (5분 단위로 라운딩)
-        horizon_minutes = (end_time - start_time).total_seconds() / 60
-        horizon = int(round(horizon_minutes / 5) * 5)
+        slot = self.time_slot_minutes
+        horizon = int((end_time - start_time).total_seconds() // 60)
+        
+        def to_minutes(td: timedelta) -> int:
+            return int((td - start_time).total_seconds() // 60)
+        
+        activity_map = {a.name: a for a in activities}
+        room_names = {r.name for r in rooms}
+        eligible_rooms = {
+            a.name: [r for r in compiled.rooms_for(a.name) if r.name in room_names]
+            for a in activities
+        }
+        
+        # Level 2 결과: 지원자별 batched 활동 시간(상수), 방별 점유 시간(상수)
+        fixed_times = {}  # (applicant_id, activity_name) -> (start_min, end_min)
+        fixed_room_blocks = defaultdict(list)  # room_name -> [(start_min, end_min)]
+        for result in batched_results:
+            for applicant_id, slots in result.schedule_by_applicant.items():
+                for ts in slots:
+                    fixed_times[(applicant_id, ts.activity_name)] = (
+                        to_minutes(ts.start_time), to_minutes(ts.end_time)
+                    )
+            for room_name, slots in result.schedule_by_room.items():
+                for ts in slots:
+                    fixed_room_blocks[room_name].append(
+                        (to_minutes(ts.start_time), to_minutes(ts.end_time))
+                    )
+        for room_name, blocks in self.reserved_rooms.items():
+            fixed_room_blocks[room_name].extend((to_minutes(s), to_minutes(e)) for s, e in blocks)
         
         # 변수 생성
-        intervals = {}
-        presences = {}
-        room_assignments = {}
+        starts = {}            # (applicant_id, activity_name) -> start expr
+        ends = {}              # (applicant_id, activity_name) -> end expr
+        slot_vars = {}         # (applicant_id, activity_name) -> 5분 슬롯 인덱스 변수
+        max_slots = {}         # (applicant_id, activity_name) -> 슬롯 인덱스 상한
+        room_assignments = {}  # (applicant_id, activity_name, room_name) -> BoolVar
+        room_intervals = defaultdict(list)       # room_name -> [(interval, demand)]
+        parallel_intervals = defaultdict(list)   # (room_name, activity_name) -> [interval] (parallel 활동)
+        applicant_intervals = defaultdict(list)  # applicant_id -> [interval]
         
-        # Individual 활동별 interval 변수
         for applicant in applicants:
             for activity in activities:
                 if activity.name not in applicant.required_activities:
                     continue
-                    
+                
+                candidates = eligible_rooms[activity.name]
+                if not candidates:
+                    logger.error(f"CP-SAT: 활동 {activity.name}에 사용 가능한 방이 없음")
+                    return None
+                
+                duration_min = activity.duration_min
+                max_slot = (horizon - duration_min) // slot
+                if max_slot < 0:
+                    logger.error(f"CP-SAT: 활동 {activity.name}이 운영시간보다 김")
+                    return None
+                
                 suffix = f"{applicant.id}_{activity.name}"
-                duration_min = int(activity.duration.total_seconds() / 60)
+                key = (applicant.id, activity.name)
                 
-                start_var = model.NewIntVar(0, horizon - duration_min, f'start_{suffix}')
-                end_var = model.NewIntVar(duration_min, horizon, f'end_{suffix}')
-                presence_var = model.NewBoolVar(f'presence_{suffix}')
+                slot_var = model.NewIntVar(0, max_slot, f'slot_{suffix}')
+                start_expr = slot_var * slot
+                slot_vars[key] = slot_var
+                max_slots[key] = max_slot
+                starts[key] = start_expr
+                ends[key] = start_expr + duration_min
                 
-                interval_var = model.NewOptionalIntervalVar(
-                    start_var, duration_min, end_var, presence_var, f'interval_{suffix}'
+                # 지원자 본인 기준 interval (항상 존재)
+                applicant_intervals[applicant.id].append(
+                    model.NewFixedSizeIntervalVar(start_expr, duration_min, f'interval_{suffix}')
                 )
                 
-                intervals[(applicant.id, activity.name)] = interval_var
-                presences[(applicant.id, activity.name)] = presence_var
-                
-                # 방 배정 변수
-                for room in rooms:
-                    if any(rt in room.room_type for rt in activity.required_rooms):
-                        room_var = model.NewBoolVar(f'room_{suffix}_{room.name}')
-                        room_assignments[(applicant.id, activity.name, room.name)] = room_var
-                        
-        # 제약 조건들...
-        # (CP-SAT 구현이 복잡하므로 핵심 부분만 표시)
+                # 방 선택 (정확히 하나)
+                choices = []
+                for room in candidates:
+                    room_var = model.NewBoolVar(f'room_{suffix}_{room.name}')
+                    room_assignments[(applicant.id, activity.name, room.name)] = room_var
+                    choices.append(room_var)
+                    
+                    room_interval = model.NewOptionalFixedSizeIntervalVar(
+                        start_expr, duration_min, room_var, f'room_interval_{suffix}_{room.name}'
+                    )
+                    if activity.mode == ActivityMode.PARALLEL:
+                        # 지원자 1명 = 수요 1, 동시 인원은 활동별 상한 min(방 용량, max_capacity)
+                        room_intervals[room.name].append((room_interval, 1))
+                        parallel_intervals[(room.name, activity.name)].append(room_interval)
+                    else:
+                        room_intervals[room.name].append((room_interval, room.capacity))
+                model.AddExactlyOne(choices)
+            
+            # Batched 블록을 상수 interval로 고정
+            for (applicant_id, activity_name), (fs, fe) in fixed_times.items():
+                if applicant_id != applicant.id or fe <= fs:
+                    continue
+                applicant_intervals[applicant.id].append(
+                    model.NewFixedSizeIntervalVar(fs, fe - fs, f'fixed_{applicant.id}_{activity_name}')
+                )
+        
+        if not starts:
+            return IndividualScheduleResult(
+                assignments={},
+                schedule_by_applicant={},
+                schedule_by_room={},
+                success=True
+            )
+        
+        # 방별 Cumulative 제약 (batched 점유 시간은 방 전체 용량으로 고정)
+        for room in rooms:
+            entries = room_intervals.get(room.name, [])
+            if not entries:
+                continue
+            intervals = [interval for interval, _ in entries]
+            demands = [demand for _, demand in entries]
+            for idx, (fs, fe) in enumerate(fixed_room_blocks.get(room.name, [])):
+                if fe > fs:
+                    intervals.append(
+                        model.NewFixedSizeIntervalVar(fs, fe - fs, f'fixed_room_{room.name}_{idx}')
+                    )
+                    demands.append(room.capacity)
+            model.AddCumulative(intervals, demands, room.capacity)
+        
+        # parallel 활동별 동시 인원 상한 (방 용량보다 작은 max_capacity)
+        for (room_name, activity_name), intervals in parallel_intervals.items():
+            room = compiled.room(room_name)
+            limit = max(1, min(room.capacity, activity_map[activity_name].max_capacity))
+            if limit < room.capacity:
+                model.AddCumulative(intervals, [1] * len(intervals), limit)
+        
+        # 지원자별 NoOverlap 제약
+        for applicant_id, intervals in applicant_intervals.items():
+            if len(intervals) > 1:
+                model.AddNoOverlap(intervals)
+        
+        # Precedence 제약 (Level 3 변수 또는 Level 2 상수, 유효 간격은 컴파일 단계에서 계산됨)
+        for applicant in applicants:
+            for successor in applicant.required_activities:
+                for predecessor, gap, is_adjacent in compiled.predecessors_of(successor):
+                    pred_key = (applicant.id, predecessor)
+                    succ_key = (applicant.id, successor)
+                    if pred_key not in starts and succ_key not in starts:
+                        continue  # 두 활동 모두 Level 2에서 이미 고정됨
+                    
+                    pred_end = ends.get(pred_key)
+                    if pred_end is None and pred_key in fixed_times:
+                        pred_end = fixed_times[pred_key][1]
+                    succ_start = starts.get(succ_key)
+                    if succ_start is None and succ_key in fixed_times:
+                        succ_start = fixed_times[succ_key][0]
+                    if pred_end is None or succ_start is None:
+                        continue
+                    
+                    if is_adjacent:
+                        model.Add(succ_start == pred_end + gap)
+                    else:
+                        model.Add(succ_start >= pred_end + gap)
+        
+        # 목적함수: 지원자별 체류시간 합 최소화
+        stay_terms = []
+        for applicant in applicants:
+            applicant_starts = [
+                starts[(applicant.id, a.name)] for a in activities if (applicant.id, a.name) in starts
+            ]
+            if not applicant_starts:
+                continue
+            applicant_ends = [ends[(applicant.id, a.name)] for a in activities if (applicant.id, a.name) in ends]
+            for (applicant_id, _), (fs, fe) in fixed_times.items():
+                if applicant_id == applicant.id:
+                    applicant_starts.append(fs)
+                    applicant_ends.append(fe)
+            
+            first_start = model.NewIntVar(0, horizon, f'first_{applicant.id}')
+            last_end = model.NewIntVar(0, horizon, f'last_{applicant.id}')
+            model.AddMinEquality(first_start, applicant_starts)
+            model.AddMaxEquality(last_end, applicant_ends)
+            # 하한: 체류시간은 본인 활동 시간 합 이상 (탐색 가지치기용)
+            busy_min = sum(
+                activity_map[a].duration_min for (aid, a) in starts if aid == applicant.id
+            ) + sum(fe - fs for (aid, _), (fs, fe) in fixed_times.items() if aid == applicant.id)
+            model.Add(last_end - first_start >= busy_min)
+            if self.max_stay:
+                model.Add(last_end - first_start <= int(self.max_stay.total_seconds() // 60))
+            stay_terms.append(last_end - first_start)
+        model.Minimize(sum(stay_terms))
+        
+        # 휴리스틱 부분 배정을 hint로 사용
+        hinted = 0
+        if hint:
+            for applicant_id, slots in hint.schedule_by_applicant.items():
+                for ts in slots:
+                    key = (applicant_id, ts.activity_name)
+                    if key not in slot_vars:
+                        continue
+                    slot_value = round(to_minutes(ts.start_time) / slot)
+                    if 0 <= slot_value <= max_slots[key]:
+                        model.AddHint(slot_vars[key], slot_value)
+                        hinted += 1
+                    for room in eligible_rooms[ts.activity_name]:
+                        model.AddHint(
+                            room_assignments[(applicant_id, ts.activity_name, room.name)],
+                            1 if room.name == ts.room_name else 0
+                        )
+        logger.info(
+            f"CP-SAT 모델: {len(starts)}개 활동 배정, hint {hinted}개, 제한시간 {time_limit_sec:.1f}초"
+        )
         
         # Solver 실행
         solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = 30.0  # Level 3는 30초
-        status = solver.Solve(model)
+        solver.parameters.max_time_in_seconds = float(time_limit_sec)
+        solver.parameters.relative_gap_limit = 0.01
+        
+        # 해를 찾은 뒤 일정 시간 개선이 없으면 탐색 종료 (하한이 약해 최적 증명이 오래 걸림)
+        stall_sec = max(2.0, time_limit_sec * 0.1)
+        callback = _CpsatStallCallback()
+        finished = threading.Event()
+        
+        def watchdog():
+            while not finished.wait(0.2):
+                if callback.solution_count and time.time() - callback.last_improvement > stall_sec:
+                    solver.StopSearch()
+                    return
+                    
+        watcher = threading.Thread(target=watchdog, daemon=True)
+        watcher.start()
+        try:
+            status = solver.Solve(model, callback)
+        finally:
+            finished.set()
+            watcher.join()
+        
+        logger.info(
+            f"CP-SAT 결과: {solver.StatusName(status)} ({solver.WallTime():.2f}초, 해 {callback.solution_count}개)"
+        )
         
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             # 결과 추출
             return self._extract_cpsat_results(
-                solver, intervals, presences, room_assignments,
-                applicants, activities, rooms, date_str
+                solver, slot_vars, room_assignments,
+                applicants, activity_map, eligible_rooms, start_time
             )
             
         return None
         
     # Helper 메서드들
+    def _ensure_compiled(
+        self,
+        activities: List[Activity],
+        rooms: List[Room],
+        precedence_rules: List[PrecedenceRule],
+        global_gap_min: int,
+        applicants: List[Applicant] = ()
+    ) -> CompiledDateConfig:
+        """활동/방을 모두 포함하는 컴파일된 설정 보장"""
+        compiled = self._compiled
+        if (compiled is None
+                or compiled.global_gap_min != global_gap_min
+                or any(a.name not in compiled.activity_ids for a in activities)
+                or any(r.name not in compiled.room_ids for r in rooms)):
+            compiled = CompiledDateConfig.build(
+                activities, rooms, precedence_rules, global_gap_min, applicants
+            )
+            self._compiled = compiled
+        return compiled
+        
+    def _extract_batched_times(
+        self,
+        batched_results: List[GroupScheduleResult]
+    ) -> Dict[Tuple[str, str], Tuple[timedelta, timedelta]]:
+        """(지원자, Batched 활동)별 시작/종료 시간"""
+        times = {}
+        for result in batched_results:
+            for applicant_id, slots in result.schedule_by_applicant.items():
+                for slot in slots:
+                    times[(applicant_id, slot.activity_name)] = (slot.start_time, slot.end_time)
+        return times
+        
+    def _earliest_start(
+        self,
+        applicant_id: str,
+        activity_name: str,
+        schedule_by_applicant: Dict[str, List[TimeSlot]],
+        default: timedelta
+    ) -> timedelta:
+        """선행 활동(Level 2 Batched 포함) 종료 + 유효 간격 이후의 최소 시작 시간"""
+        predecessors = self._compiled.predecessors_of(activity_name)
+        if not predecessors:
+            return default
+        
+        pred_ends = {
+            slot.activity_name: slot.end_time
+            for slot in schedule_by_applicant.get(applicant_id, [])
+        }
+        earliest = default
+        for predecessor, gap, _ in predecessors:
+            pred_end = pred_ends.get(predecessor)
+            if pred_end is None and (applicant_id, predecessor) in self._batched_times:
+                pred_end = self._batched_times[(applicant_id, predecessor)][1]
+            if pred_end is not None:
+                earliest = max(earliest, pred_end + timedelta(minutes=gap))
+        return earliest
+        
+    def _find_precedence_violations(
+        self,
+        result: IndividualScheduleResult
+    ) -> List[str]:
+        """휴리스틱 결과의 선후행/지원자 중복 위반 목록 (Batched 시간 포함)"""
+        violations = []
+        batched_by_applicant = defaultdict(dict)
+        for (applicant_id, activity_name), span in self._batched_times.items():
+            batched_by_applicant[applicant_id][activity_name] = span
+            
+        for applicant_id, slots in result.schedule_by_applicant.items():
+            times = dict(batched_by_applicant.get(applicant_id, {}))
+            for slot in slots:
+                times[slot.activity_name] = (slot.start_time, slot.end_time)
+            
+            ordered = sorted(times.values())
+            for (_, prev_end), (next_start, _) in zip(ordered, ordered[1:]):
+                if next_start < prev_end:
+                    violations.append(f"{applicant_id}: 시간 중복")
+                    break
+            
+            for successor, (succ_start, _) in times.items():
+                for predecessor, gap, is_adjacent in self._compiled.predecessors_of(successor):
+                    if predecessor not in times:
+                        continue
+                    actual = succ_start - times[predecessor][1]
+                    required = timedelta(minutes=gap)
+                    if actual < required or (is_adjacent and actual != required):
+                        violations.append(f"{applicant_id}: {predecessor}→{successor}")
+        return violations
+        
     def _extract_batched_blocks(
         self, 
         batched_results: List[GroupScheduleResult]
@@ -1159,22 +1713,55 @@ class IndividualScheduler:
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         start_time: timedelta,
         end_time: timedelta
-    ) -> Dict[str, List[Tuple[timedelta, timedelta]]]:
+    ) -> Dict[str, RoomAvailability]:
         """방별 사용 가능 시간대 계산"""
         availability = {}
         
         for room in rooms:
             # 초기값: 전체 운영 시간
-            available = [(start_time, end_time)]
+            available = RoomAvailability(start_time, end_time)
             
             # Batched 활동이 사용하는 시간 제외
             # 현재는 Batched 결과에서 방 사용 정보를 추출하지 않음
             # 필요시 GroupScheduleResult의 schedule_by_room을 활용
             
+            # 이미 배정된 시간 제외 (일부 지원자 재배치)
+            for reserved_start, reserved_end in self.reserved_rooms.get(room.name, []):
+                available.reserve(reserved_start, reserved_end)
+            
             availability[room.name] = available
             
         return availability
         
+    def _build_timelines(
+        self,
+        applicants: List[Applicant],
+        batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
+        start_time: timedelta,
+        end_time: timedelta,
+        log: Optional[UndoLog] = None
+    ) -> ApplicantTimelines:
+        """지원자별 비트맵 생성 - Batched 블록 표시 후 기준선 고정"""
+        timelines = ApplicantTimelines(
+            [a.id for a in applicants], start_time, end_time, self.time_slot_minutes, self.max_stay, log
+        )
+        for applicant_id, blocks in batched_blocks.items():
+            for block_start, block_end in blocks:
+                timelines.mark_busy(applicant_id, block_start, block_end)
+        timelines.freeze_base()
+        return timelines
+        
+    def _timelines_for(
+        self,
+        start_time: timedelta,
+        end_time: timedelta
+    ) -> Optional[ApplicantTimelines]:
+        """같은 운영시간으로 만든 비트맵이 있으면 반환"""
+        timelines = self._timelines
+        if timelines and timelines.start_time == start_time and timelines.end_time == end_time:
+            return timelines
+        return None
+        
     def _get_applicant_free_times(
         self,
         applicant: Applicant,
@@ -1190,6 +1777,12 @@ class IndividualScheduler:
         if end_time is None:
             end_time = timedelta(hours=18)
         
+        # 비트맵이 있으면 새 배정만 증분 반영 후 조회
+        timelines = self._timelines_for(start_time, end_time)
+        if timelines is not None:
+            timelines.sync(applicant.id, schedule_by_applicant.get(applicant.id, []))
+            return timelines.free_intervals(applicant.id)
+        
         # Batched 활동 시간
         busy_times = batched_blocks.get(applicant.id, []).copy()
         
@@ -1204,13 +1797,18 @@ class IndividualScheduler:
             
         busy_times = self._merge_time_blocks(busy_times)
         
+        # 체류시간 제한: [마지막 활동 종료 - 제한, 첫 활동 시작 + 제한] 안에서만 배정
+        if self.max_stay:
+            start_time = max(start_time, busy_times[-1][1] - self.max_stay)
+            end_time = min(end_time, busy_times[0][0] + self.max_stay)
+        
         # 바쁜 시간의 역을 계산
         free_times = []
         current_start = start_time
         
         for busy_start, busy_end in busy_times:
-            if current_start < busy_start:
-                free_times.append((current_start, busy_start))
+            if current_start < min(busy_start, end_time):
+                free_times.append((current_start, min(busy_start, end_time)))
             current_start = max(current_start, busy_end)
             
         if current_start < end_time:
@@ -1218,6 +1816,24 @@ class IndividualScheduler:
         
         return free_times
         
+    def _stay_deadline(
+        self,
+        applicant_ids: List[str],
+        block_start: timedelta,
+        batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
+        schedule_by_applicant: Dict[str, List[TimeSlot]]
+    ) -> Optional[timedelta]:
+        """block_start에 시작하는 연속 배치(활동 + 후속 활동)가 끝나야 하는 시각 - 체류시간 제한 없으면 None"""
+        if not self.max_stay:
+            return None
+        first = block_start
+        for applicant_id in applicant_ids:
+            for busy_start, _ in batched_blocks.get(applicant_id, []):
+                first = min(first, busy_start)
+            for slot in schedule_by_applicant.get(applicant_id, []):
+                first = min(first, slot.start_time)
+        return first + self.max_stay
+        
     def _merge_time_blocks(
         self, 
         blocks: List[Tuple[timedelta, timedelta]]
@@ -1241,20 +1857,41 @@ class IndividualScheduler:
                 
         return merged
         
+    def _rooms_for(self, activity_name: str) -> List[Room]:
+        """활동에 배정 가능한 방 (변형의 room_offset만큼 회전)"""
+        eligible = self._compiled.rooms_for(activity_name)
+        if self.variant.room_offset and eligible:
+            offset = self.variant.room_offset % len(eligible)
+            eligible = eligible[offset:] + eligible[:offset]
+        return eligible
+        
+    def _order_applicants(self, applicants: List[Applicant]) -> List[Applicant]:
+        """변형별 지원자 처리 순서 (default는 입력 순서 유지)"""
+        order = self.variant.applicant_order
+        if order == "constrained":
+            # 가용 시간이 적고 해야 할 활동이 많은 지원자부터
+            def free_minutes(applicant: Applicant) -> float:
+                intervals = self._timelines.free_intervals(applicant.id) if self._timelines else []
+                return sum((e - s).total_seconds() for s, e in intervals) / 60
+            return sorted(applicants, key=lambda a: (free_minutes(a), -len(a.required_activities)))
+        if order == "job":
+            return sorted(applicants, key=lambda a: a.job_code)
+        if order == "random":
+            shuffled = list(applicants)
+            random.Random(self.variant.seed).shuffle(shuffled)
+            return shuffled
+        return applicants
+        
     def _find_available_rooms(
         self,
         activity: Activity,
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]]
+        room_availability: Dict[str, RoomAvailability]
     ) -> List[Room]:
         """활동에 사용 가능한 방 찾기"""
         available = []
         
-        for room in rooms:
-            # 방 타입 확인
-            if not any(rt in room.room_type for rt in activity.required_rooms):
-                continue
-                
+        for room in self._rooms_for(activity.name):
             # 최소 하나의 시간대가 있는지 확인
             if room_availability.get(room.name):
                 available.append(room)
@@ -1265,17 +1902,13 @@ class IndividualScheduler:
         self,
         activity: Activity,
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         required_capacity: int
     ) -> List[Room]:
         """충분한 capacity를 가진 사용 가능한 방 찾기"""
         available = []
         
-        for room in rooms:
-            # 방 타입 확인
-            if not any(rt in room.room_type for rt in activity.required_rooms):
-                continue
-                
+        for room in self._rooms_for(activity.name):
             # Capacity 확인
             if room.capacity < required_capacity:
                 continue
@@ -1286,81 +1919,61 @@ class IndividualScheduler:
                 
         return available
         
-    def _update_availability(
+    def _iter_fits(
         self,
-        availability: List[Tuple[timedelta, timedelta]],
-        start: timedelta,
-        end: timedelta
-    ) -> None:
-        """가용 시간대에서 사용된 시간 제거"""
-        new_availability = []
-        
-        for slot_start, slot_end in availability:
-            if end <= slot_start or start >= slot_end:
-                # 겹치지 않음
-                new_availability.append((slot_start, slot_end))
-            elif start <= slot_start and end >= slot_end:
-                # 완전히 포함됨 - 제거
-                pass
-            elif start > slot_start and end < slot_end:
-                # 중간 부분 - 분할
-                new_availability.append((slot_start, start))
-                new_availability.append((end, slot_end))
-            elif start > slot_start:
-                # 끝부분 겹침
-                new_availability.append((slot_start, start))
-            else:
-                # 앞부분 겹침
-                new_availability.append((end, slot_end))
-                
-        availability[:] = new_availability
-        
+        availability: RoomAvailability,
+        duration: timedelta,
+        earliest: timedelta,
+        latest: timedelta
+    ):
+        """[earliest, latest) 안에서 배치 가능한 시작 시각을 이른 순서로 나열 (5분 간격)"""
+        step = timedelta(minutes=self.time_slot_minutes)
+        candidate = availability.earliest_fit(duration, earliest, latest)
+        while candidate is not None:
+            yield candidate
+            candidate = availability.earliest_fit(duration, candidate + step, latest)
+            
     def _extract_cpsat_results(
         self,
         solver,
-        intervals,
-        presences,
+        slot_vars,
         room_assignments,
         applicants: List[Applicant],
-        activities: List[Activity],
-        rooms: List[Room],
-        date_str: str
+        activity_map: Dict[str, Activity],
+        eligible_rooms: Dict[str, List[Room]],
+        start_time: timedelta
     ) -> IndividualScheduleResult:
         """CP-SAT 결과 추출"""
         assignments = {}
         schedule_by_applicant = defaultdict(list)
         schedule_by_room = defaultdict(list)
         
-        for (applicant_id, activity_name), interval in intervals.items():
-            if solver.Value(presences[(applicant_id, activity_name)]):
-                start_min = solver.Value(interval.StartExpr())
-                end_min = solver.Value(interval.EndExpr())
-                
-                # 방 찾기
-                assigned_room = None
-                for room in rooms:
-                    key = (applicant_id, activity_name, room.name)
-                    if key in room_assignments and solver.Value(room_assignments[key]):
-                        assigned_room = room.name
-                        break
-                        
-                if assigned_room:
-                    # 5분 단위로 라운딩
-                    start_time = self._round_to_5min(timedelta(minutes=start_min))
-                    end_time = self._round_to_5min(timedelta(minutes=end_min))
-                    
-                    time_slot = TimeSlot(
-                        activity_name=activity_name,
-                        start_time=start_time,
-                        end_time=end_time,
-                        room_name=assigned_room,
-                        applicant_id=applicant_id
-                    )
+        for (applicant_id, activity_name), slot_var in slot_vars.items():
+            activity = activity_map[activity_name]
+            slot_start = start_time + timedelta(
+                minutes=solver.Value(slot_var) * self.time_slot_minutes
+            )
+            
+            # 방 찾기
+            assigned_room = None
+            for room in eligible_rooms[activity_name]:
+                if solver.Value(room_assignments[(applicant_id, activity_name, room.name)]):
+                    assigned_room = room.name
+                    break
                     
-                    key = f"{applicant_id}_{activity_name}"
-                    assignments[key] = time_slot
-                    schedule_by_applicant[applicant_id].append(time_slot)
-                    schedule_by_room[assigned_room].append(time_slot)
+            if assigned_room:
+                time_slot = TimeSlot(
+                    activity_name=activity_name,
+                    start_time=slot_start,
+                    end_time=slot_start + activity.duration,
+                    room_name=assigned_room,
+                    applicant_id=applicant_id
+                )
+                
+                key = f"{applicant_id}_{activity_name}"
+                assignments[key] = time_slot
+                schedule_by_applicant[applicant_id].append(time_slot)
+                schedule_by_room[assigned_room].append(time_slot)
                     
         return IndividualScheduleResult(
             assignments=dict(assignments),
@@ -1407,6 +2020,15 @@ class IndividualScheduler:
                 ordered_names.append(name)
                 processed.add(name)
         
+        # 포트폴리오 변형: 체인 내부 순서는 유지하고 체인/나머지 활동의 처리 순서만 섞음
+        if self.variant.shuffle_activities:
+            rng = random.Random(self.variant.seed)
+            units = [list(chain) for chain in precedence_chains]
+            chained = {name for unit in units for name in unit}
+            units.extend([name] for name in ordered_names if name not in chained)
+            rng.shuffle(units)
+            ordered_names = [name for unit in units for name in unit]
+        
         logger.info(f"최적화된 활동 순서: {ordered_names}")
         if precedence_chains:
             logger.info(f"Precedence 체인: {precedence_chains}")
@@ -1478,6 +2100,13 @@ class IndividualScheduler:
         end_time: timedelta
     ) -> List[Tuple[timedelta, timedelta]]:
         """그룹 내 모든 지원자의 공통 가용 시간 계산"""
+        # 비트맵이 있으면 행 단위 OR 연산으로 한 번에 계산
+        timelines = self._timelines_for(start_time, end_time)
+        if timelines is not None:
+            for applicant in group:
+                timelines.sync(applicant.id, schedule_by_applicant.get(applicant.id, []))
+            return timelines.common_free_intervals([a.id for a in group])
+        
         common_free_times = None
         
         for applicant in group:
@@ -1502,40 +2131,12 @@ class IndividualScheduler:
         
         return common_free_times or []
     
-    def _schedule_activities_basic(
-        self,
-        activities: List[Activity],
-        applicants: List[Applicant],
-        rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
-        batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
-        assignments: Dict[str, TimeSlot],
-        schedule_by_applicant: Dict[str, List[TimeSlot]],
-        schedule_by_room: Dict[str, List[TimeSlot]],
-        date_str: str,
-        precedence_rules: List[PrecedenceRule],
-        start_time: timedelta,
-        end_time: timedelta,
-        global_gap_min: int
-    ) -> bool:
-        """기본 방식으로 활동들 스케줄링"""
-        for activity in activities:
-            success = self._schedule_single_activity(
-                activity, applicants, rooms, room_availability,
-                batched_blocks, assignments, schedule_by_applicant,
-                schedule_by_room, date_str, precedence_rules,
-                start_time, end_time, global_gap_min
-            )
-            if not success:
-                return False
-        return True
-    
     def _schedule_single_activity(
         self,
         activity: Activity,
         applicants: List[Applicant],
         rooms: List[Room],
-        room_availability: Dict[str, List[Tuple[timedelta, timedelta]]],
+        room_availability: Dict[str, RoomAvailability],
         batched_blocks: Dict[str, List[Tuple[timedelta, timedelta]]],
         assignments: Dict[str, TimeSlot],
         schedule_by_applicant: Dict[str, List[TimeSlot]],
@@ -1608,19 +2209,10 @@ class IndividualScheduler:
         activities: List[Activity] = None
     ) -> int:
         """후속 활동의 방 개수 계산"""
-        for rule in precedence_rules:
-            if rule.predecessor == activity_name and rule.is_adjacent:
-                successor_name = rule.successor
-                # 후속 활동의 방 타입을 activities에서 찾기
-                successor_room_type = None
-                if activities:
-                    for act in activities:
-                        if act.name == successor_name:
-                            successor_room_type = act.room_type
-                            break
-                
-                if successor_room_type:
-                    successor_rooms = [r for r in rooms if r.room_type == successor_room_type]
-                    return len(successor_rooms)
+        adjacent = self._compiled.adjacent_successor(activity_name)
+        if adjacent:
+            successor_rooms = self._compiled.rooms_for(adjacent[0].name)
+            if successor_rooms:
+                return len(successor_rooms)
         
         return float('inf')  # 후속 활동이 없으면 제한 없음 
\ No newline at end of file
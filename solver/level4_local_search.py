@@ -0,0 +1,232 @@
+"""
+Level 4 체류시간 지역 탐색 (simulated annealing)
+
+ScheduleIndex 위에서 변경을 제안하고, 관련 지원자의 체류시간 변화만 계산해
+(증분 평가) 수락 여부를 정한다. 제한시간 안에서 가장 좋았던 스케줄을 반환한다.
+이동 종류:
+- group_shift: batched 그룹 전체를 앞/뒤로 이동
+- group_swap: 같은 활동 구성의 두 그룹 배치 맞바꾸기
+- unit_shift: 지원자의 개별 활동 묶음(연속배치로 이어진 활동)을 이동 (다른 방 가능)
+- unit_swap: 같은 활동 묶음을 가진 두 지원자의 배치 맞바꾸기
+"""
+import math
+import random
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .schedule_index import Placement, ScheduleIndex
+from .types import ScheduleItem
+
+MOVE_TYPES = ("group_shift", "group_swap", "unit_shift", "unit_swap")
+
+
+class StayTimeLocalSearch:
+    """체류시간 합 최소화 simulated annealing"""
+
+    def __init__(
+        self,
+        index: ScheduleIndex,
+        global_gap_min: int = 5,
+        seed: int = 0,
+        start_temperature: float = 20.0,
+        end_temperature: float = 0.5
+    ):
+        self.index = index
+        self.gap = timedelta(minutes=global_gap_min)
+        self.rng = random.Random(seed)
+        self.start_temperature = start_temperature  # 분 단위
+        self.end_temperature = end_temperature
+        self.stats: Dict[str, int] = defaultdict(int)
+
+        self._applicants = [
+            applicant_id for applicant_id in index.by_applicant
+            if not applicant_id.upper().startswith('DUMMY')
+        ]
+        self._group_of: Dict[str, str] = {}
+        for group_id, positions in index.group_positions.items():
+            for pos in positions:
+                self._group_of[index.items[pos].applicant_id] = group_id
+        self._units = self._build_units()
+        self._groups_by_signature = self._bucket(
+            {group_id: self._group_signature(group_id) for group_id in index.group_positions}
+        )
+        self._units_by_signature = self._bucket(
+            {key: self._unit_signature(unit) for key, unit in self._units.items()}
+        )
+
+    # ---- 이동 단위 ----
+    def _build_units(self) -> Dict[Tuple[str, int], List[int]]:
+        """지원자별 batched 외 항목을 연속배치 규칙으로 묶은 단위 (키: (지원자, 번호))"""
+        grouped = {pos for positions in self.index.group_positions.values() for pos in positions}
+        units = {}
+        for applicant_id in self._applicants:
+            positions = sorted(
+                (pos for _, _, pos in self.index.by_applicant[applicant_id] if pos not in grouped),
+                key=lambda pos: self.index.items[pos].start_time
+            )
+            current: List[int] = []
+            for pos in positions:
+                if current and self._is_adjacent(current[-1], pos):
+                    current.append(pos)
+                    continue
+                if current:
+                    units[(applicant_id, len(units))] = current
+                current = [pos]
+            if current:
+                units[(applicant_id, len(units))] = current
+        return units
+
+    def _is_adjacent(self, before: int, after: int) -> bool:
+        pair = self.index.compiled.adjacent_successor(self.index.items[before].activity_name)
+        return pair is not None and pair[0].name == self.index.items[after].activity_name
+
+    def _group_signature(self, group_id: str) -> tuple:
+        return tuple(sorted({
+            (item.activity_name, item.end_time - item.start_time)
+            for item in self.index.group_items(group_id)
+        }))
+
+    def _unit_signature(self, unit: List[int]) -> tuple:
+        return tuple(
+            (self.index.items[pos].activity_name, self.index.items[pos].end_time - self.index.items[pos].start_time)
+            for pos in unit
+        )
+
+    @staticmethod
+    def _bucket(signatures: Dict) -> Dict[tuple, List]:
+        buckets = defaultdict(list)
+        for key, signature in signatures.items():
+            buckets[signature].append(key)
+        return {signature: keys for signature, keys in buckets.items() if keys}
+
+    # ---- 이동 제안 ----
+    def _pick_applicant(self) -> str:
+        """체류시간 상위 지원자 우선 (절반은 무작위)"""
+        if self.rng.random() < 0.5:
+            sample = self.rng.sample(self._applicants, min(8, len(self._applicants)))
+            return max(sample, key=self.index.stay_span)
+        return self.rng.choice(self._applicants)
+
+    def _shift_deltas(self, applicant_id: str, moving: set, block_start, block_end) -> List[timedelta]:
+        """이동 블록을 지원자의 다른 일정 바로 뒤/앞에 붙이는 이동량 + 작은 무작위 이동"""
+        deltas = []
+        for start, end, pos in self.index.by_applicant[applicant_id]:
+            if pos in moving:
+                continue
+            deltas.append(end + self.gap - block_start)
+            deltas.append(start - self.gap - block_end)
+        deltas.append(timedelta(minutes=5 * self.rng.choice([-6, -3, -2, -1, 1, 2, 3, 6])))
+        return [delta for delta in deltas if delta]
+
+    def _propose(self) -> Tuple[str, Dict[int, Placement]]:
+        applicant_id = self._pick_applicant()
+        move = self.rng.choice(MOVE_TYPES)
+        index = self.index
+        group_id = self._group_of.get(applicant_id)
+        units = [key for key in self._units if key[0] == applicant_id] if move.startswith("unit") else []
+
+        if move == "group_shift" and group_id:
+            changes = index.shift_changes(group_id, timedelta(0))
+            starts = [placement[1] for placement in changes.values()]
+            ends = [placement[2] for placement in changes.values()]
+            deltas = self._shift_deltas(applicant_id, set(changes), min(starts), max(ends))
+            return move, index.shift_changes(group_id, self.rng.choice(deltas))
+
+        if move == "group_swap" and group_id:
+            peers = self._groups_by_signature.get(self._group_signature(group_id), [])
+            other = self.rng.choice(peers)
+            if other != group_id:
+                return move, self._swap_groups(group_id, other)
+
+        if move == "unit_shift" and units:
+            unit = self._units[self.rng.choice(units)]
+            block_start = index.items[unit[0]].start_time
+            block_end = index.items[unit[-1]].end_time
+            delta = self.rng.choice(self._shift_deltas(applicant_id, set(unit), block_start, block_end))
+            changes = {}
+            for pos in unit:
+                item = index.items[pos]
+                room_name = item.room_name
+                if self.rng.random() < 0.3:
+                    rooms = index.compiled.rooms_for(item.activity_name)
+                    if rooms:
+                        room_name = self.rng.choice(rooms).name
+                changes[pos] = (room_name, item.start_time + delta, item.end_time + delta)
+            return move, changes
+
+        if move == "unit_swap" and units:
+            key = self.rng.choice(units)
+            peers = self._units_by_signature.get(self._unit_signature(self._units[key]), [])
+            other = self.rng.choice(peers)
+            if other != key:
+                return move, self._swap_units(self._units[key], self._units[other])
+
+        return move, {}
+
+    def _swap_groups(self, group_a: str, group_b: str) -> Dict[int, Placement]:
+        """두 그룹의 활동별 (방, 시작, 종료) 맞바꾸기"""
+        blocks = {}
+        for group_id in (group_a, group_b):
+            for item in self.index.group_items(group_id):
+                blocks.setdefault((group_id, item.activity_name), (item.room_name, item.start_time, item.end_time))
+        changes = {}
+        for group_id, other in ((group_a, group_b), (group_b, group_a)):
+            for pos in self.index.group_positions[group_id]:
+                changes[pos] = blocks[(other, self.index.items[pos].activity_name)]
+        return changes
+
+    def _swap_units(self, unit_a: List[int], unit_b: List[int]) -> Dict[int, Placement]:
+        """같은 구성의 두 개별 활동 묶음 배치 맞바꾸기"""
+        changes = {}
+        for pos_a, pos_b in zip(unit_a, unit_b):
+            item_a, item_b = self.index.items[pos_a], self.index.items[pos_b]
+            changes[pos_a] = (item_b.room_name, item_b.start_time, item_b.end_time)
+            changes[pos_b] = (item_a.room_name, item_a.start_time, item_a.end_time)
+        return changes
+
+    # ---- 탐색 ----
+    def run(self, time_budget_sec: float, max_iterations: Optional[int] = None) -> List[ScheduleItem]:
+        """제한시간(또는 반복 수) 동안 탐색 후 가장 좋은 스케줄 반환"""
+        index = self.index
+        started = time.perf_counter()
+        current = index.total_stay()
+        best, best_items = current, list(index.items)
+        self.stats["initial_stay_minutes"] = int(current.total_seconds() // 60)
+
+        if not self._applicants:
+            return best_items
+
+        iteration = 0
+        while max_iterations is None or iteration < max_iterations:
+            elapsed = time.perf_counter() - started
+            if elapsed >= time_budget_sec:
+                break
+            iteration += 1
+            progress = elapsed / time_budget_sec if time_budget_sec > 0 else 1.0
+            temperature = self.start_temperature * (self.end_temperature / self.start_temperature) ** progress
+
+            move, changes = self._propose()
+            if not changes:
+                continue
+            self.stats[f"{move}_proposed"] += 1
+
+            delta = index.stay_delta(changes)
+            delta_minutes = delta.total_seconds() / 60
+            if delta_minutes > 0 and self.rng.random() >= math.exp(-delta_minutes / temperature):
+                continue
+            if index.check_changes(changes):
+                self.stats["rejected_conflict"] += 1
+                continue
+
+            index.apply_changes(changes)
+            current += delta
+            self.stats[f"{move}_accepted"] += 1
+            if current < best:
+                best, best_items = current, list(index.items)
+                self.stats["improvements"] += 1
+
+        self.stats["iterations"] = iteration
+        self.stats["best_stay_minutes"] = int(best.total_seconds() // 60)
+        return best_items
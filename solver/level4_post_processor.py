@@ -20,6 +20,10 @@ from .types import (
     PrecedenceRule, GroupAssignment, StayTimeAnalysis,
     GroupMoveCandidate, Level4Result
 )
+from .compiled_config import CompiledDateConfig, compile_date_config
+from .schedule_index import ScheduleIndex
+from .level4_local_search import StayTimeLocalSearch
+from .retiming import ScheduleRetimer
 
 
 class Level4PostProcessor:
@@ -27,13 +31,23 @@ class Level4PostProcessor:
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
+        self._compiled: Optional[CompiledDateConfig] = None
+        self._compiled_source: Optional[DateConfig] = None
+        self._index: Optional[ScheduleIndex] = None
+        self._index_source: Optional[List[ScheduleItem]] = None
+        self.applied_moves: List[GroupMoveCandidate] = []
+        
+    def _compiled_for(self, config: DateConfig) -> CompiledDateConfig:
+        """config에 대응하는 컴파일된 설정 (없으면 생성)"""
+        if self._compiled is None or self._compiled_source is not config:
+            self._compiled = compile_date_config(config)
+            self._compiled_source = config
+        return self._compiled
         
     def _get_activity_max_capacity(self, activity_name: str, config: DateConfig) -> Optional[int]:
         """활동별 최대 용량 반환"""
-        for activity in config.activities:
-            if activity.name == activity_name:
-                return activity.max_capacity
-        return None
+        activity = self._compiled_for(config).activity(activity_name)
+        return activity.max_capacity if activity else None
     
     def _calculate_improvement_potential(self, items: List[ScheduleItem], config: DateConfig) -> float:
         """개선 가능성 계산 - 동적 기준 적용"""
@@ -169,38 +183,41 @@ class Level4PostProcessor:
         
         return dynamic_threshold
 
-    def _validate_schedule_integrity(self, schedule: List[ScheduleItem], config: DateConfig) -> List[str]:
+    def _validate_schedule_integrity(
+        self,
+        schedule: List[ScheduleItem],
+        config: Optional[DateConfig] = None
+    ) -> List[str]:
         """스케줄 무결성 검사 - 그룹 크기 초과와 중복 배정 검사"""
         issues = []
         
-        # 그룹별 크기 검사
+        # 그룹/활동별 크기 (한 번 순회 - 같은 그룹이 여러 batched 활동을 수행하므로 활동별로 셈)
         group_sizes = defaultdict(int)
         for item in schedule:
             if item.group_id and not item.applicant_id.startswith('dummy'):
-                group_sizes[item.group_id] += 1
-        
-        # Batched 활동 그룹 크기 검사 (활동별 최대 용량 기준)
-        for group_id, size in group_sizes.items():
-            # 해당 그룹의 활동 정보 확인
-            group_items = [item for item in schedule if item.group_id == group_id]
-            if group_items:
-                activity_name = group_items[0].activity_name
-                # 활동별 최대 용량 확인
-                max_capacity = self._get_activity_max_capacity(activity_name, config)
+                group_sizes[(item.group_id, item.activity_name)] += 1
+        
+        # Batched 활동 그룹 크기 검사 (활동별 최대 용량 기준, 설정이 없으면 마지막 설정 사용)
+        if config is not None or self._compiled is not None:
+            for (group_id, activity_name), size in group_sizes.items():
+                max_capacity = (
+                    self._get_activity_max_capacity(activity_name, config) if config is not None
+                    else (self._compiled.activity(activity_name).max_capacity
+                          if self._compiled.activity(activity_name) else None)
+                )
                 if max_capacity and size > max_capacity:
                     issues.append(f"⚠️ {activity_name} 그룹 {group_id} 크기 초과: {size}명 (최대 {max_capacity}명)")
         
         # 시간-방 중복 배정 검사
-        time_room_groups = defaultdict(list)
+        time_room_groups = defaultdict(set)
         for item in schedule:
             if not item.applicant_id.startswith('dummy'):
                 key = (item.room_name, item.start_time, item.end_time)
-                time_room_groups[key].append(item.group_id)
+                time_room_groups[key].add(item.group_id)
         
         for (room, start_time, end_time), group_ids in time_room_groups.items():
-            unique_groups = set(group_ids)
-            if len(unique_groups) > 1:
-                issues.append(f"⚠️ 시간-방 중복: {room} {start_time} - 그룹 {', '.join(unique_groups)}")
+            if len(group_ids) > 1:
+                issues.append(f"⚠️ 시간-방 중복: {room} {start_time} - 그룹 {', '.join(map(str, group_ids))}")
         
         return issues
 
@@ -208,13 +225,46 @@ class Level4PostProcessor:
         self,
         schedule: List[ScheduleItem],
         config: DateConfig,
-        target_improvement_hours: float = 1.0
+        target_improvement_hours: float = 1.0,
+        compiled: Optional[CompiledDateConfig] = None,
+        engine: str = "greedy",
+        time_budget_sec: float = 2.0,
+        seed: int = 0,
+        retime: bool = False,
+        retime_time_limit_sec: float = 2.0
     ) -> Level4Result:
         """
         체류시간 최적화 - 안전장치 강화 및 동적 임계값 적용
+        
+        engine:
+            greedy - 문제 케이스 그룹을 한 번씩 이동
+            anneal - time_budget_sec 동안 그룹/개별 활동 이동·교환 지역 탐색
+        retime: 이동 후 방/순서를 유지한 채 시작 시각만 다시 정하는 재시간화 수행
         """
+        result = self._optimize_with_moves(
+            schedule, config, target_improvement_hours, compiled, engine, time_budget_sec, seed
+        )
+        if retime:
+            result = self._retime_result(result, config, retime_time_limit_sec)
+        return result
+    
+    def _optimize_with_moves(
+        self,
+        schedule: List[ScheduleItem],
+        config: DateConfig,
+        target_improvement_hours: float,
+        compiled: Optional[CompiledDateConfig],
+        engine: str,
+        time_budget_sec: float,
+        seed: int
+    ) -> Level4Result:
+        """그룹/개별 활동 이동으로 체류시간 단축 (engine별)"""
         start_time = time.time()
         
+        if compiled is not None:
+            self._compiled, self._compiled_source = compiled, config
+        self._index = None
+        
         # 🔧 CRITICAL: 입력 스케줄 무결성 검사
         input_issues = self._validate_schedule_integrity(schedule, config)
         if input_issues:
@@ -231,6 +281,9 @@ class Level4PostProcessor:
         
         self.logger.info("Level 4 후처리 조정 시작")
         
+        if engine == "anneal":
+            return self._optimize_with_local_search(schedule, config, time_budget_sec, seed, start_time)
+        
         try:
             # 1. 현재 체류시간 분석
             analyses = self._analyze_stay_times(schedule)
@@ -296,8 +349,21 @@ class Level4PostProcessor:
                     logs=[]
                 )
             
-            # 5. 제약 조건 검증 및 적용
+            # 5. 제약 조건 검증 및 적용 (앞선 이동 반영 후 다시 검사)
             optimized_schedule = self._apply_moves(schedule, optimal_moves, config)
+            optimal_moves = self.applied_moves
+            
+            if not optimal_moves:
+                self.logger.info("적용된 이동이 없습니다")
+                return Level4Result(
+                    success=False,
+                    original_schedule=schedule,
+                    optimized_schedule=schedule,
+                    total_improvement_hours=0.0,
+                    adjusted_groups=0,
+                    improvements=[],
+                    logs=[]
+                )
             
             # 🔧 CRITICAL: 최종 스케줄 무결성 검사
             final_issues = self._validate_schedule_integrity(optimized_schedule, config)
@@ -344,6 +410,123 @@ class Level4PostProcessor:
                 logs=[f"Level 4 후처리 조정 실패: {str(e)}"]
             )
     
+    def _retime_result(self, result: Level4Result, config: DateConfig, time_limit_sec: float = 2.0) -> Level4Result:
+        """이동 결과를 재시간화 - 개선되면 개선량을 더한 새 결과, 아니면 그대로"""
+        if self._validate_schedule_integrity(result.optimized_schedule, config):
+            return result
+        try:
+            retimer = ScheduleRetimer(
+                self._compiled_for(config), config.operating_hours, config.global_gap_min,
+                time_limit_sec=time_limit_sec, logger=self.logger
+            )
+            retimed = retimer.retime(result.optimized_schedule)
+        except Exception as e:
+            self.logger.error(f"재시간화 실패: {str(e)}")
+            return result
+        if retimed is None or self._validate_schedule_integrity(retimed, config):
+            return result
+        
+        gained = (retimer.stats["stay_before_minutes"] - retimer.stats["stay_after_minutes"]) / 60
+        self.logger.info(
+            f"재시간화 완료: {retimer.stats['wall_time_ms']}ms, 블록 {retimer.stats['moved_blocks']}개 이동, "
+            f"{gained:.1f}시간 개선"
+        )
+        return Level4Result(
+            original_schedule=result.original_schedule,
+            optimized_schedule=retimed,
+            improvements=result.improvements,
+            total_improvement_hours=result.total_improvement_hours + gained,
+            adjusted_groups=result.adjusted_groups,
+            success=True,
+            logs=result.logs + [f"재시간화: {gained:.1f}시간 개선 ({retimer.stats['moved_blocks']}개 블록 이동)"]
+        )
+    
+    def _optimize_with_local_search(
+        self,
+        schedule: List[ScheduleItem],
+        config: DateConfig,
+        time_budget_sec: float,
+        seed: int,
+        start_time: float
+    ) -> Level4Result:
+        """anneal 엔진: 인덱스 위 지역 탐색 후 실제 측정한 체류시간 감소로 결과 생성"""
+        try:
+            index = ScheduleIndex(schedule, self._compiled_for(config), config.operating_hours)
+            original_spans = {applicant_id: index.stay_span(applicant_id) for applicant_id in index.by_applicant}
+            original_stay = index.total_stay()
+            search = StayTimeLocalSearch(index, config.global_gap_min, seed=seed)
+            optimized_schedule = search.run(time_budget_sec)
+            
+            final_index = ScheduleIndex(optimized_schedule, self._compiled_for(config), config.operating_hours)
+            total_improvement = (original_stay - final_index.total_stay()).total_seconds() / 3600
+            final_issues = self._validate_schedule_integrity(optimized_schedule, config)
+            if final_issues or total_improvement <= 0:
+                if final_issues:
+                    self.logger.error(f"최종 스케줄 무결성 오류: {final_issues}")
+                else:
+                    self.logger.info("지역 탐색 개선 없음 - 기본 스케줄 유지")
+                return Level4Result(
+                    success=False,
+                    original_schedule=schedule,
+                    optimized_schedule=schedule,
+                    total_improvement_hours=0.0,
+                    adjusted_groups=0,
+                    improvements=[],
+                    logs=[]
+                )
+            
+            # 그룹별 이동 내역 (그룹의 첫 활동 기준, 개선량은 구성원 체류시간 감소 합)
+            moves = []
+            for group_id, positions in index.group_positions.items():
+                before = min((schedule[pos] for pos in positions), key=lambda item: item.start_time)
+                after = min((optimized_schedule[pos] for pos in positions), key=lambda item: item.start_time)
+                if (before.room_name, before.start_time) == (after.room_name, after.start_time):
+                    continue
+                members = sorted(
+                    applicant_id for applicant_id in index.group_members(group_id)
+                    if not applicant_id.upper().startswith('DUMMY')
+                )
+                moves.append(GroupMoveCandidate(
+                    group_id=group_id,
+                    activity_name=before.activity_name,
+                    current_start=before.start_time,
+                    current_end=before.end_time,
+                    target_start=after.start_time,
+                    target_end=after.end_time,
+                    affected_applicants=members,
+                    estimated_improvement=sum(
+                        (original_spans[a] - final_index.stay_span(a)).total_seconds() for a in members
+                    ) / 3600
+                ))
+            self.applied_moves = moves
+            
+            elapsed_time = time.time() - start_time
+            stats = dict(search.stats)
+            self.logger.info(
+                f"Level 4 지역 탐색 완료: {elapsed_time:.2f}초, {total_improvement:.1f}시간 개선 "
+                f"(반복 {stats.get('iterations', 0)}회, 개선 {stats.get('improvements', 0)}회)"
+            )
+            return Level4Result(
+                original_schedule=schedule,
+                optimized_schedule=optimized_schedule,
+                improvements=moves,
+                total_improvement_hours=total_improvement,
+                adjusted_groups=len(moves),
+                success=True,
+                logs=[f"Level 4 지역 탐색 완료: {total_improvement:.1f}시간 개선, 탐색 통계 {stats}"]
+            )
+        except Exception as e:
+            self.logger.error(f"Level 4 지역 탐색 실패: {str(e)}")
+            return Level4Result(
+                original_schedule=schedule,
+                optimized_schedule=schedule,
+                improvements=[],
+                total_improvement_hours=0.0,
+                adjusted_groups=0,
+                success=False,
+                logs=[f"Level 4 지역 탐색 실패: {str(e)}"]
+            )
+    
     def _analyze_stay_times(self, schedule: List[ScheduleItem]) -> List[StayTimeAnalysis]:
         """체류시간 분석"""
         applicant_schedules = defaultdict(list)
@@ -400,79 +583,98 @@ class Level4PostProcessor:
         
         return problem_cases
     
+    def _index_for(self, schedule: List[ScheduleItem], config: DateConfig) -> ScheduleIndex:
+        """스케줄 인덱스 (같은 스케줄이면 재사용 - 이동 적용 결과가 누적됨)"""
+        if self._index is None or self._index_source is not schedule:
+            self._index = ScheduleIndex(schedule, self._compiled_for(config), config.operating_hours)
+            self._index_source = schedule
+        return self._index
+    
     def _find_move_candidates(
         self, 
         schedule: List[ScheduleItem], 
         problem_cases: List[StayTimeAnalysis],
         config: DateConfig
     ) -> List[GroupMoveCandidate]:
-        """조정 가능한 Batched 그룹 찾기"""
+        """조정 가능한 Batched 그룹 찾기 - 그룹별 이동 후보 시각을 모두 평가"""
+        index = self._index_for(schedule, config)
+        problem_ids = {case.applicant_id for case in problem_cases}
         candidates = []
+        evaluated = 0
         
-        # Batched 활동만 필터링
-        batched_items = [item for item in schedule if self._is_batched_activity(item, config)]
-        
-        # 그룹별로 정리
-        group_items = defaultdict(list)
-        for item in batched_items:
-            if item.group_id:
-                group_items[item.group_id].append(item)
-        
-        for group_id, items in group_items.items():
-            if not items:
+        for group_id in index.group_ids():
+            # 이 그룹에 속한 문제 케이스들
+            affected_applicants = sorted(index.group_members(group_id) & problem_ids)
+            if not affected_applicants:
                 continue
-                
-            # 그룹의 현재 시간
+            
+            items = index.group_items(group_id)
             current_start = min(item.start_time for item in items)
             current_end = max(item.end_time for item in items)
             
-            # 이 그룹에 속한 문제 케이스들
-            affected_applicants = []
-            total_improvement = 0.0
-            
-            for problem_case in problem_cases:
-                if any(item.applicant_id == problem_case.applicant_id for item in items):
-                    affected_applicants.append(problem_case.applicant_id)
-                    total_improvement += problem_case.improvement_potential
-            
-            if affected_applicants:
-                # 이동 목표 시간 계산 (오후 시간대로 이동)
-                target_start = self._calculate_target_time(current_start, config)
-                target_end = target_start + (current_end - current_start)
-                
-                candidate = GroupMoveCandidate(
+            for delta in self._candidate_deltas(index, group_id, current_start, current_end, config):
+                evaluated += 1
+                improvement = index.stay_improvement_hours(group_id, delta)
+                if improvement <= 0 or not index.can_move(group_id, delta):
+                    continue
+                candidates.append(GroupMoveCandidate(
                     group_id=group_id,
                     activity_name=items[0].activity_name,
                     current_start=current_start,
                     current_end=current_end,
-                    target_start=target_start,
-                    target_end=target_end,
+                    target_start=current_start + delta,
+                    target_end=current_end + delta,
                     affected_applicants=affected_applicants,
-                    estimated_improvement=total_improvement
-                )
-                candidates.append(candidate)
+                    estimated_improvement=improvement
+                ))
         
+        self.logger.info(f"이동 후보 평가: {evaluated}개 중 {len(candidates)}개 가능")
         return candidates
     
+    def _candidate_deltas(
+        self,
+        index: ScheduleIndex,
+        group_id: str,
+        current_start: timedelta,
+        current_end: timedelta,
+        config: DateConfig
+    ) -> List[timedelta]:
+        """
+        그룹 이동량 후보 (5분 단위)
+        - 기존 오후 시간대 목표
+        - 구성원의 다른 일정 바로 뒤에서 시작 / 바로 앞에서 끝나도록
+        """
+        gap = timedelta(minutes=config.global_gap_min)
+        deltas = {self._calculate_target_time(current_start, config) - current_start}
+        
+        moving = set(index.group_positions[group_id])
+        for applicant_id in index.group_members(group_id):
+            for start, end, pos in index.by_applicant[applicant_id]:
+                if pos in moving:
+                    continue
+                deltas.add(self._round_to_5min(end + gap - current_start))
+                deltas.add(self._round_to_5min(start - gap - current_end))
+        
+        deltas.discard(timedelta(0))
+        return sorted(deltas, key=abs)
+    
     def _simulate_optimal_moves(
         self, 
         candidates: List[GroupMoveCandidate],
         config: DateConfig
     ) -> List[GroupMoveCandidate]:
-        """최적 이동 시뮬레이션"""
-        # 개선 효과 대비 리스크가 낮은 후보들 선택
-        valid_candidates = []
+        """최적 이동 시뮬레이션 - 그룹별 최대 개선 이동을 개선 효과 순으로"""
+        best_by_group: Dict[str, GroupMoveCandidate] = {}
         
         for candidate in candidates:
-            # 운영시간 내 체크
-            if candidate.target_end <= config.operating_hours[1]:
-                # 다른 활동과 충돌 체크 (단순화)
-                if self._check_time_conflicts(candidate, config):
-                    valid_candidates.append(candidate)
-        
-        # 개선 효과 순으로 정렬하여 최대 6개 그룹 선택 (더 공격적 설정)
-        valid_candidates.sort(key=lambda x: x.estimated_improvement, reverse=True)
-        return valid_candidates[:6]
+            # 운영시간/방/지원자/선후행 충돌 체크
+            if not self._check_time_conflicts(candidate, config):
+                continue
+            best = best_by_group.get(candidate.group_id)
+            if best is None or candidate.estimated_improvement > best.estimated_improvement:
+                best_by_group[candidate.group_id] = candidate
+        
+        return sorted(best_by_group.values(), key=lambda x: x.estimated_improvement, reverse=True)
     
     def _apply_moves(
         self, 
@@ -480,73 +682,53 @@ class Level4PostProcessor:
         moves: List[GroupMoveCandidate],
         config: DateConfig
     ) -> List[ScheduleItem]:
-        """이동 적용 - 충돌 방지 강화"""
-        optimized_schedule = original_schedule.copy()
-        used_time_rooms = set()  # 🔧 CRITICAL FIX: 시간-방 충돌 추적
+        """
+        이동 적용 - 앞선 이동이 반영된 인덱스로 충돌/개선 여부를 다시 확인하고
+        안전하면서 체류시간이 줄어드는 이동만 적용 (적용된 이동은 applied_moves)
+        """
+        index = self._index_for(original_schedule, config)
+        self.applied_moves = []
         
         for move in moves:
-            # 해당 그룹의 스케줄 아이템들 찾기
-            group_items = [
-                item for item in optimized_schedule 
-                if item.group_id == move.group_id
-            ]
-            
+            group_items = index.group_items(move.group_id)
             if not group_items:
                 continue
-                
+            
             # 🔧 SAFETY CHECK: 그룹 크기 검증 (활동별 최대 용량 기준)
-            max_capacity = self._get_activity_max_capacity(move.activity_name, config)
-            if max_capacity and len(group_items) > max_capacity:
-                self.logger.warning(f"⚠️ 그룹 {move.group_id} 크기 초과 ({len(group_items)}명 > {max_capacity}명), 이동 건너뜀")
+            activity_sizes = defaultdict(int)
+            for item in group_items:
+                activity_sizes[item.activity_name] += 1
+            oversized = [
+                name for name, size in activity_sizes.items()
+                if (self._get_activity_max_capacity(name, config) or size) < size
+            ]
+            if oversized:
+                self.logger.warning(f"⚠️ 그룹 {move.group_id} 크기 초과 ({oversized}), 이동 건너뜀")
                 continue
-                
-            # 시간 이동 적용
-            time_delta = move.target_start - move.current_start
             
-            # 새로운 시간과 방 조합 확인
-            sample_item = group_items[0]
-            new_start = sample_item.start_time + time_delta
-            new_end = sample_item.end_time + time_delta
-            room_time_key = (sample_item.room_name, new_start, new_end)
+            time_delta = move.target_start - move.current_start
+            conflicts = index.move_conflicts(move.group_id, time_delta)
+            if conflicts:
+                self.logger.warning(f"⚠️ 그룹 {move.group_id} 이동 충돌, 건너뜀: {conflicts[:3]}")
+                continue
             
-            # 🔧 CRITICAL FIX: 시간-방 충돌 체크
-            if room_time_key in used_time_rooms:
-                self.logger.warning(f"⚠️ 그룹 {move.group_id} 시간-방 충돌, 이동 건너뜀: {sample_item.room_name} {new_start}")
+            improvement = index.stay_improvement_hours(move.group_id, time_delta)
+            if improvement <= 0:
                 continue
-                
-            # 충돌이 없으면 이동 실행
-            used_time_rooms.add(room_time_key)
             
-            for item in group_items:
-                # 새로운 시간으로 업데이트 (min_gap_min 제약 적용)
-                new_start_time, new_end_time = self._apply_min_gap_constraint(
-                    item.start_time + time_delta, item.end_time + time_delta, 5
-                )
-                
-                new_item = ScheduleItem(
-                    applicant_id=item.applicant_id,
-                    job_code=item.job_code,
-                    activity_name=item.activity_name,
-                    room_name=item.room_name,
-                    start_time=new_start_time,
-                    end_time=new_end_time,
-                    group_id=item.group_id
-                )
-                
-                # 기존 아이템 교체
-                idx = optimized_schedule.index(item)
-                optimized_schedule[idx] = new_item
-                
-                self.logger.info(f"그룹 {move.group_id} 이동: {item.start_time} → {new_item.start_time}")
+            index.apply_move(move.group_id, time_delta)
+            move.estimated_improvement = improvement
+            self.applied_moves.append(move)
+            self.logger.info(
+                f"그룹 {move.group_id} 이동: {move.current_start} → {move.target_start} "
+                f"({improvement:.1f}시간 개선)"
+            )
         
-        return optimized_schedule
+        return list(index.items)
     
     def _is_batched_activity(self, item: ScheduleItem, config: DateConfig) -> bool:
         """Batched 활동인지 확인"""
-        for activity in config.activities:
-            if activity.name == item.activity_name:
-                return activity.mode == ActivityMode.BATCHED
-        return False
+        return self._compiled_for(config).is_batched(item.activity_name)
     
     def _calculate_target_time(self, current_start: timedelta, config: DateConfig) -> timedelta:
         """목표 이동 시간 계산 - 충돌 방지 개선"""
@@ -617,8 +799,10 @@ class Level4PostProcessor:
         return timedelta(minutes=rounded_minutes)
     
     def _check_time_conflicts(self, candidate: GroupMoveCandidate, config: DateConfig) -> bool:
-        """시간 충돌 체크 (단순화된 버전)"""
-        # 실제로는 더 복잡한 충돌 검사 필요
-        # 현재는 기본적인 운영시간 체크만 수행
-        return (candidate.target_start >= config.operating_hours[0] and 
-                candidate.target_end <= config.operating_hours[1]) 
\ No newline at end of file
+        """시간 충돌 체크 - 운영시간, 방/지원자 중복, 선후행 간격 (인덱스 기반)"""
+        if not (candidate.target_start >= config.operating_hours[0] and
+                candidate.target_end <= config.operating_hours[1]):
+            return False
+        if self._index is None:
+            return True
+        return self._index.can_move(candidate.group_id, candidate.target_start - candidate.current_start)
@@ -3,14 +3,18 @@
 """
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, time, timedelta
+import copy
 import logging
 import traceback
 
 from .types import (
     DatePlan, DateConfig, GlobalConfig, MultiDateResult, SingleDateResult,
-    Activity, ActivityMode, Room, PrecedenceRule, Applicant
+    Activity, ActivityMode, Room, PrecedenceRule, Applicant, SchedulingContext
 )
 from .single_date_scheduler import SingleDateScheduler
+from .date_executor import DateProcessExecutor
+from .compiled_config import config_fingerprint
+from .distribution import DateLoadBalancer
 
 
 class MultiDateScheduler:
@@ -25,7 +29,9 @@ class MultiDateScheduler:
         global_config: GlobalConfig,
         rooms: Dict[str, Dict],  # 기존 방 설정 형식
         activities: Dict[str, Dict],  # 기존 활동 설정 형식
-        context: Optional["SchedulingContext"] = None
+        context: Optional["SchedulingContext"] = None,
+        date_configs: Optional[Dict[datetime, DateConfig]] = None,
+        warm_start: Optional[MultiDateResult] = None
     ) -> MultiDateResult:
         """
         여러 날짜에 걸친 면접 스케줄링 실행
@@ -35,6 +41,8 @@ class MultiDateScheduler:
             global_config: 전역 설정
             rooms: 방 정보
             activities: 활동 정보
+            date_configs: 미리 구성한 날짜별 설정 (UI 변환 캐시, 없으면 여기서 구성)
+            warm_start: 체류시간 제한만 다른 이전 단계 결과 (날짜별로 이전 배치를 재사용)
             
         Returns:
             MultiDateResult: 전체 결과
@@ -47,47 +55,69 @@ class MultiDateScheduler:
         total_applicants = 0
         scheduled_applicants = 0
         
-        # 날짜별로 순차 처리
+        # 날짜별 설정 구성 (실패한 날짜는 바로 실패 처리)
+        prebuilt = date_configs or {}
+        date_configs = {}
         for date in sorted(date_plans.keys()):
             date_plan = date_plans[date]
             total_applicants += date_plan.get_total_applicants()
-            
+            if date in prebuilt:
+                date_configs[date] = prebuilt[date]
+                continue
             try:
-                # 날짜별 설정 구성
-                date_config = self._build_date_config(
+                date_configs[date] = self._build_date_config(
                     date_plan, global_config, rooms, activities
                 )
-                
-                # 단일 날짜 스케줄링
-                scheduler = SingleDateScheduler(self.logger)
-                result = scheduler.schedule(date_config, context)
-                
-                results[date] = result
-                
-                if result.status == "SUCCESS":
-                    # 더미 제외한 실제 스케줄된 인원 계산
-                    scheduled_count = len(set(
-                        item.applicant_id 
-                        for item in result.schedule 
-                        if not item.applicant_id.startswith("DUMMY_")
-                    ))
-                    scheduled_applicants += scheduled_count
-                    self.logger.info(f"{date.date()}: 성공 - {scheduled_count}명 스케줄링")
-                else:
-                    failed_dates.append(date)
-                    self.logger.error(f"{date.date()}: 실패 - {result.error_message}")
-                    
             except Exception as e:
-                # 예외 발생시 해당 날짜 실패 처리
-                error_msg = f"예외 발생: {str(e)}\n{traceback.format_exc()}"
-                self.logger.error(f"{date.date()}: {error_msg}")
-                
-                results[date] = SingleDateResult(
-                    date=date,
-                    status="FAILED",
-                    error_message=error_msg
-                )
+                results[date] = self._exception_result(date, e)
+        
+        # 날짜별 방 유형 부하가 고르게 직무 인원 재배분 (선택)
+        if context and context.balance_dates:
+            date_configs = self._balance_dates(date_configs, date_plans)
+        
+        # 같은 설정(날짜 제외)의 날짜는 한 번만 풀고 결과 복제
+        duplicates = self._group_identical_dates(date_configs) if not context or context.dedupe_dates else {}
+        for copies in duplicates.values():
+            for date in copies:
+                del date_configs[date]
+        
+        # 날짜별 스케줄링 (작업자가 여러 개면 프로세스 병렬, 아니면 순차)
+        executor = DateProcessExecutor(
+            max_workers=context.date_workers if context else None,
+            date_timeout_sec=context.date_timeout_sec if context else None,
+            logger=self.logger
+        )
+        warm_starts = warm_start.results if warm_start else {}
+        if len(date_configs) > 1 and executor.workers_for(len(date_configs)) > 1:
+            results.update(executor.run(date_configs, context, warm_starts))
+        else:
+            for date, date_config in date_configs.items():
+                try:
+                    scheduler = SingleDateScheduler(self.logger)
+                    if date in warm_starts:
+                        results[date] = scheduler.schedule(date_config, context, warm_start=warm_starts[date])
+                    else:
+                        results[date] = scheduler.schedule(date_config, context)
+                except Exception as e:
+                    results[date] = self._exception_result(date, e)
+        for source, copies in duplicates.items():
+            for date in copies:
+                results[date] = self._clone_result(results[source], date)
+        
+        results = {date: results[date] for date in sorted(results)}
+        for date, result in results.items():
+            if result.status == "SUCCESS":
+                # 더미 제외한 실제 스케줄된 인원 계산
+                scheduled_count = len(set(
+                    item.applicant_id 
+                    for item in result.schedule 
+                    if not item.applicant_id.startswith("DUMMY_")
+                ))
+                scheduled_applicants += scheduled_count
+                self.logger.info(f"{date.date()}: 성공 - {scheduled_count}명 스케줄링")
+            else:
                 failed_dates.append(date)
+                self.logger.error(f"{date.date()}: 실패 - {result.error_message}")
         
         # 전체 상태 결정
         if not failed_dates:
@@ -105,6 +135,60 @@ class MultiDateScheduler:
             failed_dates=failed_dates
         )
     
+    def _balance_dates(
+        self,
+        date_configs: Dict[datetime, DateConfig],
+        date_plans: Dict[datetime, DatePlan]
+    ) -> Dict[datetime, DateConfig]:
+        """
+        직무별 총 인원을 날짜별 부하가 고르게 다시 배분
+        DatePlan.overrides["fixed_jobs"] ({직무: 인원})는 해당 날짜에 고정
+        """
+        fixed = {
+            date: dict(date_plans[date].overrides["fixed_jobs"])
+            for date in date_configs
+            if date_plans[date].overrides and "fixed_jobs" in date_plans[date].overrides
+        }
+        try:
+            return DateLoadBalancer(logger=self.logger).balance(date_configs, fixed)
+        except ValueError as e:
+            self.logger.warning(f"날짜별 인원 재배분 실패 - 계획대로 진행: {e}")
+            return date_configs
+    
+    def _group_identical_dates(self, date_configs: Dict[datetime, DateConfig]) -> Dict[datetime, List[datetime]]:
+        """설정 지문(날짜 제외)이 같은 날짜 묶음: 첫 날짜 -> 나머지 날짜들 (중복이 있는 묶음만)"""
+        first_date_of: Dict[str, datetime] = {}
+        duplicates: Dict[datetime, List[datetime]] = {}
+        for date in sorted(date_configs):
+            fingerprint = config_fingerprint(date_configs[date])
+            if fingerprint in first_date_of:
+                duplicates.setdefault(first_date_of[fingerprint], []).append(date)
+            else:
+                first_date_of[fingerprint] = date
+        for source, copies in duplicates.items():
+            self.logger.info(f"{source.date()}와 같은 설정: {[d.date() for d in copies]} - 한 번만 스케줄링")
+        return duplicates
+    
+    def _clone_result(self, result: SingleDateResult, date: datetime) -> SingleDateResult:
+        """
+        다른 날짜의 결과를 복제해 날짜만 바꿈
+        (지원자/그룹 ID는 날짜를 포함하지 않으므로 그대로 사용, 날짜는 SingleDateResult.date로 구분)
+        """
+        clone = copy.deepcopy(result)
+        clone.date = date
+        clone.logs.append(f"{result.date.date()}와 같은 설정 - 스케줄 결과 복제")
+        return clone
+    
+    def _exception_result(self, date: datetime, error: Exception) -> SingleDateResult:
+        """예외 발생시 해당 날짜 실패 결과"""
+        error_msg = f"예외 발생: {str(error)}\n{traceback.format_exc()}"
+        self.logger.error(f"{date.date()}: {error_msg}")
+        return SingleDateResult(
+            date=date,
+            status="FAILED",
+            error_message=error_msg
+        )
+    
     def _build_date_config(
         self,
         date_plan: DatePlan,
@@ -119,6 +203,7 @@ class MultiDateScheduler:
         # 기본값은 전역 설정에서
         operating_hours = global_config.operating_hours.get("default", (time(9, 0), time(17, 30)))
         precedence_rules = global_config.precedence_rules.copy()
+        max_stay_hours = global_config.max_stay_hours
         
         # 날짜별 오버라이드 적용
         if date_plan.overrides:
@@ -139,6 +224,9 @@ class MultiDateScheduler:
                     )
                     for rule in date_plan.overrides["precedence"]
                 ]
+            
+            if "max_stay_hours" in date_plan.overrides:
+                max_stay_hours = date_plan.overrides["max_stay_hours"]
         
         # 활동 객체 생성
         activity_objects = {}
@@ -228,7 +316,8 @@ class MultiDateScheduler:
             operating_hours=(start_td, end_td),
             precedence_rules=precedence_rules,
             job_activity_matrix=job_activity_matrix,
-            global_gap_min=global_config.global_gap_min
+            global_gap_min=global_config.global_gap_min,
+            max_stay_hours=max_stay_hours
         )
     
     def validate_config(
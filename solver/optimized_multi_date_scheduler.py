@@ -6,15 +6,17 @@
 """
 from typing import Dict, List, Optional
 from datetime import date
+from functools import partial
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time as time_module
 
 from .types import (
-    DateConfig, MultiDateResult, SingleDateResult, SchedulingContext,
-    GlobalConfig, Room, Activity, ProgressInfo, ProgressCallback
+    DatePlan, DateConfig, MultiDateResult, SingleDateResult, SchedulingContext,
+    GlobalConfig, ProgressInfo, ProgressCallback
 )
 from .optimized_scheduler import OptimizedScheduler, OptimizationConfig
+from .multi_date_scheduler import MultiDateScheduler
+from .date_executor import DateProcessExecutor
 
 
 class OptimizedMultiDateScheduler:
@@ -34,35 +36,71 @@ class OptimizedMultiDateScheduler:
     
     def schedule(
         self,
-        date_plans: Dict[date, DateConfig],
+        date_plans: Dict[date, DatePlan],
         global_config: GlobalConfig,
-        rooms: Dict[str, Room],
-        activities: Dict[str, Activity],
-        context: Optional[SchedulingContext] = None
+        rooms: Dict[str, Dict],
+        activities: Dict[str, Dict],
+        context: Optional[SchedulingContext] = None,
+        date_configs: Optional[Dict[date, DateConfig]] = None
     ) -> MultiDateResult:
         """
         최적화된 멀티 날짜 스케줄링 실행
+        date_configs: 미리 구성한 날짜별 설정 (UI 변환 캐시, 없으면 여기서 구성)
         """
         start_time = time_module.time()
         
-        result = MultiDateResult()
-        result.total_applicants = sum(sum(plan.jobs.values()) for plan in date_plans.values())
+        result = MultiDateResult(status="FAILED")
+        result.total_applicants = sum(plan.get_total_applicants() for plan in date_plans.values())
         
         self.logger.info(f"최적화된 멀티 날짜 스케줄링 시작: {len(date_plans)}개 날짜, {result.total_applicants}명")
         
         try:
+            # 날짜별 설정 구성 (DatePlan + 전역 설정, 오버라이드 적용)
+            builder = MultiDateScheduler(self.logger)
+            prebuilt = date_configs or {}
+            date_configs = {}
+            for target_date in sorted(date_plans):
+                if target_date in prebuilt:
+                    date_configs[target_date] = prebuilt[target_date]
+                    continue
+                try:
+                    date_configs[target_date] = builder._build_date_config(
+                        date_plans[target_date], global_config, rooms, activities
+                    )
+                except Exception as e:
+                    self.logger.error(f"날짜 {target_date} 설정 구성 실패: {e}")
+                    failed_result = SingleDateResult(date=target_date, status="FAILED")
+                    failed_result.error_message = f"설정 구성 예외: {str(e)}"
+                    result.results[target_date] = failed_result
+            
+            # 날짜별 방 유형 부하가 고르게 직무 인원 재배분 (선택)
+            if context and context.balance_dates:
+                date_configs = builder._balance_dates(date_configs, date_plans)
+            
+            # 같은 설정(날짜 제외)의 날짜는 한 번만 풀고 결과 복제
+            duplicates = builder._group_identical_dates(date_configs) if not context or context.dedupe_dates else {}
+            for copies in duplicates.values():
+                for target_date in copies:
+                    del date_configs[target_date]
+            
             # 날짜별 병렬 처리 여부 결정
-            if (len(date_plans) > 1 and 
+            executor = self._date_executor(context)
+            if (len(date_configs) > 1 and 
                 self.optimization_config.enable_parallel_processing and
-                result.total_applicants >= self.optimization_config.chunk_size_threshold):
+                executor.workers_for(len(date_configs)) > 1):
                 
                 self.logger.info("병렬 처리 모드 활성화")
-                self._schedule_dates_parallel(date_plans, result, context)
+                self.overall_stats["parallel_tasks"] += 1
+                result.results.update(executor.run(date_configs, context))
             else:
                 self.logger.info("순차 처리 모드")
-                self._schedule_dates_sequential(date_plans, result, context)
+                self._schedule_dates_sequential(date_configs, result, context)
+            for source, copies in duplicates.items():
+                for target_date in copies:
+                    result.results[target_date] = builder._clone_result(result.results[source], target_date)
             
             # 결과 분석
+            result.results = {target_date: result.results[target_date] for target_date in sorted(result.results)}
             self._analyze_results(result)
             
         except Exception as e:
@@ -79,127 +117,54 @@ class OptimizedMultiDateScheduler:
         
         return result
     
-    def _schedule_dates_parallel(self, date_plans: Dict[date, DateConfig], 
-                               result: MultiDateResult, context: Optional[SchedulingContext]):
-        """날짜별 병렬 처리"""
-        
-        max_workers = min(len(date_plans), self.optimization_config.max_workers)
-        self.overall_stats["parallel_tasks"] += 1
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 날짜별 작업 제출
-            future_to_date = {}
-            
-            for target_date, date_config in date_plans.items():
-                future = executor.submit(
-                    self._schedule_single_date,
-                    target_date,
-                    date_config,
-                    context
-                )
-                future_to_date[future] = target_date
-            
-            # 결과 수집
-            completed_count = 0
-            total_dates = len(date_plans)
-            
-            for future in as_completed(future_to_date):
-                target_date = future_to_date[future]
-                completed_count += 1
-                
-                try:
-                    date_result = future.result(timeout=300)  # 5분 타임아웃
-                    result.results[target_date] = date_result
-                    
-                    if date_result.status == "SUCCESS":
-                        result.successful_dates.append(target_date)
-                        result.scheduled_applicants += sum(date_config.jobs.values())
-                    else:
-                        result.failed_dates.append(target_date)
-                    
-                    # 진행 상황 보고
-                    if context and context.progress_callback:
-                        progress = completed_count / total_dates
-                        context.progress_callback(ProgressInfo(
-                            stage="MultiDate",
-                            progress=progress,
-                            message=f"날짜별 처리 완료: {completed_count}/{total_dates}",
-                            details={"completed_dates": completed_count, "total_dates": total_dates}
-                        ))
-                    
-                except Exception as e:
-                    self.logger.error(f"날짜 {target_date} 병렬 처리 실패: {e}")
-                    
-                    # 실패한 날짜 결과 생성
-                    failed_result = SingleDateResult(date=target_date, status="FAILED")
-                    failed_result.error_message = f"병렬 처리 예외: {str(e)}"
-                    
-                    result.results[target_date] = failed_result
-                    result.failed_dates.append(target_date)
+    def _date_executor(self, context: Optional[SchedulingContext]) -> DateProcessExecutor:
+        """날짜별 프로세스 병렬 실행기 (작업자 프로세스에서도 같은 최적화 설정 사용)"""
+        max_workers = context.date_workers if context and context.date_workers else self.optimization_config.max_workers
+        return DateProcessExecutor(
+            max_workers=max_workers,
+            date_timeout_sec=context.date_timeout_sec if context else None,
+            scheduler_factory=partial(OptimizedScheduler, optimization_config=self.optimization_config),
+            logger=self.logger
+        )
     
-    def _schedule_dates_sequential(self, date_plans: Dict[date, DateConfig], 
+    def _schedule_dates_sequential(self, date_configs: Dict[date, DateConfig], 
                                  result: MultiDateResult, context: Optional[SchedulingContext]):
         """날짜별 순차 처리"""
         
-        total_dates = len(date_plans)
+        total_dates = len(date_configs)
         completed_count = 0
         
-        for target_date, date_config in date_plans.items():
+        for target_date, date_config in date_configs.items():
             self.logger.info(f"날짜 처리 시작: {target_date}")
             
             try:
-                date_result = self._schedule_single_date(target_date, date_config, context)
-                result.results[target_date] = date_result
-                
-                if date_result.status == "SUCCESS":
-                    result.successful_dates.append(target_date)
-                    result.scheduled_applicants += sum(date_config.jobs.values())
-                else:
-                    result.failed_dates.append(target_date)
-                
-                completed_count += 1
-                
-                # 진행 상황 보고
-                if context and context.progress_callback:
-                    progress = completed_count / total_dates
-                    context.progress_callback(ProgressInfo(
-                        stage="MultiDate",
-                        progress=progress,
-                        message=f"날짜별 처리 완료: {completed_count}/{total_dates}",
-                        details={"completed_dates": completed_count, "total_dates": total_dates}
-                    ))
-                
+                result.results[target_date] = self._schedule_single_date(target_date, date_config, context)
             except Exception as e:
                 self.logger.error(f"날짜 {target_date} 순차 처리 실패: {e}")
                 
                 # 실패한 날짜 결과 생성
                 failed_result = SingleDateResult(date=target_date, status="FAILED")
                 failed_result.error_message = f"순차 처리 예외: {str(e)}"
-                
                 result.results[target_date] = failed_result
-                result.failed_dates.append(target_date)
-                completed_count += 1
+            
+            completed_count += 1
+            
+            # 진행 상황 보고
+            if context and context.progress_callback:
+                progress = completed_count / total_dates
+                context.progress_callback(ProgressInfo(
+                    stage="MultiDate",
+                    progress=progress,
+                    message=f"날짜별 처리 완료: {completed_count}/{total_dates}",
+                    details={"completed_dates": completed_count, "total_dates": total_dates}
+                ))
     
     def _schedule_single_date(self, target_date: date, date_config: DateConfig, 
                             context: Optional[SchedulingContext]) -> SingleDateResult:
         """단일 날짜 스케줄링 (최적화된 스케줄러 사용)"""
         
-        scheduler = OptimizedScheduler(self.logger)
-        
-        # 컨텍스트 복사 (날짜별 독립성 보장)
-        date_context = None
-        if context:
-            date_context = SchedulingContext(
-                progress_callback=context.progress_callback,
-                enable_detailed_logging=context.enable_detailed_logging,
-                real_time_updates=context.real_time_updates
-            )
-        
-        result = scheduler.schedule(
-            config=date_config,
-            context=date_context,
-            optimization_config=self.optimization_config
-        )
+        scheduler = OptimizedScheduler(self.logger, optimization_config=self.optimization_config)
+        result = scheduler.schedule(config=date_config, context=context)
         
         # 통계 수집
         if hasattr(scheduler, 'stats'):
@@ -211,19 +176,29 @@ class OptimizedMultiDateScheduler:
         """결과 분석 및 상태 결정"""
         
         total_dates = len(result.results)
-        successful_dates = len(result.successful_dates)
+        successful_dates = 0
+        result.failed_dates = []
+        result.scheduled_applicants = 0
+        for target_date, date_result in result.results.items():
+            if date_result.status == "SUCCESS":
+                successful_dates += 1
+                # 더미 제외한 실제 스케줄된 인원
+                result.scheduled_applicants += len({
+                    item.applicant_id for item in date_result.schedule
+                    if not item.applicant_id.startswith("DUMMY_")
+                })
+            else:
+                result.failed_dates.append(target_date)
         
-        if successful_dates == total_dates:
+        if total_dates and successful_dates == total_dates:
             result.status = "SUCCESS"
         elif successful_dates > 0:
             result.status = "PARTIAL"
         else:
             result.status = "FAILED"
         
-        # 성공률 계산
-        result.success_rate = successful_dates / total_dates if total_dates > 0 else 0
-        
-        self.logger.info(f"멀티 날짜 결과: {result.status}, 성공률 {result.success_rate*100:.1f}% "
+        success_rate = successful_dates / total_dates if total_dates > 0 else 0
+        self.logger.info(f"멀티 날짜 결과: {result.status}, 성공률 {success_rate*100:.1f}% "
                         f"({successful_dates}/{total_dates})")
     
     def _merge_stats(self, scheduler_stats: Dict):
@@ -5,7 +5,9 @@
 - 알고리즘 최적화
 """
 from typing import List, Dict, Optional, Set, Tuple
+from collections import defaultdict
 from datetime import datetime, timedelta
+import copy
 import logging
 import time as time_module
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
@@ -15,12 +17,13 @@ import gc
 
 from .types import (
     DateConfig, SingleDateResult, Level1Result, Level2Result, Level3Result,
-    Applicant, Group, ScheduleItem, TimeSlot, Activity, ActivityMode,
-    ProgressInfo, ProgressCallback, SchedulingContext
+    Applicant, Group, ScheduleItem, TimeSlot, Activity, ActivityMode, Room,
+    IndividualScheduleResult, ProgressInfo, ProgressCallback, SchedulingContext
 )
-from .group_optimizer import GroupOptimizer
-from .batched_scheduler import BatchedScheduler
 from .individual_scheduler import IndividualScheduler
+from .single_date_scheduler import SingleDateScheduler
+from .deadline import Deadline
+from .compiled_config import config_fingerprint
 
 
 @dataclass
@@ -31,20 +34,42 @@ class OptimizationConfig:
     enable_caching: bool = True
     max_workers: int = None  # None이면 CPU 코어 수 사용
     chunk_size_threshold: int = 100  # 이 수 이상일 때 청킹 적용
+    chunk_size: int = 50  # Level 3 청크당 최대 지원자 수 (직무/시간대 단위로 분할)
     memory_cleanup_interval: int = 50  # N명마다 메모리 정리
 
 
+def _run_level3_lane(args: tuple) -> Optional[IndividualScheduleResult]:
+    """Level 3 병렬 작업: 작업에 배정된 지원자/방으로 Individual 스케줄링 (pickle 가능한 최상위 함수)"""
+    (applicants, activities, rooms, batched_results, start_time, end_time,
+     date_str, precedence_rules, global_gap_min, time_limit_sec, search_budget, max_stay_hours) = args
+    scheduler = IndividualScheduler(None, *search_budget)
+    try:
+        return scheduler.schedule_individuals(
+            applicants, activities, rooms, batched_results, start_time, end_time,
+            date_str, precedence_rules, global_gap_min, time_limit_sec,
+            max_stay_hours=max_stay_hours
+        )
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Level 3 병렬 작업 오류: {e}")
+        return None
+
+
 class OptimizedScheduler:
     """성능 최적화된 스케줄러"""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        optimization_config: Optional[OptimizationConfig] = None
+    ):
         self.logger = logger or logging.getLogger(__name__)
         self.progress_callback: Optional[ProgressCallback] = None
         self.context: Optional[SchedulingContext] = None
-        self.optimization_config = OptimizationConfig()
+        self._deadline: Optional[Deadline] = None
+        self.optimization_config = optimization_config or OptimizationConfig()
         
         # 캐시
-        self._group_cache: Dict[str, Tuple[List[Group], int]] = {}
+        self._group_cache: Dict[str, Level1Result] = {}
         self._time_slot_cache: Dict[str, List[TimeSlot]] = {}
         
         # 통계
@@ -52,7 +77,10 @@ class OptimizedScheduler:
             "cache_hits": 0,
             "cache_misses": 0,
             "parallel_tasks": 0,
-            "memory_cleanups": 0
+            "memory_cleanups": 0,
+            "level3_chunks": 0,
+            "level3_lanes": 0,
+            "level3_fallbacks": 0
         }
     
     def schedule(
@@ -66,6 +94,10 @@ class OptimizedScheduler:
         """
         self.context = context
         self.progress_callback = context.progress_callback if context else None
+        # 대규모 경로의 레벨 실행과 일반 경로 전환이 같은 제한시간을 공유
+        self._deadline = Deadline(
+            context.time_limit_sec if context and context.time_limit_sec else SchedulingContext.time_limit_sec
+        )
         
         if optimization_config:
             self.optimization_config = optimization_config
@@ -89,10 +121,10 @@ class OptimizedScheduler:
             
             if is_large_scale:
                 result.logs.append(f"대규모 처리 모드 활성화 ({total_applicants}명)")
-                return self._schedule_large_scale(config, result)
+                result = self._schedule_large_scale(config, result, overall_start_time)
             else:
                 result.logs.append(f"일반 처리 모드 ({total_applicants}명)")
-                return self._schedule_normal(config, result)
+                result = self._schedule_normal(config, result)
                 
         except Exception as e:
             result.error_message = f"최적화된 스케줄링 예외: {str(e)}"
@@ -106,53 +138,69 @@ class OptimizedScheduler:
             result.logs.append(f"총 실행 시간: {total_time:.3f}초")
             result.logs.append(f"캐시 적중률: {self._get_cache_hit_rate():.1f}%")
             result.logs.append(f"병렬 작업 수: {self.stats['parallel_tasks']}")
+            result.logs.append(f"Level 3 청크/작업 수: {self.stats['level3_chunks']}/{self.stats['level3_lanes']}")
             result.logs.append(f"메모리 정리 횟수: {self.stats['memory_cleanups']}")
         
         return result
     
     def _schedule_normal(self, config: DateConfig, result: SingleDateResult) -> SingleDateResult:
         """일반 규모 스케줄링 (기존 로직 사용)"""
-        from .single_date_scheduler import SingleDateScheduler
-        
         scheduler = SingleDateScheduler(self.logger)
-        return scheduler.schedule(config, self.context)
+        normal_result = scheduler.schedule(config, self.context, deadline=self._deadline)
+        normal_result.logs[:0] = result.logs
+        return normal_result
     
-    def _schedule_large_scale(self, config: DateConfig, result: SingleDateResult) -> SingleDateResult:
-        """대규모 스케줄링 (최적화 적용)"""
+    def _schedule_large_scale(
+        self,
+        config: DateConfig,
+        result: SingleDateResult,
+        overall_start_time: float
+    ) -> SingleDateResult:
+        """대규모 스케줄링 (Level 1 캐싱 + Level 3 청킹/병렬 처리)"""
+        levels = self._level_scheduler()
+        if not levels._precheck(config, result):
+            return result
         
-        # Level 1: 그룹 구성 (최적화)
+        # Level 1: 그룹 구성 (설정 지문 기반 캐시)
         self._report_progress("Level1", 0.0, "대규모 그룹 구성 시작")
         level1_start = time_module.time()
         
-        level1_result = self._run_optimized_level1(config)
+        level1_result = self._run_optimized_level1(config, levels)
         level1_time = time_module.time() - level1_start
         
         if not level1_result:
             result.error_message = "Level 1 실패: 그룹 구성 불가"
+            if levels._level1_infeasibility:
+                result.error_message += f" ({levels._level1_infeasibility})"
             result.logs.append(f"Level 1 실패 ({level1_time:.1f}초)")
             self._report_progress("Level1", 1.0, "그룹 구성 실패", {"error": result.error_message})
             return result
         
         result.level1_result = level1_result
-        result.logs.append(f"Level 1 완료 ({level1_time:.1f}초): {level1_result.group_count}개 그룹")
+        total_groups = sum(len(groups) for groups in level1_result.groups.values())
+        result.logs.append(
+            f"Level 1 완료 ({level1_time:.1f}초): "
+            f"{total_groups}개 그룹, {level1_result.dummy_count}명 더미"
+        )
         self._report_progress("Level1", 1.0, "그룹 구성 완료", {
-            "groups": level1_result.group_count,
+            "groups": total_groups,
             "dummies": level1_result.dummy_count,
-            "time": level1_time
+            "time": level1_time,
+            "cache_hit_rate": self._get_cache_hit_rate()
         })
         
-        # Level 2: Batched 스케줄링 (병렬 처리)
+        # Level 2: Batched 스케줄링
         self._report_progress("Level2", 0.0, "대규모 Batched 스케줄링 시작")
         level2_start = time_module.time()
         
-        level2_result = self._run_optimized_level2(config, level1_result)
+        level2_result = levels._run_level2(config, level1_result)
         level2_time = time_module.time() - level2_start
         
         if not level2_result:
-            result.error_message = "Level 2 실패: Batched 활동 스케줄링 불가"
-            result.logs.append(f"Level 2 실패 ({level2_time:.1f}초)")
-            self._report_progress("Level2", 1.0, "Batched 스케줄링 실패", {"error": result.error_message})
-            return result
+            # 그룹 구성 재시도(백트래킹)가 필요하므로 일반 경로로 전환
+            result.logs.append(f"Level 2 실패 ({level2_time:.1f}초) - 일반 처리 모드(백트래킹)로 전환")
+            self._report_progress("Level2", 1.0, "Batched 스케줄링 실패 - 일반 처리 모드로 전환")
+            return self._schedule_normal(config, result)
         
         result.level2_result = level2_result
         result.logs.append(f"Level 2 완료 ({level2_time:.1f}초): {len(level2_result.schedule)}개 스케줄")
@@ -165,7 +213,7 @@ class OptimizedScheduler:
         self._report_progress("Level3", 0.0, "대규모 Individual 스케줄링 시작")
         level3_start = time_module.time()
         
-        level3_result = self._run_optimized_level3(config, level1_result, level2_result)
+        level3_result = self._run_optimized_level3(config, level1_result, level2_result, levels)
         level3_time = time_module.time() - level3_start
         
         if not level3_result or level3_result.unscheduled:
@@ -176,10 +224,15 @@ class OptimizedScheduler:
             return result
         
         result.level3_result = level3_result
-        result.logs.append(f"Level 3 완료 ({level3_time:.1f}초): {len(level3_result.schedule)}개 스케줄")
+        result.logs.append(
+            f"Level 3 완료 ({level3_time:.1f}초): {len(level3_result.schedule)}개 스케줄 "
+            f"({self.stats['level3_chunks']}개 청크, {self.stats['level3_lanes']}개 병렬 작업)"
+        )
         self._report_progress("Level3", 1.0, "Individual 스케줄링 완료", {
             "schedule_count": len(level3_result.schedule),
-            "time": level3_time
+            "time": level3_time,
+            "chunks": self.stats["level3_chunks"],
+            "lanes": self.stats["level3_lanes"]
         })
         
         # 전체 스케줄 통합
@@ -204,66 +257,217 @@ class OptimizedScheduler:
         
         return result
     
-    def _run_optimized_level1(self, config: DateConfig) -> Optional[Level1Result]:
-        """최적화된 Level 1: 그룹 구성"""
+    def _level_scheduler(self) -> SingleDateScheduler:
+        """레벨별 실행에 사용할 SingleDateScheduler (같은 컨텍스트 공유)"""
+        levels = SingleDateScheduler(self.logger)
+        levels.context = self.context
+        levels.progress_callback = self.progress_callback
+        levels._deadline = self._deadline
+        return levels
+    
+    def _run_optimized_level1(
+        self,
+        config: DateConfig,
+        levels: SingleDateScheduler
+    ) -> Optional[Level1Result]:
+        """최적화된 Level 1: 그룹 구성 (같은 설정 지문이면 캐시 재사용)"""
         
         # 캐시 키 생성
         cache_key = self._generate_level1_cache_key(config)
         
         if self.optimization_config.enable_caching and cache_key in self._group_cache:
             self.stats["cache_hits"] += 1
-            groups, dummy_count = self._group_cache[cache_key]
-            return Level1Result(
-                groups=groups,
-                group_count=len(groups),
-                dummy_count=dummy_count
-            )
+            return copy.deepcopy(self._group_cache[cache_key])
         
         self.stats["cache_misses"] += 1
         
-        # 기존 GroupOptimizer 사용 (이미 충분히 최적화됨)
-        optimizer = GroupOptimizer()
-        result = optimizer.optimize_groups(config)
+        result = levels._run_level1(config)
         
-        # 캐시 저장
+        # 캐시 저장 (이후 단계에서 결과가 변경되어도 캐시는 그대로 유지)
         if self.optimization_config.enable_caching and result:
-            self._group_cache[cache_key] = (result.groups, result.dummy_count)
+            self._group_cache[cache_key] = copy.deepcopy(result)
         
         return result
     
-    def _run_optimized_level2(self, config: DateConfig, level1_result: Level1Result) -> Optional[Level2Result]:
-        """최적화된 Level 2: Batched 스케줄링"""
-        
-        batched_activities = [act for act in config.activities.values() 
-                            if act.mode == ActivityMode.BATCHED]
-        
-        if not batched_activities:
-            # Batched 활동이 없으면 빈 결과 반환
-            return Level2Result(schedule=[], room_assignments={})
-        
-        # 기존 방식 사용 (BatchedScheduler가 이미 최적화됨)
-        scheduler = BatchedScheduler()
-        return scheduler.schedule_batched_activities(config, level1_result)
-    
-    def _run_optimized_level3(self, config: DateConfig, level1_result: Level1Result, 
-                            level2_result: Level2Result) -> Optional[Level3Result]:
-        """최적화된 Level 3: Individual/Parallel 스케줄링"""
+    def _run_optimized_level3(
+        self,
+        config: DateConfig,
+        level1_result: Level1Result,
+        level2_result: Level2Result,
+        levels: SingleDateScheduler
+    ) -> Optional[Level3Result]:
+        """
+        최적화된 Level 3: Individual/Parallel 스케줄링
         
-        individual_activities = [act for act in config.activities.values() 
-                               if act.mode in [ActivityMode.INDIVIDUAL, ActivityMode.PARALLEL]]
+        지원자를 직무 → Level 2 시작 시각(시간대) 순으로 청크로 나누고, 청크들을
+        방을 나눠 가진 작업(lane)에 부하가 고르게 배분한 뒤 프로세스 풀에서 실행한다.
+        작업끼리 방을 공유하지 않으므로 결과를 그대로 합칠 수 있다.
+        작업이 하나라도 실패하면 전체 지원자로 기존 Level 3를 실행한다.
+        """
+        individual_activities = [
+            a for a in config.activities
+            if a.mode in [ActivityMode.INDIVIDUAL, ActivityMode.PARALLEL]
+        ]
         
         if not individual_activities:
-            return Level3Result(schedule=[], unscheduled=[])
+            return Level3Result()
+        
+        chunks = self._build_level3_chunks(
+            level1_result.applicants, level2_result, individual_activities, config.operating_hours[0]
+        )
+        lanes = self._assign_lanes(chunks, individual_activities, config.rooms)
+        self.stats["level3_chunks"] += len(chunks)
+        self.stats["level3_lanes"] += len(lanes)
+        
+        if len(lanes) <= 1:
+            return levels._run_level3(config, level1_result, level2_result)
+        
+        context = self.context or SchedulingContext()
+        lane_args = [
+            (
+                applicants, config.activities, rooms, level2_result.group_results,
+                config.operating_hours[0], config.operating_hours[1],
+                config.date.strftime('%Y-%m-%d'), config.precedence_rules, config.global_gap_min,
+                levels._level3_time_limit(),
+                (context.level3_search_nodes, context.level3_search_time_sec),
+                config.max_stay_hours
+            )
+            for applicants, rooms in lanes
+        ]
+        lane_results = self._run_level3_lanes(lane_args)
+        
+        if self.optimization_config.enable_memory_optimization:
+            gc.collect()
+            self.stats["memory_cleanups"] += 1
+        
+        if any(r is None or not r.success for r in lane_results):
+            failed = sum(1 for r in lane_results if r is None or not r.success)
+            self.logger.warning(f"Level 3 병렬 작업 {failed}/{len(lanes)}개 실패 - 전체 지원자로 재시도")
+            self.stats["level3_fallbacks"] += 1
+            return levels._run_level3(config, level1_result, level2_result)
+        
+        merged = IndividualScheduleResult()
+        for lane_result in lane_results:
+            merged.assignments.update(lane_result.assignments)
+            merged.schedule_by_applicant.update(lane_result.schedule_by_applicant)
+            merged.schedule_by_room.update(lane_result.schedule_by_room)
+        
+        return levels._to_level3_result(
+            merged, level1_result.applicants, individual_activities,
+            levels._compiled_for(config, level1_result)
+        )
+    
+    def _build_level3_chunks(
+        self,
+        applicants: List[Applicant],
+        level2_result: Level2Result,
+        individual_activities: List[Activity],
+        day_start: timedelta
+    ) -> List[List[Applicant]]:
+        """직무별로 Level 2 첫 활동 시작 시각 순으로 정렬해 chunk_size명씩 분할"""
+        anchors: Dict[str, timedelta] = {}
+        for group_result in level2_result.group_results:
+            for applicant_id, slots in group_result.schedule_by_applicant.items():
+                for slot in slots:
+                    if applicant_id not in anchors or slot.start_time < anchors[applicant_id]:
+                        anchors[applicant_id] = slot.start_time
+        
+        individual_names = {a.name for a in individual_activities}
+        by_job: Dict[str, List[Applicant]] = defaultdict(list)
+        for applicant in applicants:
+            if individual_names.intersection(applicant.required_activities):
+                by_job[applicant.job_code].append(applicant)
+        
+        chunk_size = max(1, self.optimization_config.chunk_size)
+        chunks = []
+        for job_code in sorted(by_job):
+            members = sorted(by_job[job_code], key=lambda a: (anchors.get(a.id, day_start), a.id))
+            for i in range(0, len(members), chunk_size):
+                chunks.append(members[i:i + chunk_size])
+        return chunks
+    
+    def _assign_lanes(
+        self,
+        chunks: List[List[Applicant]],
+        individual_activities: List[Activity],
+        rooms: List[Room]
+    ) -> List[Tuple[List[Applicant], List[Room]]]:
+        """
+        청크를 병렬 작업(lane)에 배분
         
-        # 기존 IndividualScheduler 사용 (이미 최적화됨)
-        scheduler = IndividualScheduler()
-        return scheduler.schedule_individual_activities(config, level1_result, level2_result)
+        방은 종류별로 돌아가며 작업에 나눠 주고(모든 작업이 활동별로 방을 하나 이상
+        갖도록), 청크는 활동 소요시간 합이 큰 순서로 방 1개당 부하가 가장 적은
+        작업에 넣는다.
+        """
+        all_applicants = [applicant for chunk in chunks for applicant in chunk]
+        
+        eligible_counts = [
+            sum(1 for room in rooms if any(rt in room.room_type for rt in activity.required_rooms))
+            for activity in individual_activities
+        ]
+        n_lanes = min(self.optimization_config.max_workers or 1, len(chunks), min(eligible_counts))
+        if not self.optimization_config.enable_parallel_processing or n_lanes <= 1:
+            return [(all_applicants, rooms)]
+        
+        lane_rooms: List[List[Room]] = [[] for _ in range(n_lanes)]
+        per_type: Dict[str, int] = defaultdict(int)
+        for room in rooms:
+            lane_rooms[per_type[room.room_type] % n_lanes].append(room)
+            per_type[room.room_type] += 1
+        
+        # 한 활동의 방이 여러 종류에 걸쳐 있으면 작업별 방이 빌 수 있음
+        for lane in lane_rooms:
+            for activity in individual_activities:
+                if not any(rt in room.room_type for room in lane for rt in activity.required_rooms):
+                    return [(all_applicants, rooms)]
+        
+        durations = {a.name: a.duration_min for a in individual_activities}
+        
+        def chunk_load(chunk: List[Applicant]) -> int:
+            return sum(durations.get(name, 0) for a in chunk for name in a.required_activities)
+        
+        weights = [
+            sum(1 for room in lane
+                if any(rt in room.room_type for a in individual_activities for rt in a.required_rooms))
+            for lane in lane_rooms
+        ]
+        lane_applicants: List[List[Applicant]] = [[] for _ in range(n_lanes)]
+        lane_load = [0] * n_lanes
+        for chunk in sorted(chunks, key=chunk_load, reverse=True):
+            target = min(range(n_lanes), key=lambda i: (lane_load[i] + chunk_load(chunk)) / weights[i])
+            lane_applicants[target].extend(chunk)
+            lane_load[target] += chunk_load(chunk)
+        
+        return [
+            (applicants, lane)
+            for applicants, lane in zip(lane_applicants, lane_rooms)
+            if applicants
+        ]
+    
+    def _run_level3_lanes(self, lane_args: List[tuple]) -> List[Optional[IndividualScheduleResult]]:
+        """병렬 작업 실행 (작업자 1명이면 순차 실행)"""
+        workers = min(self.optimization_config.max_workers or 1, len(lane_args))
+        if workers <= 1:
+            return [_run_level3_lane(args) for args in lane_args]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_level3_lane, args) for args in lane_args]
+            self.stats["parallel_tasks"] += len(futures)
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.warning(f"Level 3 병렬 작업 예외: {e}")
+                    results.append(None)
+        return results
     
     def _generate_level1_cache_key(self, config: DateConfig) -> str:
-        """Level 1 캐시 키 생성"""
-        jobs_str = "_".join(f"{k}:{v}" for k, v in sorted(config.jobs.items()))
-        activities_str = "_".join(sorted(config.activities.keys()))
-        return f"L1_{jobs_str}_{activities_str}"
+        """
+        Level 1 캐시 키 - 그룹 구성에 영향을 주는 설정의 지문
+        (직무별 인원, 활동, 직무-활동 매트릭스, 방 × 슬롯 수 확인에 쓰이는 방/운영시간/선후행)
+        """
+        return f"L1_{config_fingerprint(config)[:32]}"
     
     def _get_cache_hit_rate(self) -> float:
         """캐시 적중률 계산"""
@@ -0,0 +1,216 @@
+"""
+열 단위 스케줄 결과 빌더 (long DataFrame 변환)와 wide 형식 변환
+
+ScheduleItem마다 dict를 만들고 DataFrame을 만든 뒤 정렬하는 대신, 항목을 바로
+열 배열로 모은다: 문자열 ID는 범주 코드(int32), 시각은 0시 기준 마이크로초(int64,
+timedelta 정밀도 그대로), 날짜는 날짜 목록의 인덱스. long 형식은 코드를 한 번에 펼친다.
+wide 형식(pivot_activities)은 (지원자, 날짜) 행 × 활동 열의 2차원 배열에 인덱스로 채워
+pivot_table 없이 만들고, 시각 문자열도 분 → 'HH:MM' 조회표로 한 번에 변환한다.
+"""
+import re
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 0 ~ 47:59 (익일 새벽까지) 분 → 'HH:MM'
+_CLOCK_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(48 * 60)], dtype=object)
+_SECOND_LABELS = np.array([f":{s:02d}" for s in range(60)], dtype=object)
+
+_CLOCK_PATTERN = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
+
+_ITEM_FIELDS = ("applicant_id", "job_code", "activity_name", "room_name", "group_id")
+
+
+class ScheduleColumns:
+    """날짜별 ScheduleItem을 열 배열로 모아 long DataFrame 생성"""
+
+    def __init__(self):
+        self._dates: List[datetime] = []
+        self._date_index: List[np.ndarray] = []
+        self._fields: Dict[str, list] = {name: [] for name in _ITEM_FIELDS}
+        self._starts: List[np.ndarray] = []
+        self._ends: List[np.ndarray] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, date: datetime, items: Sequence, skip_dummy: bool = False) -> None:
+        """date의 스케줄 항목 추가 (skip_dummy: 'DUMMY_' 지원자 제외)"""
+        if skip_dummy:
+            items = [item for item in items if not item.applicant_id.startswith("DUMMY_")]
+        if not items:
+            return
+        self._date_index.append(np.full(len(items), len(self._dates), dtype=np.int32))
+        self._dates.append(date)
+        for name, values in self._fields.items():
+            values.extend(map(attrgetter(name), items))
+        self._starts.append(self._microseconds(map(attrgetter("start_time"), items), len(items)))
+        self._ends.append(self._microseconds(map(attrgetter("end_time"), items), len(items)))
+        self._size += len(items)
+
+    def to_long(self, categorical: bool = False) -> pd.DataFrame:
+        """SingleDateResult.to_dataframe 형식 (interview_date는 date, 추가 순서 유지)"""
+        if not self._size:
+            return pd.DataFrame()
+        day_labels = np.array([date.date() for date in self._dates], dtype=object)
+        frame = {name: self._labels(name, categorical) for name in ("applicant_id", "job_code", "activity_name", "room_name")}
+        frame["start_time"] = self._timedeltas(self._concat(self._starts))
+        frame["end_time"] = self._timedeltas(self._concat(self._ends))
+        frame["group_id"] = self._labels("group_id", categorical)
+        frame["interview_date"] = day_labels[self._concat(self._date_index)]
+        return pd.DataFrame(frame)
+
+    def to_ui_frame(self, categorical: bool = False) -> pd.DataFrame:
+        """UI 표시용 long 형식 (interview_date는 datetime, 날짜 → 시작 → 지원자 순 정렬)"""
+        if not self._size:
+            return pd.DataFrame()
+        dates = np.array(self._dates, dtype="datetime64[ns]")[self._concat(self._date_index)]
+        starts, ends = self._concat(self._starts), self._concat(self._ends)
+        applicant_codes, applicants = self._factorize("applicant_id")
+        order = np.lexsort((applicant_codes, starts, dates))
+        frame = pd.DataFrame({
+            "interview_date": dates[order],
+            "applicant_id": self._take(applicant_codes[order], applicants, categorical),
+            "job_code": self._labels("job_code", categorical)[order],
+            "activity_name": self._labels("activity_name", categorical)[order],
+            "room_name": self._labels("room_name", categorical)[order],
+            "start_time": self._timedeltas(starts[order]),
+            "end_time": self._timedeltas(ends[order]),
+            "duration_min": (np.round((ends - starts)[order] / (5 * 60e6)) * 5).astype(np.int64)
+        }, index=order)
+        return frame
+
+    # 내부 도우미
+    def _factorize(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        codes, uniques = pd.factorize(np.array(self._fields[name], dtype=object), sort=True)
+        return codes.astype(np.int32), np.asarray(uniques, dtype=object)
+
+    def _labels(self, name: str, categorical: bool) -> np.ndarray:
+        codes, uniques = self._factorize(name)
+        return self._take(codes, uniques, categorical)
+
+    @staticmethod
+    def _take(codes: np.ndarray, uniques: np.ndarray, categorical: bool):
+        if categorical:
+            return pd.Categorical.from_codes(codes, categories=uniques)
+        # 코드 -1(None)은 뒤에 붙인 None을 가리킴
+        return np.append(uniques, None)[codes]
+
+    @staticmethod
+    def _concat(chunks: List[np.ndarray]) -> np.ndarray:
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    @staticmethod
+    def _microseconds(times, count: int) -> np.ndarray:
+        seconds = np.fromiter(map(timedelta.total_seconds, times), dtype=float, count=count)
+        return np.round(seconds * 1e6).astype(np.int64)
+
+    @staticmethod
+    def _timedeltas(microseconds: np.ndarray) -> np.ndarray:
+        return microseconds.astype("timedelta64[us]").astype("timedelta64[ns]")
+
+
+def _first_rows(codes: np.ndarray) -> np.ndarray:
+    """행 코드마다 처음 나온 항목의 위치 (행 코드 순)"""
+    _, first = np.unique(codes, return_index=True)
+    return first
+
+
+def _first_cells(rows: np.ndarray, columns: np.ndarray, n_columns: int, mask: np.ndarray) -> np.ndarray:
+    """mask 항목 중 (행, 열) 칸마다 처음 나온 항목의 위치"""
+    positions = np.flatnonzero(mask)
+    _, first = np.unique(rows[positions].astype(np.int64) * n_columns + columns[positions], return_index=True)
+    return positions[first]
+
+
+def clock_labels(minutes: np.ndarray, seconds: Optional[np.ndarray] = None) -> np.ndarray:
+    """0시 기준 분 → 'HH:MM' (seconds가 있으면 'HH:MM:SS'), 음수/NaN은 NaN"""
+    minutes = np.asarray(minutes, dtype=float)
+    valid = (minutes >= 0) & (minutes < len(_CLOCK_LABELS))
+    labels = np.full(len(minutes), np.nan, dtype=object)
+    labels[valid] = _CLOCK_LABELS[minutes[valid].astype(np.int64)]
+    if seconds is not None:
+        labels[valid] = labels[valid] + _SECOND_LABELS[np.asarray(seconds)[valid].astype(np.int64)]
+    return labels
+
+
+def _take_or_nan(codes: np.ndarray, uniques: np.ndarray) -> np.ndarray:
+    labels = np.full(len(codes), np.nan, dtype=object)
+    valid = codes >= 0
+    labels[valid] = uniques[codes[valid]]
+    return labels
+
+
+def time_of_day_seconds(values: pd.Series) -> np.ndarray:
+    """시각 열 → 0시 기준 초 (timedelta / datetime / 'HH:MM[:SS]' 문자열, 파싱 실패는 NaN)"""
+    if pd.api.types.is_timedelta64_dtype(values):
+        return values.dt.total_seconds().to_numpy(dtype=float)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return (values - values.dt.normalize()).dt.total_seconds().to_numpy(dtype=float)
+    # 문자열/객체 열은 서로 다른 시각 값만 파싱해서 코드로 펼침 (코드 -1은 뒤에 붙인 NaN)
+    codes, uniques = pd.factorize(values)
+    return np.append(_parse_clock(pd.Series(uniques, dtype=object)), np.nan)[codes]
+
+
+def _parse_clock(values: pd.Series) -> np.ndarray:
+    if values.empty:
+        return np.array([], dtype=float)
+    sample = values.iloc[0]
+    if isinstance(sample, timedelta):
+        return pd.to_timedelta(values, errors="coerce").dt.total_seconds().to_numpy(dtype=float)
+    if isinstance(sample, str) and _CLOCK_PATTERN.match(sample):
+        # 'HH:MM[:SS]'는 날짜 파싱 없이 timedelta로 ('HH:MM'은 ':00'을 붙임)
+        text = values.astype(str)
+        text = text.where(text.str.count(":") != 1, text + ":00")
+        return pd.to_timedelta(text, errors="coerce").dt.total_seconds().to_numpy(dtype=float)
+    parsed = pd.to_datetime(values, errors="coerce")
+    return (parsed - parsed.dt.normalize()).dt.total_seconds().to_numpy(dtype=float)
+
+
+def pivot_activities(
+    long_df: pd.DataFrame,
+    index: List[str],
+    activity: str,
+    time_columns: Dict[str, str],
+    value_columns: Dict[str, str],
+    with_seconds: bool = False
+) -> pd.DataFrame:
+    """
+    long 형식 → 활동별 열 wide 형식 (pivot_table(aggfunc='first') 대체)
+    time_columns/value_columns: 원본 열 → 결과 열 접두사 ('{접두사}{활동}'),
+    시각 열은 'HH:MM' (with_seconds면 'HH:MM:SS') 문자열. 행은 index 열 기준 정렬.
+    """
+    if long_df.empty:
+        return pd.DataFrame()
+    index_codes = [pd.factorize(long_df[column], sort=True) for column in index]
+    keys = np.zeros(len(long_df), dtype=np.int64)
+    for codes, uniques in index_codes:
+        keys = keys * (len(uniques) + 1) + (codes + 1)
+    row_codes, row_keys = pd.factorize(keys, sort=True)
+    activity_codes, activities = pd.factorize(long_df[activity], sort=True)
+    # 활동이 비어 있는 행은 pivot_table처럼 제외
+    present = activity_codes >= 0
+    row_first = _first_rows(row_codes)
+    wide = pd.DataFrame({column: np.asarray(long_df[column])[row_first] for column in index})
+    columns = {}
+    for source, prefix in time_columns.items():
+        seconds = time_of_day_seconds(long_df[source].reset_index(drop=True))
+        # aggfunc='first'처럼 빈 값은 건너뛰고 칸마다 첫 값
+        first = _first_cells(row_codes, activity_codes, len(activities), present & ~np.isnan(seconds))
+        grid = np.full((len(row_keys), len(activities)), np.nan)
+        grid[row_codes[first], activity_codes[first]] = seconds[first]
+        for column_index, name in enumerate(activities):
+            cell = grid[:, column_index]
+            columns[f"{prefix}{name}"] = clock_labels(cell // 60, cell % 60 if with_seconds else None)
+    for source, prefix in value_columns.items():
+        codes, uniques = pd.factorize(long_df[source], sort=True)
+        first = _first_cells(row_codes, activity_codes, len(activities), present & (codes >= 0))
+        grid = np.full((len(row_keys), len(activities)), -1, dtype=np.int64)
+        grid[row_codes[first], activity_codes[first]] = codes[first]
+        for column_index, name in enumerate(activities):
+            columns[f"{prefix}{name}"] = _take_or_nan(grid[:, column_index], np.asarray(uniques, dtype=object))
+    return pd.concat([wide, pd.DataFrame(columns)], axis=1)
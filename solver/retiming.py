@@ -0,0 +1,230 @@
+"""
+고정 방/순서 재시간화 (re-timing)
+
+Level 2/3에서 방과 방별 사용 순서, 지원자별 활동 순서가 정해지면 체류시간 단축은
+시작 시각만 다시 정하는 문제가 된다. 제약이 모두 두 시작 시각의 차이 제약이므로
+(방 순서, 지원자 순서, 선후행 간격, 운영시간) 시작 시각 변수만 있는 작은 CP-SAT 모델로
+정확히 푼다.
+- batched 블록(같은 그룹/활동)과 같은 방·시각의 parallel 세션은 변수 하나
+- 시간 단위는 모든 시각/소요시간/간격의 최대공약수 (보통 5분)
+- 원래 스케줄을 hint로 주고 원래 간격이 더 작으면 그 간격까지만 요구하므로 항상 해가 있다
+"""
+import logging
+import math
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from ortools.sat.python import cp_model
+
+from .compiled_config import CompiledDateConfig
+from .types import ActivityMode, ScheduleItem
+
+
+def _minutes(td: timedelta) -> int:
+    return int(td.total_seconds() // 60)
+
+
+class ScheduleRetimer:
+    """방 배정과 순서를 유지한 채 시작 시각만 다시 정해 체류시간 최소화"""
+
+    def __init__(
+        self,
+        compiled: CompiledDateConfig,
+        operating_hours: Tuple[timedelta, timedelta],
+        global_gap_min: int = 5,
+        time_limit_sec: float = 2.0,
+        max_stay_weight: int = 0,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.compiled = compiled
+        self.operating_hours = operating_hours
+        self.global_gap_min = global_gap_min
+        self.time_limit_sec = time_limit_sec
+        # 목적함수 = 체류시간 합 + max_stay_weight * 최대 체류시간
+        self.max_stay_weight = max_stay_weight
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats: Dict[str, object] = {}
+
+    def _block_key(self, pos: int, item: ScheduleItem) -> Hashable:
+        activity = self.compiled.activity(item.activity_name)
+        if item.group_id and self.compiled.is_batched(item.activity_name):
+            return ("batched", item.group_id, item.activity_name)
+        if activity is not None and activity.mode == ActivityMode.PARALLEL:
+            return ("parallel", item.room_name, item.activity_name, item.start_time, item.end_time)
+        return ("item", pos)
+
+    def retime(self, schedule: List[ScheduleItem]) -> Optional[List[ScheduleItem]]:
+        """재시간화한 스케줄 (개선이 없거나 풀지 못하면 None)"""
+        started = time.perf_counter()
+        self.stats = {}
+        if not schedule:
+            return None
+
+        # ---- 블록 구성 ----
+        block_of: List[int] = []
+        keys: Dict[Hashable, int] = {}
+        starts: List[int] = []
+        durations: List[int] = []
+        rooms: List[str] = []
+        for pos, item in enumerate(schedule):
+            key = self._block_key(pos, item)
+            if key not in keys:
+                keys[key] = len(starts)
+                starts.append(_minutes(item.start_time))
+                durations.append(_minutes(item.end_time - item.start_time))
+                rooms.append(item.room_name)
+            block_of.append(keys[key])
+
+        day_start, day_end = (_minutes(t) for t in self.operating_hours)
+        gaps = [gap for name in {item.activity_name for item in schedule}
+                for _, gap, _ in self.compiled.predecessors_of(name)]
+        unit = 0
+        for value in starts + durations + gaps + [day_start, day_end, self.global_gap_min]:
+            unit = math.gcd(unit, value)
+        unit = unit or 1
+
+        def ceil_units(value: int) -> int:
+            return -(-value // unit)
+
+        model = cp_model.CpModel()
+        lower = min(day_start, min(starts))
+        upper = max([day_end] + [s + d for s, d in zip(starts, durations)])
+        start_vars = [
+            model.NewIntVar(lower // unit, (upper - d) // unit, f"s{b}")
+            for b, d in enumerate(durations)
+        ]
+        for b, var in enumerate(start_vars):
+            model.AddHint(var, starts[b] // unit)
+
+        def end_of(b: int):
+            return start_vars[b] + durations[b] // unit
+
+        # ---- 방별 순서 유지 (원래 겹치던 parallel 세션 등은 상대 위치 고정) ----
+        by_room: Dict[str, List[int]] = defaultdict(list)
+        for b, room_name in enumerate(rooms):
+            by_room[room_name].append(b)
+        for blocks in by_room.values():
+            blocks.sort(key=lambda b: (starts[b], durations[b]))
+            front = None
+            for prev, cur in zip(blocks, blocks[1:]):
+                if starts[cur] >= starts[prev] + durations[prev]:
+                    model.Add(start_vars[cur] >= end_of(prev))
+                else:
+                    model.Add(start_vars[cur] - start_vars[prev] == (starts[cur] - starts[prev]) // unit)
+                if front is None or starts[prev] + durations[prev] > starts[front] + durations[front]:
+                    front = prev
+                if front != prev and starts[cur] >= starts[front] + durations[front]:
+                    model.Add(start_vars[cur] >= end_of(front))
+
+        # ---- 지원자별 순서/간격 + 선후행 ----
+        by_applicant: Dict[str, List[int]] = defaultdict(list)
+        for pos, item in enumerate(schedule):
+            by_applicant[item.applicant_id].append(pos)
+
+        stays = []
+        original_stays = []
+        for applicant_id, positions in by_applicant.items():
+            positions.sort(key=lambda pos: schedule[pos].start_time)
+            activity_pos = {schedule[pos].activity_name: pos for pos in positions}
+            for prev, cur in zip(positions, positions[1:]):
+                b_prev, b_cur = block_of[prev], block_of[cur]
+                if b_prev == b_cur:
+                    continue
+                actual = starts[b_cur] - starts[b_prev] - durations[b_prev]
+                required = min(actual, self.global_gap_min)
+                model.Add(start_vars[b_cur] - end_of(b_prev) >= ceil_units(required))
+
+            for pos in positions:
+                for predecessor, gap, adjacent in self.compiled.predecessors_of(schedule[pos].activity_name):
+                    pred_pos = activity_pos.get(predecessor)
+                    if pred_pos is None:
+                        continue
+                    b_pred, b_cur = block_of[pred_pos], block_of[pos]
+                    actual = starts[b_cur] - starts[b_pred] - durations[b_pred]
+                    if adjacent:
+                        model.Add(start_vars[b_cur] - end_of(b_pred) == actual // unit)
+                    else:
+                        model.Add(start_vars[b_cur] - end_of(b_pred) >= ceil_units(min(gap, actual)))
+
+            if applicant_id.upper().startswith('DUMMY'):
+                continue
+            first = min(positions, key=lambda pos: starts[block_of[pos]])
+            last = max(positions, key=lambda pos: starts[block_of[pos]] + durations[block_of[pos]])
+            stays.append(end_of(block_of[last]) - start_vars[block_of[first]])
+            original_stays.append(
+                starts[block_of[last]] + durations[block_of[last]] - starts[block_of[first]]
+            )
+
+        # ---- 운영시간 (원래 벗어난 블록은 원래 위치까지 허용) ----
+        for b, var in enumerate(start_vars):
+            model.Add(var >= ceil_units(min(day_start, starts[b])))
+            model.Add(var + durations[b] // unit <= max(day_end, starts[b] + durations[b]) // unit)
+
+        if not stays:
+            return None
+        max_stay = model.NewIntVar(0, max(original_stays) // unit, "max_stay")
+        for stay in stays:
+            model.Add(stay <= max_stay)
+        model.Minimize(sum(stays) + self.max_stay_weight * max_stay)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = self.time_limit_sec
+        solver.parameters.num_workers = 1
+        status = solver.Solve(model)
+
+        self.stats = {
+            "status": solver.StatusName(status),
+            "blocks": len(start_vars),
+            "unit_minutes": unit,
+            "stay_before_minutes": sum(original_stays),
+            "wall_time_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            self.logger.warning(f"재시간화 실패: {solver.StatusName(status)}")
+            return None
+
+        new_starts = [solver.Value(var) * unit for var in start_vars]
+        self.stats["stay_after_minutes"] = sum(solver.Value(stay) for stay in stays) * unit
+        self.stats["max_stay_minutes"] = solver.Value(max_stay) * unit
+        self.stats["moved_blocks"] = sum(1 for b in range(len(starts)) if new_starts[b] != starts[b])
+        if self.stats["stay_after_minutes"] >= self.stats["stay_before_minutes"]:
+            return None
+        return self._build_schedule(schedule, block_of, starts, new_starts)
+
+    def _build_schedule(
+        self,
+        schedule: List[ScheduleItem],
+        block_of: List[int],
+        starts: List[int],
+        new_starts: List[int]
+    ) -> List[ScheduleItem]:
+        """새 시작 시각으로 항목 재구성 (parallel 세션 id는 활동 + 시작 시각, 다른 방과 겹치면 방 이름 추가)"""
+        session_rooms: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+        for pos, item in enumerate(schedule):
+            if item.group_id and item.group_id.startswith(f"group_{item.activity_name}_"):
+                rooms = session_rooms[(item.activity_name, new_starts[block_of[pos]])]
+                if item.room_name not in rooms:
+                    rooms.append(item.room_name)
+
+        retimed = []
+        for pos, item in enumerate(schedule):
+            shift = timedelta(minutes=new_starts[block_of[pos]] - starts[block_of[pos]])
+            group_id = item.group_id
+            if group_id and group_id.startswith(f"group_{item.activity_name}_"):
+                new_start = item.start_time + shift
+                group_id = f"group_{item.activity_name}_{new_start.total_seconds()}"
+                rooms = session_rooms[(item.activity_name, new_starts[block_of[pos]])]
+                if rooms.index(item.room_name) > 0:
+                    group_id = f"{group_id}_{item.room_name}"
+            retimed.append(ScheduleItem(
+                applicant_id=item.applicant_id,
+                job_code=item.job_code,
+                activity_name=item.activity_name,
+                room_name=item.room_name,
+                start_time=item.start_time + shift,
+                end_time=item.end_time + shift,
+                group_id=group_id
+            ))
+        return retimed
@@ -0,0 +1,137 @@
+"""
+방 가용 시간 인덱스
+
+방 하나의 빈 시간대를 정수 분(minute) 단위 정렬 배열로 관리한다.
+- earliest_fit: 이분 탐색으로 시작 위치를 찾은 뒤 가장 이른 배치 가능 시각 반환
+- reserve: 사용 시간 제거 (겹치는 빈 시간대 분할)
+- release: 사용 시간 반환 (인접 빈 시간대 병합)
+- reserve/release는 바뀐 구간을 토큰으로 반환 → restore로 정확히 되돌림 (백트래킹용)
+"""
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from typing import Iterator, List, Optional, Tuple
+
+# (시작 위치, 교체 전 starts, 교체 전 ends, 교체 후 구간 수)
+ChangeToken = Tuple[int, List[int], List[int], int]
+
+
+def _to_minutes(td: timedelta) -> int:
+    return int(td.total_seconds() // 60)
+
+
+class RoomAvailability:
+    """방 하나의 빈 시간대 (겹치지 않는 [start, end) 구간의 정렬 배열)"""
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, start: timedelta = None, end: timedelta = None):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        if start is not None and end is not None and end > start:
+            self._starts.append(_to_minutes(start))
+            self._ends.append(_to_minutes(end))
+
+    @classmethod
+    def from_intervals(
+        cls,
+        intervals: List[Tuple[timedelta, timedelta]]
+    ) -> 'RoomAvailability':
+        """빈 시간대 목록으로 생성 (겹치는 구간은 병합)"""
+        index = cls()
+        for start, end in intervals:
+            index.release(start, end)
+        return index
+
+    def earliest_fit(
+        self,
+        duration: timedelta,
+        earliest: timedelta = None,
+        latest: timedelta = None
+    ) -> Optional[timedelta]:
+        """earliest 이후 duration 만큼 비어 있는 가장 이른 시작 시각 (latest까지 종료)"""
+        duration_min = _to_minutes(duration)
+        lower = _to_minutes(earliest) if earliest is not None else None
+        upper = _to_minutes(latest) if latest is not None else None
+
+        # earliest 이후에 끝나는 첫 구간부터 탐색
+        i = bisect_right(self._ends, lower) if lower is not None else 0
+        while i < len(self._starts):
+            start = self._starts[i]
+            if lower is not None and start < lower:
+                start = lower
+            if upper is not None and start + duration_min > upper:
+                return None
+            if start + duration_min <= self._ends[i]:
+                return timedelta(minutes=start)
+            i += 1
+        return None
+
+    def is_free(self, start: timedelta, end: timedelta) -> bool:
+        """[start, end) 전체가 비어 있는지 확인"""
+        s, e = _to_minutes(start), _to_minutes(end)
+        i = bisect_right(self._starts, s) - 1
+        return i >= 0 and self._ends[i] >= e
+
+    def reserve(self, start: timedelta, end: timedelta) -> Optional[ChangeToken]:
+        """[start, end) 사용 처리 - 겹치는 빈 시간대를 분할/제거"""
+        s, e = _to_minutes(start), _to_minutes(end)
+        if e <= s:
+            return None
+        lo = bisect_right(self._ends, s)
+        hi = bisect_left(self._starts, e)
+        if lo >= hi:
+            return None
+
+        new_starts, new_ends = [], []
+        if self._starts[lo] < s:
+            new_starts.append(self._starts[lo])
+            new_ends.append(s)
+        if self._ends[hi - 1] > e:
+            new_starts.append(e)
+            new_ends.append(self._ends[hi - 1])
+        return self._replace(lo, hi, new_starts, new_ends)
+
+    def release(self, start: timedelta, end: timedelta) -> Optional[ChangeToken]:
+        """[start, end) 반환 - 겹치거나 맞닿은 빈 시간대와 병합"""
+        s, e = _to_minutes(start), _to_minutes(end)
+        if e <= s:
+            return None
+        lo = bisect_left(self._ends, s)
+        hi = bisect_right(self._starts, e)
+        if lo < hi:
+            s = min(s, self._starts[lo])
+            e = max(e, self._ends[hi - 1])
+        return self._replace(lo, hi, [s], [e])
+
+    def restore(self, token: ChangeToken) -> None:
+        """reserve/release 토큰으로 변경 이전 상태 복원"""
+        lo, old_starts, old_ends, count = token
+        self._starts[lo:lo + count] = old_starts
+        self._ends[lo:lo + count] = old_ends
+
+    def _replace(
+        self,
+        lo: int,
+        hi: int,
+        new_starts: List[int],
+        new_ends: List[int]
+    ) -> ChangeToken:
+        """[lo, hi) 구간 교체 후 되돌리기 토큰 반환"""
+        token = (lo, self._starts[lo:hi], self._ends[lo:hi], len(new_starts))
+        self._starts[lo:hi] = new_starts
+        self._ends[lo:hi] = new_ends
+        return token
+
+    def intervals(self) -> List[Tuple[timedelta, timedelta]]:
+        """빈 시간대 목록 (timedelta)"""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Tuple[timedelta, timedelta]]:
+        for s, e in zip(self._starts, self._ends):
+            yield (timedelta(minutes=s), timedelta(minutes=e))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"RoomAvailability({self.intervals()})"
@@ -0,0 +1,85 @@
+"""
+Level 2 방 캘린더 (이벤트 기반 배치)
+
+방별 다음 사용 가능 시각을 min-heap으로 관리한다.
+- find: 선행 활동 제약(earliest)을 만족하는 가장 이른 5분 단위 시작 시각과 방
+  (같은 시각에 여러 방이 비어 있으면 선호 방 → 설정 순서)
+- book: 배치 확정 후 해당 방의 다음 사용 가능 시각 갱신
+heap 항목은 갱신시 새로 넣고, 오래된 항목은 꺼낼 때 버린다 (lazy deletion).
+"""
+import heapq
+from datetime import timedelta
+from typing import Collection, Dict, List, Optional, Sequence, Tuple
+
+from .types import Room
+
+
+def _to_minutes(td: timedelta) -> int:
+    return int(td.total_seconds() // 60)
+
+
+class RoomCalendar:
+    """방별 다음 사용 가능 시각 heap"""
+
+    def __init__(
+        self,
+        rooms: Sequence[Room],
+        day_start: timedelta,
+        day_end: timedelta,
+        next_free: Optional[Dict[str, timedelta]] = None,
+        slot_minutes: int = 5
+    ):
+        self.rooms = {room.name: room for room in rooms}
+        self.day_start = _to_minutes(day_start)
+        self.day_end = _to_minutes(day_end)
+        self.slot_minutes = slot_minutes
+        # 여러 활동이 같은 방을 쓰는 경우를 위해 외부 dict 공유 가능
+        self.next_free = next_free if next_free is not None else {}
+
+        self._order = {room.name: i for i, room in enumerate(rooms)}
+        self._heap: List[Tuple[int, int, str]] = []
+        for room in rooms:
+            free_at = _to_minutes(self.next_free.get(room.name, day_start))
+            heapq.heappush(self._heap, (free_at, self._order[room.name], room.name))
+
+    def _current(self, name: str) -> int:
+        return _to_minutes(self.next_free.get(name, timedelta(minutes=self.day_start)))
+
+    def _ceil_to_slot(self, minutes: int) -> int:
+        return -(-minutes // self.slot_minutes) * self.slot_minutes
+
+    def find(
+        self,
+        duration: timedelta,
+        earliest: timedelta,
+        preferred: Collection[str] = ()
+    ) -> Optional[Tuple[Room, timedelta]]:
+        """earliest 이후 duration을 배치할 수 있는 가장 이른 (방, 시작 시각)"""
+        # 오래된 항목 제거
+        while self._heap and self._heap[0][0] != self._current(self._heap[0][2]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+
+        target = self._ceil_to_slot(max(_to_minutes(earliest), self.day_start, self._heap[0][0]))
+        if target + _to_minutes(duration) > self.day_end:
+            return None
+
+        # target까지 비는 방들 중 선호 방 → 설정 순서
+        ready = []
+        while self._heap and self._heap[0][0] <= target:
+            entry = heapq.heappop(self._heap)
+            if entry[0] == self._current(entry[2]):
+                ready.append(entry)
+        best = min(ready, key=lambda entry: (entry[2] not in preferred, entry[1]))
+        for entry in ready:
+            heapq.heappush(self._heap, entry)
+
+        return self.rooms[best[2]], timedelta(minutes=target)
+
+    def book(self, room_name: str, start: timedelta, end: timedelta) -> None:
+        """배치 확정 - 방의 다음 사용 가능 시각을 end로 갱신"""
+        if end <= self.next_free.get(room_name, timedelta(minutes=self.day_start)):
+            return
+        self.next_free[room_name] = end
+        heapq.heappush(self._heap, (_to_minutes(end), self._order[room_name], room_name))
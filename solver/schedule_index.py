@@ -0,0 +1,328 @@
+"""
+Level 4 작업 스케줄 인덱스
+
+그룹 이동 후보를 빠르게 평가/적용하기 위해 스케줄을 한 번 색인한다.
+- 그룹 id → 스케줄 위치 (batched 항목만)
+- 방별 / 지원자별 시작 시각 정렬 구간 목록 (bisect로 O(log n) 겹침 확인)
+- 변경 검사: 운영시간, 방 겹침(parallel 활동은 수용인원까지), 지원자 겹침,
+  선후행 간격(연속배치 포함)
+변경(위치 → 새 방/시각)을 적용하면 바뀐 항목만 인덱스에서 빼고 다시 넣는다.
+"""
+import bisect
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .compiled_config import CompiledDateConfig
+from .types import ActivityMode, ScheduleItem
+
+
+# 항목의 새 배치: (방, 시작, 종료)
+Placement = Tuple[str, timedelta, timedelta]
+
+
+class IntervalIndex:
+    """시작 시각 정렬 [start, end) 구간 목록 (구간마다 소유자 키)"""
+
+    __slots__ = ('_starts', '_items', '_max_length')
+
+    def __init__(self):
+        self._starts: List[timedelta] = []
+        self._items: List[Tuple[timedelta, timedelta, Hashable]] = []
+        self._max_length = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, start: timedelta, end: timedelta, owner: Hashable) -> None:
+        pos = bisect.bisect_right(self._starts, start)
+        self._starts.insert(pos, start)
+        self._items.insert(pos, (start, end, owner))
+        self._max_length = max(self._max_length, end - start)
+
+    def remove(self, start: timedelta, end: timedelta, owner: Hashable) -> None:
+        pos = bisect.bisect_left(self._starts, start)
+        while pos < len(self._items) and self._starts[pos] == start:
+            if self._items[pos] == (start, end, owner):
+                del self._starts[pos]
+                del self._items[pos]
+                return
+            pos += 1
+        raise KeyError((start, end, owner))
+
+    def overlapping(
+        self,
+        start: timedelta,
+        end: timedelta,
+        ignore: Iterable[Hashable] = ()
+    ) -> List[Tuple[timedelta, timedelta, Hashable]]:
+        """[start, end)와 겹치는 구간 (ignore 소유자 제외)"""
+        found = []
+        pos = bisect.bisect_left(self._starts, end) - 1
+        # 시작이 start - 최대길이 이전인 구간은 start까지 닿을 수 없음
+        lower = start - self._max_length
+        while pos >= 0 and self._starts[pos] >= lower:
+            item = self._items[pos]
+            if item[1] > start and item[2] not in ignore:
+                found.append(item)
+            pos -= 1
+        return found
+
+
+class ScheduleIndex:
+    """Level 4 이동 평가/적용용 스케줄 인덱스"""
+
+    def __init__(
+        self,
+        schedule: List[ScheduleItem],
+        compiled: CompiledDateConfig,
+        operating_hours: Tuple[timedelta, timedelta]
+    ):
+        self.items: List[ScheduleItem] = list(schedule)
+        self.compiled = compiled
+        self.operating_hours = operating_hours
+
+        self.group_positions: Dict[str, List[int]] = defaultdict(list)
+        self.by_room: Dict[str, IntervalIndex] = defaultdict(IntervalIndex)
+        self.by_applicant: Dict[str, IntervalIndex] = defaultdict(IntervalIndex)
+        self._activity_position: Dict[Tuple[str, str], int] = {}
+        # 같은 batched 블록을 공유하는 항목 수 (방 구간은 블록당 하나)
+        self._room_refs: Dict[Tuple, int] = defaultdict(int)
+
+        for pos, item in enumerate(self.items):
+            if item.group_id and compiled.is_batched(item.activity_name):
+                self.group_positions[item.group_id].append(pos)
+            self._index_item(pos)
+
+    # ---- 색인 ----
+    def _room_owner(self, pos: int) -> Hashable:
+        """방 구간 소유자 - batched 그룹은 (그룹, 활동) 하나로 묶음"""
+        item = self.items[pos]
+        if item.group_id and self.compiled.is_batched(item.activity_name):
+            return (item.group_id, item.activity_name)
+        return pos
+
+    def _index_item(self, pos: int) -> None:
+        item = self.items[pos]
+        key = (item.room_name, item.start_time, item.end_time, self._room_owner(pos))
+        self._room_refs[key] += 1
+        if self._room_refs[key] == 1:
+            self.by_room[item.room_name].add(item.start_time, item.end_time, key[3])
+        self.by_applicant[item.applicant_id].add(item.start_time, item.end_time, pos)
+        self._activity_position[(item.applicant_id, item.activity_name)] = pos
+
+    def _unindex_item(self, pos: int) -> None:
+        item = self.items[pos]
+        key = (item.room_name, item.start_time, item.end_time, self._room_owner(pos))
+        self._room_refs[key] -= 1
+        if self._room_refs[key] == 0:
+            del self._room_refs[key]
+            self.by_room[item.room_name].remove(item.start_time, item.end_time, key[3])
+        self.by_applicant[item.applicant_id].remove(item.start_time, item.end_time, pos)
+
+    # ---- 조회 ----
+    def group_ids(self) -> List[str]:
+        return list(self.group_positions)
+
+    def group_items(self, group_id: str) -> List[ScheduleItem]:
+        return [self.items[pos] for pos in self.group_positions.get(group_id, ())]
+
+    def group_members(self, group_id: str) -> Set[str]:
+        return {item.applicant_id for item in self.group_items(group_id)}
+
+    def shift_changes(self, group_id: str, delta: timedelta) -> Dict[int, Placement]:
+        """그룹 전체를 delta만큼 옮기는 변경"""
+        return {
+            pos: (self.items[pos].room_name, self.items[pos].start_time + delta, self.items[pos].end_time + delta)
+            for pos in self.group_positions.get(group_id, ())
+        }
+
+    def check_changes(self, changes: Dict[int, Placement]) -> List[str]:
+        """
+        위치별 새 (방, 시작, 종료)를 적용할 때의 위반 사항 (비어 있으면 적용 가능)
+        batched 그룹 블록은 구성원 항목을 모두 함께 바꿔야 한다.
+        """
+        conflicts = []
+        day_start, day_end = self.operating_hours
+        changed = set(changes)
+        moving_owners = {self._room_owner(pos) for pos in changes}
+
+        # 방: 새 블록(소유자 단위)이 남은 블록/다른 새 블록과 겹치는지
+        new_blocks: Dict[Tuple, int] = {}
+        for pos, (room_name, start, end) in changes.items():
+            if start < day_start or end > day_end:
+                conflicts.append(f"{self.items[pos].activity_name} 운영시간 초과")
+                continue
+            new_blocks.setdefault((room_name, start, end, self._room_owner(pos)), pos)
+        for (room_name, start, end, owner), pos in new_blocks.items():
+            others = self.by_room[room_name].overlapping(start, end, ignore=moving_owners)
+            others += [
+                (o_start, o_end, o_owner)
+                for (o_room, o_start, o_end, o_owner) in new_blocks
+                if o_room == room_name and o_owner != owner and o_start < end and o_end > start
+            ]
+            if others and not self._fits_room(pos, room_name, start, end, others):
+                conflicts.append(f"{room_name} {start} 방 중복")
+
+        # 지원자: 바뀌지 않은 일정/다른 새 일정과 겹침 + 선후행 간격
+        new_by_applicant: Dict[str, List[Placement]] = defaultdict(list)
+        for pos, (_, start, end) in changes.items():
+            applicant_id = self.items[pos].applicant_id
+            if self.by_applicant[applicant_id].overlapping(start, end, ignore=changed):
+                conflicts.append(f"{applicant_id} {self.items[pos].activity_name} 일정 중복")
+            if any(o_start < end and o_end > start for _, o_start, o_end in new_by_applicant[applicant_id]):
+                conflicts.append(f"{applicant_id} {self.items[pos].activity_name} 일정 중복")
+            new_by_applicant[applicant_id].append(changes[pos])
+            conflicts.extend(self._precedence_conflicts(self.items[pos], start, end, changes))
+        return conflicts
+
+    def _fits_room(
+        self,
+        pos: int,
+        room_name: str,
+        start: timedelta,
+        end: timedelta,
+        others: List[Tuple[timedelta, timedelta, Hashable]]
+    ) -> bool:
+        """
+        겹치는 구간이 있을 때: 같은 parallel 활동이 같은 시각에 시작하고
+        방 수용인원 안이면 허용 (Level 3와 같은 세션 단위 공유)
+        """
+        activity = self.compiled.activity(self.items[pos].activity_name)
+        room = self.compiled.room(room_name)
+        if activity is None or room is None or activity.mode != ActivityMode.PARALLEL:
+            return False
+        for o_start, o_end, owner in others:
+            if not isinstance(owner, int) or self.items[owner].activity_name != activity.name:
+                return False
+            if (o_start, o_end) != (start, end):
+                return False
+        return len(others) + 1 <= room.capacity
+
+    def move_conflicts(self, group_id: str, delta: timedelta) -> List[str]:
+        """그룹 전체를 delta만큼 옮길 때 위반 사항 (비어 있으면 이동 가능)"""
+        if not self.group_positions.get(group_id):
+            return [f"그룹 {group_id} 없음"]
+        return self.check_changes(self.shift_changes(group_id, delta))
+
+    def can_move(self, group_id: str, delta: timedelta) -> bool:
+        return not self.move_conflicts(group_id, delta)
+
+    def _precedence_conflicts(
+        self,
+        item: ScheduleItem,
+        new_start: timedelta,
+        new_end: timedelta,
+        changes: Dict[int, Placement]
+    ) -> List[str]:
+        conflicts = []
+        for predecessor, gap, adjacent in self.compiled.predecessors_of(item.activity_name):
+            other = self._placed(item.applicant_id, predecessor, changes)
+            if other is None:
+                continue
+            actual = int((new_start - other[1]).total_seconds() // 60)
+            if actual < gap or (adjacent and actual != gap):
+                conflicts.append(f"{item.applicant_id}: {predecessor}→{item.activity_name}")
+        for successor, gap, adjacent in self.compiled.successors_of(item.activity_name):
+            other = self._placed(item.applicant_id, successor, changes)
+            if other is None:
+                continue
+            actual = int((other[0] - new_end).total_seconds() // 60)
+            if actual < gap or (adjacent and actual != gap):
+                conflicts.append(f"{item.applicant_id}: {item.activity_name}→{successor}")
+        return conflicts
+
+    def _placed(
+        self,
+        applicant_id: str,
+        activity_name: str,
+        changes: Dict[int, Placement]
+    ) -> Optional[Tuple[timedelta, timedelta]]:
+        """지원자 활동 시간 (변경 대상이면 변경 후 시간)"""
+        pos = self._activity_position.get((applicant_id, activity_name))
+        if pos is None:
+            return None
+        if pos in changes:
+            return changes[pos][1], changes[pos][2]
+        item = self.items[pos]
+        return item.start_time, item.end_time
+
+    def stay_span(self, applicant_id: str, changes: Dict[int, Placement] = None) -> timedelta:
+        """지원자 체류시간 (changes가 있으면 변경 후 기준)"""
+        changes = changes or {}
+        starts, ends = [], []
+        for start, end, pos in self.by_applicant.get(applicant_id, ()):
+            if pos in changes:
+                start, end = changes[pos][1], changes[pos][2]
+            starts.append(start)
+            ends.append(end)
+        if not starts:
+            return timedelta(0)
+        return max(ends) - min(starts)
+
+    def stay_delta(self, changes: Dict[int, Placement]) -> timedelta:
+        """변경 적용시 관련 지원자(더미 제외) 체류시간 합의 증감 (음수 = 감소)"""
+        affected = {self.items[pos].applicant_id for pos in changes}
+        delta = timedelta(0)
+        for applicant_id in affected:
+            if applicant_id.upper().startswith('DUMMY'):
+                continue
+            delta += self.stay_span(applicant_id, changes) - self.stay_span(applicant_id)
+        return delta
+
+    def stay_improvement_hours(self, group_id: str, delta: timedelta) -> float:
+        """그룹 이동시 구성원(더미 제외) 체류시간 감소 합 (시간)"""
+        return -self.stay_delta(self.shift_changes(group_id, delta)).total_seconds() / 3600
+
+    def total_stay(self) -> timedelta:
+        """전체 지원자(더미 제외) 체류시간 합"""
+        return sum(
+            (self.stay_span(applicant_id) for applicant_id in self.by_applicant
+             if not applicant_id.upper().startswith('DUMMY')),
+            timedelta(0)
+        )
+
+    # ---- 적용 ----
+    def apply_changes(self, changes: Dict[int, Placement]) -> None:
+        """위치별 새 (방, 시작, 종료)로 항목을 바꾸고 인덱스 갱신"""
+        for pos in changes:
+            self._unindex_item(pos)
+        for pos, (room_name, start, end) in changes.items():
+            item = self.items[pos]
+            self.items[pos] = ScheduleItem(
+                applicant_id=item.applicant_id,
+                job_code=item.job_code,
+                activity_name=item.activity_name,
+                room_name=room_name,
+                start_time=start,
+                end_time=end,
+                group_id=self._group_id_after(item, room_name, start, end)
+            )
+            self._index_item(pos)
+
+    def _group_id_after(self, item: ScheduleItem, room_name: str, start: timedelta, end: timedelta) -> Optional[str]:
+        """
+        parallel 세션 id: 같은 방/시각 세션이 있으면 그 id를 쓰고, 없으면 Level 3 규칙
+        (활동 + 시작 시각) - 다른 방에서 이미 쓰는 id면 방 이름을 붙인다
+        """
+        prefix = f"group_{item.activity_name}_"
+        if not (item.group_id and item.group_id.startswith(prefix)):
+            return item.group_id
+        session_ids = {}
+        for room in self.compiled.rooms_for(item.activity_name):
+            for o_start, o_end, owner in self.by_room[room.name].overlapping(start, end):
+                if isinstance(owner, int) and (o_start, o_end) == (start, end):
+                    session_ids[room.name] = self.items[owner].group_id
+        if room_name in session_ids:
+            return session_ids[room_name]
+        group_id = f"{prefix}{start.total_seconds()}"
+        if group_id in session_ids.values():
+            group_id = f"{group_id}_{room_name}"
+        return group_id
+
+    def apply_move(self, group_id: str, delta: timedelta) -> None:
+        """그룹 항목을 delta만큼 이동하고 인덱스 갱신"""
+        self.apply_changes(self.shift_changes(group_id, delta))
@@ -3,18 +3,54 @@
 """
 import time as time_module
 import logging
+import multiprocessing
+import os
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from typing import Optional, Dict, List, Any, Tuple, Set
 
 from .group_optimizer_v2 import GroupOptimizerV2
 from .batched_scheduler import BatchedScheduler
 from .individual_scheduler import IndividualScheduler
 from .level4_post_processor import Level4PostProcessor
+from .compiled_config import (
+    CompiledDateConfig, compile_date_config, config_fingerprint, warm_start_fingerprint
+)
+from .feasibility import FeasibilityChecker
+from .deadline import Deadline
 from .types import (
     DateConfig, SingleDateResult, Level1Result, Level2Result, 
     Level3Result, Level4Result, Applicant, Activity, ScheduleItem, Group, 
-    SchedulingContext, TimeSlot, ActivityMode, ProgressInfo
+    SchedulingContext, TimeSlot, ActivityMode, ProgressInfo, IndividualScheduleResult,
+    stay_violations
 )
 
+# 웜 스타트 재배치의 Level 3 CP-SAT 제한시간: 이전 단계 소요시간의 일부 (최소값 보장)
+WARM_REPAIR_TIME_RATIO = 0.5
+WARM_REPAIR_MIN_TIME_SEC = 0.2
+
+
+# 백트래킹 프로세스 풀 워커의 중단 신호 (부모가 결과를 정하면 설정)
+_backtrack_stop = None
+
+
+def _init_backtrack_worker(stop_event) -> None:
+    global _backtrack_stop
+    _backtrack_stop = stop_event
+
+
+def _run_backtrack_attempt(args) -> Dict[str, Any]:
+    """
+    프로세스 풀 작업: 더미 힌트 하나로 Level 1 → 2 → 3 실행
+    부모의 마감 시각(wall clock)과 중단 신호를 워커 deadline으로 써서, 대기열에서 늦게 시작하거나
+    부모가 먼저 끝나도 레벨 사이에서 스스로 멈춘다.
+    """
+    config, context, dummy_hint, deadline_at = args
+    scheduler = SingleDateScheduler()
+    scheduler.context = context
+    scheduler._deadline = Deadline(max(0.0, deadline_at - time_module.time()), stop_event=_backtrack_stop)
+    return scheduler._attempt_dummy_hint(config, dummy_hint)
+
 
 class SingleDateScheduler:
     """단일 날짜에 대한 3단계 스케줄링을 수행하는 클래스"""
@@ -23,16 +59,32 @@ class SingleDateScheduler:
     LEVEL1_TIME_LIMIT = 30
     LEVEL2_TIME_LIMIT = 60  
     LEVEL3_TIME_LIMIT = 30
+    LEVEL2_CPSAT_TIME_LIMIT = 15  # Level 2 CP-SAT (백트래킹마다 반복 실행되므로 짧게)
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.progress_callback: Optional[ProgressCallback] = None
         self.context: Optional[SchedulingContext] = None
+        self._compiled: Optional[CompiledDateConfig] = None
+        self._compiled_source: Optional[Tuple[DateConfig, Optional[Level1Result]]] = None
+        self._level3_search_stats: Dict[str, Any] = {}
+        self._level1_infeasibility: Optional[str] = None
+        self._deadline: Optional[Deadline] = None
+        # 제한시간 초과시 반환할 부분 결과 (미배정이 가장 적은 Level 2/3 결과)
+        self._best_partial: Optional[Tuple[Level2Result, Optional[Level3Result]]] = None
+        # (설정 지문, 더미 힌트)별 레벨 결과 - 백트래킹에서 같은 구성을 다시 풀지 않음
+        self._level1_memo: Dict[Tuple[str, int], Tuple[Optional[Level1Result], Optional[str]]] = {}
+        self._level2_memo: Dict[Tuple[str, int], Optional[Level2Result]] = {}
+        self._level3_memo: Dict[Tuple[str, int], Optional[Level3Result]] = {}
+        self._fingerprint: Optional[Tuple[DateConfig, str]] = None
+        self._started_at: float = 0.0  # schedule() 시작 시각 (총 소요시간 보고용)
         
     def schedule(
         self, 
         config: DateConfig, 
-        context: Optional[SchedulingContext] = None
+        context: Optional[SchedulingContext] = None,
+        deadline: Optional[Deadline] = None,
+        warm_start: Optional[SingleDateResult] = None
     ) -> SingleDateResult:
         """
         3단계 계층적 스케줄링 실행
@@ -40,17 +92,38 @@ class SingleDateScheduler:
         Level 1: 그룹 구성 최적화
         Level 2: Batched 활동 스케줄링
         Level 3: Individual/Parallel 활동 스케줄링
+        
+        모든 레벨과 백트래킹은 하나의 deadline(기본: context.time_limit_sec)을 공유하고,
+        시간이 다 되면 지금까지 가장 많이 배정된 부분 결과(PARTIAL)를 반환한다.
+        warm_start: 체류시간 제한만 다른 이전 결과 (있으면 그 배치에서 출발, _warm_start 참고)
         """
         self.context = context
         self.progress_callback = context.progress_callback if context else None
+        self._deadline = deadline or Deadline(
+            context.time_limit_sec if context and context.time_limit_sec else SchedulingContext.time_limit_sec
+        )
+        self._best_partial = None
+        self._level1_memo.clear()
+        self._level2_memo.clear()
+        self._level3_memo.clear()
         
         result = SingleDateResult(date=config.date, status="FAILED")
+        result.fingerprint = warm_start_fingerprint(config)
         result.logs.append(f"=== {config.date.date()} 스케줄링 시작 ===")
         
         # 전체 시작 시간
-        overall_start_time = time_module.time()
+        overall_start_time = self._started_at = time_module.time()
         
         try:
+            # 사전 검사: 하한을 위반하면 레벨을 실행하지 않고 바로 실패
+            if not self._precheck(config, result):
+                return result
+            
+            # 웜 스타트: 이전 결과의 Level 1/2를 재사용하고 제한을 넘는 지원자만 다시 배치
+            warm = self._warm_start(config, warm_start, result)
+            if warm is not None:
+                return self._complete(config, result, *warm, {})
+            
             # 진행 상황 초기화
             self._report_progress("Level1", 0.0, "그룹 구성 최적화 시작")
             
@@ -61,6 +134,8 @@ class SingleDateScheduler:
             
             if not level1_result:
                 result.error_message = "Level 1 실패: 그룹 구성 불가"
+                if self._level1_infeasibility:
+                    result.error_message += f" ({self._level1_infeasibility})"
                 result.logs.append(f"Level 1 실패 ({level1_time:.1f}초)")
                 self._report_progress("Level1", 1.0, "그룹 구성 실패", {"error": result.error_message})
                 return result
@@ -77,10 +152,13 @@ class SingleDateScheduler:
                 "time": level1_time
             })
             
+            if self._deadline.expired():
+                return self._timed_out(result, "Level 1 이후")
+            
             # Level 2: Batched 스케줄링
             self._report_progress("Level2", 0.0, "Batched 활동 스케줄링 시작")
             level2_start = time_module.time()
-            level2_result = self._run_level2(config, level1_result)
+            level2_result = self._run_level2(config, level1_result, dummy_hint=0)
             level2_time = time_module.time() - level2_start
             
             if not level2_result:
@@ -101,89 +179,42 @@ class SingleDateScheduler:
                 "schedule_count": len(level2_result.schedule),
                 "time": level2_time
             })
+            self._remember_partial(level2_result, None)
+            if self._deadline.expired():
+                return self._timed_out(result, "Level 2 이후")
             
             # Level 3: Individual/Parallel 스케줄링
             self._report_progress("Level3", 0.0, "Individual/Parallel 활동 스케줄링 시작")
             level3_start = time_module.time()
-            level3_result = self._run_level3(config, level1_result, level2_result)
+            level3_result = self._run_level3(config, level1_result, level2_result, dummy_hint=0)
             level3_time = time_module.time() - level3_start
             
             if not level3_result or level3_result.unscheduled:
                 # Level 3 실패시 백트래킹
+                self._remember_partial(level2_result, level3_result)
                 unscheduled_count = len(level3_result.unscheduled) if level3_result else "전체"
                 result.error_message = f"Level 3 실패: {unscheduled_count}명 스케줄링 불가"
                 result.logs.append(f"Level 3 실패 ({level3_time:.1f}초) - 백트래킹 필요")
                 self._report_progress("Level3", 1.0, "Individual 스케줄링 실패 - 백트래킹 시작", {
-                    "unscheduled": unscheduled_count
+                    "unscheduled": unscheduled_count,
+                    "search": self._level3_search_stats
                 })
                 return self._backtrack_from_level3(config, result)
             
-            result.level3_result = level3_result
             result.logs.append(
                 f"Level 3 완료 ({level3_time:.1f}초): "
                 f"{len(level3_result.schedule)}개 스케줄 항목"
             )
             self._report_progress("Level3", 1.0, "Individual 스케줄링 완료", {
                 "schedule_count": len(level3_result.schedule),
-                "time": level3_time
+                "time": level3_time,
+                "search": self._level3_search_stats
             })
             
-            # Level 4: 후처리 조정
-            self._report_progress("Level4", 0.0, "후처리 조정 시작")
-            level4_start = time_module.time()
-            
-            # 전체 스케줄 통합 (Level 2 + Level 3)
-            all_schedule = []
-            all_schedule.extend(level2_result.schedule)
-            all_schedule.extend(level3_result.schedule)
-            
-            # Level 4 후처리 조정 실행
-            level4_result = self._run_level4(config, all_schedule)
-            level4_time = time_module.time() - level4_start
-            
-            if not level4_result or not level4_result.success:
-                # Level 4 실패해도 기본 스케줄은 유지
-                result.logs.append(f"Level 4 후처리 조정 실패 ({level4_time:.1f}초) - 기본 스케줄 유지")
-                self._report_progress("Level4", 1.0, "후처리 조정 실패 - 기본 스케줄 유지", {
-                    "error": "후처리 조정 실패"
-                })
-                # 기본 스케줄 사용
-                result.schedule = all_schedule
-                result.level4_result = level4_result
-            else:
-                # Level 4 성공 - 최적화된 스케줄 사용
-                result.logs.append(
-                    f"Level 4 완료 ({level4_time:.1f}초): "
-                    f"{level4_result.total_improvement_hours:.1f}시간 개선"
-                )
-                self._report_progress("Level4", 1.0, "후처리 조정 완료", {
-                    "improvement_hours": level4_result.total_improvement_hours,
-                    "adjusted_groups": level4_result.adjusted_groups,
-                    "time": level4_time
-                })
-                # 최적화된 스케줄 사용
-                result.schedule = level4_result.optimized_schedule
-                result.level4_result = level4_result
-            
-            result.status = "SUCCESS"
-            result.error_message = None
-            
-            total_time = time_module.time() - overall_start_time
-            result.logs.append(f"=== 스케줄링 성공 (총 {total_time:.1f}초) ===")
-            
-            # 최종 완료 보고
-            improvement_info = ""
-            if level4_result and level4_result.success:
-                improvement_info = f" (체류시간 {level4_result.total_improvement_hours:.1f}시간 개선)"
-                
-            self._report_progress("Complete", 1.0, f"스케줄링 성공{improvement_info}", {
-                "total_time": total_time,
+            return self._complete(config, result, level1_result, level2_result, level3_result, {
                 "level1_time": level1_time,
-                "level2_time": level2_time, 
-                "level3_time": level3_time,
-                "level4_time": level4_time,
-                "total_schedule": len(result.schedule),
-                "level4_improvement": level4_result.total_improvement_hours if level4_result else 0.0
+                "level2_time": level2_time,
+                "level3_time": level3_time
             })
             
         except Exception as e:
@@ -191,24 +222,237 @@ class SingleDateScheduler:
             result.logs.append(f"예외: {str(e)}")
             self.logger.exception("스케줄링 중 예외 발생")
             self._report_progress("Error", 1.0, f"예외 발생: {str(e)}")
+        finally:
+            # 백트래킹/시간초과/사전 검사 실패 등 모든 종료 경로의 실제 소요시간 (웜 스타트 예산 기준)
+            result.solve_time = time_module.time() - overall_start_time
+        
+        return result
+    
+    def _complete(
+        self,
+        config: DateConfig,
+        result: SingleDateResult,
+        level1_result: Level1Result,
+        level2_result: Level2Result,
+        level3_result: Level3Result,
+        timings: Dict[str, float]
+    ) -> SingleDateResult:
+        """
+        Level 1~3 결과로 Level 4 후처리 조정 후 성공 결과 완성 (timings: 레벨별 소요 시간)
+        본 경로와 백트래킹 성공 경로가 모두 여기서 끝난다.
+        """
+        result.level1_result = level1_result
+        result.level2_result = level2_result
+        result.level3_result = level3_result
+        
+        # Level 4: 후처리 조정
+        self._report_progress("Level4", 0.0, "후처리 조정 시작")
+        level4_start = time_module.time()
+        
+        # 전체 스케줄 통합 (Level 2 + Level 3)
+        all_schedule = []
+        all_schedule.extend(level2_result.schedule)
+        all_schedule.extend(level3_result.schedule)
+        
+        # Level 4 후처리 조정 실행 (제한시간이 지났으면 기본 스케줄 유지)
+        if self._deadline.expired():
+            result.logs.append("⏰ 제한시간 도달 - Level 4 생략")
+            level4_result = None
+        else:
+            level4_result = self._run_level4(config, all_schedule, level1_result)
+        level4_time = time_module.time() - level4_start
+        
+        if not level4_result or not level4_result.success:
+            # Level 4 실패해도 기본 스케줄은 유지
+            result.logs.append(f"Level 4 후처리 조정 실패 ({level4_time:.1f}초) - 기본 스케줄 유지")
+            self._report_progress("Level4", 1.0, "후처리 조정 실패 - 기본 스케줄 유지", {
+                "error": "후처리 조정 실패"
+            })
+            # 기본 스케줄 사용
+            result.schedule = all_schedule
+            result.level4_result = level4_result
+        else:
+            # Level 4 성공 - 최적화된 스케줄 사용
+            result.logs.append(
+                f"Level 4 완료 ({level4_time:.1f}초): "
+                f"{level4_result.total_improvement_hours:.1f}시간 개선"
+            )
+            self._report_progress("Level4", 1.0, "후처리 조정 완료", {
+                "improvement_hours": level4_result.total_improvement_hours,
+                "adjusted_groups": level4_result.adjusted_groups,
+                "time": level4_time
+            })
+            # 최적화된 스케줄 사용
+            result.schedule = level4_result.optimized_schedule
+            result.level4_result = level4_result
+        
+        result.status = "SUCCESS"
+        result.error_message = None
+        
+        total_time = time_module.time() - self._started_at
+        result.logs.append(f"=== 스케줄링 성공 (총 {total_time:.1f}초) ===")
+        
+        # 최종 완료 보고
+        improvement_info = ""
+        if level4_result and level4_result.success:
+            improvement_info = f" (체류시간 {level4_result.total_improvement_hours:.1f}시간 개선)"
+            
+        self._report_progress("Complete", 1.0, f"스케줄링 성공{improvement_info}", {
+            "total_time": total_time,
+            "level1_time": timings.get("level1_time", 0.0),
+            "level2_time": timings.get("level2_time", 0.0),
+            "level3_time": timings.get("level3_time", 0.0),
+            "level4_time": level4_time,
+            "total_schedule": len(result.schedule),
+            "level4_improvement": level4_result.total_improvement_hours if level4_result else 0.0
+        })
         
         return result
     
+    def _warm_start(
+        self,
+        config: DateConfig,
+        warm_start: Optional[SingleDateResult],
+        result: SingleDateResult
+    ) -> Optional[Tuple[Level1Result, Level2Result, Level3Result]]:
+        """
+        같은 설정(체류시간 제한 제외)의 이전 성공 결과에서 출발하는 Level 1~3 결과
+        1. Level 1 그룹과 이전 최종 스케줄(Level 4 조정 포함)의 Batched 배치를 그대로 사용
+        2. 새 제한을 넘는 지원자의 Individual/Parallel 활동만 다시 배치 (나머지 배정은 고정)
+        3. 안 되면 그 지원자들의 체류시간 창과 겹치는 배정까지 풀어서 다시 배치
+        재배치 CP-SAT은 이전 단계 소요시간의 일부로 제한해 처음부터 푸는 것보다 비싸지지 않게 한다.
+        Batched 배치부터 제한을 넘거나 재배치가 모두 실패하면 None - Level 1 그룹만 메모에 넣어
+        Level 2부터 처음처럼 진행한다.
+        """
+        if (warm_start is None or warm_start.status != "SUCCESS" or warm_start.level1_result is None
+                or warm_start.fingerprint != result.fingerprint):
+            return None
+        level1_result = warm_start.level1_result
+        self._level1_memo[self._memo_key(config, 0)] = (level1_result, None)
+        compiled = self._compiled_for(config, level1_result)
+        
+        level2_result = BatchedScheduler(self.logger).rebuild(
+            level1_result.groups, config, warm_start.schedule, compiled
+        )
+        max_stay = config.max_stay
+        if level2_result is None or (max_stay and stay_violations(level2_result.schedule, max_stay)):
+            result.logs.append("♻️ 웜 스타트: Batched 배치 재사용 불가 - Level 2부터 다시 배치")
+            return None
+        
+        individual_items = [item for item in warm_start.schedule if not compiled.is_batched(item.activity_name)]
+        affected = set(stay_violations(warm_start.schedule, max_stay)) if max_stay else set()
+        level3_result = Level3Result(schedule=individual_items)
+        repair_time = max(WARM_REPAIR_MIN_TIME_SEC, warm_start.solve_time * WARM_REPAIR_TIME_RATIO)
+        if affected:
+            # 초과자만 → 초과자의 체류시간 창과 겹치는 배정까지 넓혀 다시 배치
+            for applicant_ids in (affected, self._stay_neighbourhood(warm_start.schedule, affected, max_stay, compiled)):
+                level3_result = self._repair_level3(
+                    config, level1_result, level2_result, individual_items, applicant_ids, repair_time
+                )
+                if level3_result is not None:
+                    affected = applicant_ids
+                    break
+            else:
+                result.logs.append("♻️ 웜 스타트: Level 3 재배치 실패 - Level 2부터 다시 배치")
+                return None
+        
+        result.logs.append(
+            f"♻️ 웜 스타트: Level 1/2 재사용, {len(affected)}명 재배치"
+        )
+        return level1_result, level2_result, level3_result
+    
+    def _repair_level3(
+        self,
+        config: DateConfig,
+        level1_result: Level1Result,
+        level2_result: Level2Result,
+        individual_items: List[ScheduleItem],
+        applicant_ids: Set[str],
+        time_limit_sec: float
+    ) -> Optional[Level3Result]:
+        """applicant_ids의 Individual/Parallel 활동만 다시 배치 (나머지 배정의 방 시간대는 고정), 실패시 None"""
+        kept = [item for item in individual_items if item.applicant_id not in applicant_ids]
+        reserved_rooms: Dict[str, Set[Tuple]] = {}
+        for item in kept:
+            reserved_rooms.setdefault(item.room_name, set()).add((item.start_time, item.end_time))
+        repaired = self._run_level3(
+            config, level1_result, level2_result,
+            applicant_ids=applicant_ids,
+            reserved_rooms={room: sorted(blocks) for room, blocks in reserved_rooms.items()},
+            time_limit_sec=min(self._level3_time_limit(), time_limit_sec)
+        )
+        if repaired is None or repaired.unscheduled:
+            return None
+        return Level3Result(schedule=kept + repaired.schedule)
+    
+    @staticmethod
+    def _stay_neighbourhood(
+        schedule: List[ScheduleItem],
+        affected: Set[str],
+        max_stay,
+        compiled: CompiledDateConfig
+    ) -> Set[str]:
+        """초과자와, 초과자의 체류시간 창(Batched 블록 기준) 안에 Individual/Parallel 배정이 있는 지원자"""
+        windows = {}
+        for item in schedule:
+            if item.applicant_id in affected and compiled.is_batched(item.activity_name):
+                lo, hi = windows.get(item.applicant_id, (item.end_time - max_stay, item.start_time + max_stay))
+                windows[item.applicant_id] = (max(lo, item.end_time - max_stay), min(hi, item.start_time + max_stay))
+        neighbourhood = set(affected)
+        for item in schedule:
+            if compiled.is_batched(item.activity_name):
+                continue
+            if any(item.start_time < hi and item.end_time > lo for lo, hi in windows.values()):
+                neighbourhood.add(item.applicant_id)
+        return neighbourhood
+    
+    def _precheck(self, config: DateConfig, result: SingleDateResult) -> bool:
+        """하한 분석 사전 검사 (context.precheck), 통과하면 True / 위반 사유와 병목 후보는 result에 기록"""
+        if self.context and not self.context.precheck:
+            return True
+        report = FeasibilityChecker(logger=self.logger).check(config)
+        result.feasibility = report
+        if not report.feasible:
+            result.error_message = "사전 검사 실패: " + "; ".join(report.violations)
+            result.logs.append(f"사전 검사 실패 ({report.elapsed_ms}ms): {report.violations}")
+            self._report_progress("Precheck", 1.0, "사전 검사 실패", {"violations": report.violations})
+            return False
+        for bottleneck in report.bottlenecks:
+            result.logs.append(
+                f"병목 후보: {bottleneck['resource']} {bottleneck['demand']}/"
+                f"{bottleneck['capacity']}{bottleneck['unit']} (사용률 {bottleneck['utilization']:.0%})"
+            )
+        return True
+    
+    def _memo_key(self, config: DateConfig, dummy_hint: int) -> Tuple[str, int]:
+        """레벨 결과 메모 키 (설정 지문은 같은 config 객체면 재사용)"""
+        if self._fingerprint is None or self._fingerprint[0] is not config:
+            self._fingerprint = (config, config_fingerprint(config))
+        return self._fingerprint[1], dummy_hint
+    
     def _run_level1(self, config: DateConfig, dummy_hint: int = 0) -> Optional[Level1Result]:
-        """Level 1: 그룹 구성 최적화"""
+        """Level 1: 그룹 구성 최적화 (같은 설정 지문/더미 힌트면 메모된 결과)"""
+        key = self._memo_key(config, dummy_hint)
+        if key in self._level1_memo:
+            result, self._level1_infeasibility = self._level1_memo[key]
+            return result
         try:
             optimizer = GroupOptimizerV2(self.logger)
             
             # 지원자 생성
             applicants = self._create_applicants(config)
             
-            # 그룹 최적화 (dummy_hint 전달)
+            # 그룹 최적화 (dummy_hint 전달, 방 × 슬롯 수로 배치 가능 여부 사전 확인)
             result = optimizer.optimize(
                 applicants=applicants,
                 activities=config.activities,
-                time_limit=self.LEVEL1_TIME_LIMIT,
-                dummy_hint=dummy_hint
+                time_limit=self._level_time_limit("level1", self.LEVEL1_TIME_LIMIT),
+                dummy_hint=dummy_hint,
+                compiled=self._compiled_for(config),
+                operating_hours=config.operating_hours
             )
+            self._level1_infeasibility = optimizer.last_infeasibility
+            self._level1_memo[key] = (result, self._level1_infeasibility)
             
             return result
             
@@ -219,18 +463,53 @@ class SingleDateScheduler:
     def _run_level2(
         self, 
         config: DateConfig, 
-        level1_result: Level1Result
+        level1_result: Level1Result,
+        dummy_hint: Optional[int] = None
     ) -> Optional[Level2Result]:
-        """Level 2: Batched 활동 스케줄링"""
+        """
+        Level 2: Batched 활동 스케줄링 (SchedulingContext.level2_engine에 따라 CP-SAT 사용)
+        dummy_hint를 주면 level1_result가 그 힌트의 Level 1 결과라고 보고 결과를 메모한다.
+        """
+        if dummy_hint is not None:
+            key = self._memo_key(config, dummy_hint)
+            if key not in self._level2_memo:
+                self._level2_memo[key] = self._run_level2(config, level1_result)
+            return self._level2_memo[key]
         try:
             scheduler = BatchedScheduler(self.logger)
+            compiled = self._compiled_for(config, level1_result)
+            engine = self.context.level2_engine if self.context else "greedy"
+            time_limit = self._level2_time_limit()
             
+            greedy_start = time_module.time()
             result = scheduler.schedule(
                 groups=level1_result.groups,
                 config=config,
-                time_limit=self.LEVEL2_TIME_LIMIT
+                time_limit=time_limit,
+                compiled=compiled
             )
             
+            # cpsat: greedy 결과를 hint로 개선 / auto: greedy 실패시에만 CP-SAT
+            if engine == "cpsat" or (engine == "auto" and result is None):
+                cpsat_result = scheduler.schedule_cpsat(
+                    groups=level1_result.groups,
+                    config=config,
+                    time_limit=min(
+                        time_limit - (time_module.time() - greedy_start),
+                        self.LEVEL2_CPSAT_TIME_LIMIT
+                    ),
+                    compiled=compiled,
+                    hint=scheduler.greedy_placements
+                )
+                if cpsat_result is not None:
+                    return cpsat_result
+                if scheduler.last_cpsat_status == "INFEASIBLE":
+                    if result is None:
+                        self.logger.warning("Level 2 CP-SAT: 현재 그룹 구성으로는 배치 불가능 (증명됨)")
+                        return None
+                    # greedy가 이미 유효한 배치를 찾았으면 그대로 사용
+                    self.logger.warning("Level 2 CP-SAT 불가능 판정 - greedy 배치 사용")
+            
             return result
             
         except Exception as e:
@@ -241,9 +520,24 @@ class SingleDateScheduler:
         self,
         config: DateConfig,
         level1_result: Level1Result,
-        level2_result: Level2Result
+        level2_result: Level2Result,
+        portfolio_seed: Optional[int] = None,
+        dummy_hint: Optional[int] = None,
+        applicant_ids: Optional[Set[str]] = None,
+        reserved_rooms: Optional[Dict[str, List[Tuple]]] = None,
+        time_limit_sec: Optional[float] = None
     ) -> Optional[Level3Result]:
-        """Level 3: Individual/Parallel 활동 스케줄링"""
+        """
+        Level 3: Individual/Parallel 활동 스케줄링 (portfolio_seed 지정시 포트폴리오 방식)
+        기본 방식에 dummy_hint를 주면 Level 2와 같은 키로 결과를 메모한다.
+        applicant_ids/reserved_rooms: 일부 지원자만 다시 배치 (방별 나머지 배정 시간대는 고정)
+        time_limit_sec: CP-SAT 제한시간 (기본: 남은 deadline 기준)
+        """
+        if dummy_hint is not None and portfolio_seed is None:
+            key = self._memo_key(config, dummy_hint)
+            if key not in self._level3_memo:
+                self._level3_memo[key] = self._run_level3(config, level1_result, level2_result)
+            return self._level3_memo[key]
         try:
             # Individual/Parallel 활동이 있는지 확인
             individual_activities = [
@@ -258,10 +552,13 @@ class SingleDateScheduler:
                 level3_result.unscheduled = []  # 빈 리스트로 설정
                 return level3_result
             
-            scheduler = IndividualScheduler()
+            scheduler = self._create_individual_scheduler()
+            compiled = self._compiled_for(config, level1_result)
             
             # Level 1 결과에서 모든 지원자 가져오기 (더미 포함)
             all_applicants = level1_result.applicants
+            if applicant_ids is not None:
+                all_applicants = [a for a in all_applicants if a.id in applicant_ids]
             
             # Batched 스케줄 결과를 GroupScheduleResult 형태로 변환
             batched_results = []
@@ -269,7 +566,7 @@ class SingleDateScheduler:
                 batched_results = level2_result.group_results
             
             # Individual 스케줄링 실행
-            result = scheduler.schedule_individuals(
+            level3_kwargs = dict(
                 applicants=all_applicants,
                 activities=config.activities,
                 rooms=config.rooms,
@@ -278,69 +575,105 @@ class SingleDateScheduler:
                 end_time=config.operating_hours[1],
                 date_str=config.date.strftime('%Y-%m-%d'),
                 precedence_rules=config.precedence_rules,
-                global_gap_min=config.global_gap_min
+                global_gap_min=config.global_gap_min,
+                time_limit_sec=time_limit_sec if time_limit_sec is not None else self._level3_time_limit(),
+                compiled=compiled,
+                max_stay_hours=config.max_stay_hours
             )
+            if reserved_rooms is not None:
+                level3_kwargs["reserved_rooms"] = reserved_rooms
+            if portfolio_seed is None:
+                result = scheduler.schedule_individuals(**level3_kwargs)
+            else:
+                result = scheduler.schedule_portfolio(
+                    n_variants=self._level3_portfolio_size(),
+                    seed=portfolio_seed,
+                    max_workers=self._level3_portfolio_workers(),
+                    **level3_kwargs
+                )
+            
+            self._level3_search_stats = dict(scheduler.search_stats)
             
             if not result:
                 return None
                 
-            # IndividualScheduleResult를 Level3Result로 변환
-            level3_result = Level3Result()
-            
-            # 스케줄 항목 생성
-            for applicant_id, time_slots in result.schedule_by_applicant.items():
-                for slot in time_slots:
-                    # 지원자의 job_code 찾기
-                    job_code = None
-                    for applicant in all_applicants:
-                        if applicant.id == applicant_id:
-                            job_code = applicant.job_code
-                            break
-                    
-                    schedule_item = ScheduleItem(
-                        applicant_id=applicant_id,
-                        job_code=job_code or "UNKNOWN",
-                        activity_name=slot.activity_name,
-                        room_name=slot.room_name,
-                        start_time=slot.start_time,
-                        end_time=slot.end_time,
-                        group_id=slot.group_id
-                    )
-                    level3_result.schedule.append(schedule_item)
-            
-            # 스케줄되지 않은 지원자 찾기 (Individual/Parallel 활동 대상자만)
-            # Individual/Parallel 활동을 수행해야 하는 지원자들만 체크
-            target_applicants = set()
-            for applicant in all_applicants:
-                if not applicant.is_dummy:
-                    for activity in individual_activities:
-                        if activity.name in applicant.required_activities:
-                            target_applicants.add(applicant.id)
-            
-            scheduled_ids = set(result.schedule_by_applicant.keys())
-            level3_result.unscheduled = list(target_applicants - scheduled_ids)
-            
-            return level3_result
+            return self._to_level3_result(result, all_applicants, individual_activities, compiled)
             
         except Exception as e:
             self.logger.error(f"Level 3 오류: {str(e)}")
             return None
     
+    def _to_level3_result(
+        self,
+        result: IndividualScheduleResult,
+        all_applicants: List[Applicant],
+        individual_activities: List[Activity],
+        compiled: CompiledDateConfig
+    ) -> Level3Result:
+        """IndividualScheduleResult를 Level3Result로 변환"""
+        level3_result = Level3Result()
+        
+        # 스케줄 항목 생성
+        for applicant_id, time_slots in result.schedule_by_applicant.items():
+            for slot in time_slots:
+                # 지원자의 job_code 찾기
+                job_code = compiled.job_of(applicant_id)
+                
+                schedule_item = ScheduleItem(
+                    applicant_id=applicant_id,
+                    job_code=job_code or "UNKNOWN",
+                    activity_name=slot.activity_name,
+                    room_name=slot.room_name,
+                    start_time=slot.start_time,
+                    end_time=slot.end_time,
+                    group_id=slot.group_id
+                )
+                level3_result.schedule.append(schedule_item)
+        
+        # 스케줄되지 않은 지원자 찾기 (Individual/Parallel 활동 대상자만)
+        # Individual/Parallel 활동을 수행해야 하는 지원자들만 체크
+        target_applicants = set()
+        for applicant in all_applicants:
+            if not applicant.is_dummy:
+                for activity in individual_activities:
+                    if activity.name in applicant.required_activities:
+                        target_applicants.add(applicant.id)
+        
+        scheduled_ids = set(result.schedule_by_applicant.keys())
+        level3_result.unscheduled = list(target_applicants - scheduled_ids)
+        
+        return level3_result
+    
     def _run_level4(
         self,
         config: DateConfig,
-        all_schedule: List[ScheduleItem]
+        all_schedule: List[ScheduleItem],
+        level1_result: Optional[Level1Result] = None
     ) -> Optional[Level4Result]:
         """Level 4: 후처리 조정"""
         try:
             post_processor = Level4PostProcessor(self.logger)
+            context = self.context or SchedulingContext()
+            budget = self._level_time_limit("level4")
             
             result = post_processor.optimize_stay_times(
                 schedule=all_schedule,
                 config=config,
-                target_improvement_hours=1.0
+                target_improvement_hours=1.0,
+                compiled=self._compiled_for(config, level1_result),
+                engine=context.level4_engine,
+                time_budget_sec=min(context.level4_time_budget_sec, budget),
+                retime=context.level4_retime,
+                retime_time_limit_sec=budget
             )
             
+            # 조정 후 최대 체류시간을 넘는 지원자가 생기면 조정 결과를 쓰지 않음
+            if result and result.success and config.max_stay:
+                over = stay_violations(result.optimized_schedule, config.max_stay)
+                if over:
+                    self.logger.warning(f"Level 4 조정 결과 체류시간 제한 초과 {len(over)}명 - 조정 취소")
+                    result.success = False
+            
             return result
             
         except Exception as e:
@@ -426,6 +759,9 @@ class SingleDateScheduler:
             "level": "Level2"
         })
         
+        if self._deadline_expired():
+            return self._timed_out(result, "Level 2 백트래킹")
+        
         # 최대 백트래킹 횟수 제한
         MAX_BACKTRACK = 3
         if result.backtrack_count > MAX_BACKTRACK:
@@ -443,53 +779,203 @@ class SingleDateScheduler:
                 'group_count': total_groups
             })
         
-        # 더미 수 조정 전략
+        # 더미 수 조정 전략 (같은 힌트는 한 번만)
         adjustment_strategies = [
             lambda dc: dc + 1,      # 더미 1명 추가
             lambda dc: dc + 2,      # 더미 2명 추가  
             lambda dc: dc * 2,      # 더미 2배로
             lambda dc: dc + 5,      # 더미 5명 추가
         ]
+        prev_dummy = result.level1_result.dummy_count if result.level1_result else 0
+        hints = list(dict.fromkeys(strategy(prev_dummy) for strategy in adjustment_strategies))
+        result.logs.append(f"백트래킹 시도 {result.backtrack_count}: 더미 {prev_dummy} → {hints}")
         
-        for strategy in adjustment_strategies:
-            # 이전 더미 수 계산
-            prev_dummy = result.level1_result.dummy_count if result.level1_result else 0
-            new_dummy_hint = strategy(prev_dummy)
-            
-            result.logs.append(f"백트래킹 시도 {result.backtrack_count}: 더미 {prev_dummy} → {new_dummy_hint}")
-            
-            # Level 1을 더미 힌트와 함께 재시도
-            level1_result = self._run_level1(config, dummy_hint=new_dummy_hint)
-            
-            if not level1_result:
-                continue
-                
-            # Level 2 재시도
-            level2_result = self._run_level2(config, level1_result)
-            
-            if level2_result:
-                result.logs.append(f"✅ 백트래킹 성공! 더미 {level1_result.dummy_count}명으로 해결")
-                result.level1_result = level1_result
-                result.level2_result = level2_result
-                
-                # Level 3 진행
-                level3_result = self._run_level3(config, level1_result, level2_result)
-                if level3_result and not level3_result.unscheduled:
-                    result.level3_result = level3_result
-                    result.status = "SUCCESS"
-                    result.error_message = None
-                    
-                    # 전체 스케줄 통합
-                    all_schedule = []
-                    all_schedule.extend(level2_result.schedule)
-                    all_schedule.extend(level3_result.schedule)
-                    result.schedule = all_schedule
-                    
-                return result
+        # 전략들을 동시에 평가 (메모된 힌트는 재사용), 전략 순서상 Level 2와 3을 모두 통과한 첫 결과 채택
+        attempts = self._evaluate_dummy_hints(config, hints)
+        for attempt in attempts:
+            result.attempted_configs.append(self._attempt_record(attempt))
+            if attempt["level2"] is not None:
+                self._remember_partial(attempt["level2"], attempt["level3"])
+        
+        solved = next((a for a in attempts if self._attempt_solved(a)), None)
+        if solved is not None:
+            level1_result, level2_result, level3_result = solved["level1"], solved["level2"], solved["level3"]
+            result.logs.append(f"✅ 백트래킹 성공! 더미 {level1_result.dummy_count}명으로 해결")
+            return self._complete(config, result, level1_result, level2_result, level3_result, {})
+        
+        placed = next((a for a in attempts if a["level2"] is not None), None)
+        if placed is not None:
+            # Level 2는 통과했지만 Level 3 실패 - 해당 구성으로 결과 보고
+            result.logs.append(f"더미 {placed['level1'].dummy_count}명으로 Level 2 통과, Level 3 실패")
+            result.level1_result = placed["level1"]
+            result.level2_result = placed["level2"]
+            return result
+        
+        infeasible = next((a["infeasibility"] for a in attempts if a["infeasibility"]), None)
+        if infeasible:
+            # 방 × 슬롯 수 부족은 더미 수를 바꿔도 해결되지 않음
+            result.logs.append(f"백트래킹 중단: {infeasible}")
+        elif self._deadline_expired():
+            return self._timed_out(result, "Level 2 백트래킹")
                 
         result.logs.append("❌ 모든 백트래킹 전략 실패")
         return result
     
+    def _attempt_dummy_hint(self, config: DateConfig, dummy_hint: int) -> Dict[str, Any]:
+        """더미 힌트 하나로 Level 1 → 2 → 3 실행 (메모 사용), 레벨별 소요시간 기록"""
+        attempt = {
+            "dummy_hint": dummy_hint, "level1": None, "level2": None, "level3": None,
+            "infeasibility": None, "timings": {}, "cached": False
+        }
+        started = time_module.time()
+        attempt["level1"] = self._run_level1(config, dummy_hint=dummy_hint)
+        attempt["infeasibility"] = self._level1_infeasibility
+        attempt["timings"]["level1"] = time_module.time() - started
+        if attempt["level1"] is None or self._deadline_expired():
+            return attempt
+        
+        started = time_module.time()
+        attempt["level2"] = self._run_level2(config, attempt["level1"], dummy_hint=dummy_hint)
+        attempt["timings"]["level2"] = time_module.time() - started
+        if attempt["level2"] is None or self._deadline_expired():
+            return attempt
+        
+        started = time_module.time()
+        attempt["level3"] = self._run_level3(config, attempt["level1"], attempt["level2"], dummy_hint=dummy_hint)
+        attempt["timings"]["level3"] = time_module.time() - started
+        return attempt
+    
+    def _memoized_attempt(self, config: DateConfig, dummy_hint: int) -> Optional[Dict[str, Any]]:
+        """이미 끝까지 평가한 힌트면 메모에서 시도 결과 구성 (아니면 None)"""
+        key = self._memo_key(config, dummy_hint)
+        if key not in self._level1_memo:
+            return None
+        level1_result, infeasibility = self._level1_memo[key]
+        attempt = {
+            "dummy_hint": dummy_hint, "level1": level1_result, "level2": None, "level3": None,
+            "infeasibility": infeasibility, "timings": {}, "cached": True
+        }
+        if level1_result is None:
+            return attempt
+        if key not in self._level2_memo:
+            return None
+        attempt["level2"] = self._level2_memo[key]
+        if attempt["level2"] is None:
+            return attempt
+        if key not in self._level3_memo:
+            return None
+        attempt["level3"] = self._level3_memo[key]
+        return attempt
+    
+    def _store_attempt(self, config: DateConfig, attempt: Dict[str, Any]):
+        """프로세스 풀에서 평가한 시도 결과를 메모에 반영"""
+        key = self._memo_key(config, attempt["dummy_hint"])
+        self._level1_memo[key] = (attempt["level1"], attempt["infeasibility"])
+        if attempt["level1"] is not None and "level2" in attempt["timings"]:
+            self._level2_memo[key] = attempt["level2"]
+        if attempt["level2"] is not None and "level3" in attempt["timings"]:
+            self._level3_memo[key] = attempt["level3"]
+    
+    @staticmethod
+    def _attempt_solved(attempt: Dict[str, Any]) -> bool:
+        return attempt["level3"] is not None and not attempt["level3"].unscheduled
+    
+    @staticmethod
+    def _attempt_record(attempt: Dict[str, Any]) -> Dict[str, Any]:
+        """attempted_configs 기록 (구성, 통과 레벨, 소요시간)"""
+        level1_result = attempt["level1"]
+        return {
+            'dummy_hint': attempt["dummy_hint"],
+            'dummy_count': level1_result.dummy_count if level1_result else None,
+            'group_count': sum(len(g) for g in level1_result.groups.values()) if level1_result else 0,
+            'level2_ok': attempt["level2"] is not None,
+            'level3_ok': SingleDateScheduler._attempt_solved(attempt),
+            'cached': attempt["cached"],
+            'timings': {level: round(sec, 3) for level, sec in attempt["timings"].items()},
+            'time_sec': round(sum(attempt["timings"].values()), 3)
+        }
+    
+    def _evaluate_dummy_hints(self, config: DateConfig, hints: List[int]) -> List[Dict[str, Any]]:
+        """
+        더미 힌트별 Level 1 → 2 → 3 시도 (결과는 힌트 순서)
+        메모된 힌트는 바로 사용하고, 나머지는 프로세스 풀에서 동시에 평가한다.
+        앞선 힌트가 모두 끝난 상태에서 해결(또는 불가능 판정)된 힌트가 나오면 중단하므로
+        완료 순서와 관계없이 같은 입력이면 같은 힌트가 채택된다 (워커 1개면 순서대로).
+        """
+        order = {hint: i for i, hint in enumerate(hints)}
+        attempts = []
+        pending = []
+        for hint in hints:
+            memoized = self._memoized_attempt(config, hint)
+            if memoized is None:
+                pending.append(hint)
+            else:
+                attempts.append(memoized)
+        if self._hints_decided(hints, attempts):
+            return attempts
+        
+        workers = min(len(pending), self._backtrack_workers())
+        if workers <= 1:
+            for hint in pending:
+                if self._deadline_expired():
+                    break
+                attempts.append(self._attempt_dummy_hint(config, hint))
+                if self._hints_decided(hints, attempts):
+                    break
+            return sorted(attempts, key=lambda a: order[a["dummy_hint"]])
+        
+        context = dataclasses.replace(self.context or SchedulingContext(), progress_callback=None)
+        remaining = self._deadline.remaining() if self._deadline else SchedulingContext.time_limit_sec
+        deadline_at = time_module.time() + remaining
+        self.logger.info(f"🔀 백트래킹 전략 {len(pending)}개 동시 평가 (워커 {workers}개)")
+        stop = multiprocessing.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_backtrack_worker, initargs=(stop,)
+        )
+        try:
+            futures = {
+                executor.submit(_run_backtrack_attempt, (config, context, hint, deadline_at))
+                for hint in pending
+            }
+            while futures:
+                timeout = self._deadline.remaining() if self._deadline else None
+                if timeout is not None and timeout <= 0:
+                    self.logger.warning(f"⏰ 백트래킹 제한시간 도달 (미완료 전략 {len(futures)}개)")
+                    break
+                done, futures = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        attempt = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"백트래킹 워커 오류: {e}")
+                        continue
+                    self._store_attempt(config, attempt)
+                    attempts.append(attempt)
+                if self._hints_decided(hints, attempts):
+                    break
+        finally:
+            # 실행 중인 워커는 중단 신호로 다음 deadline 확인 때 멈춤
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return sorted(attempts, key=lambda a: order[a["dummy_hint"]])
+    
+    def _hints_decided(self, hints: List[int], attempts: List[Dict[str, Any]]) -> bool:
+        """힌트 순서상 앞선 힌트가 모두 끝났고 그중 해결/불가능 판정된 힌트가 있는지"""
+        by_hint = {attempt["dummy_hint"]: attempt for attempt in attempts}
+        for hint in hints:
+            attempt = by_hint.get(hint)
+            if attempt is None:
+                return False
+            if self._attempt_solved(attempt) or attempt["infeasibility"]:
+                return True
+        return False
+    
+    def _backtrack_workers(self) -> int:
+        """백트래킹 전략 동시 평가 프로세스 수 (SchedulingContext.backtrack_workers, 없으면 CPU 수)"""
+        if self.context and self.context.backtrack_workers:
+            return max(1, int(self.context.backtrack_workers))
+        return os.cpu_count() or 1
+    
     def _backtrack_from_level3(
         self,
         config: DateConfig,
@@ -499,6 +985,9 @@ class SingleDateScheduler:
         result.logs.append("=== Level 3 백트래킹 시작 ===")
         result.backtrack_count += 1
         
+        if self._deadline_expired():
+            return self._timed_out(result, "Level 3 백트래킹")
+        
         # 최대 백트래킹 횟수 제한
         MAX_BACKTRACK = 5
         if result.backtrack_count > MAX_BACKTRACK:
@@ -509,25 +998,23 @@ class SingleDateScheduler:
         if result.backtrack_count <= 2:
             result.logs.append("전략 1: 방 재배치로 재시도")
             
-            # Individual 스케줄러에 다른 seed나 전략 적용
-            # (현재는 같은 방식으로 재시도하므로 효과 제한적)
-            level3_result = self._run_level3(config, result.level1_result, result.level2_result)
+            # 활동/지원자 순서와 방 시작 위치가 다른 휴리스틱 변형을 동시에 실행
+            # (백트래킹 회차마다 seed를 바꿔 같은 변형을 반복하지 않음)
+            portfolio_seed = result.backtrack_count * self._level3_portfolio_size()
+            level3_result = self._run_level3(
+                config, result.level1_result, result.level2_result, portfolio_seed=portfolio_seed
+            )
+            self._remember_partial(result.level2_result, level3_result)
             
             if level3_result and not level3_result.unscheduled:
                 result.logs.append("✅ 방 재배치로 해결!")
-                result.level3_result = level3_result
-                result.status = "SUCCESS"
-                result.error_message = None
-                
-                # 전체 스케줄 통합
-                all_schedule = []
-                all_schedule.extend(result.level2_result.schedule)
-                all_schedule.extend(level3_result.schedule)
-                result.schedule = all_schedule
-                
-                return result
+                return self._complete(
+                    config, result, result.level1_result, result.level2_result, level3_result, {}
+                )
                 
         # 전략 2: Level 2부터 재시도 (다른 시간대 배치)
+        if self._deadline_expired():
+            return self._timed_out(result, "Level 3 백트래킹")
         result.logs.append("전략 2: Level 2부터 재시도")
         return self._backtrack_from_level2(config, result)
 
@@ -560,6 +1047,95 @@ class SingleDateScheduler:
         # 향후 필요시 dummy_hint를 전달하는 메커니즘 추가 가능
         return config 
 
+    def _compiled_for(
+        self,
+        config: DateConfig,
+        level1_result: Optional[Level1Result] = None
+    ) -> CompiledDateConfig:
+        """Level 1 결과별 컴파일된 설정 (같은 결과면 재사용)"""
+        source = self._compiled_source
+        if self._compiled is None or source[0] is not config or source[1] is not level1_result:
+            self._compiled = compile_date_config(config, level1_result)
+            self._compiled_source = (config, level1_result)
+        return self._compiled
+        
+    def _level_time_limit(self, level: str, cap: Optional[float] = None) -> float:
+        """
+        레벨 제한시간: deadline의 남은 시간 중 레벨 몫 (cap 이하)
+        schedule() 밖에서 레벨을 직접 실행하면(deadline 없음) SchedulingContext.time_limit_sec 기준
+        """
+        if self._deadline is not None:
+            return self._deadline.budget(level, cap)
+        limit = float(self.context.time_limit_sec) if self.context and self.context.time_limit_sec else None
+        if cap is None:
+            return limit if limit is not None else float(SchedulingContext.time_limit_sec)
+        return min(limit, float(cap)) if limit is not None else float(cap)
+        
+    def _deadline_expired(self) -> bool:
+        return self._deadline is not None and self._deadline.expired()
+        
+    def _level2_time_limit(self) -> float:
+        """Level 2 제한시간 (deadline / SchedulingContext.time_limit_sec 기준)"""
+        return self._level_time_limit("level2", self.LEVEL2_TIME_LIMIT)
+        
+    def _level3_time_limit(self) -> float:
+        """Level 3 CP-SAT 제한시간 (deadline / SchedulingContext.time_limit_sec 기준)"""
+        return self._level_time_limit("level3", self.LEVEL3_TIME_LIMIT)
+        
+    def _create_individual_scheduler(self) -> IndividualScheduler:
+        """Level 3 스케줄러 (백트래킹 예산은 SchedulingContext 기준, Level 3 몫 이하)"""
+        context = self.context or SchedulingContext()
+        return IndividualScheduler(
+            search_node_limit=context.level3_search_nodes,
+            search_time_limit_sec=min(context.level3_search_time_sec, self._level3_time_limit())
+        )
+        
+    def _remember_partial(self, level2_result: Level2Result, level3_result: Optional[Level3Result]):
+        """제한시간 초과시 반환할 부분 결과 갱신 (Level 3 미배정이 가장 적은 결과)"""
+        def unscheduled(level3: Optional[Level3Result]) -> float:
+            return len(level3.unscheduled) if level3 is not None else float('inf')
+        
+        if level2_result is None:
+            return
+        if self._best_partial is None or (
+            level3_result is not None and unscheduled(level3_result) < unscheduled(self._best_partial[1])
+        ):
+            self._best_partial = (level2_result, level3_result)
+        
+    def _timed_out(self, result: SingleDateResult, stage: str) -> SingleDateResult:
+        """제한시간 초과 - 예외/대기 없이 지금까지의 최선 부분 결과 반환"""
+        elapsed = self._deadline.elapsed() if self._deadline else 0.0
+        reason = f"제한시간 초과 ({stage}, {elapsed:.1f}초)"
+        result.logs.append(f"⏰ {reason}")
+        
+        if self._best_partial is not None:
+            level2_result, level3_result = self._best_partial
+            result.level2_result = level2_result
+            result.level3_result = level3_result
+            result.schedule = list(level2_result.schedule) + (list(level3_result.schedule) if level3_result else [])
+            result.status = "PARTIAL" if result.schedule else "FAILED"
+            missing = len(level3_result.unscheduled) if level3_result else "Level 3 전체"
+            result.logs.append(f"부분 결과 반환: {len(result.schedule)}개 스케줄 항목, 미배정 {missing}")
+        
+        result.error_message = f"{reason}" + (f" - {result.error_message}" if result.error_message else "")
+        self._report_progress("Timeout", 1.0, reason, {
+            "status": result.status,
+            "schedule_count": len(result.schedule)
+        })
+        return result
+        
+    def _level3_portfolio_size(self) -> int:
+        """Level 3 포트폴리오 변형 수 (SchedulingContext.level3_portfolio_size 기준)"""
+        if self.context:
+            return max(1, int(self.context.level3_portfolio_size))
+        return SchedulingContext.level3_portfolio_size
+    
+    def _level3_portfolio_workers(self) -> Optional[int]:
+        """Level 3 포트폴리오 프로세스 수 (SchedulingContext.level3_portfolio_workers, 없으면 CPU 수)"""
+        if self.context and self.context.level3_portfolio_workers:
+            return max(1, int(self.context.level3_portfolio_workers))
+        return None
+        
     def _report_progress(
         self, 
         stage: str, 
@@ -6,6 +6,8 @@ from interview_opt_test_v4 import build_model
 import contextlib, io
 from pathlib import Path
 
+from .result_frame import pivot_activities
+
 
 
 def _derive_internal_tables(cfg_ui: dict, the_date: pd.Timestamp, *, debug: bool = False) -> dict:
@@ -146,74 +148,24 @@ def _calculate_dynamic_daily_limit(
     room_plan_tpl: pd.DataFrame, 
     oper_window_tpl: pd.DataFrame, 
     activities_df: pd.DataFrame, 
-    job_acts_map: pd.DataFrame
+    job_acts_map: pd.DataFrame,
+    precedence_df: pd.DataFrame = None
 ) -> int:
-    """사용 가능한 자원(시간, 공간)과 지원자별 필요 자원을 기반으로 일일 처리 가능 인원을 동적으로 추정합니다."""
-    from datetime import date, datetime
-    
-    # 1. 총 가용 시간 계산
-    start_time_str = oper_window_tpl['start_time'].iloc[0]
-    end_time_str = oper_window_tpl['end_time'].iloc[0]
-
-    if isinstance(start_time_str, str):
-        start_time = pd.to_datetime(start_time_str).time()
-    else:
-        start_time = start_time_str
-
-    if isinstance(end_time_str, str):
-        end_time = pd.to_datetime(end_time_str).time()
-    else:
-        end_time = end_time_str
+    """
+    방 유형별 병목 모델로 일일 처리 가능 인원을 추정합니다.
+    직무 구성비를 유지한 채 방 사용시간/batched 그룹 슬롯/선후행 경로 하한을 모두 만족하는
+    최대 인원의 90%를 하루 배정 인원으로 사용합니다.
+    """
+    from .capacity import DailyCapacityEstimator, date_config_from_frames
 
-    if not start_time or not end_time:
+    config = date_config_from_frames(
+        activities_df, room_plan_tpl, oper_window_tpl, job_acts_map, precedence_df
+    )
+    if not config.rooms or sum(config.jobs.values()) == 0:
         return 20 # Fallback
 
-    total_oper_minutes = (datetime.combine(date.min, end_time) - datetime.combine(date.min, start_time)).total_seconds() / 60
-    
-    room_types = activities_df.query("use==True")['room_type'].dropna().unique()
-    total_room_minutes = 0
-    for rt in room_types:
-        count_col = f"{rt}_count"
-        if count_col in room_plan_tpl:
-            try:
-                num_rooms = pd.to_numeric(room_plan_tpl[count_col].iloc[0], errors='coerce')
-                if pd.notna(num_rooms):
-                    total_room_minutes += num_rooms * total_oper_minutes
-            except (ValueError, IndexError):
-                pass
-            
-    if total_room_minutes <= 0:
-        return 20
-
-    # 2. 지원자 1명당 평균 필요 시간 계산
-    job_acts_map_copy = job_acts_map.copy()
-    
-    if 'total_duration' not in job_acts_map_copy.columns:
-        job_acts_map_copy['total_duration'] = 0
-        for idx, row in job_acts_map_copy.iterrows():
-            total_duration = 0
-            activities = [act for act, required in row.items() if required and act not in ['code', 'count', 'total_duration']]
-            
-            for act_name in activities:
-                act_info = activities_df[activities_df['activity'] == act_name]
-                if not act_info.empty:
-                    duration = act_info['duration_min'].iloc[0]
-                    total_duration += duration
-            job_acts_map_copy.loc[idx, 'total_duration'] = total_duration
-
-    total_applicants = job_acts_map_copy['count'].sum()
-    if total_applicants == 0:
-        return 20
-        
-    weighted_avg_duration = (job_acts_map_copy['total_duration'] * job_acts_map_copy['count']).sum() / total_applicants
-    
-    if weighted_avg_duration <= 0:
-        return 20
-
-    # 3. 일일 처리 가능 인원 추산 (안전 마진 80% 적용)
-    daily_capacity = int((total_room_minutes / weighted_avg_duration) * 0.8)
-    
-    return max(10, daily_capacity)
+    estimate = DailyCapacityEstimator().estimate(config)
+    return max(1, estimate.recommended)
 
 def solve_for_days(cfg_ui: dict, params: dict, debug: bool):
     """
@@ -253,7 +205,8 @@ def solve_for_days(cfg_ui: dict, params: dict, debug: bool):
             room_plan_tpl=room_plan_tpl,
             oper_window_tpl=oper_window_tpl,
             activities_df=activities_df.query("use==True"),
-            job_acts_map=job_acts_map
+            job_acts_map=job_acts_map,
+            precedence_df=rules
         )
     except Exception as e:
         logger.warning(f"동적 일일 처리량 계산 실패: {e}. 기본값(70)으로 대체합니다.")
@@ -382,24 +335,17 @@ def solve_for_days(cfg_ui: dict, params: dict, debug: bool):
     if all_scheduled_cands_long.empty:
         return "NO_SOLUTION", None, "\n".join(log_messages), daily_candidate_limit
 
-    # 최종적으로 long 포맷을 wide 포맷으로 변환
-    final_wide = all_scheduled_cands_long.pivot_table(
+    # 최종적으로 long 포맷을 wide 포맷으로 변환 (활동별 열, 시간은 'HH:MM:SS')
+    final_wide = pivot_activities(
+        all_scheduled_cands_long,
         index=['id', 'interview_date', 'code'],
-        columns='activity',
-        values=['start', 'end', 'loc'],
-        aggfunc='first'
-    ).reset_index()
-
-    final_wide.columns = ['_'.join(col).strip() if isinstance(col, tuple) and col[1] else col[0] for col in final_wide.columns]
-    final_wide = final_wide.rename(columns={'id_': 'id', 'interview_date_': 'interview_date', 'code_': 'code'})
+        activity='activity',
+        time_columns={'start': 'start_', 'end': 'end_'},
+        value_columns={'loc': 'loc_'},
+        with_seconds=True
+    )
 
     activity_cols = sorted(list(all_scheduled_cands_long['activity'].unique()))
-    
-    for act in activity_cols:
-        for prefix in ['start_', 'end_']:
-            col = f"{prefix}{act}"
-            if col in final_wide.columns:
-                final_wide[col] = pd.to_datetime(final_wide[col], errors='coerce').dt.strftime('%H:%M:%S')
 
     sorted_activity_cols = sort_activities_by_time(final_wide.copy(), activity_cols)
 
@@ -220,6 +220,29 @@ class Level4Result:
     logs: List[str]
 
 
+@dataclass
+class FeasibilityReport:
+    """실행 전 실현 가능성 사전 검사 결과"""
+    violations: List[str] = field(default_factory=list)  # 위반한 하한 (있으면 해 없음)
+    bottlenecks: List[Dict[str, Any]] = field(default_factory=list)  # 사용률 높은 자원 (사용률 내림차순)
+    utilization: Dict[str, float] = field(default_factory=dict)  # 자원별 사용률 (필요량 / 가용량)
+    elapsed_ms: float = 0.0
+    
+    @property
+    def feasible(self) -> bool:
+        return not self.violations
+
+
+@dataclass
+class DailyCapacityEstimate:
+    """직무 구성비별 일일 처리 가능 인원 추정"""
+    job_mix: Dict[str, float] = field(default_factory=dict)  # 직무별 구성비
+    bound: int = 0  # 사전 검사 하한을 모두 만족하는 최대 인원
+    recommended: int = 0  # 권장 인원 (bound × margin)
+    per_job: Dict[str, int] = field(default_factory=dict)  # 권장 인원의 직무별 배분
+    bottleneck: Optional[str] = None  # bound + 1명에서 처음 위반하는 자원
+
+
 @dataclass
 class SingleDateResult:
     """단일 날짜 스케줄링 결과"""
@@ -241,26 +264,16 @@ class SingleDateResult:
     level2_result: Optional['Level2Result'] = None
     level3_result: Optional['Level3Result'] = None
     level4_result: Optional['Level4Result'] = None  # Level 4 후처리 조정 결과 추가
+    feasibility: Optional[FeasibilityReport] = None  # 사전 검사 결과 (병목 자원 안내용)
+    fingerprint: Optional[str] = None  # 체류시간 제한을 뺀 설정 지문 (다음 단계 웜 스타트 재사용 판단용)
+    solve_time: float = 0.0  # 성공까지 걸린 시간 (초, 웜 스타트 재배치 예산 기준)
     
     def to_dataframe(self) -> pd.DataFrame:
-        """스케줄을 DataFrame으로 변환"""
-        if not self.schedule:
-            return pd.DataFrame()
-        
-        data = []
-        for item in self.schedule:
-            data.append({
-                'applicant_id': item.applicant_id,
-                'job_code': item.job_code,
-                'activity_name': item.activity_name,
-                'room_name': item.room_name,
-                'start_time': item.start_time,
-                'end_time': item.end_time,
-                'group_id': item.group_id,
-                'interview_date': self.date.date()
-            })
-        
-        return pd.DataFrame(data)
+        """스케줄을 DataFrame으로 변환 (열 단위 빌더)"""
+        from .result_frame import ScheduleColumns
+        columns = ScheduleColumns()
+        columns.add(self.date, self.schedule)
+        return columns.to_long()
 
 
 @dataclass
@@ -273,19 +286,67 @@ class MultiDateResult:
     failed_dates: List[datetime] = field(default_factory=list)
     
     def to_dataframe(self) -> pd.DataFrame:
-        """전체 스케줄을 DataFrame으로 변환"""
-        all_dataframes = []
-        
-        for date, result in self.results.items():
+        """전체 스케줄을 DataFrame으로 변환 (날짜별 DataFrame을 이어 붙이지 않고 한 번에)"""
+        return self.to_columns().to_long()
+    
+    def to_columns(self, skip_dummy: bool = False) -> 'ScheduleColumns':
+        """실패하지 않은 날짜의 스케줄을 열 단위 빌더로 (long / UI / wide 형식 변환용)"""
+        from .result_frame import ScheduleColumns
+        columns = ScheduleColumns()
+        for result in self.results.values():
             if result.status != "FAILED":
-                df = result.to_dataframe()
-                if not df.empty:
-                    all_dataframes.append(df)
-        
-        if not all_dataframes:
-            return pd.DataFrame()
-        
-        return pd.concat(all_dataframes, ignore_index=True)
+                columns.add(result.date, result.schedule, skip_dummy=skip_dummy)
+        return columns
+
+
+@dataclass
+class SweepPoint:
+    """체류시간 제한 후보 하나의 평가 결과 (하드 제약 후보 동시 평가)"""
+    label: str  # "p90", "4.5h" 등
+    hard_constraints: Dict[str, float]  # 날짜별 최대 체류시간 (시간)
+    percentile: Optional[float] = None  # 분위수 후보면 분위수, 시간 후보면 None
+    status: str = "PENDING"  # "SUCCESS", "FAILED", "ERROR"
+    total_violations: int = 0
+    violation_rate: float = 0.0
+    runtime_sec: float = 0.0
+    schedule: Optional[pd.DataFrame] = None
+    exceed_analysis: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def cap_hours(self) -> float:
+        """가장 느슨한 날짜의 제한 (트레이드오프 곡선의 제한 축)"""
+        return max(self.hard_constraints.values()) if self.hard_constraints else float('inf')
+
+    def dominates(self, other: 'SweepPoint') -> bool:
+        """제한/위반 수/실행시간이 모두 같거나 낫고 하나 이상 나으면 True"""
+        mine = (self.cap_hours, self.total_violations, self.runtime_sec)
+        theirs = (other.cap_hours, other.total_violations, other.runtime_sec)
+        return all(a <= b for a, b in zip(mine, theirs)) and mine != theirs
+
+
+@dataclass
+class SweepResult:
+    """체류시간 제한 후보 동시 평가 결과"""
+    points: List[SweepPoint] = field(default_factory=list)
+    pareto: List[SweepPoint] = field(default_factory=list)  # 지배되지 않는 성공 후보 (제한 오름차순)
+    selected: Optional[SweepPoint] = None
+    policy: str = "tightest"
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """후보별 제한 / 위반 수 / 실행시간 표 (UI 트레이드오프 곡선용)"""
+        pareto_ids = {id(point) for point in self.pareto}
+        return pd.DataFrame([{
+            'label': point.label,
+            'percentile': point.percentile,
+            'cap_hours': round(point.cap_hours, 2),
+            'total_violations': point.total_violations,
+            'violation_rate': round(point.violation_rate, 1),
+            'runtime_sec': round(point.runtime_sec, 2),
+            'status': point.status,
+            'pareto': id(point) in pareto_ids,
+            'selected': point is self.selected
+        } for point in self.points])
 
 
 @dataclass
@@ -312,6 +373,11 @@ class DateConfig:
     precedence_rules: List[PrecedenceRule] = field(default_factory=list)
     job_activity_matrix: Dict[Tuple[str, str], bool] = field(default_factory=dict)
     global_gap_min: int = 5
+    max_stay_hours: Optional[float] = None  # 지원자 최대 체류시간 (첫 활동 시작 ~ 마지막 활동 종료, None이면 제한 없음)
+    
+    @property
+    def max_stay(self) -> Optional[timedelta]:
+        return timedelta(hours=self.max_stay_hours) if self.max_stay_hours else None
 
 
 @dataclass
@@ -326,12 +392,37 @@ class GlobalConfig:
     max_stay_hours: int = 8
 
 
+@dataclass
+class UIConversion:
+    """UI 설정(cfg_ui) 변환 결과 - 변환 캐시 항목"""
+    date_plans: Dict[datetime, DatePlan]
+    global_config: GlobalConfig
+    rooms: Dict[str, Dict]
+    activities: Dict[str, Dict]
+    date_configs: Optional[Dict[datetime, DateConfig]] = None  # 날짜별 실행 설정 (구성 실패 날짜가 있으면 None)
+    logs: List[str] = field(default_factory=list)  # 변환 중 남긴 로그 (캐시 적중시 다시 출력)
+
+
 @dataclass
 class SchedulingContext:
     """스케줄링 컨텍스트"""
     progress_callback: Optional[ProgressCallback] = None
     time_limit_sec: float = 120.0
     debug: bool = False
+    level3_portfolio_size: int = 8  # Level 3 백트래킹시 동시 실행할 휴리스틱 변형 수
+    level3_portfolio_workers: Optional[int] = None  # Level 3 포트폴리오 프로세스 수 (None이면 CPU 수, 1이면 순차)
+    level3_search_nodes: int = 5000  # Level 3 휴리스틱 백트래킹 노드 예산
+    level3_search_time_sec: float = 5.0  # Level 3 휴리스틱 백트래킹 시간 예산
+    level2_engine: str = "greedy"  # Level 2 엔진: greedy | cpsat (greedy 결과를 hint로 개선) | auto (greedy 실패시 CP-SAT)
+    level4_engine: str = "greedy"  # Level 4 엔진: greedy (그룹 이동) | anneal (시간 제한 지역 탐색)
+    level4_time_budget_sec: float = 2.0  # Level 4 anneal 엔진 시간 예산
+    level4_retime: bool = True  # Level 4 이동 후 방/순서 고정 재시간화 (CP-SAT, 시작 시각만)
+    backtrack_workers: Optional[int] = None  # 백트래킹 더미 전략 동시 평가 프로세스 수 (None이면 CPU 수)
+    date_workers: Optional[int] = None  # 멀티 날짜 동시 실행 프로세스 수 (None이면 CPU 수, 1이면 순차)
+    date_timeout_sec: Optional[float] = None  # 날짜별 강제 제한시간 (None이면 time_limit_sec + 30초)
+    dedupe_dates: bool = True  # 설정이 같은 날짜(날짜 제외)는 한 번만 풀고 결과 복제
+    balance_dates: bool = False  # 스케줄링 전에 직무별 인원을 날짜별 부하가 고르게 재배분
+    precheck: bool = True  # Level 1 전에 하한 분석으로 명백히 불가능한 설정을 바로 실패 처리
 
 
 # Utility functions
@@ -400,4 +491,16 @@ def calculate_group_count(
         best_groups = 1
         best_dummies = min_capacity - total_count
     
-    return best_groups, int(best_dummies)
\ No newline at end of file
+    return best_groups, int(best_dummies)
+
+def stay_violations(schedule: List[ScheduleItem], max_stay: timedelta) -> Dict[str, timedelta]:
+    """체류시간(첫 활동 시작 ~ 마지막 활동 종료)이 max_stay를 넘는 지원자와 체류시간"""
+    spans: Dict[str, List[timedelta]] = {}
+    for item in schedule:
+        span = spans.setdefault(item.applicant_id, [item.start_time, item.end_time])
+        span[0], span[1] = min(span[0], item.start_time), max(span[1], item.end_time)
+    return {
+        applicant_id: end - start
+        for applicant_id, (start, end) in spans.items()
+        if end - start > max_stay
+    }
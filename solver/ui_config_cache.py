@@ -0,0 +1,115 @@
+"""
+UI 설정 → 스케줄러 입력 변환 캐시
+
+실행 버튼을 누를 때마다(2/3단계 흐름은 단계마다) 같은 UI 표를 다시 변환하지 않도록
+cfg_ui 내용의 해시를 키로 변환 결과(DatePlan/GlobalConfig/방/활동 + 날짜별 DateConfig)를
+LRU로 보관한다.
+- DataFrame은 pd.util.hash_pandas_object로 내용(열 이름, dtype, 값, 인덱스)만 해시
+  → 객체가 새로 만들어져도 내용이 같으면 같은 키
+- 캐시 항목은 깊은 복사로 돌려주므로 호출 측에서 고쳐도 (예: max_stay_hours) 캐시는 그대로
+"""
+import copy
+import hashlib
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .types import DatePlan, GlobalConfig, UIConversion
+from .multi_date_scheduler import MultiDateScheduler
+
+Converter = Callable[[dict, List[str]], Tuple[Dict[datetime, DatePlan], GlobalConfig, Dict, Dict]]
+
+
+def content_hash(value) -> str:
+    """cfg_ui 값(DataFrame/dict/list/스칼라)의 내용 해시"""
+    digest = hashlib.sha1()
+    _update(digest, value)
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    if isinstance(value, pd.Series):
+        value = value.to_frame()
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), list(value.dtypes))).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        except TypeError:
+            # 해시할 수 없는 셀 (list/dict 등)
+            digest.update(value.to_json(date_format="iso", default_handler=repr).encode())
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple, set)):
+        digest.update(b"[")
+        for item in (sorted(value, key=repr) if isinstance(value, set) else value):
+            _update(digest, item)
+        digest.update(b"]")
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+class UIConfigCache:
+    """cfg_ui 내용 해시 → 변환 결과 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 16, logger: Optional[logging.Logger] = None):
+        self.maxsize = maxsize
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: "OrderedDict[str, UIConversion]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get_or_convert(self, cfg_ui: dict, convert: Converter, logs_buffer: List[str]) -> UIConversion:
+        """
+        같은 내용의 cfg_ui를 같은 변환기로 변환한 적이 있으면 복사본을, 없으면 변환 후 저장
+        변환 로그는 캐시 적중 때도 logs_buffer에 다시 남긴다
+        """
+        # 날짜가 없는 기존 방식은 '내일'로 변환되므로 오늘 날짜도 키에 포함
+        key = content_hash((convert.__module__, convert.__qualname__, datetime.now().date(), cfg_ui))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            logs_buffer.extend(entry.logs)
+            logs_buffer.append(f"♻️ 변환 캐시 적중 ({key[:8]}): UI 설정 변환 생략")
+            return copy.deepcopy(entry)
+
+        self.stats["misses"] += 1
+        logs: List[str] = []
+        date_plans, global_config, rooms, activities = convert(cfg_ui, logs)
+        entry = UIConversion(
+            date_plans=date_plans,
+            global_config=global_config,
+            rooms=rooms,
+            activities=activities,
+            date_configs=self._build_date_configs(date_plans, global_config, rooms, activities),
+            logs=logs
+        )
+        self._entries[key] = entry
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        logs_buffer.extend(logs)
+        return copy.deepcopy(entry)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _build_date_configs(self, date_plans, global_config, rooms, activities):
+        """날짜별 DateConfig 미리 구성 (한 날짜라도 실패하면 None - 스케줄러가 날짜별로 실패 처리)"""
+        builder = MultiDateScheduler(self.logger)
+        try:
+            return {
+                date: builder._build_date_config(plan, global_config, rooms, activities)
+                for date, plan in date_plans.items()
+            }
+        except Exception as e:
+            self.logger.warning(f"날짜별 설정 미리 구성 실패 (스케줄링 때 다시 구성): {e}")
+            return None
@@ -0,0 +1,104 @@
+"""
+Level 3 백트래킹용 변경 기록 (undo log)
+
+배정/방 가용성 변경을 되돌리는 함수를 순서대로 쌓아 두고, 특정 시점(mark)까지
+역순으로 실행해 상태를 복원한다. 전체 초기화 없이 변경 개수만큼만 되돌린다.
+- JournaledDict: assignments (키 추가/덮어쓰기 기록)
+- JournaledListDict: schedule_by_applicant / schedule_by_room (키 생성, append 기록)
+- JournaledAvailability: 방 가용성 (reserve/release 기록)
+"""
+from collections import defaultdict
+from typing import Callable, List
+
+from .room_availability import RoomAvailability
+
+
+class UndoLog:
+    """되돌리기 함수 스택"""
+
+    def __init__(self):
+        self._undo: List[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def mark(self) -> int:
+        """현재 시점 (rollback 대상)"""
+        return len(self._undo)
+
+    def push(self, undo: Callable[[], None]) -> None:
+        self._undo.append(undo)
+
+    def rollback(self, mark: int = 0) -> int:
+        """mark 이후의 변경을 역순으로 되돌림 - 되돌린 변경 수 반환"""
+        undone = 0
+        while len(self._undo) > mark:
+            self._undo.pop()()
+            undone += 1
+        return undone
+
+
+class JournaledDict(dict):
+    """키 추가/덮어쓰기를 UndoLog에 기록하는 dict"""
+
+    def __init__(self, log: UndoLog, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._log = log
+
+    def __setitem__(self, key, value):
+        if key in self:
+            previous = self[key]
+            self._log.push(lambda: dict.__setitem__(self, key, previous))
+        else:
+            self._log.push(lambda: dict.__delitem__(self, key))
+        super().__setitem__(key, value)
+
+
+class JournaledList(list):
+    """append를 UndoLog에 기록하는 list"""
+
+    def __init__(self, log: UndoLog, *args):
+        super().__init__(*args)
+        self._log = log
+
+    def append(self, item):
+        super().append(item)
+        self._log.push(self.pop)
+
+
+class JournaledListDict(defaultdict):
+    """defaultdict(list) 대체 - 새 키 생성과 리스트 append를 기록"""
+
+    def __init__(self, log: UndoLog):
+        super().__init__(None)
+        self._log = log
+
+    def __missing__(self, key):
+        value = JournaledList(self._log)
+        dict.__setitem__(self, key, value)
+        self._log.push(lambda: dict.__delitem__(self, key))
+        return value
+
+
+class JournaledAvailability(RoomAvailability):
+    """reserve/release를 UndoLog에 기록하는 방 가용성"""
+
+    __slots__ = ('_log',)
+
+    def __init__(self, log: UndoLog, source: RoomAvailability):
+        super().__init__()
+        self._log = log
+        self._starts = list(source._starts)
+        self._ends = list(source._ends)
+
+    def reserve(self, start, end):
+        token = super().reserve(start, end)
+        if token is not None:
+            self._log.push(lambda: self.restore(token))
+        return token
+
+    def release(self, start, end):
+        token = super().release(start, end)
+        if token is not None:
+            self._log.push(lambda: self.restore(token))
+        return token
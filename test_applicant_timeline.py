@@ -0,0 +1,79 @@
+"""
+ApplicantTimelines (지원자별 비트맵) 테스트
+"""
+from datetime import timedelta
+from solver.applicant_timeline import ApplicantTimelines
+from solver.types import TimeSlot
+from solver.undo_log import JournaledListDict, UndoLog
+
+
+def m(minutes):
+    return timedelta(minutes=minutes)
+
+
+def test_free_intervals():
+    """바쁜 시간 표시 후 가용 시간대"""
+    timelines = ApplicantTimelines(["A", "B"], m(540), m(720))  # 09:00 ~ 12:00
+    timelines.mark_busy("A", m(540), m(570))
+    timelines.mark_busy("A", m(600), m(615))
+
+    print(f"A 가용 시간: {timelines.free_intervals('A')}")
+    assert timelines.free_intervals("A") == [(m(570), m(600)), (m(615), m(720))]
+    assert timelines.free_intervals("B") == [(m(540), m(720))]
+    assert timelines.free_intervals("UNKNOWN") == [(m(540), m(720))]
+
+
+def test_common_free_intervals():
+    """그룹 공통 가용 시간"""
+    timelines = ApplicantTimelines(["A", "B", "C"], m(540), m(720))
+    timelines.mark_busy("A", m(540), m(600))
+    timelines.mark_busy("B", m(630), m(660))
+    timelines.mark_busy("C", m(700), m(720))
+
+    assert timelines.common_free_intervals(["A", "B", "C"]) == [(m(600), m(630)), (m(660), m(700))]
+    assert timelines.common_free_intervals(["B"]) == [(m(540), m(630)), (m(660), m(720))]
+
+
+def test_sync_incremental_and_reset():
+    """schedule_by_applicant 증분 반영 및 초기화 후 기준선 복원"""
+    timelines = ApplicantTimelines(["A"], m(540), m(720))
+    timelines.mark_busy("A", m(540), m(570))  # Batched 블록
+    timelines.freeze_base()
+
+    slots = [TimeSlot(m(600), m(615), "면접실A", "발표면접", "A")]
+    timelines.sync("A", slots)
+    assert timelines.free_intervals("A") == [(m(570), m(600)), (m(615), m(720))]
+
+    slots.append(TimeSlot(m(615), m(630), "면접실A", "인성면접", "A"))
+    timelines.sync("A", slots)
+    assert timelines.free_intervals("A") == [(m(570), m(600)), (m(630), m(720))]
+
+    timelines.sync("A", [])
+    assert timelines.free_intervals("A") == [(m(570), m(720))]
+
+
+def test_sync_after_rollback_same_length():
+    """rollback 후 같은 길이로 다시 append해도 되돌린 배정은 빠지고 새 배정이 반영됨"""
+    log = UndoLog()
+    timelines = ApplicantTimelines(["A"], m(540), m(720), log=log)
+    schedule_by_applicant = JournaledListDict(log)
+
+    mark = log.mark()
+    schedule_by_applicant["A"].append(TimeSlot(m(540), m(600), "면접실A", "발표면접", "A"))
+    timelines.sync("A", schedule_by_applicant["A"])
+    assert timelines.free_intervals("A") == [(m(600), m(720))]
+
+    log.rollback(mark)
+    schedule_by_applicant["A"].append(TimeSlot(m(660), m(720), "면접실A", "발표면접", "A"))
+    timelines.sync("A", schedule_by_applicant["A"])
+
+    print(f"rollback 후 재배정 가용 시간: {timelines.free_intervals('A')}")
+    assert timelines.free_intervals("A") == [(m(540), m(660))]
+
+
+if __name__ == "__main__":
+    test_free_intervals()
+    test_common_free_intervals()
+    test_sync_incremental_and_reset()
+    test_sync_after_rollback_same_length()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,60 @@
+"""
+백트래킹 메모이제이션과 더미 전략 동시 평가 테스트
+"""
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import SchedulingContext
+from test_level3_portfolio import _make_config
+
+
+def test_level_results_memoized():
+    """같은 설정 지문/더미 힌트면 Level 1/2/3을 다시 풀지 않음 (내용이 같은 새 config도)"""
+    scheduler = SingleDateScheduler()
+    scheduler.context = SchedulingContext()
+    config = _make_config()
+
+    level1 = scheduler._run_level1(config, dummy_hint=1)
+    assert level1 is not None
+    assert scheduler._run_level1(_make_config(), dummy_hint=1) is level1
+    assert scheduler._run_level1(config, dummy_hint=2) is not level1
+
+    first = scheduler._attempt_dummy_hint(config, 1)
+    again = scheduler._memoized_attempt(config, 1)
+    print(f"시도 기록: {scheduler._attempt_record(first)}")
+    assert again["cached"] and again["level2"] is first["level2"] and again["level3"] is first["level3"]
+    assert set(first["timings"]) == {"level1", "level2", "level3"}
+
+
+def test_parallel_hint_evaluation():
+    """프로세스 풀 평가 결과도 메모에 저장되고, 통과한 전략이 있으면 사용할 수 있음"""
+    config = _make_config()
+    scheduler = SingleDateScheduler()
+    scheduler.context = SchedulingContext(backtrack_workers=2)
+
+    attempts = scheduler._evaluate_dummy_hints(config, [1, 2])
+    records = [scheduler._attempt_record(a) for a in attempts]
+    print(f"동시 평가: {records}")
+    assert attempts and any(scheduler._attempt_solved(a) for a in attempts)
+    assert all(not r["cached"] and r["time_sec"] >= 0 for r in records)
+
+    cached = scheduler._evaluate_dummy_hints(config, [a["dummy_hint"] for a in attempts])
+    assert all(a["cached"] for a in cached)
+
+
+def test_parallel_choice_follows_strategy_order():
+    """동시 평가해도 완료 순서와 관계없이 전략 순서상 첫 해결 힌트가 앞에 옴"""
+    for hints in ([2, 1], [5, 1, 2]):
+        scheduler = SingleDateScheduler()
+        scheduler.context = SchedulingContext(backtrack_workers=2)
+        attempts = scheduler._evaluate_dummy_hints(_make_config(), hints)
+        solved = next(a for a in attempts if scheduler._attempt_solved(a))
+
+        print(f"힌트 {hints} → 평가 순서 {[a['dummy_hint'] for a in attempts]}, 채택 {solved['dummy_hint']}")
+        assert [a["dummy_hint"] for a in attempts] == hints[:len(attempts)]
+        assert solved["dummy_hint"] == hints[0]
+
+
+if __name__ == "__main__":
+    test_level_results_memoized()
+    test_parallel_hint_evaluation()
+    test_parallel_choice_follows_strategy_order()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,101 @@
+"""
+Level 2 CP-SAT (Batched 그룹 배치) 테스트
+"""
+import dataclasses
+import time
+from datetime import timedelta
+from solver.batched_scheduler import BatchedScheduler
+from solver.group_optimizer_v2 import GroupOptimizerV2
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import Activity, ActivityMode, PrecedenceRule, SchedulingContext
+from test_room_calendar import _make_config
+from test_cpsat_fallback import _check_schedule
+
+
+def _makespan(level2_result):
+    return max(a.end_time for r in level2_result.group_results for a in r.assignments)
+
+
+def test_cpsat_with_greedy_hint():
+    """greedy 결과를 hint로 사용 - 제약 준수, makespan이 greedy 이하"""
+    config = _make_config(120, 2)
+    level1_result = SingleDateScheduler()._run_level1(config)
+    scheduler = BatchedScheduler()
+    greedy = scheduler.schedule(level1_result.groups, config)
+    result = scheduler.schedule_cpsat(
+        level1_result.groups, config, time_limit=20, hint=scheduler.greedy_placements
+    )
+
+    assert result is not None
+    print(f"makespan: greedy {_makespan(greedy)} → CP-SAT {_makespan(result)} ({scheduler.last_cpsat_status})")
+    assert _makespan(result) <= _makespan(greedy)
+
+    total_groups = sum(len(groups) for groups in level1_result.groups.values())
+    assert sum(len(r.assignments) for r in result.group_results) == total_groups
+    capacity = {room.name: room.capacity for room in config.rooms}
+    assert not _check_schedule(result.schedule, config.precedence_rules, config.global_gap_min, capacity)
+
+
+def test_cpsat_proves_infeasible():
+    """방 수에 비해 그룹이 너무 많으면 빠르게 불가능 증명"""
+    config = _make_config(160, 2)
+    single = SingleDateScheduler()
+    # Level 1은 방 × 슬롯 수 확인으로 먼저 거부하므로 확인 없이 그룹 구성
+    assert single._run_level1(config) is None
+    level1_result = GroupOptimizerV2().optimize(single._create_applicants(config), config.activities)
+    scheduler = BatchedScheduler()
+
+    started = time.time()
+    result = scheduler.schedule_cpsat(level1_result.groups, config, time_limit=20)
+    assert result is None
+    assert scheduler.last_cpsat_status == "INFEASIBLE"
+    assert time.time() - started < 5
+
+
+def test_engine_selected_by_context():
+    """SchedulingContext.level2_engine='cpsat'으로 전체 스케줄링"""
+    config = _make_config(60, 2)
+    context = SchedulingContext(level2_engine="cpsat", time_limit_sec=30)
+    result = SingleDateScheduler().schedule(config, context)
+
+    assert result.status == "SUCCESS"
+    assert result.level2_result.schedule
+    assert all(item.start_time >= timedelta(hours=9) for item in result.level2_result.schedule)
+
+
+def test_exact_adjacency_off_grid():
+    """소요시간/간격이 5분 배수가 아니어도 연속배치 간격이 정확히 지켜짐 (17분 + 3분)"""
+    config = dataclasses.replace(
+        _make_config(24, 2),
+        activities=[Activity("토론면접", ActivityMode.BATCHED, 17, "토론면접실", ["토론면접실"], 4, 6),
+                    Activity("그룹과제", ActivityMode.BATCHED, 40, "과제실", ["과제실"], 4, 6)],
+        precedence_rules=[PrecedenceRule("토론면접", "그룹과제", gap_min=3, is_adjacent=True)],
+        global_gap_min=0
+    )
+    level1_result = SingleDateScheduler()._run_level1(config)
+    result = BatchedScheduler().schedule_cpsat(level1_result.groups, config, time_limit=10)
+
+    assert result is not None
+    starts = {(item.applicant_id, item.activity_name): (item.start_time, item.end_time) for item in result.schedule}
+    gaps = {starts[(a, "그룹과제")][0] - starts[(a, "토론면접")][1] for a, name in starts if name == "토론면접"}
+    print(f"토론면접 → 그룹과제 간격: {gaps}")
+    assert gaps == {timedelta(minutes=3)}
+
+
+def test_cpsat_infeasible_keeps_greedy(monkeypatch):
+    """cpsat 엔진에서 CP-SAT이 불가능 판정해도 greedy가 찾은 배치는 사용"""
+    def infeasible(self, *args, **kwargs):
+        self.last_cpsat_status = "INFEASIBLE"
+        return None
+
+    monkeypatch.setattr(BatchedScheduler, "schedule_cpsat", infeasible)
+    config = _make_config(24, 2)
+    scheduler = SingleDateScheduler()
+    scheduler.context = SchedulingContext(level2_engine="cpsat", time_limit_sec=30)
+    level2_result = scheduler._run_level2(config, scheduler._run_level1(config))
+    assert level2_result is not None and level2_result.schedule
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v", "-s"])
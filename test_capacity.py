@@ -0,0 +1,71 @@
+"""
+일일 처리량 상한 추정 테스트
+"""
+import dataclasses
+from datetime import timedelta
+import pandas as pd
+from solver.capacity import DailyCapacityEstimator, date_config_from_frames
+from solver.feasibility import FeasibilityChecker
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.solver import _calculate_dynamic_daily_limit
+from test_level3_portfolio import _make_config
+
+
+def _frames():
+    activities = pd.DataFrame({
+        "use": [True, True, True],
+        "activity": ["토론면접", "발표준비", "발표면접"],
+        "mode": ["batched", "parallel", "individual"],
+        "duration_min": [30, 5, 15],
+        "room_type": ["토론면접실", "발표준비실", "발표면접실"],
+        "min_cap": [4, 1, 1],
+        "max_cap": [6, 2, 1],
+    })
+    room_plan = pd.DataFrame([{
+        "토론면접실_count": 2, "토론면접실_cap": 6,
+        "발표준비실_count": 2, "발표준비실_cap": 2,
+        "발표면접실_count": 3, "발표면접실_cap": 1,
+    }])
+    oper_window = pd.DataFrame([{"start_time": "09:00", "end_time": "18:00"}])
+    job_acts_map = pd.DataFrame([
+        {"code": "JOB01", "count": 20, "토론면접": True, "발표준비": True, "발표면접": True},
+        {"code": "JOB02", "count": 18, "토론면접": True, "발표준비": True, "발표면접": True},
+    ])
+    return activities, room_plan, oper_window, job_acts_map
+
+
+def test_bound_is_tight_and_names_bottleneck():
+    """상한 인원은 사전 검사를 통과하고 한 명 더하면 병목 자원에서 위반, 권장 인원은 실제로 스케줄 가능"""
+    config = _make_config()
+    estimate = DailyCapacityEstimator().estimate(config)
+    print(f"상한 {estimate.bound}명, 권장 {estimate.per_job}, 병목: {estimate.bottleneck}")
+
+    checker = FeasibilityChecker()
+    over = DailyCapacityEstimator._apportion(estimate.bound + 1, estimate.job_mix)
+    assert checker.check(dataclasses.replace(config, jobs=estimate.per_job)).feasible
+    assert not checker.check(dataclasses.replace(config, jobs=over)).feasible
+    assert "발표면접" in estimate.bottleneck
+    assert sum(estimate.per_job.values()) == estimate.recommended
+
+    result = SingleDateScheduler().schedule(dataclasses.replace(config, jobs=estimate.per_job))
+    assert result.status == "SUCCESS"
+
+
+def test_legacy_daily_limit_uses_room_types():
+    """레거시 UI 표로도 같은 설정을 만들어 같은 한도를 계산 (방 유형/그룹 수용인원/선후행 반영)"""
+    activities, room_plan, oper_window, job_acts_map = _frames()
+    config = date_config_from_frames(activities, room_plan, oper_window, job_acts_map)
+    assert [room.name for room in config.rooms][:2] == ["토론면접실A", "토론면접실B"]
+    assert config.operating_hours == (timedelta(hours=9), timedelta(hours=18))
+    assert config.jobs == {"JOB01": 20, "JOB02": 18}
+
+    limit = _calculate_dynamic_daily_limit(room_plan, oper_window, activities, job_acts_map)
+    expected = DailyCapacityEstimator().estimate(dataclasses.replace(_make_config(), precedence_rules=[]))
+    print(f"레거시 일일 한도: {limit}명")
+    assert limit == expected.recommended
+
+
+if __name__ == "__main__":
+    test_bound_is_tight_and_names_bottleneck()
+    test_legacy_daily_limit_uses_room_types()
+    print("✅ 모든 테스트 통과")
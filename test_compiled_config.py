@@ -0,0 +1,74 @@
+"""
+CompiledDateConfig (컴파일된 날짜 설정) 테스트
+"""
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, ActivityMode, PrecedenceRule, DateConfig
+)
+from solver.compiled_config import compile_date_config
+from solver.single_date_scheduler import SingleDateScheduler
+
+
+def _make_config():
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("발표준비", ActivityMode.PARALLEL, 5, "발표준비실", ["발표준비실"], 1, 2),
+        Activity("발표면접", ActivityMode.INDIVIDUAL, 15, "발표면접실", ["발표면접실"], 1, 1),
+    ]
+    rooms = [
+        Room("토론면접실A", "토론면접실", 6),
+        Room("발표준비실A", "발표준비실", 2),
+        Room("발표면접실A", "발표면접실", 1),
+        Room("발표면접실B", "발표면접실", 1),
+    ]
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs={"JOB01": 6},
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=18)),
+        precedence_rules=[
+            PrecedenceRule("토론면접", "발표준비", gap_min=0),
+            PrecedenceRule("발표준비", "발표면접", gap_min=0, is_adjacent=True),
+        ],
+        job_activity_matrix={("JOB01", a.name): True for a in activities},
+        global_gap_min=5
+    )
+
+
+def test_lookups_and_precedence():
+    """조회 테이블과 유효 간격"""
+    compiled = compile_date_config(_make_config())
+
+    assert compiled.activity("발표면접").duration_min == 15
+    assert [r.name for r in compiled.rooms_for("발표면접")] == ["발표면접실A", "발표면접실B"]
+    assert compiled.can_use_room("토론면접", "토론면접실A")
+    assert not compiled.can_use_room("토론면접", "발표면접실A")
+    assert compiled.is_batched("토론면접") and not compiled.is_batched("발표준비")
+
+    # 일반 선후행은 max(gap_min, global_gap_min), 연속배치는 gap_min 그대로
+    assert compiled.predecessors_of("발표준비") == [("토론면접", 5, False)]
+    assert compiled.successors_of("발표준비") == [("발표면접", 0, True)]
+    successor, gap = compiled.adjacent_successor("발표준비")
+    assert successor.name == "발표면접" and gap == 0
+    assert compiled.adjacent_successor("발표면접") is None
+
+
+def test_with_level1_result():
+    """Level 1 결과 포함 컴파일 - 지원자/그룹 id"""
+    config = _make_config()
+    scheduler = SingleDateScheduler()
+    level1_result = scheduler._run_level1(config)
+    compiled = compile_date_config(config, level1_result)
+
+    print(f"지원자 {len(compiled.applicants)}명, 그룹 {len(compiled.groups)}개")
+    assert compiled.job_of("JOB01_001") == "JOB01"
+    assert compiled.job_of("UNKNOWN") is None
+    assert len(compiled.groups) == len(compiled.group_ids) >= 1
+    assert all(compiled.applicant(a.id) is a for a in level1_result.applicants)
+
+
+if __name__ == "__main__":
+    test_lookups_and_precedence()
+    test_with_level1_result()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,101 @@
+"""
+체류시간 하드 제약 후보 동시 평가(sweep) 테스트
+"""
+import time
+from datetime import date, timedelta
+import pandas as pd
+import pytest
+from solver import api, constraint_sweep
+from solver.constraint_sweep import ConstraintSweep
+from solver.types import SweepPoint
+from test_ui_config_cache import _cfg
+
+
+def _point(label, cap, violations, runtime, total=40):
+    return SweepPoint(
+        label=label, hard_constraints={"2025-07-01": cap}, status="SUCCESS",
+        total_violations=violations, violation_rate=violations / total * 100, runtime_sec=runtime
+    )
+
+
+def test_pareto_and_policies():
+    """지배되는 후보는 Pareto에서 빠지고, 정책별로 다른 후보 선택"""
+    points = [
+        _point("tight", 1.5, 4, 1.0),      # 위반 10% - 허용 위반률(5%) 초과
+        _point("mid", 2.0, 1, 2.0),
+        _point("loose", 3.0, 0, 0.5),
+        _point("dominated", 3.0, 1, 3.0),  # loose에 지배됨
+    ]
+    pareto = ConstraintSweep.pareto(points)
+    picks = {policy: ConstraintSweep(policy=policy).select(pareto).label
+             for policy in ("tightest", "fewest_violations", "fastest")}
+
+    print(f"Pareto: {[p.label for p in pareto]}, 정책별 선택: {picks}")
+    assert [p.label for p in pareto] == ["tight", "mid", "loose"]
+    assert picks == {"tightest": "mid", "fewest_violations": "loose", "fastest": "loose"}
+    assert ConstraintSweep(max_violation_rate=0.0).select(pareto[:2]).label == "mid"
+    with pytest.raises(ValueError):
+        ConstraintSweep(policy="cheapest")
+
+
+def test_candidates_per_date():
+    """분위수 후보는 날짜별로 (지원자 ID가 날짜마다 겹쳐도) 따로 계산, 같은 제한은 한 번만"""
+    rows = []
+    for day, minutes in ((1, [60, 90, 120, 180]), (2, [60, 60, 60, 60])):
+        for i, stay in enumerate(minutes):
+            rows.append({"interview_date": date(2025, 7, day), "applicant_id": f"JOB01_{i:03d}", "job_code": "JOB01",
+                         "start_time": timedelta(hours=9), "end_time": timedelta(hours=9, minutes=stay)})
+    sweep = ConstraintSweep(percentiles=[0, 50, 100, 100.0], hour_caps=[2.5])
+    points = sweep.candidates(pd.DataFrame(rows))
+    caps = {p.label: p.hard_constraints for p in points}
+
+    print(f"후보별 제한: {caps}")
+    assert list(caps) == ["p0", "p50", "p100", "2.5h"]
+    assert caps["p100"] == {"2025-07-01": 3.0, "2025-07-02": 1.0}
+    assert caps["p50"] == {"2025-07-01": 1.75, "2025-07-02": 1.0}
+    assert caps["2.5h"] == {"2025-07-01": 2.5, "2025-07-02": 2.5}
+
+
+def test_sweep_end_to_end():
+    """1단계 결과 하나로 후보를 동시에 평가하고 트레이드오프 표와 선택 결과 반환"""
+    status, final_df, logs, daily_limit, reports = api.solve_for_days_sweep(
+        _cfg(24), hour_caps=[6], workers=2
+    )
+    tradeoff = reports["sweep_tradeoff"]
+
+    print(logs)
+    print(tradeoff[["label", "cap_hours", "total_violations", "runtime_sec", "pareto", "selected"]])
+    assert status == "SUCCESS" and not final_df.empty and daily_limit == 24
+    assert (tradeoff["status"] == "SUCCESS").all() and tradeoff["selected"].sum() == 1
+    selected = tradeoff[tradeoff["selected"]].iloc[0]
+    assert selected["pareto"] and selected["violation_rate"] <= 5.0
+    assert selected["cap_hours"] == tradeoff[tradeoff["violation_rate"] <= 5.0]["cap_hours"].min()
+
+
+def _slow_candidate(args):
+    """2시간 후보만 멈춘 것처럼 오래 걸리는 평가"""
+    _, hard_constraints, *_ = args
+    if 2.0 in hard_constraints.values():
+        time.sleep(60)
+    return {'status': "SUCCESS", 'exceed_analysis': {}, 'runtime_sec': 0.0}
+
+
+def test_overdue_candidates_fail(monkeypatch):
+    """제한시간(time_limit_sec + 여유) 안에 끝나지 않은 후보는 기다리지 않고 FAILED"""
+    monkeypatch.setattr(constraint_sweep, "_run_sweep_candidate", _slow_candidate)
+    monkeypatch.setattr(constraint_sweep, "SWEEP_TIMEOUT_MARGIN_SEC", 0.5)
+    points = [
+        SweepPoint(label=f"{hours:g}h", hard_constraints={"2025-07-01": hours}) for hours in (2.0, 3.0)
+    ]
+    started = time.monotonic()
+    ConstraintSweep(workers=2)._evaluate(points, {}, None, {'time_limit_sec': 0.5}, False, None)
+    elapsed = time.monotonic() - started
+
+    print(f"평가 {elapsed:.1f}초: {[(p.label, p.status, p.error) for p in points]}")
+    assert elapsed < 10
+    assert [p.status for p in points] == ["FAILED", "SUCCESS"]
+    assert "제한시간" in points[0].error
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
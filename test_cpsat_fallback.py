@@ -0,0 +1,191 @@
+"""
+Level 3 CP-SAT fallback 테스트
+
+휴리스틱이 실패해도 CP-SAT 모델이 방 용량, 지원자 중복, precedence(연속배치/간격)를
+지키는 스케줄을 만드는지 확인
+"""
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, Applicant, ActivityMode, PrecedenceRule,
+    DateConfig, SchedulingContext
+)
+from solver.individual_scheduler import IndividualScheduler
+from solver.single_date_scheduler import SingleDateScheduler
+
+
+def _make_activities():
+    return [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("발표준비", ActivityMode.PARALLEL, 5, "발표준비실", ["발표준비실"], 1, 2),
+        Activity("발표면접", ActivityMode.INDIVIDUAL, 15, "발표면접실", ["발표면접실"], 1, 1),
+    ]
+
+
+def _make_rooms():
+    return [
+        Room("토론면접실A", "토론면접실", 6),
+        Room("토론면접실B", "토론면접실", 6),
+        Room("발표준비실A", "발표준비실", 2),
+        Room("발표면접실A", "발표면접실", 1),
+        Room("발표면접실B", "발표면접실", 1),
+    ]
+
+
+def _check_schedule(items, rules, global_gap_min, room_capacity):
+    """스케줄 제약 검증 - 위반 목록 반환"""
+    errors = []
+    by_applicant = {}
+    by_room = {}
+    for item in items:
+        by_applicant.setdefault(item.applicant_id, {})[item.activity_name] = item
+        by_room.setdefault(item.room_name, []).append(item)
+
+    # 지원자 중복 / precedence
+    for applicant_id, acts in by_applicant.items():
+        ordered = sorted(acts.values(), key=lambda x: x.start_time)
+        for a, b in zip(ordered, ordered[1:]):
+            if b.start_time < a.end_time:
+                errors.append(f"{applicant_id}: {a.activity_name}/{b.activity_name} 겹침")
+        for rule in rules:
+            if rule.predecessor not in acts or rule.successor not in acts:
+                continue
+            gap = acts[rule.successor].start_time - acts[rule.predecessor].end_time
+            if rule.is_adjacent and gap != timedelta(minutes=rule.gap_min):
+                errors.append(f"{applicant_id}: 연속배치 위반 ({gap})")
+            if not rule.is_adjacent and gap < timedelta(minutes=max(rule.gap_min, global_gap_min)):
+                errors.append(f"{applicant_id}: 간격 위반 ({gap})")
+
+    # 방 용량 (batched 그룹은 같은 group_id 묶음을 1개로 계산)
+    for room_name, slots in by_room.items():
+        points = sorted({s.start_time for s in slots})
+        for t in points:
+            active = [s for s in slots if s.start_time <= t < s.end_time]
+            sessions = {s.group_id or s.applicant_id for s in active}
+            if any(s.group_id for s in active):
+                if len(sessions) > 1:
+                    errors.append(f"{room_name}: {t} 그룹 중복")
+            elif len(active) > room_capacity[room_name]:
+                errors.append(f"{room_name}: {t} 용량 초과 ({len(active)})")
+    return errors
+
+
+def test_cpsat_model_direct():
+    """휴리스틱 없이 CP-SAT 모델만으로 Individual/Parallel 배정"""
+    activities = [a for a in _make_activities() if a.mode != ActivityMode.BATCHED]
+    rooms = _make_rooms()
+    applicants = [
+        Applicant(id=f"JOB01_{i:03d}", job_code="JOB01", required_activities=["발표준비", "발표면접"])
+        for i in range(1, 9)
+    ]
+    rules = [PrecedenceRule("발표준비", "발표면접", gap_min=0, is_adjacent=True)]
+
+    scheduler = IndividualScheduler()
+    result = scheduler._schedule_cpsat(
+        applicants, activities, rooms, [],
+        timedelta(hours=9), timedelta(hours=12), "2025-07-01",
+        precedence_rules=rules, global_gap_min=5, time_limit_sec=10.0
+    )
+
+    assert result is not None and result.success
+    assert len(result.assignments) == 16
+
+    items = [slot for slots in result.schedule_by_applicant.values() for slot in slots]
+    for slot in items:
+        minutes = int((slot.start_time - timedelta(hours=9)).total_seconds() // 60)
+        assert minutes % 5 == 0, f"5분 단위 위반: {slot.start_time}"
+
+    room_capacity = {r.name: r.capacity for r in rooms}
+    errors = _check_schedule(items, rules, 5, room_capacity)
+    print(f"CP-SAT 직접 배정: {len(items)}개, 위반 {len(errors)}건")
+    assert not errors, errors
+
+    # 2명 면접실 * 15분 → 8명은 최소 60분 필요, 체류시간 합은 8 * 20분 이상
+    total_stay = sum(
+        (max(s.end_time for s in slots) - min(s.start_time for s in slots)).total_seconds() / 60
+        for slots in result.schedule_by_applicant.values()
+    )
+    assert total_stay >= 8 * 20
+
+
+def test_cpsat_infeasible():
+    """운영시간이 부족하면 None 반환"""
+    activities = [a for a in _make_activities() if a.mode == ActivityMode.INDIVIDUAL]
+    rooms = _make_rooms()
+    applicants = [
+        Applicant(id=f"JOB01_{i:03d}", job_code="JOB01", required_activities=["발표면접"])
+        for i in range(1, 6)
+    ]
+
+    result = IndividualScheduler()._schedule_cpsat(
+        applicants, activities, rooms, [],
+        timedelta(hours=9), timedelta(hours=9, minutes=30), "2025-07-01",
+        time_limit_sec=5.0
+    )
+    assert result is None
+
+
+def test_cpsat_parallel_max_capacity():
+    """parallel 활동은 방 용량이 더 커도 max_capacity를 넘겨 동시 배정하지 않음"""
+    activities = [Activity("발표준비", ActivityMode.PARALLEL, 5, "발표준비실", ["발표준비실"], 1, 4)]
+    rooms = [Room("발표준비실A", "발표준비실", 6)]
+    applicants = [
+        Applicant(id=f"JOB01_{i:03d}", job_code="JOB01", required_activities=["발표준비"])
+        for i in range(1, 7)
+    ]
+
+    # 5분 한 타임에 6명은 max_capacity(4) 초과
+    result = IndividualScheduler()._schedule_cpsat(
+        applicants, activities, rooms, [],
+        timedelta(hours=9), timedelta(hours=9, minutes=5), "2025-07-01",
+        time_limit_sec=5.0
+    )
+    assert result is None
+
+    result = IndividualScheduler()._schedule_cpsat(
+        applicants, activities, rooms, [],
+        timedelta(hours=9), timedelta(hours=9, minutes=10), "2025-07-01",
+        time_limit_sec=5.0
+    )
+    assert result is not None and result.success
+    items = [slot for slots in result.schedule_by_applicant.values() for slot in slots]
+    errors = _check_schedule(items, [], 5, {"발표준비실A": 4})
+    assert not errors, errors
+
+
+def test_single_date_with_cpsat_fallback():
+    """전체 계층 스케줄링에서 Level 3가 precedence를 지키는지 확인"""
+    activities = _make_activities()
+    rooms = _make_rooms()
+    rules = [
+        PrecedenceRule("토론면접", "발표준비", gap_min=5),
+        PrecedenceRule("발표준비", "발표면접", gap_min=0, is_adjacent=True),
+    ]
+    config = DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs={"JOB01": 12},
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=18)),
+        precedence_rules=rules,
+        job_activity_matrix={("JOB01", a.name): True for a in activities},
+        global_gap_min=5
+    )
+
+    result = SingleDateScheduler().schedule(config, SchedulingContext(time_limit_sec=10.0))
+    print(f"상태: {result.status}, 스케줄 항목: {len(result.schedule)}")
+
+    assert result.status == "SUCCESS"
+    real_items = [s for s in result.schedule if not s.applicant_id.startswith("DUMMY")]
+    assert len(real_items) == 12 * 3
+
+    room_capacity = {r.name: r.capacity for r in rooms}
+    errors = _check_schedule(result.schedule, rules, 5, room_capacity)
+    assert not errors, errors
+
+
+if __name__ == "__main__":
+    test_cpsat_model_direct()
+    test_cpsat_infeasible()
+    test_cpsat_parallel_max_capacity()
+    test_single_date_with_cpsat_fallback()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,76 @@
+"""
+같은 설정의 날짜를 한 번만 스케줄링하는지 테스트
+"""
+import time
+from datetime import datetime
+import solver.multi_date_scheduler as multi_date_module
+from solver.multi_date_scheduler import MultiDateScheduler
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import DatePlan, GlobalConfig, PrecedenceRule, SchedulingContext
+
+GLOBAL_CONFIG = GlobalConfig(
+    precedence_rules=[PrecedenceRule("토론면접", "발표면접", gap_min=5)],
+    global_gap_min=5
+)
+ROOMS = {"토론실": {"count": 2, "capacity": 6}, "발표실": {"count": 2, "capacity": 1}}
+ACTIVITIES = {
+    "토론면접": {"mode": "batched", "duration_min": 30, "room_type": "토론실",
+                 "min_capacity": 4, "max_capacity": 6},
+    "발표면접": {"mode": "individual", "duration_min": 15, "room_type": "발표실"},
+}
+
+
+def _plans(days, overrides=None):
+    return {
+        datetime(2025, 7, day): DatePlan(
+            datetime(2025, 7, day), {"JOB01": 12}, ["토론면접", "발표면접"],
+            overrides if day == days[-1] else None
+        )
+        for day in days
+    }
+
+
+def _run(date_plans, dedupe, monkeypatch):
+    calls = []
+
+    class CountingScheduler(SingleDateScheduler):
+        def schedule(self, config, context=None, deadline=None):
+            calls.append(config.date)
+            return super().schedule(config, context, deadline)
+
+    monkeypatch.setattr(multi_date_module, "SingleDateScheduler", CountingScheduler)
+    context = SchedulingContext(date_workers=1, dedupe_dates=dedupe)
+    started = time.perf_counter()
+    result = MultiDateScheduler().schedule(date_plans, GLOBAL_CONFIG, ROOMS, ACTIVITIES, context)
+    return result, calls, time.perf_counter() - started
+
+
+def test_identical_days_solved_once(monkeypatch):
+    """4일 모두 같은 설정이면 한 번만 풀고 날짜만 바꿔 복제"""
+    result, calls, elapsed = _run(_plans([1, 2, 3, 4]), True, monkeypatch)
+    _, all_calls, elapsed_all = _run(_plans([1, 2, 3, 4]), False, monkeypatch)
+
+    print(f"중복 제거 {elapsed:.2f}초 ({len(calls)}회) vs 전체 {elapsed_all:.2f}초 ({len(all_calls)}회)")
+    assert calls == [datetime(2025, 7, 1)] and len(all_calls) == 4
+    assert result.status == "SUCCESS" and result.scheduled_applicants == 48
+    first = result.results[datetime(2025, 7, 1)]
+    for date, date_result in result.results.items():
+        assert date_result.date == date
+        assert set(date_result.to_dataframe()["interview_date"]) == {date.date()}
+        assert [(i.applicant_id, i.room_name, i.start_time) for i in date_result.schedule] == \
+               [(i.applicant_id, i.room_name, i.start_time) for i in first.schedule]
+    assert first.schedule[0] is not result.results[datetime(2025, 7, 2)].schedule[0]
+
+
+def test_different_override_solved_separately(monkeypatch):
+    """운영시간 오버라이드가 다른 날짜는 따로 스케줄링"""
+    plans = _plans([1, 2, 3], overrides={"operating_hours": {"start": "10:00", "end": "17:00"}})
+    result, calls, _ = _run(plans, True, monkeypatch)
+
+    assert calls == [datetime(2025, 7, 1), datetime(2025, 7, 3)]
+    assert min(i.start_time for i in result.results[datetime(2025, 7, 3)].schedule).seconds >= 10 * 3600
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-q", "-s"])
@@ -0,0 +1,138 @@
+"""
+날짜별 프로세스 병렬 실행 테스트
+"""
+import dataclasses
+import functools
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from datetime import datetime
+from solver.date_executor import DateProcessExecutor
+from solver.optimized_multi_date_scheduler import OptimizedMultiDateScheduler
+from solver.types import DatePlan, GlobalConfig, PrecedenceRule, SchedulingContext
+from test_level3_portfolio import _make_config
+
+
+class _SlowScheduler:
+    """제한시간 테스트용: 2025-07-02만 오래 걸리는 스케줄러 (pickle 가능한 최상위 클래스)"""
+
+    def schedule(self, config, context=None):
+        if config.date.day == 2:
+            time.sleep(60)
+        from solver.single_date_scheduler import SingleDateScheduler
+        return SingleDateScheduler().schedule(config, context)
+
+
+class _NestedSlowScheduler:
+    """2025-07-02에 하위 프로세스를 띄우고 멈추는 스케줄러 (하위 프로세스 pid를 파일에 기록)"""
+
+    def __init__(self, pid_path):
+        self.pid_path = pid_path
+
+    def schedule(self, config, context=None):
+        if config.date.day == 2:
+            child = mp.Process(target=time.sleep, args=(60,))
+            child.start()
+            with open(self.pid_path, "w") as f:
+                f.write(str(child.pid))
+            time.sleep(60)
+        from solver.single_date_scheduler import SingleDateScheduler
+        return SingleDateScheduler().schedule(config, context)
+
+
+def _alive(pid):
+    """프로세스가 살아 있는지 (좀비는 종료로 봄)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] not in ("Z", "X")
+    except FileNotFoundError:
+        return False
+
+
+def _configs(days):
+    return {
+        datetime(2025, 7, day): dataclasses.replace(_make_config(), date=datetime(2025, 7, day))
+        for day in days
+    }
+
+
+def test_results_in_date_order_with_progress():
+    """완료 순서와 관계없이 날짜 순서 결과, 작업자 진행 상황이 부모 콜백으로 전달됨"""
+    events = []
+    context = SchedulingContext(progress_callback=events.append)
+    results = DateProcessExecutor(max_workers=2).run(_configs([3, 1, 2]), context)
+
+    print(f"결과: {[(d.day, r.status) for d, r in results.items()]}, 진행 보고 {len(events)}개")
+    assert list(results) == sorted(results)
+    assert all(r.status == "SUCCESS" and r.schedule for r in results.values())
+    assert any(e.stage == "Level3" and e.details.get("date") for e in events)
+    assert events[-1].stage == "MultiDate" and events[-1].progress == 1.0
+
+
+def test_date_timeout_returns_failed():
+    """제한시간을 넘긴 날짜는 기다리지 않고 FAILED, 나머지 날짜는 정상 처리"""
+    executor = DateProcessExecutor(max_workers=2, date_timeout_sec=3, scheduler_factory=_SlowScheduler)
+    started = time.monotonic()
+    results = executor.run(_configs([1, 2]))
+    elapsed = time.monotonic() - started
+
+    print(f"경과 {elapsed:.1f}초: {[(d.day, r.status, r.error_message) for d, r in results.items()]}")
+    assert elapsed < 30
+    assert results[datetime(2025, 7, 1)].status == "SUCCESS"
+    assert results[datetime(2025, 7, 2)].status == "FAILED"
+    assert "제한시간 초과" in results[datetime(2025, 7, 2)].error_message
+
+
+def test_timeout_kills_nested_processes():
+    """제한시간 초과시 작업자가 띄운 하위 프로세스까지 종료"""
+    pid_path = os.path.join(tempfile.mkdtemp(), "child.pid")
+    executor = DateProcessExecutor(
+        max_workers=2, date_timeout_sec=3, scheduler_factory=functools.partial(_NestedSlowScheduler, pid_path)
+    )
+    results = executor.run(_configs([1, 2]))
+    with open(pid_path) as f:
+        child_pid = int(f.read())
+    for _ in range(20):
+        if not _alive(child_pid):
+            break
+        time.sleep(0.1)
+
+    print(f"결과: {[(d.day, r.status) for d, r in results.items()]}, 하위 프로세스 {child_pid} 종료: {not _alive(child_pid)}")
+    assert results[datetime(2025, 7, 1)].status == "SUCCESS"
+    assert results[datetime(2025, 7, 2)].status == "FAILED"
+    assert not _alive(child_pid)
+
+
+def test_optimized_multi_date_from_date_plans():
+    """OptimizedMultiDateScheduler: DatePlan으로 날짜별 설정을 만들어 병렬 실행, 성공 날짜 집계"""
+    global_config = GlobalConfig(
+        precedence_rules=[PrecedenceRule("토론면접", "발표면접", gap_min=5)],
+        global_gap_min=5
+    )
+    rooms = {"토론실": {"count": 2, "capacity": 6}, "발표실": {"count": 2, "capacity": 1}}
+    activities = {
+        "토론면접": {"mode": "batched", "duration_min": 30, "room_type": "토론실",
+                     "min_capacity": 4, "max_capacity": 6},
+        "발표면접": {"mode": "individual", "duration_min": 15, "room_type": "발표실"},
+    }
+    date_plans = {
+        datetime(2025, 7, day): DatePlan(datetime(2025, 7, day), {"JOB01": 12}, ["토론면접", "발표면접"])
+        for day in (1, 2)
+    }
+
+    scheduler = OptimizedMultiDateScheduler()
+    result = scheduler.schedule(date_plans, global_config, rooms, activities, SchedulingContext(date_workers=2))
+
+    print(f"상태 {result.status}, {result.scheduled_applicants}/{result.total_applicants}명")
+    assert result.status == "SUCCESS"
+    assert list(result.results) == sorted(date_plans)
+    assert result.scheduled_applicants == result.total_applicants == 24
+
+
+if __name__ == "__main__":
+    test_results_in_date_order_with_progress()
+    test_date_timeout_returns_failed()
+    test_timeout_kills_nested_processes()
+    test_optimized_multi_date_from_date_plans()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,90 @@
+"""
+전체 제한시간(deadline)과 레벨별 예산 분배 테스트
+"""
+import threading
+from solver.deadline import Deadline
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import Level3Result, SchedulingContext
+from test_level3_portfolio import _make_config
+
+
+class _Clock:
+    """테스트용 시계 (직접 시간을 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_budget_split_adapts():
+    """남은 시간을 이후 레벨 가중치 비율로 나누고, 앞 레벨 잔여 시간은 뒤로 넘어감"""
+    clock = _Clock()
+    deadline = Deadline(100, clock=clock)
+    assert deadline.budget("level1") == 10.0           # 100 × 1/10
+    assert deadline.budget("level3", cap=30) == 30.0   # 100 × 4/6, 상한 30초
+
+    clock.now = 2.0                                     # Level 1이 2초 만에 끝남
+    assert deadline.budget("level2") == 98.0 * 3 / 9
+    clock.now = 90.0
+    assert deadline.budget("level4") == 10.0            # 마지막 레벨은 남은 시간 전부
+    clock.now = 120.0
+    assert deadline.expired() and deadline.budget("level3") == 0.0
+
+    stop = threading.Event()
+    stopped = Deadline(100, clock=_Clock(), stop_event=stop)
+    assert not stopped.expired()
+    stop.set()                                          # 부모가 중단 신호를 보냄
+    assert stopped.expired() and stopped.remaining() == 0.0
+
+
+def test_levels_use_deadline_budget():
+    """Level 2/3 제한시간과 Level 3 탐색 예산은 deadline의 레벨 몫을 넘지 않음"""
+    clock = _Clock()
+    scheduler = SingleDateScheduler()
+    scheduler.context = SchedulingContext(time_limit_sec=120, level3_search_time_sec=5.0)
+    scheduler._deadline = Deadline(12, clock=clock)
+
+    assert scheduler._level2_time_limit() == 12 * 3 / 9
+    assert scheduler._level3_time_limit() == 12 * 4 / 6
+    clock.now = 11.0
+    assert scheduler._level3_time_limit() == 1.0 * 4 / 6
+    assert scheduler._create_individual_scheduler().search_time_limit_sec == 1.0 * 4 / 6
+
+
+def test_partial_result_on_timeout():
+    """Level 3 도중 시간이 다 되면 백트래킹 없이 부분 결과(PARTIAL) 반환"""
+    config = _make_config()
+    clock = _Clock()
+    scheduler = SingleDateScheduler()
+    run_level3 = scheduler._run_level3
+    calls = []
+
+    def slow_partial_level3(config, level1_result, level2_result, portfolio_seed=None, dummy_hint=None):
+        # 첫 지원자를 못 넣은 채 제한시간 소진
+        calls.append(portfolio_seed)
+        full = run_level3(config, level1_result, level2_result, portfolio_seed)
+        first = full.schedule[0].applicant_id
+        partial = Level3Result()
+        partial.schedule = [item for item in full.schedule if item.applicant_id != first]
+        partial.unscheduled = [first]
+        clock.now = 1000.0
+        return partial
+
+    scheduler._run_level3 = slow_partial_level3
+    result = scheduler.schedule(config, deadline=Deadline(60, clock=clock))
+
+    print(f"상태: {result.status}, {result.error_message}, 항목 {len(result.schedule)}개")
+    assert result.status == "PARTIAL"
+    assert calls == [None]                              # 백트래킹 재시도 없음
+    assert "제한시간 초과" in result.error_message
+    assert len(result.level3_result.unscheduled) == 1
+    assert len(result.schedule) == len(result.level2_result.schedule) + len(result.level3_result.schedule)
+
+
+if __name__ == "__main__":
+    test_budget_split_adapts()
+    test_levels_use_deadline_budget()
+    test_partial_result_on_timeout()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,63 @@
+"""
+날짜별 지원자 배분(부하 균형) 테스트
+"""
+from datetime import datetime
+from solver.distribution import DateLoadBalancer
+from solver.feasibility import FeasibilityChecker
+from solver.multi_date_scheduler import MultiDateScheduler
+from solver.types import DatePlan, SchedulingContext
+from test_date_dedupe import GLOBAL_CONFIG, ROOMS, ACTIVITIES
+
+DAY1, DAY2, DAY3 = (datetime(2025, 7, day) for day in (1, 2, 3))
+
+
+def _plans(counts, overrides=None):
+    overrides = overrides or {}
+    return {
+        date: DatePlan(date, jobs, ["토론면접", "발표면접"], overrides.get(date))
+        for date, jobs in zip((DAY1, DAY2, DAY3), counts)
+    }
+
+
+def test_overloaded_day_rebalanced():
+    """한 날짜에 몰린 인원(발표면접실 용량 68명 초과)을 나눠 모든 날짜가 첫 시도에 성공"""
+    plans = _plans([{"JOB01": 70, "JOB02": 10}, {"JOB01": 10}])
+    context = SchedulingContext(date_workers=1, time_limit_sec=30)
+    unbalanced = MultiDateScheduler().schedule(plans, GLOBAL_CONFIG, ROOMS, ACTIVITIES, context)
+    assert unbalanced.results[DAY1].status == "FAILED"
+    assert "사전 검사 실패" in unbalanced.results[DAY1].error_message
+
+    context = SchedulingContext(date_workers=1, time_limit_sec=30, balance_dates=True)
+    result = MultiDateScheduler().schedule(plans, GLOBAL_CONFIG, ROOMS, ACTIVITIES, context)
+    counts = {date.day: len({i.applicant_id for i in r.schedule if not i.applicant_id.startswith("DUMMY_")})
+              for date, r in result.results.items()}
+    print(f"재배분 결과: {counts}, 상태 {result.status}")
+    assert result.status == "SUCCESS"
+    assert result.scheduled_applicants == result.total_applicants == 90
+    assert all(r.backtrack_count == 0 for r in result.results.values())
+
+
+def test_fixed_assignment_and_hosts():
+    """고정 배정은 그대로, 나머지는 사용률이 낮은 날짜로"""
+    builder = MultiDateScheduler()
+    plans = _plans(
+        [{"JOB01": 30, "JOB02": 30}, {"JOB01": 0}, {"JOB02": 12}],
+        overrides={DAY2: {"fixed_jobs": {"JOB02": 12}}}
+    )
+    configs = {date: builder._build_date_config(plan, GLOBAL_CONFIG, ROOMS, ACTIVITIES) for date, plan in plans.items()}
+    fixed = {DAY2: {"JOB02": 12}}
+    balanced = DateLoadBalancer().balance(configs, fixed)
+
+    jobs = {date.day: config.jobs for date, config in balanced.items()}
+    print(f"배분: {jobs}")
+    assert balanced[DAY2].jobs["JOB02"] >= 12
+    assert sum(c.jobs.get("JOB01", 0) for c in balanced.values()) == 30
+    assert sum(c.jobs.get("JOB02", 0) for c in balanced.values()) == 42
+    loads = [max(FeasibilityChecker().check(c).utilization.values()) for c in balanced.values()]
+    assert max(loads) - min(loads) < 0.2
+
+
+if __name__ == "__main__":
+    test_overloaded_day_rebalanced()
+    test_fixed_assignment_and_hosts()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,70 @@
+"""
+실행 전 실현 가능성 사전 검사 테스트
+"""
+import time
+from datetime import datetime, timedelta
+from solver.feasibility import FeasibilityChecker
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import Activity, ActivityMode, DateConfig, PrecedenceRule, Room
+from test_group_sizing import _chain_config
+from test_level3_portfolio import _make_config
+
+
+def _interview_config(n_applicants, hours, n_rooms=2):
+    activities = [Activity("발표면접", ActivityMode.INDIVIDUAL, 30, "발표면접실", ["발표면접실"], 1, 1)]
+    rooms = [Room(f"발표면접실{chr(65 + i)}", "발표면접실", 1) for i in range(n_rooms)]
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs={"JOB01": n_applicants},
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=9 + hours)),
+        job_activity_matrix={("JOB01", "발표면접"): True},
+        global_gap_min=5
+    )
+
+
+def test_overloaded_config_fails_fast():
+    """방 사용시간이 모자라면 레벨 실행 없이 100ms 안에 실패, 사유에 자원 명시"""
+    config = _interview_config(40, 4)  # 40명 × 30분 = 1200분 > 방 2개 × 240분
+    started = time.perf_counter()
+    result = SingleDateScheduler().schedule(config)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{elapsed_ms:.1f}ms: {result.error_message}")
+    assert result.status == "FAILED" and result.level1_result is None
+    assert "발표면접" in result.error_message and "1200분" in result.error_message
+    assert elapsed_ms < 100
+
+
+def test_precedence_chain_and_bottleneck_hint():
+    """선후행 최장 경로가 운영시간을 넘으면 위반, 여유가 적은 자원은 병목 후보로 안내"""
+    config = _make_config()
+    config.precedence_rules.append(PrecedenceRule("토론면접", "발표면접", gap_min=500))
+    report = FeasibilityChecker().check(config)
+    print(f"위반: {report.violations}")
+    assert not report.feasible
+    assert any("선후행 최장 경로" in v for v in report.violations)
+
+    tight = _interview_config(15, 4)  # 450분 / 480분
+    report = FeasibilityChecker().check(tight)
+    print(f"병목 후보: {report.bottlenecks} ({report.elapsed_ms}ms)")
+    assert report.feasible
+    assert report.bottlenecks[0]["resource"] == "발표면접 방 사용시간"
+    assert report.bottlenecks[0]["utilization"] > 0.9
+
+
+def test_feasible_configs_pass():
+    """풀리는 설정은 사전 검사 통과 (하한이 실제 해를 막지 않음)"""
+    for config in (_make_config(), _interview_config(16, 4)):
+        assert FeasibilityChecker().check(config).feasible
+        assert SingleDateScheduler().schedule(config).status == "SUCCESS"
+    # 토론면접실 1개를 JOB02(9~10시) / JOB01(10~11시)가 나눠 쓰는 설정도 통과
+    assert FeasibilityChecker().check(_chain_config()).feasible
+
+
+if __name__ == "__main__":
+    test_overloaded_config_fails_fast()
+    test_precedence_chain_and_bottleneck_hint()
+    test_feasible_configs_pass()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,115 @@
+"""
+Level 1 방 수용인원/슬롯 수 기반 그룹 구성 테스트
+"""
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, ActivityMode, PrecedenceRule, DateConfig, SchedulingContext
+)
+from solver.compiled_config import compile_date_config
+from solver.single_date_scheduler import SingleDateScheduler
+
+
+def _make_config(n_applicants, n_rooms, hours, room_capacity=6):
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("그룹과제", ActivityMode.BATCHED, 40, "과제실", ["과제실"], 4, 6),
+    ]
+    rooms = [Room(f"토론면접실{chr(65 + i)}", "토론면접실", room_capacity) for i in range(n_rooms)]
+    rooms += [Room(f"과제실{chr(65 + i)}", "과제실", room_capacity) for i in range(n_rooms)]
+    jobs = {"JOB01": n_applicants}
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs=jobs,
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=9 + hours)),
+        precedence_rules=[PrecedenceRule("토론면접", "그룹과제", gap_min=5)],
+        job_activity_matrix={(job, a.name): True for job in jobs for a in activities},
+        global_gap_min=5
+    )
+
+
+def _chain_config():
+    """토론면접실 1개, JOB01은 사전과제 → 토론면접, JOB02는 토론면접 → 사후과제 (9~11시, 간격 0)"""
+    activities = [
+        Activity("사전과제", ActivityMode.BATCHED, 60, "과제실", ["과제실"], 4, 6),
+        Activity("토론면접", ActivityMode.BATCHED, 60, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("사후과제", ActivityMode.BATCHED, 60, "과제실", ["과제실"], 4, 6),
+    ]
+    rooms = [Room("토론면접실A", "토론면접실", 6), Room("과제실A", "과제실", 6), Room("과제실B", "과제실", 6)]
+    performs = {"JOB01": ("사전과제", "토론면접"), "JOB02": ("토론면접", "사후과제")}
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs={"JOB01": 6, "JOB02": 6},
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=11)),
+        precedence_rules=[PrecedenceRule("사전과제", "토론면접", gap_min=0),
+                          PrecedenceRule("토론면접", "사후과제", gap_min=0)],
+        job_activity_matrix={(job, a.name): a.name in performs[job] for job in performs for a in activities},
+        global_gap_min=0
+    )
+
+
+def test_slot_capacity_infeasible():
+    """방 × 슬롯 수보다 그룹이 많으면 Level 2/백트래킹 없이 바로 실패"""
+    # 2시간, 방 1개: 토론면접 슬롯 = (120 - 그룹과제 40 - 간격 5) // 30 = 2 < 필요 그룹 4
+    config = _make_config(20, 1, 2)
+    scheduler = SingleDateScheduler()
+    assert scheduler._run_level1(config) is None
+    assert "토론면접" in scheduler._level1_infeasibility
+
+    result = scheduler.schedule(config)
+    print(f"실패 사유: {result.error_message}")
+    assert result.status == "FAILED"
+    assert result.backtrack_count == 0
+    assert "배치 가능" in result.error_message
+
+
+def test_slot_capacity_feasible():
+    """슬롯이 충분하면 같은 그룹 수로 Level 2까지 성공"""
+    config = _make_config(20, 2, 2)
+    result = SingleDateScheduler().schedule(config)
+    assert result.status == "SUCCESS", result.error_message
+    assert result.backtrack_count == 0
+
+
+def test_slot_capacity_per_job_windows():
+    """직무마다 앞뒤 선후행이 다르면 직무별 구간으로 판단 (JOB02 9~10시, JOB01 10~11시)"""
+    config = _chain_config()
+    required_by_job = {"JOB01": {"사전과제", "토론면접"}, "JOB02": {"토론면접", "사후과제"}}
+    slots, job_slots = compile_date_config(config).slots_per_room(config.activities[1], required_by_job, 120)
+    assert (slots, job_slots) == (2, {"JOB01": 1, "JOB02": 1})
+    scheduler = SingleDateScheduler()
+    assert scheduler._run_level1(config) is not None, scheduler._level1_infeasibility
+
+    result = SingleDateScheduler().schedule(config, context=SchedulingContext(level2_engine="auto"))
+    starts = {(i.job_code, i.activity_name): i.start_time for i in result.schedule}
+    print(f"토론면접 시작: JOB01 {starts[('JOB01', '토론면접')]}, JOB02 {starts[('JOB02', '토론면접')]}")
+    assert result.status == "SUCCESS", result.error_message
+    assert starts[("JOB02", "토론면접")] == timedelta(hours=9)
+    assert starts[("JOB01", "토론면접")] == timedelta(hours=10)
+
+    # 그룹이 직무별 구간 합집합의 슬롯보다 많으면 여전히 실패
+    config = _chain_config()
+    config.jobs["JOB01"] = 12
+    scheduler = SingleDateScheduler()
+    assert scheduler._run_level1(config) is None
+    assert "토론면접" in scheduler._level1_infeasibility
+
+
+def test_group_size_capped_by_room():
+    """방 수용인원이 활동 최대 인원보다 작으면 그룹 크기를 방에 맞춤"""
+    config = _make_config(20, 2, 8, room_capacity=5)
+    level1_result = SingleDateScheduler()._run_level1(config)
+    sizes = [group.size for group in level1_result.groups["토론면접"]]
+    print(f"그룹 크기: {sizes}")
+    assert max(sizes) <= 5 and len(sizes) == 4
+
+
+if __name__ == "__main__":
+    test_slot_capacity_infeasible()
+    test_slot_capacity_feasible()
+    test_slot_capacity_per_job_windows()
+    test_group_size_capped_by_room()
+    print("✅ 모든 테스트 통과")
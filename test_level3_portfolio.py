@@ -0,0 +1,129 @@
+"""
+Level 3 포트폴리오 (휴리스틱 변형 동시 실행) 테스트
+"""
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, ActivityMode, PrecedenceRule, DateConfig
+)
+from solver.individual_scheduler import IndividualScheduler, HeuristicVariant
+from solver.single_date_scheduler import SingleDateScheduler
+
+
+def _make_config():
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("발표준비", ActivityMode.PARALLEL, 5, "발표준비실", ["발표준비실"], 1, 2),
+        Activity("발표면접", ActivityMode.INDIVIDUAL, 15, "발표면접실", ["발표면접실"], 1, 1),
+    ]
+    rooms = [
+        Room("토론면접실A", "토론면접실", 6),
+        Room("토론면접실B", "토론면접실", 6),
+        Room("발표준비실A", "발표준비실", 2),
+        Room("발표준비실B", "발표준비실", 2),
+        Room("발표면접실A", "발표면접실", 1),
+        Room("발표면접실B", "발표면접실", 1),
+        Room("발표면접실C", "발표면접실", 1),
+    ]
+    jobs = {"JOB01": 20, "JOB02": 18}
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs=jobs,
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=18)),
+        precedence_rules=[
+            PrecedenceRule("토론면접", "발표준비", gap_min=5),
+            PrecedenceRule("발표준비", "발표면접", gap_min=0, is_adjacent=True),
+        ],
+        job_activity_matrix={(job, a.name): True for job in jobs for a in activities},
+        global_gap_min=5
+    )
+
+
+def _run_portfolio(max_workers, first_feasible):
+    config = _make_config()
+    single = SingleDateScheduler()
+    level1_result = single._run_level1(config)
+    level2_result = single._run_level2(config, level1_result)
+
+    scheduler = IndividualScheduler()
+    result = scheduler.schedule_portfolio(
+        level1_result.applicants, config.activities, config.rooms,
+        level2_result.group_results, config.operating_hours[0], config.operating_hours[1],
+        "2025-07-01", config.precedence_rules, config.global_gap_min,
+        time_limit_sec=30, n_variants=6, max_workers=max_workers,
+        first_feasible=first_feasible
+    )
+    return scheduler, result
+
+
+def test_build_portfolio():
+    """첫 변형은 기본 휴리스틱, 나머지는 서로 다른 변형"""
+    variants = IndividualScheduler.build_portfolio(8, seed=10)
+    assert variants[0] == HeuristicVariant(seed=10)
+    assert len(set(variants)) == 8
+    assert {v.applicant_order for v in variants[1:]} == {"constrained", "job", "random"}
+
+
+def test_portfolio_best_stay():
+    """best-by-stay 모드: 기본 휴리스틱보다 총 체류시간이 길지 않음"""
+    scheduler, result = _run_portfolio(max_workers=1, first_feasible=False)
+    assert result is not None and result.success
+    assert not scheduler._find_precedence_violations(result)
+
+    _, default_result = _run_portfolio(max_workers=1, first_feasible=True)
+    best_stay = scheduler._total_stay_minutes(result)
+    default_stay = scheduler._total_stay_minutes(default_result)
+    print(f"총 체류시간: 기본 {default_stay:.0f}분 → 포트폴리오 {best_stay:.0f}분")
+    assert best_stay <= default_stay
+
+
+def test_portfolio_process_pool():
+    """프로세스 풀 실행 결과도 제약을 만족"""
+    scheduler, result = _run_portfolio(max_workers=2, first_feasible=False)
+    assert result is not None and result.success
+    assert not scheduler._find_precedence_violations(result)
+    assert len(result.assignments) == 76  # 38명 × (발표준비 + 발표면접)
+
+
+def test_portfolio_stop_event():
+    """중단 신호가 설정되면 휴리스틱 탐색이 바로 실패로 끝남"""
+    import multiprocessing
+    config = _make_config()
+    single = SingleDateScheduler()
+    level1_result = single._run_level1(config)
+    level2_result = single._run_level2(config, level1_result)
+
+    scheduler = IndividualScheduler()
+    scheduler.stop_event = multiprocessing.Event()
+    scheduler.stop_event.set()
+    scheduler._ensure_compiled(
+        config.activities, config.rooms, config.precedence_rules,
+        config.global_gap_min, level1_result.applicants
+    )
+    individual_activities = [a for a in config.activities if a.mode != ActivityMode.BATCHED]
+    result = scheduler._schedule_heuristic(
+        level1_result.applicants, individual_activities, config.rooms,
+        level2_result.group_results, config.operating_hours[0], config.operating_hours[1],
+        "2025-07-01", config.precedence_rules, config.global_gap_min
+    )
+    assert result is not None and not result.success
+    assert scheduler.search_stats["nodes"] == 0
+
+
+def test_portfolio_workers_from_context():
+    """SchedulingContext.level3_portfolio_workers로 포트폴리오 프로세스 수 지정"""
+    from solver.types import SchedulingContext
+    single = SingleDateScheduler()
+    assert single._level3_portfolio_workers() is None
+    single.context = SchedulingContext(level3_portfolio_workers=1)
+    assert single._level3_portfolio_workers() == 1
+
+
+if __name__ == "__main__":
+    test_build_portfolio()
+    test_portfolio_best_stay()
+    test_portfolio_process_pool()
+    test_portfolio_stop_event()
+    test_portfolio_workers_from_context()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,60 @@
+"""
+Level 4 지역 탐색 (anneal 엔진) 테스트
+"""
+from datetime import timedelta
+from solver.level4_local_search import StayTimeLocalSearch
+from solver.level4_post_processor import Level4PostProcessor
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import PrecedenceRule
+from test_level3_portfolio import _make_config
+from test_cpsat_fallback import _check_schedule
+from test_schedule_index import _make_index
+
+
+def _stay_minutes(schedule):
+    spans = {}
+    for item in schedule:
+        start, end = spans.get(item.applicant_id, (item.start_time, item.end_time))
+        spans[item.applicant_id] = (min(start, item.start_time), max(end, item.end_time))
+    return sum((end - start).total_seconds() for start, end in spans.values()) / 60
+
+
+def test_search_improves_small_schedule():
+    """G1을 발표면접 쪽으로 옮기는 개선(240분 이상)을 찾고 제약 유지"""
+    index = _make_index()
+    initial = _stay_minutes(index.items)
+    search = StayTimeLocalSearch(index, 5, seed=0)
+    best = search.run(time_budget_sec=5.0, max_iterations=3000)
+
+    print(f"체류시간 {initial:.0f}분 → {_stay_minutes(best):.0f}분, 통계 {dict(search.stats)}")
+    assert _stay_minutes(best) <= initial - 240
+    rules = [PrecedenceRule("토론면접", "발표면접", gap_min=5)]
+    assert not _check_schedule(best, rules, 5, {"토론면접실A": 6, "발표면접실A": 1})
+
+
+def test_anneal_engine_not_worse_than_greedy():
+    """anneal 엔진: 제약 위반 없음, greedy 이상 개선, 보고한 개선량 = 실제 감소량"""
+    config = _make_config()
+    result = SingleDateScheduler().schedule(config)
+    assert result.status == "SUCCESS"
+    original = result.level4_result.original_schedule if result.level4_result else result.schedule
+    greedy = Level4PostProcessor().optimize_stay_times(original, config)
+
+    anneal = Level4PostProcessor().optimize_stay_times(
+        original, config, engine="anneal", time_budget_sec=1.0
+    )
+    assert anneal.success
+    capacity = {room.name: room.capacity for room in config.rooms}
+    assert not _check_schedule(anneal.optimized_schedule, config.precedence_rules, config.global_gap_min, capacity)
+
+    saved = (_stay_minutes(original) - _stay_minutes(anneal.optimized_schedule)) / 60
+    print(f"greedy {(_stay_minutes(original) - _stay_minutes(greedy.optimized_schedule)) / 60:.1f}시간, "
+          f"anneal {saved:.1f}시간 개선 ({anneal.adjusted_groups}개 그룹 이동)")
+    assert abs(saved - anneal.total_improvement_hours) < 1e-6
+    assert _stay_minutes(anneal.optimized_schedule) <= _stay_minutes(greedy.optimized_schedule)
+
+
+if __name__ == "__main__":
+    test_search_improves_small_schedule()
+    test_anneal_engine_not_worse_than_greedy()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,96 @@
+"""
+최대 체류시간 제약을 Level 2/3 배치 단계에서 지키는지 테스트
+"""
+from datetime import datetime, timedelta
+from solver import api
+from solver.multi_date_scheduler import MultiDateScheduler
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import DatePlan, GlobalConfig, Level3Result, stay_violations
+from solver.ui_config_cache import UIConfigCache
+from test_date_dedupe import GLOBAL_CONFIG, ROOMS, ACTIVITIES
+from test_ui_config_cache import _cfg
+
+DAY = datetime(2025, 7, 1)
+LIMIT = timedelta(hours=1.5)
+
+
+def _schedule(count, overrides=None):
+    plan = DatePlan(DAY, {"JOB01": count}, ["토론면접", "발표면접"], overrides)
+    config = MultiDateScheduler()._build_date_config(plan, GLOBAL_CONFIG, ROOMS, ACTIVITIES)
+    return config, SingleDateScheduler().schedule(config)
+
+
+def test_stay_limit_enforced_before_level4():
+    """날짜 오버라이드의 체류시간 제한을 Level 2/3 결과부터 지킴 (제한이 없으면 초과자 발생)"""
+    _, free = _schedule(24)
+    config, limited = _schedule(24, {"max_stay_hours": 1.5})
+    free_pre = free.level2_result.schedule + free.level3_result.schedule
+    limited_pre = limited.level2_result.schedule + limited.level3_result.schedule
+
+    print(f"제한 없음: 초과 {len(stay_violations(free_pre, LIMIT))}명, "
+          f"제한 1.5시간: 초과 {len(stay_violations(limited_pre, LIMIT))}명")
+    assert config.max_stay == LIMIT
+    assert stay_violations(free_pre, LIMIT)
+    assert limited.status == "SUCCESS" and limited.backtrack_count == 0
+    assert stay_violations(limited_pre, LIMIT) == {}
+    assert stay_violations(limited.schedule, LIMIT) == {}
+
+
+def test_stay_limit_below_activity_sum_fails_precheck():
+    """활동 소요시간 합보다 짧은 제한은 사전 검사에서 바로 실패"""
+    _, result = _schedule(12, {"max_stay_hours": 0.5})
+    print(f"결과: {result.status} - {result.error_message}")
+    assert result.status == "FAILED"
+    assert "최대 체류시간" in result.error_message
+
+
+def test_ui_date_overrides_reach_date_config():
+    """UI 설정의 날짜별 오버라이드(2단계 스케줄링 하드 제약 형식)가 날짜 설정에 반영"""
+    cfg = _cfg(12)
+    cfg["max_stay_hours"] = 6
+    cfg["date_overrides"] = {"2025-07-01 00:00:00": {"max_stay_hours": 2.5}}
+    conversion = UIConfigCache().get_or_convert(cfg, api._integrate_and_convert, [])
+
+    stays = {d.day: c.max_stay_hours for d, c in conversion.date_configs.items()}
+    print(f"날짜별 체류시간 제한: {stays}")
+    assert stays == {1: 2.5, 2: 6}
+
+
+def test_ui_default_matches_global_config():
+    """UI 설정에 체류시간 제한이 없으면 GlobalConfig 기본값(8시간) 사용"""
+    cfg = _cfg(12)
+    cfg.pop("max_stay_hours", None)
+    conversion = UIConfigCache().get_or_convert(cfg, api._integrate_and_convert, [])
+    assert {c.max_stay_hours for c in conversion.date_configs.values()} == {GlobalConfig.max_stay_hours}
+
+
+def test_backtracked_success_runs_level4(monkeypatch):
+    """Level 3 백트래킹으로 성공해도 본 경로처럼 Level 4 후처리와 체류시간 검사를 거침"""
+    plan = DatePlan(DAY, {"JOB01": 24}, ["토론면접", "발표면접"], {"max_stay_hours": 1.5})
+    config = MultiDateScheduler()._build_date_config(plan, GLOBAL_CONFIG, ROOMS, ACTIVITIES)
+    run_level3 = SingleDateScheduler._run_level3
+    level3_calls, level4_calls = [], []
+
+    def fail_first_level3(self, *args, **kwargs):
+        level3_calls.append(1)
+        if len(level3_calls) == 1:
+            return Level3Result(unscheduled=["JOB01_001"])
+        return run_level3(self, *args, **kwargs)
+
+    def counting_level4(self, *args, **kwargs):
+        level4_calls.append(1)
+        return None
+
+    monkeypatch.setattr(SingleDateScheduler, "_run_level3", fail_first_level3)
+    monkeypatch.setattr(SingleDateScheduler, "_run_level4", counting_level4)
+    result = SingleDateScheduler().schedule(config)
+
+    print(f"상태 {result.status}, 백트래킹 {result.backtrack_count}회, Level 4 호출 {len(level4_calls)}회")
+    assert result.status == "SUCCESS" and result.backtrack_count == 1
+    assert level4_calls == [1]
+    assert stay_violations(result.schedule, LIMIT) == {}
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v", "-s"])
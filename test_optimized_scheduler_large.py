@@ -0,0 +1,85 @@
+"""
+OptimizedScheduler 대규모 경로 테스트 (Level 1 캐시 + Level 3 청킹/병렬 처리)
+"""
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, ActivityMode, PrecedenceRule, DateConfig
+)
+from solver.optimized_scheduler import OptimizedScheduler, OptimizationConfig
+
+
+def _make_config(jobs, date=datetime(2025, 7, 1)):
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("발표준비", ActivityMode.PARALLEL, 5, "발표준비실", ["발표준비실"], 1, 2),
+        Activity("발표면접", ActivityMode.INDIVIDUAL, 15, "발표면접실", ["발표면접실"], 1, 1),
+    ]
+    rooms = [Room(f"토론면접실{chr(65 + i)}", "토론면접실", 6) for i in range(4)]
+    rooms += [Room(f"발표준비실{chr(65 + i)}", "발표준비실", 2) for i in range(4)]
+    rooms += [Room(f"발표면접실{chr(65 + i)}", "발표면접실", 1) for i in range(6)]
+    return DateConfig(
+        date=date,
+        jobs=jobs,
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=18)),
+        precedence_rules=[
+            PrecedenceRule("토론면접", "발표준비", gap_min=5),
+            PrecedenceRule("발표준비", "발표면접", gap_min=0, is_adjacent=True),
+        ],
+        job_activity_matrix={(job, a.name): True for job in jobs for a in activities},
+        global_gap_min=5
+    )
+
+
+def _check_schedule(result, config):
+    """전원 배정 + 방 중복 없음"""
+    assert result.status == "SUCCESS", result.error_message
+    real_ids = {
+        item.applicant_id for item in result.schedule
+        if item.activity_name == "발표면접" and not item.applicant_id.startswith("DUMMY")
+    }
+    assert len(real_ids) >= sum(config.jobs.values())
+
+    by_room = {}
+    for item in result.schedule:
+        if item.activity_name == "발표면접":
+            by_room.setdefault(item.room_name, []).append((item.start_time, item.end_time))
+    for slots in by_room.values():
+        slots.sort()
+        assert all(prev[1] <= cur[0] for prev, cur in zip(slots, slots[1:]))
+
+
+def test_cache_key_fingerprint():
+    """같은 설정이면 날짜와 무관하게 같은 키, 인원이 바뀌면 다른 키"""
+    scheduler = OptimizedScheduler()
+    key = scheduler._generate_level1_cache_key(_make_config({"JOB01": 60, "JOB02": 60}))
+    other_date = _make_config({"JOB02": 60, "JOB01": 60}, date=datetime(2025, 7, 2))
+    assert scheduler._generate_level1_cache_key(other_date) == key
+    assert scheduler._generate_level1_cache_key(_make_config({"JOB01": 60, "JOB02": 61})) != key
+
+
+def test_large_scale_chunked_parallel():
+    """청크를 방이 분리된 작업 2개로 병렬 실행 + 두 번째 실행은 Level 1 캐시 적중"""
+    opt_config = OptimizationConfig(max_workers=2, chunk_size_threshold=100, chunk_size=30)
+    scheduler = OptimizedScheduler()
+
+    config = _make_config({"JOB01": 60, "JOB02": 60})
+    result = scheduler.schedule(config, optimization_config=opt_config)
+    _check_schedule(result, config)
+    print(f"통계: {scheduler.stats}")
+    assert scheduler.stats["level3_chunks"] == 4
+    assert scheduler.stats["parallel_tasks"] == 2
+    assert scheduler.stats["level3_fallbacks"] == 0
+
+    result = scheduler.schedule(_make_config({"JOB01": 60, "JOB02": 60}, datetime(2025, 7, 2)),
+                                optimization_config=opt_config)
+    _check_schedule(result, config)
+    assert scheduler.stats["cache_hits"] == 1 and scheduler.stats["cache_misses"] == 1
+    assert scheduler._get_cache_hit_rate() == 50.0
+
+
+if __name__ == "__main__":
+    test_cache_key_fingerprint()
+    test_large_scale_chunked_parallel()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,102 @@
+"""
+열 단위 결과 빌더(ScheduleColumns)와 wide 형식 변환(pivot_activities) 테스트
+"""
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from solver import api
+from solver.result_frame import pivot_activities
+from solver.types import MultiDateResult, ScheduleItem, SingleDateResult
+
+DAY1, DAY2 = datetime(2025, 7, 1), datetime(2025, 7, 2)
+
+
+def _item(applicant, activity, start_min, duration=25, room=None, group=None, seconds=0):
+    start = timedelta(hours=9, minutes=start_min, seconds=seconds)
+    return ScheduleItem(applicant, applicant.split("_")[0], activity, room or f"{activity}실A",
+                        start, start + timedelta(minutes=duration, microseconds=seconds * 1000), group)
+
+
+def _result():
+    day1 = [_item("JOB02_001", "토론면접", 0, 30, group="G1"), _item("JOB01_001", "토론면접", 0, 30, group="G1"),
+            _item("DUMMY_001", "토론면접", 0, 30, group="G1"), _item("JOB01_001", "발표면접", 40, 17),
+            _item("JOB02_001", "발표면접", 40, 15, room="발표면접실B")]
+    day2 = [_item("JOB01_001", "발표면접", 10, seconds=30), _item("JOB01_002", "토론면접", 0, 30)]
+    return MultiDateResult("SUCCESS", {
+        DAY1: SingleDateResult(DAY1, "SUCCESS", day1),
+        DAY2: SingleDateResult(DAY2, "SUCCESS", day2),
+        datetime(2025, 7, 3): SingleDateResult(datetime(2025, 7, 3), "FAILED", [_item("JOB03_001", "토론면접", 0)]),
+    })
+
+
+def test_long_frames_match_item_rows():
+    """long / UI 형식이 항목별 dict로 만든 DataFrame과 같음 (실패 날짜 제외, UI는 더미 제외 + 정렬, 초 단위 보존)"""
+    result = _result()
+    expected = pd.DataFrame([
+        {"applicant_id": i.applicant_id, "job_code": i.job_code, "activity_name": i.activity_name,
+         "room_name": i.room_name, "start_time": i.start_time, "end_time": i.end_time,
+         "group_id": i.group_id, "interview_date": r.date.date()}
+        for r in result.results.values() if r.status != "FAILED" for i in r.schedule
+    ])
+    ui = api._convert_result_to_ui_format(result, [])
+
+    print(ui[["interview_date", "applicant_id", "activity_name", "start_time", "duration_min"]])
+    pd.testing.assert_frame_equal(result.to_dataframe(), expected)
+    assert list(ui["applicant_id"]) == ["JOB01_001", "JOB02_001", "JOB01_001", "JOB02_001", "JOB01_002", "JOB01_001"]
+    assert list(ui["duration_min"]) == [30, 30, 15, 15, 30, 25]
+    assert ui["interview_date"].dtype == "datetime64[ns]"
+    assert ui["start_time"].iloc[-1] == timedelta(hours=9, minutes=10, seconds=30)
+    assert ui["end_time"].iloc[-1] == timedelta(hours=9, minutes=35, seconds=30, microseconds=30000)
+    categorical = result.to_columns().to_long(categorical=True)
+    assert isinstance(categorical["applicant_id"].dtype, pd.CategoricalDtype)
+    assert list(categorical["applicant_id"].astype(str)) == list(expected["applicant_id"])
+
+
+def test_wide_format_from_ui_frame():
+    """UI long 형식 → convert_to_wide_format: 지원자 × 날짜 한 행, 활동 열 정렬, 없는 활동은 빈 값"""
+    result = _result()
+    ui = api._convert_result_to_ui_format(result, [])
+    long_df = ui.rename(columns={"applicant_id": "id", "activity_name": "activity", "room_name": "room"})
+    wide = api.convert_to_wide_format(long_df)
+
+    print(wide)
+    assert list(wide.columns) == ["id", "interview_date", "code", "end_발표면접", "end_토론면접",
+                                  "loc_발표면접", "loc_토론면접", "start_발표면접", "start_토론면접"]
+    assert list(zip(wide["id"], wide["interview_date"])) == [
+        ("JOB01_001", DAY1), ("JOB01_001", DAY2), ("JOB01_002", DAY2), ("JOB02_001", DAY1)
+    ]
+    row = wide[(wide["id"] == "JOB01_001") & (wide["interview_date"] == DAY1)].iloc[0]
+    assert (row["start_토론면접"], row["end_발표면접"], row["loc_발표면접"]) == ("09:00", "09:57", "발표면접실A")
+    assert pd.isna(wide[wide["id"] == "JOB01_002"].iloc[0]["start_발표면접"])
+
+
+def test_pivot_time_formats():
+    """시각 열 형식(문자열/timedelta/datetime)과 관계없이 같은 wide 결과, 같은 칸은 첫 값"""
+    times = [timedelta(hours=9), timedelta(hours=9, minutes=30, seconds=15), timedelta(hours=10)]
+    base = pd.DataFrame({"id": ["A_1", "A_1", "A_1"], "interview_date": [DAY1] * 3,
+                         "activity": ["토론", "발표", "토론"], "loc": ["R1", "R2", "R3"]})
+    formats = {
+        "timedelta": times,
+        "hh:mm:ss": [f"{int(t.total_seconds()) // 3600:02d}:{int(t.total_seconds()) % 3600 // 60:02d}:"
+                     f"{int(t.total_seconds()) % 60:02d}" for t in times],
+        "datetime": [DAY1 + t for t in times],
+    }
+    frames = {
+        name: pivot_activities(base.assign(start=values), ["id", "interview_date"], "activity",
+                               {"start": "start_"}, {"loc": "loc_"}, with_seconds=True)
+        for name, values in formats.items()
+    }
+
+    print(frames["timedelta"])
+    for frame in frames.values():
+        pd.testing.assert_frame_equal(frame, frames["timedelta"])
+    row = frames["timedelta"].iloc[0]
+    assert (row["start_토론"], row["start_발표"], row["loc_토론"]) == ("09:00:00", "09:30:15", "R1")
+    assert np.array_equal(pivot_activities(base.iloc[:0], ["id"], "activity", {}, {}).shape, (0, 0))
+
+
+if __name__ == "__main__":
+    test_long_frames_match_item_rows()
+    test_wide_format_from_ui_frame()
+    test_pivot_time_formats()
+    print("✅ 모든 테스트 통과")
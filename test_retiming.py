@@ -0,0 +1,62 @@
+"""
+Level 4 재시간화 (방/순서 고정, 시작 시각만 최적화) 테스트
+"""
+import time
+from solver.retiming import ScheduleRetimer
+from solver.level4_post_processor import Level4PostProcessor
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import PrecedenceRule, SchedulingContext
+from test_level3_portfolio import _make_config
+from test_cpsat_fallback import _check_schedule
+from test_schedule_index import _make_index
+from test_level4_local_search import _stay_minutes
+
+
+def test_retime_small_schedule():
+    """G1을 G2 직전으로 당기고 발표면접을 빈틈없이 붙이면 500분 → 350분 (최적)"""
+    index = _make_index()
+    retimer = ScheduleRetimer(index.compiled, index.operating_hours, 5)
+    retimed = retimer.retime(index.items)
+    print(f"재시간화 통계: {retimer.stats}")
+
+    assert retimed is not None
+    assert retimer.stats["status"] == "OPTIMAL"
+    assert _stay_minutes(index.items) == 500
+    assert _stay_minutes(retimed) == 350
+    # 방 배정과 방별 순서 유지
+    assert [item.room_name for item in retimed] == [item.room_name for item in index.items]
+    order = lambda items: [i.applicant_id for i in sorted(items, key=lambda i: i.start_time)
+                           if i.activity_name == "발표면접"]
+    assert order(retimed) == order(index.items)
+    rules = [PrecedenceRule("토론면접", "발표면접", gap_min=5)]
+    assert not _check_schedule(retimed, rules, 5, {"토론면접실A": 6, "발표면접실A": 1})
+
+
+def test_level4_retime_stage():
+    """재시간화 단계: 제약 위반 없음, 이동만 한 결과 이상 개선, 보고한 개선량 = 실제 감소량"""
+    config = _make_config()
+    moves_only = SingleDateScheduler().schedule(config, SchedulingContext(level4_retime=False))
+    result = SingleDateScheduler().schedule(config)
+    assert result.status == "SUCCESS" and result.level4_result.success
+
+    capacity = {room.name: room.capacity for room in config.rooms}
+    assert not _check_schedule(result.schedule, config.precedence_rules, config.global_gap_min, capacity)
+    original = result.level4_result.original_schedule
+    saved = (_stay_minutes(original) - _stay_minutes(result.schedule)) / 60
+    print(f"이동만 {(_stay_minutes(original) - _stay_minutes(moves_only.schedule)) / 60:.1f}시간, "
+          f"재시간화 포함 {saved:.1f}시간 개선")
+    assert abs(saved - result.level4_result.total_improvement_hours) < 1e-6
+    assert _stay_minutes(result.schedule) <= _stay_minutes(moves_only.schedule)
+
+    started = time.perf_counter()
+    retimer = ScheduleRetimer(
+        Level4PostProcessor()._compiled_for(config), config.operating_hours, config.global_gap_min
+    )
+    retimer.retime(original)
+    assert time.perf_counter() - started < 1.0
+
+
+if __name__ == "__main__":
+    test_retime_small_schedule()
+    test_level4_retime_stage()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,54 @@
+"""
+RoomAvailability (방 가용 시간 인덱스) 테스트
+"""
+from datetime import timedelta
+from solver.room_availability import RoomAvailability
+
+
+def m(minutes):
+    return timedelta(minutes=minutes)
+
+
+def test_reserve_and_earliest_fit():
+    """예약 후 가장 이른 배치 가능 시각"""
+    index = RoomAvailability(m(540), m(1080))  # 09:00 ~ 18:00
+
+    index.reserve(m(540), m(600))   # 09:00 ~ 10:00
+    index.reserve(m(620), m(660))   # 10:20 ~ 11:00
+    print(f"빈 시간대: {index.intervals()}")
+    assert index.intervals() == [(m(600), m(620)), (m(660), m(1080))]
+
+    assert index.earliest_fit(m(15)) == m(600)
+    assert index.earliest_fit(m(30)) == m(660)
+    assert index.earliest_fit(m(15), earliest=m(610)) == m(660)
+    assert index.earliest_fit(m(30), earliest=m(540), latest=m(680)) is None
+
+    assert index.is_free(m(600), m(620))
+    assert not index.is_free(m(600), m(625))
+
+
+def test_release_merges_neighbors():
+    """반환시 인접 빈 시간대 병합"""
+    index = RoomAvailability(m(540), m(1080))
+    for start in range(540, 1080, 30):
+        index.reserve(m(start), m(start + 15))
+    assert len(index) == 18
+
+    for start in range(540, 1080, 30):
+        index.release(m(start), m(start + 15))
+    assert index.intervals() == [(m(540), m(1080))]
+
+
+def test_reserve_across_intervals():
+    """여러 빈 시간대에 걸친 예약"""
+    index = RoomAvailability.from_intervals([(m(0), m(10)), (m(20), m(30)), (m(40), m(50))])
+    index.reserve(m(5), m(45))
+    assert index.intervals() == [(m(0), m(5)), (m(45), m(50))]
+    assert not index.is_free(m(20), m(25))
+
+
+if __name__ == "__main__":
+    test_reserve_and_earliest_fit()
+    test_release_merges_neighbors()
+    test_reserve_across_intervals()
+    print("✅ 모든 테스트 통과")
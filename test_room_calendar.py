@@ -0,0 +1,129 @@
+"""
+Level 2 방 캘린더 (이벤트 기반 배치) 테스트 + 배치 벤치마크
+
+python test_room_calendar.py 로 실행하면 벤치마크 결과도 출력
+"""
+import time
+from datetime import datetime, timedelta
+from solver.types import (
+    Activity, Room, ActivityMode, PrecedenceRule, DateConfig
+)
+from solver.room_calendar import RoomCalendar
+from solver.batched_scheduler import BatchedScheduler
+from solver.single_date_scheduler import SingleDateScheduler
+
+
+def m(minutes):
+    return timedelta(minutes=minutes)
+
+
+def test_find_earliest_and_preferred():
+    """가장 이른 시각 우선, 같은 시각이면 선호 방"""
+    rooms = [Room("토론면접실A", "토론면접실", 6), Room("토론면접실B", "토론면접실", 6)]
+    calendar = RoomCalendar(rooms, m(540), m(600))
+
+    room, start = calendar.find(m(30), m(540), preferred={"토론면접실B"})
+    assert (room.name, start) == ("토론면접실B", m(540))
+    calendar.book(room.name, start, start + m(30))
+
+    room, start = calendar.find(m(30), m(540), preferred={"토론면접실B"})
+    assert (room.name, start) == ("토론면접실A", m(540))
+    calendar.book(room.name, start, start + m(30))
+
+    # 선행 활동 제약(earliest)은 5분 단위로 올림
+    room, start = calendar.find(m(20), m(572))
+    assert start == m(575)
+
+    # 운영시간 초과
+    assert calendar.find(m(30), m(575)) is None
+
+
+def test_shared_next_free():
+    """같은 방을 쓰는 활동끼리 다음 사용 가능 시각 공유"""
+    rooms = [Room("면접실A", "면접실", 6)]
+    next_free = {}
+    first = RoomCalendar(rooms, m(540), m(720), next_free=next_free)
+    first.book("면접실A", m(540), m(600))
+
+    second = RoomCalendar(rooms, m(540), m(720), next_free=next_free)
+    room, start = second.find(m(30), m(540))
+    assert start == m(600)
+
+
+def _make_config(n_applicants: int, n_rooms: int) -> DateConfig:
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 4, 6),
+        Activity("그룹과제", ActivityMode.BATCHED, 40, "과제실", ["과제실"], 4, 6),
+    ]
+    rooms = [Room(f"토론면접실{chr(65 + i)}", "토론면접실", 6) for i in range(n_rooms)]
+    rooms += [Room(f"과제실{chr(65 + i)}", "과제실", 6) for i in range(n_rooms)]
+    jobs = {"JOB01": n_applicants // 2, "JOB02": n_applicants - n_applicants // 2}
+    return DateConfig(
+        date=datetime(2025, 7, 1),
+        jobs=jobs,
+        activities=activities,
+        rooms=rooms,
+        operating_hours=(timedelta(hours=9), timedelta(hours=18)),
+        precedence_rules=[PrecedenceRule("토론면접", "그룹과제", gap_min=5)],
+        job_activity_matrix={(job, a.name): True for job in jobs for a in activities},
+        global_gap_min=5
+    )
+
+
+def _place(config: DateConfig):
+    level1_result = SingleDateScheduler()._run_level1(config)
+    started = time.perf_counter()
+    level2_result = BatchedScheduler().schedule(level1_result.groups, config)
+    elapsed = time.perf_counter() - started
+    return level1_result, level2_result, elapsed
+
+
+def test_all_groups_placed_with_precedence():
+    """모든 그룹 배치 + 방 중복 없음 + 선후행 간격 준수"""
+    config = _make_config(80, 3)
+    level1_result, level2_result, _ = _place(config)
+    assert level2_result is not None
+
+    total_groups = sum(len(groups) for groups in level1_result.groups.values())
+    placed = [a for r in level2_result.group_results for a in r.assignments]
+    assert len(placed) == total_groups
+
+    by_room = {}
+    for a in placed:
+        by_room.setdefault(a.room.name, []).append((a.start_time, a.end_time))
+    for slots in by_room.values():
+        slots.sort()
+        assert all(prev[1] <= cur[0] for prev, cur in zip(slots, slots[1:]))
+
+    times = {}
+    for a in placed:
+        for applicant in a.group.applicants:
+            times[(applicant.id, a.group.activity_name)] = (a.start_time, a.end_time)
+    for (applicant_id, name), (start, _) in times.items():
+        if name == "그룹과제":
+            assert start >= times[(applicant_id, "토론면접")][1] + m(5)
+
+
+def benchmark_batched_placement():
+    """그룹 수별 Level 2 배치 시간과 방 활용률"""
+    print(f"{'지원자':>6} {'방':>3} {'그룹':>5} {'배치':>5} {'시간(ms)':>9} {'종료':>8} {'활용률':>7}")
+    for n_applicants, n_rooms in [(120, 2), (240, 4), (480, 8), (960, 16)]:
+        config = _make_config(n_applicants, n_rooms)
+        level1_result, level2_result, elapsed = _place(config)
+        total_groups = sum(len(groups) for groups in level1_result.groups.values())
+        placed = [a for r in level2_result.group_results for a in r.assignments] if level2_result else []
+
+        busy = sum((a.end_time - a.start_time).total_seconds() for a in placed)
+        last_end = max((a.end_time for a in placed), default=config.operating_hours[0])
+        span = (last_end - config.operating_hours[0]).total_seconds() * n_rooms * 2
+        utilization = busy / span if span else 0.0
+        print(f"{n_applicants:>6} {n_rooms:>3} {total_groups:>5} {len(placed):>5} "
+              f"{elapsed * 1000:>9.1f} {str(last_end):>8} {utilization:>7.1%}")
+
+
+if __name__ == "__main__":
+    test_find_earliest_and_preferred()
+    test_shared_next_free()
+    test_all_groups_placed_with_precedence()
+    print("✅ 모든 테스트 통과")
+    benchmark_batched_placement()
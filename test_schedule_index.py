@@ -0,0 +1,96 @@
+"""
+Level 4 스케줄 인덱스 (이동 충돌 검사) 테스트
+"""
+from datetime import timedelta
+from solver.schedule_index import IntervalIndex, ScheduleIndex
+from solver.compiled_config import CompiledDateConfig
+from solver.level4_post_processor import Level4PostProcessor
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import Activity, ActivityMode, PrecedenceRule, Room, ScheduleItem
+from test_level3_portfolio import _make_config
+from test_cpsat_fallback import _check_schedule
+
+
+def m(minutes):
+    return timedelta(minutes=minutes)
+
+
+def test_interval_overlap():
+    """겹치는 구간만 반환, 소유자 제외 가능"""
+    index = IntervalIndex()
+    index.add(m(0), m(30), "a")
+    index.add(m(30), m(40), "b")
+    index.add(m(100), m(200), "c")
+    assert [o for _, _, o in index.overlapping(m(20), m(35))] == ["b", "a"]
+    assert not index.overlapping(m(40), m(100))
+    assert [o for _, _, o in index.overlapping(m(150), m(160), ignore={"x"})] == ["c"]
+    index.remove(m(100), m(200), "c")
+    assert not index.overlapping(m(150), m(160))
+
+
+def _make_index():
+    activities = [
+        Activity("토론면접", ActivityMode.BATCHED, 30, "토론면접실", ["토론면접실"], 2, 6),
+        Activity("발표면접", ActivityMode.INDIVIDUAL, 15, "발표면접실", ["발표면접실"], 1, 1),
+    ]
+    rooms = [Room("토론면접실A", "토론면접실", 6), Room("발표면접실A", "발표면접실", 1)]
+    compiled = CompiledDateConfig.build(
+        activities, rooms, [PrecedenceRule("토론면접", "발표면접", gap_min=5)], 5
+    )
+
+    def item(applicant, activity, room, start, duration, group=None):
+        return ScheduleItem(applicant, "JOB01", activity, room, m(start), m(start + duration), group)
+
+    schedule = [
+        item("A", "토론면접", "토론면접실A", 540, 30, "G1"),
+        item("B", "토론면접", "토론면접실A", 540, 30, "G1"),
+        item("C", "토론면접", "토론면접실A", 600, 30, "G2"),
+        item("D", "토론면접", "토론면접실A", 600, 30, "G2"),
+        item("A", "발표면접", "발표면접실A", 700, 15),
+        item("B", "발표면접", "발표면접실A", 720, 15),
+        item("C", "발표면접", "발표면접실A", 640, 15),
+        item("D", "발표면접", "발표면접실A", 660, 15),
+    ]
+    return ScheduleIndex(schedule, compiled, (m(540), m(1080)))
+
+
+def test_move_conflicts():
+    """방 중복, 선후행 간격, 운영시간 위반 검출"""
+    index = _make_index()
+    assert index.group_positions["G1"] == [0, 1]
+    assert index.move_conflicts("G1", m(60))           # G2와 같은 방/시간
+    assert index.move_conflicts("G1", m(140))          # A: 발표면접(700) 전 5분 간격 부족
+    assert index.move_conflicts("G1", m(-60))          # 운영시간 이전
+    assert index.can_move("G1", m(120))                # 660~690, A/B 발표면접과 간격 충분
+
+    before = index.stay_span("A")
+    assert index.stay_improvement_hours("G1", m(120)) > 0
+    index.apply_move("G1", m(120))
+    assert index.stay_span("A") == before - m(120)
+    assert index.items[0].start_time == m(660)
+    assert index.move_conflicts("G2", m(60))           # 이동한 G1과 방 중복
+
+
+def test_level4_moves_keep_constraints():
+    """Level 4 이동 후에도 방/선후행 제약 유지, 체류시간 감소"""
+    config = _make_config()
+    result = SingleDateScheduler().schedule(config)
+    assert result.status == "SUCCESS"
+
+    level4 = result.level4_result
+    capacity = {room.name: room.capacity for room in config.rooms}
+    assert not _check_schedule(result.schedule, config.precedence_rules, config.global_gap_min, capacity)
+    if level4 and level4.success:
+        processor = Level4PostProcessor()
+        before = processor._analyze_stay_times(level4.original_schedule)
+        after = processor._analyze_stay_times(level4.optimized_schedule)
+        saved = sum(a.stay_time_hours for a in before) - sum(a.stay_time_hours for a in after)
+        print(f"조정 그룹 {level4.adjusted_groups}개, 체류시간 {saved:.1f}시간 감소")
+        assert abs(saved - level4.total_improvement_hours) < 1e-6
+
+
+if __name__ == "__main__":
+    test_interval_overlap()
+    test_move_conflicts()
+    test_level4_moves_keep_constraints()
+    print("✅ 모든 테스트 통과")
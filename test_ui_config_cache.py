@@ -0,0 +1,92 @@
+"""
+UI 설정 변환 캐시 테스트
+"""
+import pandas as pd
+from datetime import date
+from solver import api
+from solver.ui_config_cache import UIConfigCache, content_hash
+
+
+def _cfg(count=20):
+    return {
+        "activities": pd.DataFrame({
+            "use": [True, True, True],
+            "activity": ["토론면접", "발표준비", "발표면접"],
+            "mode": ["batched", "parallel", "individual"],
+            "duration_min": [30, 5, 15],
+            "room_type": ["토론면접실", "발표준비실", "발표면접실"],
+            "min_cap": [4, 1, 1],
+            "max_cap": [6, 2, 1],
+        }),
+        "room_plan": pd.DataFrame([{
+            "토론면접실_count": 2, "토론면접실_cap": 6,
+            "발표준비실_count": 1, "발표준비실_cap": 2,
+            "발표면접실_count": 2, "발표면접실_cap": 1,
+        }]),
+        "job_acts_map": pd.DataFrame([
+            {"code": "JOB01", "count": count, "토론면접": True, "발표준비": True, "발표면접": True}
+        ]),
+        "oper_window": pd.DataFrame({"start_time": ["09:00"], "end_time": ["17:00"]}),
+        "precedence": pd.DataFrame([
+            {"predecessor": "발표준비", "successor": "발표면접", "gap_min": 0, "adjacent": True},
+            {"predecessor": "토론면접", "successor": "발표면접", "gap_min": 10, "adjacent": False},
+        ]),
+        "interview_dates": [date(2025, 7, 1), date(2025, 7, 2)],
+    }
+
+
+def _counting(calls):
+    def convert(cfg_ui, logs_buffer):
+        calls.append(1)
+        return api._integrate_and_convert(cfg_ui, logs_buffer)
+    return convert
+
+
+def test_same_content_skips_conversion():
+    """새로 만든 같은 내용의 표는 변환 없이 캐시 사용, 돌려받은 설정을 고쳐도 캐시는 그대로"""
+    cache, calls = UIConfigCache(), []
+    convert = _counting(calls)
+    first_logs, second_logs = [], []
+    first = cache.get_or_convert(_cfg(), convert, first_logs)
+    first.global_config.max_stay_hours = 2
+    second = cache.get_or_convert(_cfg(), convert, second_logs)
+
+    print(f"변환 {len(calls)}회, 통계 {cache.stats}")
+    assert len(calls) == 1
+    assert cache.stats == {"hits": 1, "misses": 1}
+    assert second.global_config.max_stay_hours == 8
+    assert "발표준비+발표면접" in second.activities
+    assert set(second.date_configs) == set(second.date_plans)
+    assert second_logs[:-1] == first_logs and "변환 캐시 적중" in second_logs[-1]
+
+
+def test_content_change_and_lru_eviction():
+    """내용이 바뀌면 다시 변환, 용량을 넘으면 가장 오래 쓰지 않은 항목부터 제거"""
+    cache, calls = UIConfigCache(maxsize=2), []
+    convert = _counting(calls)
+    assert content_hash(_cfg(20)) == content_hash(_cfg(20))
+    assert content_hash(_cfg(20)) != content_hash(_cfg(21))
+
+    for count in (20, 21, 20, 22, 21):
+        cache.get_or_convert(_cfg(count), convert, [])
+    # 20 변환, 21 변환, 20 적중, 22 변환 (21 제거), 21 다시 변환 (20 제거)
+    assert len(calls) == 4
+    assert len(cache) == 2
+
+
+def test_solve_reuses_conversion():
+    """solve_for_days_v2를 같은 입력으로 두 번 실행하면 두 번째는 변환 생략"""
+    api._UI_CONFIG_CACHE.clear()
+    cfg = _cfg(12)
+    status1, df1, _, _ = api.solve_for_days_v2(cfg, {"max_stay_hours": 12})
+    status2, df2, logs2, _ = api.solve_for_days_v2(cfg, {"max_stay_hours": 12})
+    assert status1 == status2 == "SUCCESS"
+    assert "변환 캐시 적중" in logs2
+    assert len(df1) == len(df2)
+
+
+if __name__ == "__main__":
+    test_same_content_skips_conversion()
+    test_content_change_and_lru_eviction()
+    test_solve_reuses_conversion()
+    print("✅ 모든 테스트 통과")
@@ -0,0 +1,90 @@
+"""
+Level 3 undo log / 백트래킹 탐색 테스트
+"""
+from datetime import timedelta
+from solver.room_availability import RoomAvailability
+from solver.undo_log import (
+    UndoLog, JournaledDict, JournaledListDict, JournaledAvailability
+)
+from solver.individual_scheduler import IndividualScheduler
+
+
+def m(minutes):
+    return timedelta(minutes=minutes)
+
+
+def test_rollback_restores_state():
+    """mark 이후 변경만 역순으로 되돌림"""
+    log = UndoLog()
+    assignments = JournaledDict(log)
+    by_applicant = JournaledListDict(log)
+    room = JournaledAvailability(log, RoomAvailability(m(540), m(720)))
+
+    assignments["A_면접"] = 1
+    by_applicant["A"].append("slot1")
+    room.reserve(m(540), m(570))
+    mark = log.mark()
+
+    assignments["A_면접"] = 2
+    assignments["B_면접"] = 3
+    by_applicant["A"].append("slot2")
+    by_applicant["B"].append("slot3")
+    room.reserve(m(600), m(630))
+    room.release(m(540), m(570))
+
+    undone = log.rollback(mark)
+    print(f"되돌린 변경: {undone}개")
+    assert assignments == {"A_면접": 1}
+    assert dict(by_applicant) == {"A": ["slot1"]}
+    assert room.intervals() == [(m(570), m(720))]
+
+    log.rollback()
+    assert not assignments and not by_applicant
+    assert room.intervals() == [(m(540), m(720))]
+
+
+def test_search_revisits_previous_unit():
+    """두 번째 단위가 막히면 첫 번째 단위의 다음 후보로 되돌아감"""
+    scheduler = IndividualScheduler()
+    log = scheduler._undo_log
+    room = JournaledAvailability(log, RoomAvailability(m(0), m(20)))
+
+    def first_unit():
+        # 후보: [0, 10) → [10, 20)
+        for start in (0, 10):
+            room.reserve(m(start), m(start + 10))
+            yield True
+
+    def second_unit():
+        # [0, 10)만 가능
+        if room.is_free(m(0), m(10)):
+            room.reserve(m(0), m(10))
+            yield True
+
+    assert scheduler._search_placements([first_unit, second_unit])
+    assert len(room) == 0
+    assert scheduler.search_stats["backtracks"] == 1
+    assert scheduler.search_stats["nodes"] == 3
+
+
+def test_search_budget():
+    """노드 예산 초과시 실패 처리"""
+    scheduler = IndividualScheduler(search_node_limit=5)
+
+    def many_alternatives():
+        for _ in range(100):
+            yield True
+
+    def never():
+        return iter(())
+
+    assert not scheduler._search_placements([many_alternatives, never])
+    assert scheduler.search_stats["budget_exhausted"]
+    assert scheduler.search_stats["nodes"] <= 6
+
+
+if __name__ == "__main__":
+    test_rollback_restores_state()
+    test_search_revisits_previous_unit()
+    test_search_budget()
+    print("✅ 모든 테스트 통과")
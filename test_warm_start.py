@@ -0,0 +1,105 @@
+"""
+단계 사이 웜 스타트 테스트 (이전 단계 결과의 Level 1/2 재사용, 초과자만 재배치)
+"""
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta
+from solver import api
+from solver import single_date_scheduler as single_date_module
+from solver.multi_date_scheduler import MultiDateScheduler
+from solver.single_date_scheduler import SingleDateScheduler
+from solver.types import DatePlan, stay_violations
+from test_date_dedupe import GLOBAL_CONFIG, ROOMS, ACTIVITIES
+from test_ui_config_cache import _cfg
+
+DAY = datetime(2025, 7, 1)
+
+
+def _first_phase(count=24):
+    plan = DatePlan(DAY, {"JOB01": count}, ["토론면접", "발표면접"], {"max_stay_hours": 12})
+    config = MultiDateScheduler()._build_date_config(plan, GLOBAL_CONFIG, ROOMS, ACTIVITIES)
+    return config, SingleDateScheduler().schedule(config)
+
+
+def _count_level1(monkeypatch):
+    calls = []
+
+    class CountingOptimizer(single_date_module.GroupOptimizerV2):
+        def optimize(self, *args, **kwargs):
+            calls.append(1)
+            return super().optimize(*args, **kwargs)
+
+    monkeypatch.setattr(single_date_module, "GroupOptimizerV2", CountingOptimizer)
+    return calls
+
+
+def _warm_logs(result):
+    return [log for log in result.logs if "웜 스타트" in log]
+
+
+def test_compliant_schedule_reused(monkeypatch):
+    """새 제한을 이미 지키는 이전 결과는 Level 1~3을 다시 풀지 않고 그대로 사용"""
+    config, first = _first_phase()
+    longest = max(stay_violations(first.schedule, timedelta(0)).values())
+    calls = _count_level1(monkeypatch)
+    second = SingleDateScheduler().schedule(
+        replace(config, max_stay_hours=longest.total_seconds() / 3600), warm_start=first
+    )
+
+    print(f"웜 스타트 로그: {_warm_logs(second)}, Level 1 호출 {len(calls)}회")
+    assert second.status == "SUCCESS" and not calls
+    assert "0명 재배치" in _warm_logs(second)[0]
+    assert {(i.applicant_id, i.activity_name) for i in second.schedule} == \
+           {(i.applicant_id, i.activity_name) for i in first.schedule}
+
+
+def test_tighter_limit_repairs_violators():
+    """2단계 파이프라인처럼 제한만 줄여 다시 풀면 Level 1/2를 재사용하고 새 제한을 지킴"""
+    cfg = _cfg(40)
+    *_, first = api._solve_for_days_v2_result(cfg, {"max_stay_hours": 12})
+    stays = sorted(stay_violations(first.results[DAY].schedule, timedelta(0)).values())
+    limit = stays[int(len(stays) * 0.9)]
+    cfg["date_overrides"] = {str(date): {"max_stay_hours": limit.total_seconds() / 3600} for date in first.results}
+    status, *_, second = api._solve_for_days_v2_result(cfg, {}, warm_start=first)
+
+    logs = [log for result in second.results.values() for log in _warm_logs(result)]
+    print(f"제한 {limit}: 이전 초과 {len(stay_violations(first.results[DAY].schedule, limit))}명, 로그 {logs}")
+    assert stay_violations(first.results[DAY].schedule, limit)
+    assert status == "SUCCESS" and len(logs) == len(second.results)
+    assert all("Level 1/2 재사용" in log for log in logs)
+    for date, result in second.results.items():
+        assert stay_violations(result.schedule, limit) == {}
+        assert result.level1_result.groups == first.results[date].level1_result.groups
+
+
+def test_different_config_solves_cold(monkeypatch):
+    """체류시간 외 설정이 다르면 웜 스타트를 쓰지 않고 처음부터 풀이"""
+    config, first = _first_phase()
+    calls = _count_level1(monkeypatch)
+    other = replace(config, jobs={"JOB01": 18}, max_stay_hours=6)
+    second = SingleDateScheduler().schedule(other, warm_start=first)
+
+    print(f"지문 {first.fingerprint[:8]} → {second.fingerprint[:8]}, Level 1 호출 {len(calls)}회")
+    assert second.fingerprint != first.fingerprint
+    assert second.status == "SUCCESS" and calls and not _warm_logs(second)
+
+
+def test_backtracked_result_has_solve_time(monkeypatch):
+    """백트래킹으로 끝난 결과도 소요시간을 기록 (다음 단계 웜 스타트 재배치 예산)"""
+    config, _ = _first_phase()
+
+    def slow_backtrack(self, config, result):
+        time.sleep(0.05)
+        return result
+
+    monkeypatch.setattr(SingleDateScheduler, "_run_level2", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr(SingleDateScheduler, "_backtrack_from_level2", slow_backtrack)
+    result = SingleDateScheduler().schedule(config)
+
+    print(f"상태 {result.status}, 소요시간 {result.solve_time:.3f}초")
+    assert result.solve_time >= 0.05
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v", "-s"])